@@ -0,0 +1,192 @@
+"""
+Local authorization from an access list file.
+
+The access list is a tab-separated file whose header row holds the
+``issuer`` and ``username`` columns followed by the names (IDs) of the
+projects, and whose rows give the access tier of each user to each project.
+"""
+import csv
+import math
+import os
+import threading
+
+import candig.server.exceptions as exceptions
+
+
+def validateAccessLevel(level):
+    """
+    Returns True if the level is one of 0, 1, 2, 3, 4, this indicates the user has some access to the dataset.
+    Returns False if the level is one of empty string or X, this indicates the user has no access to the dataset.
+    Raise an exception otherwise, this indicates that there's illegal characters specified as 'level'.
+
+    The support for empty string will be deprecated and removed in future releases.
+    """
+    try:
+        if 0 <= int(level) <= 4:
+            return True
+    except (ValueError, TypeError):
+        if level in ("X", " ", "", None):
+            return False
+        try:
+            if math.isnan(float(level)):
+                return False
+        except (ValueError, TypeError):
+            pass
+
+    raise exceptions.InvalidAccessListException(level)
+
+
+def parseAccessList(filePath):
+    """
+    Parses the specified access list file and returns a dictionary
+    mapping (issuer, username) tuples to {project: tier} dictionaries,
+    leaving out the projects the user has no access to.
+    """
+    accessMap = {}
+    with open(filePath, newline='') as accessFile:
+        reader = csv.reader(accessFile, delimiter='\t')
+        header = None
+        for row in reader:
+            if not any(row):
+                continue
+            if header is None:
+                header = row
+                try:
+                    issuerIndex = header.index('issuer')
+                    usernameIndex = header.index('username')
+                except ValueError:
+                    raise ValueError(
+                        "The access list must have issuer and "
+                        "username columns")
+                projects = [
+                    (index, project) for index, project in enumerate(header)
+                    if index not in (issuerIndex, usernameIndex)]
+                continue
+            row += [''] * (len(header) - len(row))
+            user = (row[issuerIndex], row[usernameIndex])
+            if user in accessMap:
+                raise ValueError(
+                    "Duplicate entries detected for {}. "
+                    "User access disabled until ACL resolved.".format(user))
+            accessMap[user] = {
+                project: int(row[index]) for index, project in projects
+                if validateAccessLevel(row[index])}
+    return accessMap
+
+
+class UserAccessMap(object):
+    """
+    Loads local authorization info from an access list file to the backend
+    ACL tsv file header row contains list of project names(ID)
+
+    The file is watched from a background thread, which polls its
+    modification time every pollInterval seconds and swaps in a newly
+    parsed map when it changes, so requests only read the current map.
+    While the file can't be parsed, all user access is disabled.
+
+    Threads do not survive a fork, so the thread is started again in
+    pre-forked server workers the first time they use the map.
+    """
+    def __init__(self, filePath, pollInterval=5, logger=None):
+        if not filePath:
+            raise exceptions.ConfigurationException("No user access list defined")
+        self._filePath = filePath
+        self._pollInterval = pollInterval
+        self._logger = logger
+        self._userAccessMap = {}
+        self._listUpdated = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def load(self):
+        """
+        Parses the access list file and replaces the current map with its
+        contents. Access levels that aren't supported raise an
+        InvalidAccessListException, after disabling all user access.
+        """
+        try:
+            listUpdated = os.path.getmtime(self._filePath)
+        except OSError as err:
+            listUpdated = None
+            if self._logger:
+                self._logger.error(err)
+        self._listUpdated = listUpdated
+        try:
+            userAccessMap = parseAccessList(self._filePath)
+        except (IOError, ValueError) as err:
+            userAccessMap = {}
+            if self._logger:
+                self._logger.error(err)
+        except exceptions.InvalidAccessListException:
+            self._userAccessMap = {}
+            raise
+        self._userAccessMap = userAccessMap
+        return self
+
+    def reloadIfUpdated(self):
+        """
+        Reloads the access list if its file was modified since it was last
+        loaded. Returns True if it was reloaded.
+        """
+        try:
+            listUpdated = os.path.getmtime(self._filePath)
+        except OSError:
+            listUpdated = None
+        if listUpdated == self._listUpdated:
+            return False
+        if self._logger:
+            self._logger.info(
+                "local access_list.txt updated -> reloading backend list")
+        try:
+            self.load()
+        except exceptions.InvalidAccessListException as err:
+            if self._logger:
+                self._logger.error(err.message)
+        return True
+
+    def start(self):
+        """
+        Starts watching the access list file for changes.
+        """
+        self._ensureStarted()
+        return self
+
+    def stop(self):
+        """
+        Stops watching the access list file.
+        """
+        self._stopped.set()
+
+    def _ensureStarted(self):
+        if self._stopped.is_set() or self._pollInterval <= 0:
+            return
+        pid = os.getpid()
+        with self._lock:
+            if self._thread is not None and self._pid == pid:
+                return
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="UserAccessMap")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self._pollInterval):
+            try:
+                self.reloadIfUpdated()
+            except Exception as exc:
+                if self._logger:
+                    self._logger.warning(
+                        "Couldn't reload the access list: {}".format(exc))
+
+    def getUserAccessMap(self, issuer, username):
+        self._ensureStarted()
+        return self._userAccessMap.get((issuer, username), {})
+
+    def getFilePath(self):
+        return self._filePath
+
+    def getListUpdated(self):
+        return self._listUpdated
@@ -0,0 +1,183 @@
+"""
+Client for the Open Policy Agent (OPA) dataset permission endpoint.
+
+Decisions are cached per (token, path) so that repeated requests made with
+the same token do not each pay for a round trip to OPA. An entry never
+outlives the token it was issued for.
+"""
+import base64
+import collections
+import json
+import threading
+import time
+
+import requests
+import requests.adapters
+
+
+def parseTokenPayload(token):
+    """
+    Returns the decoded payload of the specified JWT, which may be
+    prefixed by its authorization scheme ("Bearer <token>"). Tokens that
+    have no payload segment decode to an empty dict.
+    """
+    try:
+        tokenPayload = token.split(".")[1]
+
+        # make sure token is padded properly for b64 decoding
+        padding = len(tokenPayload) % 4
+        if padding != 0:
+            tokenPayload += '=' * (4 - padding)
+        decodedPayload = base64.b64decode(tokenPayload)
+
+    except IndexError:
+        decodedPayload = '{}'
+
+    return json.loads(decodedPayload)
+
+
+class TokenPayloadCache(object):
+    """
+    A bounded LRU cache of decoded token payloads, keyed by the raw
+    authorization header value. Entries are dropped once the token has
+    expired.
+    """
+    def __init__(self, maxSize=1024):
+        self._maxSize = maxSize
+        self._payloads = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        """
+        Returns the decoded payload of the specified token.
+        """
+        now = time.time()
+        with self._lock:
+            payload = self._payloads.get(token)
+            if payload is not None:
+                expiry = payload.get('exp')
+                if expiry is None or expiry > now:
+                    self._payloads.move_to_end(token)
+                    return payload
+                del self._payloads[token]
+        payload = parseTokenPayload(token)
+        with self._lock:
+            self._payloads[token] = payload
+            while len(self._payloads) > self._maxSize:
+                self._payloads.popitem(last=False)
+        return payload
+
+
+class OpaClient(object):
+    """
+    Queries OPA for the datasets a token grants access to, over a pooled
+    keep-alive session, and caches the decisions.
+
+    An entry is kept for at most cacheTtl seconds, and never past the
+    token's ``exp`` claim; a cacheTtl of 0 disables the cache.
+    """
+    def __init__(
+            self, url, serverToken='', timeout=5, cacheTtl=60,
+            cacheSize=1024, poolSize=10):
+        self._url = url
+        self._timeout = timeout
+        self._cacheTtl = cacheTtl
+        self._cacheSize = cacheSize
+        self._decisions = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=poolSize)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers.update({
+            'Authorization': 'Bearer ' + serverToken,
+            'Content-Type': 'application/json'
+        })
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._requestTime = 0.0
+        self._maxRequestTime = 0.0
+
+    def getDatasets(self, token, path, tokenPayload=None):
+        """
+        Returns the list of datasets that OPA allows the bearer of the
+        specified token ("Bearer <jwt>") to access through path.
+        """
+        now = time.time()
+        key = (token, path)
+        with self._lock:
+            entry = self._decisions.get(key)
+            if entry is not None:
+                expiry, datasets = entry
+                if expiry > now:
+                    self._decisions.move_to_end(key)
+                    self._hits += 1
+                    return datasets
+                del self._decisions[key]
+            self._misses += 1
+        datasets = self._query(token, path)
+        if self._cacheTtl > 0:
+            expiry = now + self._cacheTtl
+            if tokenPayload is None:
+                tokenPayload = parseTokenPayload(token)
+            tokenExpiry = tokenPayload.get('exp')
+            if tokenExpiry is not None:
+                expiry = min(expiry, tokenExpiry)
+            with self._lock:
+                self._decisions[key] = (expiry, datasets)
+                while len(self._decisions) > self._cacheSize:
+                    self._decisions.popitem(last=False)
+        return datasets
+
+    def _query(self, token, path):
+        payload = json.dumps({
+            "input": {
+                "token": token.split(' ')[1],
+                "body": {
+                    "method": "GET",  # Opa only accepts GET right now
+                    "path": path
+                }
+            }
+        })
+        start = time.time()
+        try:
+            response = self._session.post(
+                self._url, data=payload, timeout=self._timeout)
+            response.raise_for_status()
+            datasets = response.json()["result"]
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            elapsed = time.time() - start
+            with self._lock:
+                self._requestTime += elapsed
+                self._maxRequestTime = max(self._maxRequestTime, elapsed)
+        return datasets
+
+    def clear(self):
+        """
+        Drops all the cached decisions.
+        """
+        with self._lock:
+            self._decisions.clear()
+
+    def getStats(self):
+        """
+        Returns a dictionary of the cache and OPA request statistics.
+        Latencies are in seconds.
+        """
+        with self._lock:
+            misses = self._misses
+            return {
+                "hits": self._hits,
+                "misses": misses,
+                "errors": self._errors,
+                "cachedDecisions": len(self._decisions),
+                "opaRequestTime": self._requestTime,
+                "opaMeanLatency": self._requestTime / misses if misses else 0,
+                "opaMaxLatency": self._maxRequestTime,
+            }
@@ -4,14 +4,18 @@ responses.
 """
 
 import candig.server.datamodel as datamodel
+import candig.server.datamodel.ontologies as ontologies
 import candig.server.exceptions as exceptions
 import candig.server.paging as paging
 import candig.server.response_builder as response_builder
+import candig.server.tracing as tracing
 import candig.schemas.protocol as protocol
 import operator
 from google.protobuf.json_format import MessageToDict
 import json
+import functools
 import itertools
+import numpy as np
 import candig.server.DP as DP
 
 
@@ -133,7 +137,11 @@ class Backend(object):
             nextPageToken = None
             if currentIndex < numObjects:
                 nextPageToken = str(currentIndex)
-            yield object_.toProtocolElement(tier), nextPageToken
+            if isinstance(object_, datamodel.TieredMetadataObject):
+                yield datamodel.CachedProtocolElement(
+                    object_, tier), nextPageToken
+            else:
+                yield object_.toProtocolElement(tier), nextPageToken
 
     def _protocolObjectGenerator(self, request, numObjects, getByIndexMethod):
         """
@@ -176,6 +184,54 @@ class Backend(object):
             tier=tier,
         )
 
+    def _cursorListGenerator(self, request, key, getObjectList, tier=0):
+        """
+        Returns a generator over the objects in the list returned by the
+        specified function, whose page tokens refer to a cursor holding the
+        list. The list is only computed when the page token doesn't refer
+        to a registered cursor for the specified key, and is registered
+        when it doesn't fit in the requested page.
+        """
+        cursorId, currentIndex = paging.parseCursorPageToken(
+            request.page_token)
+        objectList = None
+        if cursorId is not None:
+            objectList = paging.cursorRegistry.get(cursorId, key)
+        if objectList is None:
+            objectList = getObjectList()
+            cursorId = None
+            if len(objectList) - currentIndex > request.page_size:
+                cursorId = paging.cursorRegistry.register(key, objectList)
+        return self._cursorObjectGenerator(
+            objectList, cursorId, currentIndex, tier)
+
+    def _cursorObjectGenerator(self, objectList, cursorId, currentIndex, tier):
+        numObjects = len(objectList)
+        while currentIndex < numObjects:
+            object_ = objectList[currentIndex]
+            currentIndex += 1
+            nextPageToken = None
+            if currentIndex < numObjects:
+                nextPageToken = paging.getCursorPageToken(
+                    cursorId, currentIndex)
+            yield datamodel.CachedProtocolElement(object_, tier), nextPageToken
+
+    def _filteredListGenerator(self, request, dataset, getObjectsMethod, tier):
+        """
+        Returns a generator over the objects returned by the specified
+        method of the dataset that match the filters of the request.
+        """
+        filters = self.filtersValidator(request)
+        key = (
+            getObjectsMethod.__name__, dataset.getId(),
+            json.dumps(MessageToDict(request).get("filters", []), sort_keys=True))
+        return self._cursorListGenerator(
+            request, key,
+            lambda: [
+                obj for obj in getObjectsMethod()
+                if self.comparisonGenerator(obj, filters)],
+            tier=tier)
+
     def datasetsGenerator(self, request, access_map):
         """
         Returns a generator over the (dataset, nextPageToken) pairs
@@ -200,12 +256,23 @@ class Backend(object):
         except KeyError as error:
             raise exceptions.MissingFieldNameException(str(error))
 
-        responses = self.componentsHandler(dataset_id, components, return_mimetype, access_map)
-        patient_list = self.logicHandler(logic, responses, dataset_id, access_map)
+        # The patients matching the query are kept in a cursor, so that
+        # the components aren't searched again for the following pages
+        key = (
+            "queryGenerator", dataset_id,
+            json.dumps([logic, components], sort_keys=True),
+            json.dumps(access_map or {}, sort_keys=True))
+        cursorId = paging.cursorRegistry.getCursorId(key)
+        patient_list = paging.cursorRegistry.get(cursorId, key)
+        if patient_list is None:
+            responses = self.componentsHandler(dataset_id, components, return_mimetype, access_map)
+            patient_list = sorted(self.logicHandler(logic, responses, dataset_id, access_map))
+            paging.cursorRegistry.register(key, patient_list)
         page_token = parsedRequest.get("pageToken")
 
         return self.resultsHandler(results, patient_list, dataset_id, return_mimetype, access_map, page_token, count)
 
+    @tracing.traced("logic")
     def logicHandler(self, logic, responses, dataset_id, access_map):
         """
         :param  logic: dict parsed from query containing logic statement keys or component id keys
@@ -390,6 +457,7 @@ class Backend(object):
 
         return self.endpointCaller(requests, idMapper, return_mimetype, access_map)
 
+    @tracing.traced("components")
     def endpointCaller(self, requests, idMapper, return_mimetype, access_map):
         """
         Call all endpoints returned by componentsHandler
@@ -429,6 +497,7 @@ class Backend(object):
 
         return responses
 
+    @tracing.traced("results")
     def resultsHandler(self, results, patient_list, dataset_id, return_mimetype, access_map, page_token, count):
         """
         :param results:
@@ -785,349 +854,184 @@ class Backend(object):
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getPatients():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getPatients, tier)
 
     def enrollmentsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getEnrollments():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getEnrollments, tier)
 
     def consentsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getConsents():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getConsents, tier)
 
     def diagnosesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getDiagnoses():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getDiagnoses, tier)
 
     def samplesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getSamples():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getSamples, tier)
 
     def treatmentsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getTreatments():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getTreatments, tier)
 
     def outcomesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getOutcomes():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getOutcomes, tier)
 
     def complicationsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getComplications():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getComplications, tier)
 
     def tumourboardsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getTumourboards():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getTumourboards, tier)
 
     def chemotherapiesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getChemotherapies():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getChemotherapies, tier)
 
     def radiotherapiesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getRadiotherapies():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getRadiotherapies, tier)
 
     def surgeriesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getSurgeries():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getSurgeries, tier)
 
     def immunotherapiesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getImmunotherapies():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getImmunotherapies, tier)
 
     def celltransplantsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getCelltransplants():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getCelltransplants, tier)
 
     def slidesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getSlides():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getSlides, tier)
 
     def studiesGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getStudies():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getStudies, tier)
 
     def labtestsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getLabtests():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getLabtests, tier)
 
     def extractionsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getExtractions():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getExtractions, tier)
 
     def sequencingGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getSequencings():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getSequencings, tier)
 
     def alignmentsGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getAlignments():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getAlignments, tier)
 
     def variantCallingGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getVariantCallings():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getVariantCallings, tier)
 
     def fusionDetectionGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getFusionDetections():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getFusionDetections, tier)
 
     def expressionAnalysisGenerator(self, request, access_map):
         """
         """
         dataset = self.getDataRepository().getDataset(request.dataset_id)
         tier = self.getUserAccessTier(dataset, access_map)
-        results = []
-        filters = self.filtersValidator(request)
-
-        for obj in dataset.getExpressionAnalyses():
-            qualified = self.comparisonGenerator(obj, filters)
-
-            if qualified:
-                results.append(obj)
-        return self._objectListGenerator(request, results, tier=tier)
+        return self._filteredListGenerator(
+            request, dataset, dataset.getExpressionAnalyses, tier)
 
     def phenotypeAssociationSetsGenerator(self, request, access_map):
         """
@@ -1450,10 +1354,13 @@ class Backend(object):
             request, variantAnnotationSet)
         return iterator
 
-    def featuresGenerator(self, request, access_map):
+    def featuresGenerator(self, request, access_map,
+                          includeDescendants=False):
         """
         Returns a generator over the (features, nextPageToken) pairs
-        defined by the (JSON string) request.
+        defined by the (JSON string) request. If includeDescendants is
+        True, the feature types requested also match their descendants
+        in the feature set's ontology.
         """
         compoundId = None
         parentId = None
@@ -1487,13 +1394,14 @@ class Backend(object):
         self.getUserAccessTier(dataset, access_map)
         featureSet = dataset.getFeatureSet(compoundId.feature_set_id)
         iterator = paging.FeaturesIterator(
-            request, featureSet, parentId)
+            request, featureSet, parentId, includeDescendants)
         return iterator
 
-    def continuousGenerator(self, request, access_map):
+    def continuousGenerator(self, request, access_map, resolution=None):
         """
         Returns a generator over the (continuous, nextPageToken) pairs
-        defined by the (JSON string) request.
+        defined by the (JSON string) request. If resolution is given, each
+        value is the mean over that many bases.
         """
         compoundId = None
         if request.continuous_set_id != "":
@@ -1507,13 +1415,17 @@ class Backend(object):
         # check user acce
         self.getUserAccessTier(dataset, access_map)
         continuousSet = dataset.getContinuousSet(request.continuous_set_id)
-        iterator = paging.ContinuousIterator(request, continuousSet)
+        iterator = paging.ContinuousIterator(
+            request, continuousSet, resolution=resolution)
         return iterator
 
-    def phenotypesGenerator(self, request, access_map):
+    def phenotypesGenerator(self, request, access_map,
+                            includeDescendants=False):
         """
         Returns a generator over the (phenotypes, nextPageToken) pairs
-        defined by the (JSON string) request
+        defined by the (JSON string) request. If includeDescendants is
+        True, the phenotype type requested also matches its descendants
+        in the ontology of the repository with the same prefix.
         """
         # TODO make paging work using SPARQL?
         compoundId = datamodel.PhenotypeAssociationSetCompoundId.parse(
@@ -1522,7 +1434,12 @@ class Backend(object):
         self.getUserAccessTier(dataset, access_map)
         phenotypeAssociationSet = dataset.getPhenotypeAssociationSet(
             compoundId.phenotypeAssociationSetId)
-        associations = phenotypeAssociationSet.getAssociations(request)
+        phenotypeOntology = None
+        if includeDescendants and request.type.term_id:
+            phenotypeOntology = self._getOntologyForTerm(
+                request.type.term_id)
+        associations = phenotypeAssociationSet.getAssociations(
+            request, phenotypeOntology=phenotypeOntology)
         phenotypes = [association.phenotype for association in associations]
         return self._protocolListGenerator(
             request, phenotypes)
@@ -1665,13 +1582,13 @@ class Backend(object):
         Runs a get request by converting the specified datamodel
         object into its protocol representation.
         """
-        protocolElement = obj.toProtocolElement(tier=tier)
-        data = protocol.serialize(protocolElement, return_mimetype)
-        return data
+        return obj.toSerializedProtocolElement(
+            tier=tier, mimetype=return_mimetype)
 
+    @tracing.traced("search")
     def runSearchRequest(
             self, requestStr, requestClass, responseClass, objectGenerator,
-            access_map, return_mimetype="application/json"):
+            access_map, return_mimetype="application/json", stream=False):
         """
         Runs the specified request. The request is a string containing
         a JSON representation of an instance of the specified requestClass.
@@ -1681,6 +1598,9 @@ class Backend(object):
         generator, which must return (object, nextPageToken) pairs,
         and be able to resume iteration from any point using the
         nextPageToken attribute of the request object.
+
+        If stream is True, the filled SearchResponseBuilder is returned
+        instead, so that the caller can write the page out value by value.
         """
         self.startProfile()
         try:
@@ -1701,7 +1621,11 @@ class Backend(object):
             if responseBuilder.isFull():
                 break
         responseBuilder.setNextPageToken(nextPageToken)
-        responseString = responseBuilder.getSerializedResponse()
+        if stream:
+            self.endProfile()
+            return responseBuilder
+        with tracing.span("serialize"):
+            responseString = responseBuilder.getSerializedResponse()
         self.endProfile()
         return responseString
 
@@ -2290,7 +2214,7 @@ class Backend(object):
 
     # Search requests.
 
-    def runSearchReadGroupSets(self, request, return_mimetype, access_map):
+    def runSearchReadGroupSets(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchReadGroupSetsRequest.
         """
@@ -2299,9 +2223,10 @@ class Backend(object):
             protocol.SearchReadGroupSetsResponse,
             self.readGroupSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchIndividuals(self, request, return_mimetype, access_map):
+    def runSearchIndividuals(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchIndividualsRequest.
         """
@@ -2310,7 +2235,8 @@ class Backend(object):
             protocol.SearchIndividualsResponse,
             self.individualsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
     # Search requests
     def runSearchQuery(self, request, return_mimetype, access_map):
@@ -2334,7 +2260,7 @@ class Backend(object):
             raise exceptions.InvalidJsonException(str(e))
         return self.queryGenerator(request, return_mimetype, access_map, count=True)
 
-    def runSearchPatients(self, request, return_mimetype, access_map):
+    def runSearchPatients(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchPatientsRequest.
         """
@@ -2344,9 +2270,10 @@ class Backend(object):
             self.patientsGenerator,
             access_map,
             return_mimetype,
+            stream=stream,
         )
 
-    def runSearchEnrollments(self, request, return_mimetype, access_map):
+    def runSearchEnrollments(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchEnrollmentsRequest.
         """
@@ -2355,10 +2282,11 @@ class Backend(object):
             protocol.SearchEnrollmentsResponse,
             self.enrollmentsGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchConsents(self, request, return_mimetype, access_map):
+    def runSearchConsents(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchConsentsRequest.
         """
@@ -2367,10 +2295,11 @@ class Backend(object):
             protocol.SearchConsentsResponse,
             self.consentsGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchDiagnoses(self, request, return_mimetype, access_map):
+    def runSearchDiagnoses(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchDiagnosesRequest.
         """
@@ -2379,10 +2308,11 @@ class Backend(object):
             protocol.SearchDiagnosesResponse,
             self.diagnosesGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchSamples(self, request, return_mimetype, access_map):
+    def runSearchSamples(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchSamplesRequest.
         """
@@ -2391,10 +2321,11 @@ class Backend(object):
             protocol.SearchSamplesResponse,
             self.samplesGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchTreatments(self, request, return_mimetype, access_map):
+    def runSearchTreatments(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchTreatmentsRequest.
         """
@@ -2403,10 +2334,11 @@ class Backend(object):
             protocol.SearchTreatmentsResponse,
             self.treatmentsGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchOutcomes(self, request, return_mimetype, access_map):
+    def runSearchOutcomes(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchOutcomesRequest.
         """
@@ -2415,10 +2347,11 @@ class Backend(object):
             protocol.SearchOutcomesResponse,
             self.outcomesGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchComplications(self, request, return_mimetype, access_map):
+    def runSearchComplications(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchComplicationsRequest.
         """
@@ -2427,10 +2360,11 @@ class Backend(object):
             protocol.SearchComplicationsResponse,
             self.complicationsGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchTumourboards(self, request, return_mimetype, access_map):
+    def runSearchTumourboards(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchTumourboardsRequest.
         """
@@ -2439,10 +2373,11 @@ class Backend(object):
             protocol.SearchTumourboardsResponse,
             self.tumourboardsGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchChemotherapies(self, request, return_mimetype, access_map):
+    def runSearchChemotherapies(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchChemotherapiesRequest.
         """
@@ -2451,9 +2386,10 @@ class Backend(object):
             protocol.SearchChemotherapiesResponse,
             self.chemotherapiesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchRadiotherapies(self, request, return_mimetype, access_map):
+    def runSearchRadiotherapies(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchRadiotherapiesRequest.
         """
@@ -2462,9 +2398,10 @@ class Backend(object):
             protocol.SearchRadiotherapiesResponse,
             self.radiotherapiesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchSurgeries(self, request, return_mimetype, access_map):
+    def runSearchSurgeries(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchSurgeriesRequest.
         """
@@ -2473,9 +2410,10 @@ class Backend(object):
             protocol.SearchSurgeriesResponse,
             self.surgeriesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchImmunotherapies(self, request, return_mimetype, access_map):
+    def runSearchImmunotherapies(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchImmunotherapiesRequest.
         """
@@ -2484,9 +2422,10 @@ class Backend(object):
             protocol.SearchImmunotherapiesResponse,
             self.immunotherapiesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchCelltransplants(self, request, return_mimetype, access_map):
+    def runSearchCelltransplants(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchCelltransplantsRequest.
         """
@@ -2495,9 +2434,10 @@ class Backend(object):
             protocol.SearchCelltransplantsResponse,
             self.celltransplantsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchSlides(self, request, return_mimetype, access_map):
+    def runSearchSlides(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchSlidesRequest.
         """
@@ -2506,9 +2446,10 @@ class Backend(object):
             protocol.SearchSlidesResponse,
             self.slidesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchStudies(self, request, return_mimetype, access_map):
+    def runSearchStudies(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchStudiesRequest.
         """
@@ -2517,9 +2458,10 @@ class Backend(object):
             protocol.SearchStudiesResponse,
             self.studiesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchLabtests(self, request, return_mimetype, access_map):
+    def runSearchLabtests(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchLabtestsRequest.
         """
@@ -2528,9 +2470,10 @@ class Backend(object):
             protocol.SearchLabtestsResponse,
             self.labtestsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchExtractions(self, request, return_mimetype, access_map):
+    def runSearchExtractions(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchExtractionsRequest.
         """
@@ -2539,10 +2482,11 @@ class Backend(object):
             protocol.SearchExtractionsResponse,
             self.extractionsGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchSequencing(self, request, return_mimetype, access_map):
+    def runSearchSequencing(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchSequencingRequest.
         """
@@ -2551,10 +2495,11 @@ class Backend(object):
             protocol.SearchSequencingResponse,
             self.sequencingGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchAlignments(self, request, return_mimetype, access_map):
+    def runSearchAlignments(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchAlignmentsRequest.
         """
@@ -2563,10 +2508,11 @@ class Backend(object):
             protocol.SearchAlignmentsResponse,
             self.alignmentsGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchVariantCalling(self, request, return_mimetype, access_map):
+    def runSearchVariantCalling(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchVariantCallingRequest.
         """
@@ -2575,10 +2521,11 @@ class Backend(object):
             protocol.SearchVariantCallingResponse,
             self.variantCallingGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchFusionDetection(self, request, return_mimetype, access_map):
+    def runSearchFusionDetection(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchFusionDetectionRequest.
         """
@@ -2587,10 +2534,11 @@ class Backend(object):
             protocol.SearchFusionDetectionResponse,
             self.fusionDetectionGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchExpressionAnalysis(self, request, return_mimetype, access_map):
+    def runSearchExpressionAnalysis(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified search SearchExpressionAnalysisRequest.
         """
@@ -2599,10 +2547,11 @@ class Backend(object):
             protocol.SearchExpressionAnalysisResponse,
             self.expressionAnalysisGenerator,
             access_map,
-            return_mimetype
+            return_mimetype,
+            stream=stream
         )
 
-    def runSearchBiosamples(self, request, return_mimetype, access_map):
+    def runSearchBiosamples(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchBiosamplesRequest.
         """
@@ -2611,9 +2560,10 @@ class Backend(object):
             protocol.SearchBiosamplesResponse,
             self.biosamplesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchReads(self, request, return_mimetype, access_map):
+    def runSearchReads(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchReadsRequest.
         """
@@ -2622,9 +2572,10 @@ class Backend(object):
             protocol.SearchReadsResponse,
             self.readsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchReferenceSets(self, request, return_mimetype, access_map):
+    def runSearchReferenceSets(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchReferenceSetsRequest.
         """
@@ -2633,9 +2584,10 @@ class Backend(object):
             protocol.SearchReferenceSetsResponse,
             self.referenceSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchReferences(self, request, return_mimetype, access_map):
+    def runSearchReferences(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchReferenceRequest.
         """
@@ -2644,9 +2596,10 @@ class Backend(object):
             protocol.SearchReferencesResponse,
             self.referencesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchVariantSets(self, request, return_mimetype, access_map):
+    def runSearchVariantSets(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchVariantSetsRequest.
         """
@@ -2655,9 +2608,10 @@ class Backend(object):
             protocol.SearchVariantSetsResponse,
             self.variantSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchVariantAnnotationSets(self, request, return_mimetype, access_map):
+    def runSearchVariantAnnotationSets(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchVariantAnnotationSetsRequest.
         """
@@ -2666,9 +2620,10 @@ class Backend(object):
             protocol.SearchVariantAnnotationSetsResponse,
             self.variantAnnotationSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchVariants(self, request, return_mimetype, access_map):
+    def runSearchVariants(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchVariantRequest.
         """
@@ -2677,9 +2632,10 @@ class Backend(object):
             protocol.SearchVariantsResponse,
             self.variantsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchBeaconRangeVariants(self, request, return_mimetype, access_map):
+    def runSearchBeaconRangeVariants(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchVariantRangeRequest.
         """
@@ -2688,7 +2644,8 @@ class Backend(object):
             protocol.SearchVariantsResponse,
             self.variantsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
     def runSearchBeaconAlleleFreqVariants(self, request, return_mimetype, access_map):
         """
@@ -2702,7 +2659,7 @@ class Backend(object):
         """
         return self.runSearchGenotypesRequest(request, access_map, return_mimetype)
 
-    def runSearchVariantAnnotations(self, request, return_mimetype, access_map):
+    def runSearchVariantAnnotations(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchVariantAnnotationsRequest.
         """
@@ -2711,9 +2668,10 @@ class Backend(object):
             protocol.SearchVariantAnnotationsResponse,
             self.variantAnnotationsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchCallSets(self, request, return_mimetype, access_map):
+    def runSearchCallSets(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchCallSetsRequest.
         """
@@ -2722,9 +2680,10 @@ class Backend(object):
             protocol.SearchCallSetsResponse,
             self.callSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchDatasets(self, request, return_mimetype, access_map):
+    def runSearchDatasets(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchDatasetsRequest.
         """
@@ -2733,9 +2692,10 @@ class Backend(object):
             protocol.SearchDatasetsResponse,
             self.datasetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchExperiments(self, request, return_mimetype, access_map):
+    def runSearchExperiments(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchExperimentsRequest.
         """
@@ -2744,9 +2704,10 @@ class Backend(object):
             protocol.SearchExperimentsResponse,
             self.experimentsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchAnalyses(self, request, return_mimetype, access_map):
+    def runSearchAnalyses(self, request, return_mimetype, access_map, stream=False):
         """
         Runs the specified SearchAnalysesRequest.
         """
@@ -2755,9 +2716,10 @@ class Backend(object):
             protocol.SearchAnalysesResponse,
             self.analysesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchFeatureSets(self, request, return_mimetype, access_map):
+    def runSearchFeatureSets(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchFeatureSetsResponse for the specified
         SearchFeatureSetsRequest object.
@@ -2767,24 +2729,61 @@ class Backend(object):
             protocol.SearchFeatureSetsResponse,
             self.featureSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
+
+    def _getOntologyForTerm(self, termId):
+        """
+        Returns the ontology in the repository holding the specified term
+        ID, given either as an OBO ID or an OBO PURL.
+        """
+        termId = ontologies.toOboId(termId)
+        prefix = termId.split(":")[0]
+        for ontology in self.getDataRepository().getOntologys():
+            if ontology.getOntologyPrefix() == prefix:
+                return ontology
+        raise exceptions.BadRequestException(
+            "No ontology found for term '{}'".format(termId))
 
-    def runSearchFeatures(self, request, return_mimetype, access_map):
+    def _parseIncludeDescendants(self, request):
+        """
+        Returns the includeDescendants option of the specified (JSON
+        string) request, which is not part of the schema.
+        """
+        try:
+            includeDescendants = json.loads(request).get(
+                "includeDescendants", False)
+        except (ValueError, AttributeError):
+            raise exceptions.InvalidJsonException(request)
+        if not isinstance(includeDescendants, bool):
+            raise exceptions.BadRequestException(
+                "includeDescendants must be true or false")
+        return includeDescendants
+
+    def runSearchFeatures(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchFeaturesResponse for the specified
         SearchFeaturesRequest object.
 
+        The request may also hold includeDescendants, which is not part of
+        the schema: if true, the feature_types also match their descendant
+        terms in the sequence ontology.
+
         :param request: JSON string representing searchFeaturesRequest
         :return: JSON string representing searchFeatureResponse
         """
+        includeDescendants = self._parseIncludeDescendants(request)
         return self.runSearchRequest(
             request, protocol.SearchFeaturesRequest,
             protocol.SearchFeaturesResponse,
-            self.featuresGenerator,
+            functools.partial(
+                self.featuresGenerator,
+                includeDescendants=includeDescendants),
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchContinuousSets(self, request, return_mimetype, access_map):
+    def runSearchContinuousSets(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchContinuousSetsResponse for the specified
         SearchContinuousSetsRequest object.
@@ -2794,48 +2793,81 @@ class Backend(object):
             protocol.SearchContinuousSetsResponse,
             self.continuousSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchContinuous(self, request, return_mimetype, access_map):
+    def runSearchContinuous(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchContinuousResponse for the specified
         SearchContinuousRequest object.
 
+        The request may also hold a resolution, which is not part of the
+        schema: a number of bases that each returned value averages over,
+        read from the zoom levels of the BigWig file.
+
         :param request: JSON string representing searchContinuousRequest
         :return: JSON string representing searchContinuousResponse
         """
+        try:
+            resolution = json.loads(request).get("resolution")
+        except (ValueError, AttributeError):
+            raise exceptions.InvalidJsonException(request)
+        if resolution is not None:
+            try:
+                resolution = int(resolution)
+            except (TypeError, ValueError):
+                raise exceptions.BadRequestIntegerException(
+                    "resolution", resolution)
+            if resolution < 1:
+                raise exceptions.BadRequestException(
+                    "resolution must be a positive number of bases")
         return self.runSearchRequest(
             request, protocol.SearchContinuousRequest,
             protocol.SearchContinuousResponse,
-            self.continuousGenerator,
+            functools.partial(
+                self.continuousGenerator, resolution=resolution),
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchGenotypePhenotypes(self, request, return_mimetype, access_map):
+    def runSearchGenotypePhenotypes(self, request, return_mimetype, access_map, stream=False):
         return self.runSearchRequest(
             request, protocol.SearchGenotypePhenotypeRequest,
             protocol.SearchGenotypePhenotypeResponse,
             self.genotypesPhenotypesGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
+
+    def runSearchPhenotypes(self, request, return_mimetype, access_map, stream=False):
+        """
+        Returns a SearchPhenotypesResponse for the specified
+        SearchPhenotypesRequest object.
 
-    def runSearchPhenotypes(self, request, return_mimetype, access_map):
+        The request may also hold includeDescendants, which is not part of
+        the schema: if true, the type also matches its descendant terms.
+        """
+        includeDescendants = self._parseIncludeDescendants(request)
         return self.runSearchRequest(
             request, protocol.SearchPhenotypesRequest,
             protocol.SearchPhenotypesResponse,
-            self.phenotypesGenerator,
+            functools.partial(
+                self.phenotypesGenerator,
+                includeDescendants=includeDescendants),
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchPhenotypeAssociationSets(self, request, return_mimetype, access_map):
+    def runSearchPhenotypeAssociationSets(self, request, return_mimetype, access_map, stream=False):
         return self.runSearchRequest(
             request, protocol.SearchPhenotypeAssociationSetsRequest,
             protocol.SearchPhenotypeAssociationSetsResponse,
             self.phenotypeAssociationSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchRnaQuantificationSets(self, request, return_mimetype, access_map):
+    def runSearchRnaQuantificationSets(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchRnaQuantificationSetsResponse for the specified
         SearchRnaQuantificationSetsRequest object.
@@ -2845,9 +2877,10 @@ class Backend(object):
             protocol.SearchRnaQuantificationSetsResponse,
             self.rnaQuantificationSetsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchRnaQuantifications(self, request, return_mimetype, access_map):
+    def runSearchRnaQuantifications(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchRnaQuantificationResponse for the specified
         SearchRnaQuantificationRequest object.
@@ -2857,9 +2890,10 @@ class Backend(object):
             protocol.SearchRnaQuantificationsResponse,
             self.rnaQuantificationsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
-    def runSearchExpressionLevels(self, request, return_mimetype, access_map):
+    def runSearchExpressionLevels(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchExpressionLevelResponse for the specified
         SearchExpressionLevelRequest object.
@@ -2869,9 +2903,53 @@ class Backend(object):
             protocol.SearchExpressionLevelsResponse,
             self.expressionLevelsGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
+
+    def runSearchExpressionMatrix(self, request, return_mimetype, access_map):
+        """
+        Returns the dense expression sub-matrix of the requested feature
+        names and rna quantifications of an RnaQuantificationSet, serialized
+        in return_mimetype. The schemas have no message for it, so it is
+        returned as a Struct.
+        """
+        try:
+            request = json.loads(request)
+        except ValueError as e:
+            raise exceptions.InvalidJsonException(str(e))
+        rnaQuantificationSetId = request.get("rnaQuantificationSetId")
+        if not rnaQuantificationSetId:
+            raise exceptions.MissingFieldNameException(
+                "rnaQuantificationSetId")
+        compoundId = datamodel.RnaQuantificationSetCompoundId.parse(
+            rnaQuantificationSetId)
+        dataset = self.getDataRepository().getDataset(compoundId.dataset_id)
+        self.getUserAccessTier(dataset, access_map)
+        rnaQuantSet = dataset.getRnaQuantificationSet(rnaQuantificationSetId)
+        samples = [
+            rnaQuantSet.getRnaQuantification(id_).getLocalId()
+            for id_ in request.get("rnaQuantificationIds", [])]
+        names, samples, values = rnaQuantSet.getExpressionMatrix(
+            names=request.get("names", []), samples=samples,
+            threshold=request.get("threshold"))
+        rnaQuantIds = {
+            rnaQuant.getLocalId(): rnaQuant.getId()
+            for rnaQuant in rnaQuantSet.getRnaQuantifications()}
+        # NaN marks a missing value, which JSON has no literal for
+        missing = np.isnan(values)
+        values = values.astype(object)
+        values[missing] = None
+        response = protocol.struct_pb2.Struct()
+        response.update({"expressionMatrices": [{
+            "rnaQuantificationSetId": rnaQuantificationSetId,
+            "names": names,
+            "rnaQuantificationIds": [
+                rnaQuantIds[sample] for sample in samples],
+            "values": values.tolist(),
+        }]})
+        return protocol.serialize(response, return_mimetype)
 
-    def runSearchVariantsByGeneName(self, request, return_mimetype, access_map):
+    def runSearchVariantsByGeneName(self, request, return_mimetype, access_map, stream=False):
         """
         Returns a SearchVariantsByGeneNameResponse for the specified
         SearchVariantsByGeneNameRequest object.
@@ -2881,7 +2959,8 @@ class Backend(object):
             protocol.SearchVariantsByGeneNameResponse,
             self.runSearchVariantsByGeneNameGenerator,
             access_map,
-            return_mimetype)
+            return_mimetype,
+            stream=stream)
 
     def variantsGeneSearchHelper(self, dataset, processedVariantsets, request):
         """
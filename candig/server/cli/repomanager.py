@@ -2,11 +2,13 @@
 repo manager cli
 """
 
+import csv
 import glob
 import json
 import os
 import sys
 import textwrap
+import time
 import traceback
 import urllib.parse
 
@@ -26,6 +28,7 @@ import candig.server.datamodel.variants as variants
 import candig.server.datamodel.peers as peers
 import candig.server.datarepo as datarepo
 import candig.server.exceptions as exceptions
+import candig.server.repo.metadata_ingest as metadata_ingest
 import candig.server.repo.rnaseq2ga as rnaseq2ga
 from candig.server.ontology import OntologyValidator
 
@@ -388,6 +391,7 @@ class RepoManager(object):
                 dataset, name, self._args.dirPath)
         phenotypeAssociationSet.setAttributes(
             json.loads(self._args.attributes))
+        phenotypeAssociationSet.compile()
         self._updateRepo(
             self._repo.insertPhenotypeAssociationSet,
             phenotypeAssociationSet)
@@ -509,6 +513,16 @@ class RepoManager(object):
             self._updateRepo(self._repo.removeFeatureSet, featureSet)
         self._confirmDelete("FeatureSet", featureSet.getLocalId(), func)
 
+    def indexFeatureSet(self):
+        """
+        Builds the spatial index used for range queries into the DB of
+        a feature set of this repo
+        """
+        self._openRepo()
+        dataset = self._repo.getDatasetByName(self._args.datasetName)
+        featureSet = dataset.getFeatureSetByName(self._args.featureSetName)
+        sequence_annotations.createSpatialIndex(featureSet.getDataUrl())
+
     def addContinuousSet(self):
         """
         Adds a new continuous set into this repo
@@ -586,6 +600,49 @@ class RepoManager(object):
             self._updateRepo(self._repo.removeIndividual, individual)
         self._confirmDelete("Individual", individual.getLocalId(), func)
 
+    def ingestMetadata(self):
+        """
+        Adds or updates the clinical or pipeline metadata records of a
+        JSON or NDJSON file in bulk, creating the repo and the dataset
+        if they don't exist
+        """
+        if not self._repo.exists():
+            self._updateRepo(self._repo.initialise)
+        self._repo.open(datarepo.MODE_WRITE)
+        try:
+            self._repo.loadDatasets()
+            try:
+                dataset = self._repo.getDatasetByName(self._args.datasetName)
+            except exceptions.DatasetNameNotFoundException:
+                dataset = datasets.Dataset(self._args.datasetName)
+                self._repo.insertDataset(dataset)
+            ingester = metadata_ingest.MetadataIngester(
+                self._repo, dataset, batchSize=self._args.batchSize,
+                skipInvalid=self._args.skipInvalid)
+            startTime = time.time()
+            if self._args.filePath == "-":
+                metadataFile = sys.stdin
+            else:
+                metadataFile = open(self._args.filePath)
+            try:
+                with self._repo.bulkLoad():
+                    counts = ingester.ingest(
+                        metadata_ingest.readMetadataObjects(metadataFile))
+            finally:
+                if metadataFile is not sys.stdin:
+                    metadataFile.close()
+            self._repo.commit()
+        finally:
+            self._repo.close()
+        elapsed = time.time() - startTime
+        for tableName, count in sorted(counts.items()):
+            print("{}: {} records".format(tableName, count))
+        print("{} records in {:.1f}s, {:.0f} records/s".format(
+            sum(counts.values()), elapsed,
+            sum(counts.values()) / max(elapsed, 1e-6)))
+        for error in ingester.getErrors():
+            print("skipped: {}".format(error), file=sys.stderr)
+
     def addPatient(self):
         """
         Adds a new patient into this repo
@@ -1247,6 +1304,45 @@ class RepoManager(object):
             readGroupSetNames=self._args.readGroupSetName,
             biosampleId=biosampleId, sampleId=sampleId, patientId=patientId)
 
+    def addRnaQuantifications(self):
+        """
+        Adds the rnaQuantifications listed in a manifest into this repo
+        """
+        self._openRepo()
+        dataset = self._repo.getDatasetByName(self._args.datasetName)
+        featureType = "gene"
+        if self._args.transcript:
+            featureType = "transcript"
+        quantifications = []
+        with open(self._args.manifestPath) as manifestFile:
+            for row in csv.DictReader(manifestFile, delimiter="\t"):
+                filePath = row.get("quantificationFilePath")
+                patientId = row.get("patientId")
+                sampleId = row.get("sampleId")
+                if not filePath or not patientId or not sampleId:
+                    raise exceptions.RepoManagerException(
+                        "Each manifest row needs a quantificationFilePath, "
+                        "patientId and sampleId")
+                name = row.get("name") or getNameFromPath(filePath)
+                biosampleId = ""
+                if row.get("biosampleName"):
+                    biosampleId = dataset.getBiosampleByName(
+                        row["biosampleName"]).getId()
+                quantifications.append(
+                    (name, filePath, biosampleId, sampleId, patientId))
+
+        def progress(filesDone, rowsDone, elapsed):
+            print("{}/{} files, {} rows, {:.0f} rows/s".format(
+                filesDone, len(quantifications), rowsDone,
+                rowsDone / max(elapsed, 1e-6)))
+
+        rnaseq2ga.bulkRnaseq2ga(
+            quantifications, self._args.filePath, self._args.format,
+            dataset=dataset, featureType=featureType,
+            description=self._args.description,
+            featureSetNames=self._args.featureSetNames,
+            processes=self._args.processes, progress=progress)
+
     def initRnaQuantificationSet(self):
         """
         Initialize an empty RNA quantification set
@@ -2071,6 +2167,15 @@ class RepoManager(object):
         cls.addFeatureSetNameArgument(removeFeatureSetParser)
         cls.addForceOption(removeFeatureSetParser)
 
+        indexFeatureSetParser = common_cli.addSubparser(
+            subparsers, "index-featureset",
+            "Build the spatial index used for range queries into the "
+            "database of a feature set")
+        indexFeatureSetParser.set_defaults(runner="indexFeatureSet")
+        cls.addRepoArgument(indexFeatureSetParser)
+        cls.addDatasetNameArgument(indexFeatureSetParser)
+        cls.addFeatureSetNameArgument(indexFeatureSetParser)
+
         addContinuousSetParser = common_cli.addSubparser(
             subparsers, "add-continuousset",
             "Add a continuous set to the data repo")
@@ -2127,6 +2232,26 @@ class RepoManager(object):
         cls.addIndividualNameArgument(removeIndividualParser)
         cls.addForceOption(removeIndividualParser)
 
+        ingestMetadataParser = common_cli.addSubparser(
+            subparsers, "ingest-metadata",
+            "Add or update the clinical or pipeline metadata records of a "
+            "JSON or NDJSON file in bulk")
+        ingestMetadataParser.set_defaults(runner="ingestMetadata")
+        cls.addRepoArgument(ingestMetadataParser)
+        cls.addDatasetNameArgument(ingestMetadataParser)
+        cls.addFilePathArgument(
+            ingestMetadataParser,
+            "The path to the JSON or NDJSON metadata file, or - to read "
+            "it from the standard input")
+        ingestMetadataParser.add_argument(
+            "-b", "--batchSize", type=int, default=1000,
+            help="The number of records validated and written in each "
+                 "transaction (default: %(default)s)")
+        ingestMetadataParser.add_argument(
+            "--skipInvalid", action="store_true", default=False,
+            help="Leave out the invalid records and report them, instead "
+                 "of stopping at the first one")
+
         addPatientParser = common_cli.addSubparser(
             subparsers, "add-patient", "Add an Patient to the dataset")
         addPatientParser.set_defaults(runner="addPatient")
@@ -2547,6 +2672,32 @@ class RepoManager(object):
         cls.addRnaFeatureTypeOption(addRnaQuantificationParser)
         cls.addAttributesArgument(addRnaQuantificationParser)
 
+        addRnaQuantificationsParser = common_cli.addSubparser(
+            subparsers, "add-rnaquantifications",
+            "Add the RNA quantifications listed in a manifest to the data "
+            "repo in one bulk load")
+        addRnaQuantificationsParser.set_defaults(
+            runner="addRnaQuantifications")
+        cls.addFilePathArgument(
+            addRnaQuantificationsParser,
+            "The path to the RNA SQLite database to create or modify")
+        addRnaQuantificationsParser.add_argument(
+            "manifestPath",
+            help="The path to a tab separated manifest with a header and "
+                 "quantificationFilePath, patientId, sampleId and optional "
+                 "name and biosampleName columns")
+        cls.addRnaFormatArgument(addRnaQuantificationsParser)
+        cls.addRepoArgument(addRnaQuantificationsParser)
+        cls.addDatasetNameArgument(addRnaQuantificationsParser)
+        addRnaQuantificationsParser.add_argument(
+            "--featureSetNames", default=None, help="Comma separated list")
+        addRnaQuantificationsParser.add_argument(
+            "-p", "--processes", type=int, default=None,
+            help="The number of processes parsing quantification files "
+                 "(default: one per CPU)")
+        cls.addDescriptionOption(addRnaQuantificationsParser, objectType)
+        cls.addRnaFeatureTypeOption(addRnaQuantificationsParser)
+
         objectType = "RnaQuantificationSet"
         initRnaQuantificationSetParser = common_cli.addSubparser(
             subparsers, "init-rnaquantificationset",
@@ -2586,7 +2737,8 @@ class RepoManager(object):
 
         addPhenotypeAssociationSetParser = common_cli.addSubparser(
             subparsers, "add-phenotypeassociationset",
-            "Adds phenotypes in ttl format to the repo.")
+            "Adds phenotypes in ttl format to the repo, compiling their "
+            "associations into an SQLite DB in the same directory.")
         addPhenotypeAssociationSetParser.set_defaults(
             runner="addPhenotypeAssociationSet")
         cls.addRepoArgument(addPhenotypeAssociationSetParser)
@@ -0,0 +1,72 @@
+"""
+Compression of the HTTP responses, negotiated from the Accept-Encoding
+header of the requests.
+
+gzip is always supported. zstd is supported when the optional zstandard
+package is installed.
+"""
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+
+def getSupportedEncodings():
+    """
+    Returns the content encodings the server can apply, in order of
+    preference.
+    """
+    if zstandard is not None:
+        return [ZSTD, GZIP]
+    return [GZIP]
+
+
+def chooseEncoding(acceptEncodings):
+    """
+    Returns the content encoding to apply to a response for the
+    specified Accept-Encoding header (a werkzeug Accept object), or None
+    if the response should be sent as is.
+    """
+    return acceptEncodings.best_match(getSupportedEncodings())
+
+
+class Compressor(object):
+    """
+    Compresses a response body, as a whole or chunk by chunk.
+    """
+    def __init__(self, encoding, level=6):
+        if encoding == GZIP:
+            # wbits of 16 + MAX_WBITS writes the gzip header and trailer
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._flushMode = zlib.Z_SYNC_FLUSH
+        elif encoding == ZSTD and zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            self._flushMode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        else:
+            raise ValueError("Unsupported content encoding: {}".format(encoding))
+
+    def compress(self, data):
+        """
+        Returns the compressed form of the specified bytes.
+        """
+        return self._compressor.compress(data) + self._compressor.flush()
+
+    def iterCompress(self, chunks):
+        """
+        Yields the compressed form of the specified chunks of bytes or
+        strings. Each chunk is flushed as soon as it is compressed, so the
+        client can decode the response as it arrives.
+        """
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            data = self._compressor.compress(chunk) + self._compressor.flush(self._flushMode)
+            if data:
+                yield data
+        yield self._compressor.flush()
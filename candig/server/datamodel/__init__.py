@@ -5,13 +5,19 @@ data in existing formats into GA4GH protocol types.
 
 import base64
 import collections
+import datetime
+import functools
 import glob
 import json
+import operator
 import os
+import threading
 
 import difflib
 
+import candig.server.datamodel.metadata_schema as metadata_schema
 import candig.server.exceptions as exceptions
+import candig.server.tracing as tracing
 import candig.schemas.protocol as protocol
 
 from binascii import Error as binascii_error
@@ -31,6 +37,9 @@ class PysamFileHandleCache(object):
         self._memoTable = dict()
         # Initialize the value even if it will be set up by the config
         self._maxCacheSize = 500
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def setMaxCacheSize(self, size):
         """
@@ -75,10 +84,13 @@ class PysamFileHandleCache(object):
         if dataFile in self._memoTable:
             handle = self._memoTable[dataFile]
             self._update(dataFile, handle)
+            self._hits += 1
             return handle
         else:
+            self._misses += 1
             try:
-                handle = openMethod(dataFile)
+                with tracing.span("fileOpen", {"file": dataFile}):
+                    handle = openMethod(dataFile)
             except ValueError:
                 raise exceptions.FileOpenFailedException(dataFile)
 
@@ -87,13 +99,114 @@ class PysamFileHandleCache(object):
             if len(self._memoTable) > self._maxCacheSize:
                 dataFile = self._removeLru()
                 del self._memoTable[dataFile]
+                self._evictions += 1
             return handle
 
+    def getStats(self):
+        """
+        Returns a dictionary of the cache statistics.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "openFiles": len(self._memoTable),
+            "maxSize": self._maxCacheSize,
+        }
+
 
 # LRU cache of open file handles
 fileHandleCache = PysamFileHandleCache()
 
 
+class SerializedElementCache(object):
+    """
+    LRU cache of serialized protocol elements, keyed by object ID, access
+    tier and serialization format. The cache is bounded by the total
+    length of the serialized elements it holds, and must be cleared when
+    the repository is loaded again.
+    """
+    def __init__(self, maxSize=64 * 1024 * 1024):
+        self._elements = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._maxSize = maxSize
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def setMaxSize(self, size):
+        """
+        Sets the maximum total length of the cached elements. A size of 0
+        disables the cache.
+        """
+        if size < 0:
+            raise ValueError(
+                "The size of the cache must be a positive value")
+        with self._lock:
+            self._maxSize = size
+            self._evict()
+
+    def _evict(self):
+        while self._size > self._maxSize:
+            _, data = self._elements.popitem(last=False)
+            self._size -= len(data)
+
+    def get(self, key):
+        """
+        Returns the serialized element stored under the specified key, or
+        None if it isn't cached.
+        """
+        with self._lock:
+            data = self._elements.get(key)
+            if data is None:
+                self._misses += 1
+            else:
+                self._elements.move_to_end(key)
+                self._hits += 1
+            return data
+
+    def put(self, key, data):
+        """
+        Stores the specified serialized element under the specified key.
+        """
+        if len(data) > self._maxSize:
+            return
+        with self._lock:
+            previous = self._elements.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._elements[key] = data
+            self._size += len(data)
+            self._evict()
+
+    def clear(self):
+        """
+        Removes all the cached elements and resets the statistics.
+        """
+        with self._lock:
+            self._elements.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+
+    def getStats(self):
+        """
+        Returns a dictionary of the cache statistics.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "elements": len(self._elements),
+                "size": self._size,
+                "maxSize": self._maxSize,
+            }
+
+
+# LRU cache of the serialized clinical and pipeline metadata records
+serializedElementCache = SerializedElementCache()
+
+
 class CompoundId(object):
     """
     Base class for an id composed of several different parts.  Each
@@ -164,9 +277,27 @@ class CompoundId(object):
             setattr(self, idFieldName, obfuscated)
 
     def __str__(self):
-        values = [getattr(self, f) for f in self.fields]
-        compoundIdStr = self.join(values)
-        return self.obfuscate(compoundIdStr)
+        # Compound IDs aren't modified once created, so the string is
+        # only formatted once
+        idStr = self.__dict__.get('_idStr')
+        if idStr is None:
+            values = [getattr(self, f) for f in self.fields]
+            idStr = self._idStr = self.obfuscate(self.join(values))
+        return idStr
+
+    def getChildIdFormatter(self, childCompoundIdClass):
+        """
+        Returns the formatter of the IDs of the specified child compound
+        ID class below this compound ID, as returned by getIdFormatter.
+        The formatters are cached, so the prefix shared by the IDs of the
+        children is only obfuscated once.
+        """
+        formatters = self.__dict__.setdefault('_childIdFormatters', {})
+        formatter = formatters.get(childCompoundIdClass)
+        if formatter is None:
+            formatter = childCompoundIdClass.getIdFormatter(self)
+            formatters[childCompoundIdClass] = formatter
+        return formatter
 
     @classmethod
     def join(cls, splits):
@@ -207,7 +338,8 @@ class CompoundId(object):
     def parse(cls, compoundIdStr):
         """
         Parses the specified compoundId string and returns an instance
-        of this CompoundId class.
+        of this CompoundId class. The parsed IDs are memoized, so the
+        returned instance may be shared and must not be modified.
 
         :raises: An ObjectWithIdNotFoundException if parsing fails. This is
         because this method is a client-facing method, and if a malformed
@@ -216,6 +348,10 @@ class CompoundId(object):
         """
         if not isinstance(compoundIdStr, str):
             raise exceptions.BadIdentifierException(compoundIdStr)
+        return _parseCompoundId(cls, compoundIdStr)
+
+    @classmethod
+    def _parse(cls, compoundIdStr):
         try:
             deobfuscated = cls.deobfuscate(compoundIdStr)
         except binascii_error:
@@ -247,6 +383,48 @@ class CompoundId(object):
             raise exceptions.ObjectWithIdNotFoundException(compoundIdStr)
         return cls(None, *splits)
 
+    @classmethod
+    def getIdFormatter(cls, parentCompoundId):
+        """
+        Returns a function mapping the local IDs of the fields this class
+        adds to its parent class to the string form of the compound ID
+        of this class below the specified parent, i.e.
+        formatter(*localIds) == str(cls(parentCompoundId, *localIds)).
+
+        The parent fields are joined once, and the longest prefix of
+        them spanning whole base64 quanta is obfuscated once, so that
+        each call only encodes the local part. This is meant for
+        materializing large numbers of child IDs.
+        """
+        parentFields = parentCompoundId.fields
+        localFields = cls.fields[len(parentFields):]
+        if (cls.__bases__[0].fields != parentFields or
+                cls.differentiatorFieldName in localFields):
+            raise ValueError(
+                "{} IDs cannot be formatted from a {} parent".format(
+                    cls.__name__, type(parentCompoundId).__name__))
+        numLocalIds = len(localFields)
+        values = [getattr(parentCompoundId, f) for f in parentFields]
+        # Strip the closing '"]' of the empty local ID
+        prefix = cls.join(values + [""])[:-2].encode('utf-8')
+        split = len(prefix) - len(prefix) % 3
+        obfuscatedHead = base64.urlsafe_b64encode(
+            prefix[:split]).decode('utf-8')
+        tail = prefix[split:]
+        encode = cls.encode
+
+        def formatter(*localIds):
+            if len(localIds) != numLocalIds:
+                raise ValueError(
+                    "Incorrect number of fields provided to instantiate ID")
+            for localId in localIds:
+                if not isinstance(localId, str):
+                    raise exceptions.BadIdentifierNotStringException(localId)
+            data = '","'.join(map(encode, localIds)).encode('utf-8')
+            return obfuscatedHead + base64.urlsafe_b64encode(
+                tail + data + b'"]').replace(b'=', b'').decode('utf-8')
+        return formatter
+
     @classmethod
     def obfuscate(cls, idStr):
         """
@@ -282,6 +460,15 @@ class CompoundId(object):
         return cls.join(['notValid'] * len(cls.fields))
 
 
+# Number of parsed compound IDs memoized by CompoundId.parse
+COMPOUND_ID_PARSE_CACHE_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=COMPOUND_ID_PARSE_CACHE_SIZE)
+def _parseCompoundId(compoundIdClass, compoundIdStr):
+    return compoundIdClass._parse(compoundIdStr)
+
+
 class ReferenceSetCompoundId(CompoundId):
     """
     The compound ID for reference sets.
@@ -731,9 +918,15 @@ class DatamodelObject(object):
     parent container.
     """
 
+    __slots__ = (
+        "_parentContainer", "_localId", "_compoundId", "_attributes")
+
     compoundIdClass = None
     """ The class for compoundIds. Must be set in concrete subclasses.  """
 
+    _objectAttr = {}
+    """ Maps the fields that can be searched to their getters. """
+
     def __init__(self, parentContainer, localId):
         self._parentContainer = parentContainer
         self._localId = localId
@@ -742,7 +935,6 @@ class DatamodelObject(object):
             parentId = parentContainer.getCompoundId()
         self._compoundId = self.compoundIdClass(parentId, localId)
         self._attributes = {}
-        self._objectAttr = {}
 
     def getId(self):
         """
@@ -790,6 +982,17 @@ class DatamodelObject(object):
         else:
             self._attributes = {}
 
+    def toSerializedProtocolElement(self, tier=0, mimetype=None):
+        """
+        Returns the protocol element of this object for the specified access
+        tier serialized in the specified mimetype, or as protobuf bytes if
+        mimetype is None.
+        """
+        protocolElement = self.toProtocolElement(tier=tier)
+        if mimetype is None:
+            return protocolElement.SerializeToString()
+        return protocol.serialize(protocolElement, mimetype)
+
     def validateAttribute(self, attribute_name, attributes, tier=0):
         """
         Return True if the access level is higher than the required, False otherwise.
@@ -868,11 +1071,221 @@ class DatamodelObject(object):
         try:
             return self._objectAttr[field]()
         except (AttributeError, KeyError):
-            try:
-                closeMatch = difflib.get_close_matches(field, list(self._objectAttr.keys()))[0]
-                raise exceptions.BadFieldNameException(field, closeMatch)
-            except IndexError:
-                raise exceptions.BadFieldNameNoCloseMatchException(field)
+            raise self._getBadFieldNameException(field, self._objectAttr.keys())
+
+    def _getBadFieldNameException(self, field, fieldNames):
+        """
+        Returns the exception to raise for a field that isn't one of
+        fieldNames, suggesting the closest of these names.
+        """
+        closeMatches = difflib.get_close_matches(field, list(fieldNames))
+        if closeMatches:
+            return exceptions.BadFieldNameException(field, closeMatches[0])
+        return exceptions.BadFieldNameNoCloseMatchException(field)
+
+
+def _getGetterName(field):
+    return "get" + field[0].upper() + field[1:]
+
+
+def _makeFieldGetter(index):
+    def getter(self):
+        return self._values[index]
+    return getter
+
+
+def _makeTierGetter(index):
+    def getter(self):
+        return self._tiers[index]
+    return getter
+
+
+def _makeRecordGetter(names):
+    """
+    Returns a function returning the tuple of the specified attributes
+    of its argument.
+    """
+    getter = operator.attrgetter(*names)
+    if len(names) == 1:
+        return lambda record: (getter(record),)
+    return getter
+
+
+class TieredMetadataObject(DatamodelObject):
+    """
+    Superclass of the clinical and pipeline metadata types. Besides the
+    common fields, a record holds the fields listed in the fields class
+    attribute, each with the lowest access tier allowed to see its value.
+    Concrete subclasses set fields from the metadata_schema, and get a
+    getter for each field and tier (getPatientId, getPatientIdTier, ...).
+
+    The values and tiers are kept in two tuples to keep the records
+    small. Records do not change once loaded, and their protocol elements
+    only depend on the access tier of the request, so the serialized
+    elements are memoized in the serializedElementCache.
+    """
+    __slots__ = (
+        "_created", "_updated", "_name", "_description", "_values",
+        "_tiers")
+
+    protocolClass = None
+    """ The protocol class of the records. Must be set in concrete subclasses. """
+
+    fields = ()
+    """ The fields of the records. Must be set in concrete subclasses. """
+
+    def __init_subclass__(cls, **kwargs):
+        super(TieredMetadataObject, cls).__init_subclass__(**kwargs)
+        if "fields" not in cls.__dict__:
+            return
+        tierFields = tuple(
+            metadata_schema.getTierField(field) for field in cls.fields)
+        cls._fieldIndexes = {
+            field: index for index, field in enumerate(cls.fields)}
+        cls._emptyValues = (None,) * len(cls.fields)
+        cls._getRecordValues = staticmethod(_makeRecordGetter(cls.fields))
+        cls._getRecordTiers = staticmethod(_makeRecordGetter(tierFields))
+        for index, field in enumerate(cls.fields):
+            tierField = metadata_schema.getTierField(field)
+            setattr(cls, _getGetterName(field), _makeFieldGetter(index))
+            setattr(cls, _getGetterName(tierField), _makeTierGetter(index))
+
+    def __init__(self, parentContainer, localId):
+        super(TieredMetadataObject, self).__init__(parentContainer, localId)
+        now = datetime.datetime.now().isoformat()
+        self._created = now
+        self._updated = now
+        self._name = localId
+        self._description = None
+        self._values = self._emptyValues
+        self._tiers = self._emptyValues
+
+    def toProtocolElement(self, tier=0):
+        """
+        Returns the protocol element of this record, holding the fields
+        whose tier is at most the specified access tier.
+        """
+        record = {
+            'id': self.getId(),
+            'dataset_id': self._parentContainer.getId(),
+            'created': self._created,
+            'updated': self._updated,
+            'name': self._name,
+            'description': self._description,
+        }
+        for field, value, fieldTier in zip(
+                self.fields, self._values, self._tiers):
+            # A field without a tier hides the fields that follow it
+            if fieldTier is None:
+                break
+            if tier >= fieldTier:
+                record[field] = value
+        protocolElement = self.protocolClass(**record)
+        self.serializeMetadataAttributes(protocolElement, tier)
+        return protocolElement
+
+    def toSerializedProtocolElement(self, tier=0, mimetype=None):
+        # Keyed by ID so that the cache doesn't keep records alive
+        key = (self.getId(), tier, mimetype)
+        data = serializedElementCache.get(key)
+        if data is None:
+            data = super(TieredMetadataObject, self).toSerializedProtocolElement(
+                tier=tier, mimetype=mimetype)
+            serializedElementCache.put(key, data)
+        return data
+
+    def populateFromRow(self, record):
+        """
+        Populates this record from the specified row of its repository
+        table.
+        """
+        self._created = record.created
+        self._updated = record.updated
+        self._name = record.name
+        self._description = record.description
+        self.setAttributesJson(record.attributes)
+        self._values = self._getRecordValues(record)
+        self._tiers = self._getRecordTiers(record)
+        return self
+
+    def populateFromJson(self, jsonString):
+        """
+        Populates this record from the specified JSON representation of
+        its protocol element.
+        """
+        try:
+            parsed = protocol.fromJson(jsonString, self.protocolClass)
+        except Exception:
+            raise exceptions.InvalidJsonException(jsonString)
+        self._created = parsed.created
+        self._updated = parsed.updated
+        self._name = parsed.name
+        self._description = parsed.description
+        attributes = {}
+        for key in parsed.attributes.attr:
+            attributes[key] = protocol.toJsonDict(parsed.attributes.attr[key])['values']
+        self.setAttributes(attributes)
+        self._values = self._getRecordValues(parsed)
+        self._tiers = self._getRecordTiers(parsed)
+        return self
+
+    def getFieldValues(self):
+        """
+        Returns a dictionary of the values and tiers of the fields of this
+        record, keyed by the names of their repository columns.
+        """
+        values = dict(zip(self.fields, self._values))
+        for field, fieldTier in zip(self.fields, self._tiers):
+            values[metadata_schema.getTierField(field)] = fieldTier
+        return values
+
+    def mapper(self, field):
+        index = self._fieldIndexes.get(field)
+        if index is None:
+            raise self._getBadFieldNameException(field, self.fields)
+        return self._values[index]
+
+    def getCreated(self):
+        return self._created
+
+    def getUpdated(self):
+        return self._updated
+
+    def getName(self):
+        return self._name
+
+    def getDescription(self):
+        return self._description
+
+    def setDescription(self, description):
+        self._description = description
+
+
+class CachedProtocolElement(object):
+    """
+    Stands for the protocol element of a TieredMetadataObject at a
+    given access tier. Response builders splice its cached serialization
+    into the response instead of copying a newly built message.
+    """
+    __slots__ = ("_object", "_tier")
+
+    def __init__(self, object_, tier=0):
+        self._object = object_
+        self._tier = tier
+
+    def serialize(self, mimetype=None):
+        """
+        Returns the element serialized in the specified mimetype, or as
+        protobuf bytes if mimetype is None.
+        """
+        return self._object.toSerializedProtocolElement(
+            tier=self._tier, mimetype=mimetype)
+
+    def toProtocolElement(self):
+        """
+        Returns the element as a protocol message.
+        """
+        return self._object.toProtocolElement(tier=self._tier)
 
 
 class PysamDatamodelMixin(object):
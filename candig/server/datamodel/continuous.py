@@ -5,9 +5,9 @@ into GA4GH native objects.
 
 import random
 import re
-import math
 
 # no step/span; requires numpy
+import numpy as np
 import pyBigWig
 
 # for running bigwig tool externally
@@ -179,7 +179,7 @@ class BigWigDataSource:
 
     def __init__(self, sourceFile):
         self._sourceFile = sourceFile
-        self._INCREMENT = 10000  # max results per bw query
+        self._INCREMENT = 100000  # max results per bw query
         self._MAX_VALUES = 1000  # max values length
 
     def checkReference(self, reference):
@@ -192,15 +192,10 @@ class BigWigDataSource:
             return False
         return True
 
-    def readValuesPyBigWig(self, reference, start, end):
+    def _openPyBigWig(self, reference, start, end):
         """
-        Use pyBigWig package to read a BigWig file for the
-        given range and return a protocol object.
-
-        pyBigWig returns an array of values that fill the query range.
-        Not sure if it is possible to get the step and span.
-
-        This method trims NaN values from the start and end.
+        Returns the (cached) pyBigWig handle of the source file and the query
+        range clipped to the reference, after checking the query.
 
         pyBigWig throws an exception if end is outside of the
         reference range. This function checks the query range
@@ -211,7 +206,8 @@ class BigWigDataSource:
             raise exceptions.ReferenceNameNotFoundException(reference)
         if start < 0:
             start = 0
-        bw = pyBigWig.open(self._sourceFile)
+        bw = datamodel.fileHandleCache.getFileHandle(
+            self._sourceFile, pyBigWig.open)
         referenceLen = bw.chroms(reference)
         if referenceLen is None:
             raise exceptions.ReferenceNameNotFoundException(reference)
@@ -220,30 +216,108 @@ class BigWigDataSource:
         if start >= end:
             raise exceptions.ReferenceRangeErrorException(
                 reference, start, end)
+        return bw, start, end
 
-        data = protocol.Continuous()
-        curStart = start
-        curEnd = curStart + self._INCREMENT
-        while curStart < end:
-            if curEnd > end:
-                curEnd = end
-            for i, val in enumerate(bw.values(reference, curStart, curEnd)):
-                if not math.isnan(val):
-                    if len(data.values) == 0:
-                        data.start = curStart + i
-                    data.values.append(val)
-                    if len(data.values) == self._MAX_VALUES:
+    def _valueRuns(self, chunks, step=1):
+        """
+        Yields protocol objects for the runs of values that are not NaN in
+        the specified (start, values) chunks of consecutive values, each
+        value covering step bases. Runs longer than _MAX_VALUES are split,
+        and runs continue across chunk boundaries.
+        """
+        runStart = None
+        pending = []
+        pendingLen = 0
+        for chunkStart, values in chunks:
+            valid = np.concatenate(([0], ~np.isnan(values), [0]))
+            edges = np.diff(valid.astype(np.int8))
+            starts = np.flatnonzero(edges == 1)
+            ends = np.flatnonzero(edges == -1)
+            for first, last in zip(starts, ends):
+                position = chunkStart + first * step
+                if runStart is not None and \
+                        runStart + pendingLen * step != position:
+                    for data in self._splitRun(runStart, pending, step):
+                        yield data
+                    runStart, pending, pendingLen = None, [], 0
+                if runStart is None:
+                    runStart = position
+                pending.append(values[first:last])
+                pendingLen += last - first
+                if pendingLen >= self._MAX_VALUES:
+                    # emit the full messages of a long run straight away
+                    runValues = np.concatenate(pending)
+                    full = pendingLen - pendingLen % self._MAX_VALUES
+                    for data in self._splitRun(
+                            runStart, [runValues[:full]], step):
                         yield data
-                        data = protocol.Continuous()
-                elif len(data.values) > 0:
-                    # data.values.append(float('NaN'))
+                    runStart += full * step
+                    pending = [runValues[full:]]
+                    pendingLen -= full
+            if runStart is not None and runStart + pendingLen * step != \
+                    chunkStart + len(values) * step:
+                for data in self._splitRun(runStart, pending, step):
                     yield data
-                    data = protocol.Continuous()
-            curStart = curEnd
-            curEnd = curStart + self._INCREMENT
+                runStart, pending, pendingLen = None, [], 0
+        if runStart is not None:
+            for data in self._splitRun(runStart, pending, step):
+                yield data
 
-        bw.close()
-        if len(data.values) > 0:
+    def _splitRun(self, runStart, pieces, step):
+        """
+        Yields protocol objects of at most _MAX_VALUES values for a run of
+        values given as a list of arrays.
+        """
+        values = np.concatenate(pieces)
+        for offset in range(0, len(values), self._MAX_VALUES):
+            data = protocol.Continuous()
+            data.start = runStart + offset * step
+            data.values.extend(
+                values[offset:offset + self._MAX_VALUES].tolist())
+            yield data
+
+    def readValuesPyBigWig(self, reference, start, end):
+        """
+        Use pyBigWig package to read a BigWig file for the
+        given range and return a protocol object.
+
+        pyBigWig returns an array of values that fill the query range.
+        Not sure if it is possible to get the step and span.
+
+        This method trims NaN values from the start and end.
+        """
+        bw, start, end = self._openPyBigWig(reference, start, end)
+
+        def chunks():
+            for curStart in range(start, end, self._INCREMENT):
+                curEnd = min(curStart + self._INCREMENT, end)
+                yield curStart, bw.values(
+                    reference, curStart, curEnd, numpy=True)
+
+        for data in self._valueRuns(chunks()):
+            yield data
+
+    def readStatsPyBigWig(self, reference, start, end, resolution):
+        """
+        Use pyBigWig package to read the mean values of the given range in
+        bins of resolution bases, and return protocol objects where each
+        value covers resolution bases (the last one may cover fewer, at the
+        end of the range).
+
+        The bin means come from the zoom levels of the BigWig file when it
+        has a suitable one, so this is cheap for ranges of any length.
+        """
+        bw, start, end = self._openPyBigWig(reference, start, end)
+        numBins = (end - start) // resolution
+        stats = []
+        if numBins > 0:
+            stats = bw.stats(
+                reference, start, start + numBins * resolution,
+                nBins=numBins)
+        if start + numBins * resolution < end:
+            stats += bw.stats(reference, start + numBins * resolution, end)
+        values = np.array(stats, dtype=np.float64)
+        for data in self._valueRuns([(start, values)], resolution):
             yield data
 
     def readValuesBigWigToWig(self, reference, start, end):
@@ -287,9 +361,14 @@ class BigWigDataSource:
 
         return wiggleReader.getData()
 
-    def bigWigToProtocol(self, reference, start, end):
+    def bigWigToProtocol(self, reference, start, end, resolution=None):
         # return self.readValuesBigWigToWig(reference, start, end)
-        for continuousObj in self.readValuesPyBigWig(reference, start, end):
+        if resolution is not None and resolution > 1:
+            reader = self.readStatsPyBigWig(
+                reference, start, end, resolution)
+        else:
+            reader = self.readValuesPyBigWig(reference, start, end)
+        for continuousObj in reader:
             yield continuousObj
 
 
@@ -366,7 +445,8 @@ class FileContinuousSet(AbstractContinuousSet):
         """
         return self._filePath
 
-    def getContinuous(self, referenceName=None, start=None, end=None):
+    def getContinuous(self, referenceName=None, start=None, end=None,
+                      resolution=None):
         """
         Method passed to runSearchRequest to fulfill the request to
         yield continuous protocol objects that satisfy the given query.
@@ -374,10 +454,13 @@ class FileContinuousSet(AbstractContinuousSet):
         :param str referenceName: name of reference (ex: "chr1")
         :param start: castable to int, start position on reference
         :param end: castable to int, end position on reference
+        :param resolution: if greater than 1, each value is the mean over
+            this many bases
         :return: yields a protocol.Continuous at a time
         """
         bigWigReader = BigWigDataSource(self._filePath)
-        for continuousObj in bigWigReader.bigWigToProtocol(referenceName, start, end):
+        for continuousObj in bigWigReader.bigWigToProtocol(
+                referenceName, start, end, resolution=resolution):
             yield continuousObj
 
 
@@ -1272,6 +1272,45 @@ class Dataset(datamodel.DatamodelObject):
             raise exceptions.ReadGroupNotFoundException(id_)
         return self._readGroupSetIdMap[id_]
 
+    def getObjectCounts(self):
+        """
+        Returns a dictionary mapping the name of each type of object in
+        this dataset to the number of objects of that type.
+        """
+        return {
+            "variantSets": len(self._variantSetIds),
+            "featureSets": len(self._featureSetIds),
+            "continuousSets": len(self._continuousSetIds),
+            "readGroupSets": len(self._readGroupSetIds),
+            "biosamples": len(self._biosampleIds),
+            "individuals": len(self._individualIds),
+            "phenotypeAssociationSets": len(self._phenotypeAssociationSetIds),
+            "rnaQuantificationSets": len(self._rnaQuantificationSetIds),
+            "patients": len(self._patientIds),
+            "enrollments": len(self._enrollmentIds),
+            "consents": len(self._consentIds),
+            "diagnoses": len(self._diagnosisIds),
+            "samples": len(self._sampleIds),
+            "treatments": len(self._treatmentIds),
+            "outcomes": len(self._outcomeIds),
+            "complications": len(self._complicationIds),
+            "tumourboards": len(self._tumourboardIds),
+            "chemotherapies": len(self._chemotherapyIds),
+            "radiotherapies": len(self._radiotherapyIds),
+            "surgeries": len(self._surgeryIds),
+            "immunotherapies": len(self._immunotherapyIds),
+            "celltransplants": len(self._celltransplantIds),
+            "slides": len(self._slideIds),
+            "studies": len(self._studyIds),
+            "labtests": len(self._labtestIds),
+            "extractions": len(self._extractionIds),
+            "sequencing": len(self._sequencingIds),
+            "alignments": len(self._alignmentIds),
+            "variantcalling": len(self._variantCallingIds),
+            "fusiondetection": len(self._fusionDetectionIds),
+            "expressionanalysis": len(self._expressionAnalysisIds),
+        }
+
     def getInfo(self):
         """
         Returns the info of this dataset.
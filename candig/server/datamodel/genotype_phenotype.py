@@ -4,10 +4,18 @@ objects.
 """
 
 import collections
+import collections.abc
+import glob
+import os
+import sqlite3
+
 import rdflib
+import rdflib.store
 
 import candig.server.datamodel as datamodel
+import candig.server.datamodel.ontologies as ontologies
 import candig.server.exceptions as exceptions
+import candig.server.sqlite_backend as sqlite_backend
 
 import candig.schemas.protocol as protocol
 
@@ -17,6 +25,197 @@ LABEL = 'http://www.w3.org/2000/01/rdf-schema#label'
 HAS_QUALITY = 'http://purl.obolibrary.org/obo/BFO_0000159'
 
 
+"""
+An RdfPhenotypeAssociationSet can be compiled into an SQLite DB stored next
+to its RDF files, so that searches are indexed lookups rather than SPARQL
+queries over the graph. The ASSOCIATION table holds one row per association
+as returned by the base SPARQL query, and the DETAIL table holds the
+(subject, predicate, object) triples describing the features, environments
+and phenotypes of the associations, which include their labels.
+
+The DB also holds the whole RDF graph of the set, read through the
+SqliteTripleStore, so that the server never has to parse the RDF files of a
+compiled set. The TERM table holds the distinct RDF terms, the TRIPLE table
+the triples as term IDs, and the NAMESPACE table the prefixes bound in the
+graph.
+"""
+ASSOCIATION_DB_VERSION = 1
+
+_associationColumns = [
+    'association', 'environment', 'environment_label', 'feature',
+    'feature_label', 'phenotype', 'phenotype_label', 'sources',
+    'evidence_type', 'external_id', 'phenotype_quality']
+
+
+def getAssociationDbPath(dataDir):
+    """
+    Returns the path of the association DB compiled from the RDF files in
+    the specified directory.
+    """
+    return os.path.join(dataDir, "associations.db")
+
+
+class PhenotypeAssociationDbBackend(sqlite_backend.SqliteBackedDataSource):
+    """
+    Queries the association DB compiled from an RdfPhenotypeAssociationSet.
+    """
+    def searchAssociationsInDb(self, clauses, args):
+        """
+        Returns the associations matching all of the specified SQL clauses
+        over the ASSOCIATION table, as dicts holding the non-null columns.
+        """
+        sql = "SELECT {} FROM ASSOCIATION".format(
+            ", ".join(_associationColumns))
+        if len(clauses) > 0:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+        query = self._dbconn.execute(sql, args)
+        return [
+            dict((key, value) for key, value in zip(_associationColumns, row)
+                 if value is not None)
+            for row in query.fetchall()]
+
+    def getDetailsInDb(self, subjects, batchSize=500):
+        """
+        Returns a dict mapping each of the specified subjects to the dict
+        of its predicates and objects.
+        """
+        details = collections.defaultdict(dict)
+        subjects = list(subjects)
+        for i in range(0, len(subjects), batchSize):
+            batch = subjects[i:i + batchSize]
+            sql = (
+                "SELECT subject, predicate, object FROM DETAIL "
+                "WHERE subject IN ({}) ORDER BY id").format(
+                ", ".join(["?"] * len(batch)))
+            for subject, predicate, object_ in self._dbconn.execute(
+                    sql, batch):
+                details[subject][predicate] = object_
+        return details
+
+
+def _termToRow(term):
+    """
+    Returns the (kind, value, datatype, lang) row of the TERM table
+    storing the specified RDF term.
+    """
+    if isinstance(term, rdflib.term.Literal):
+        datatype = term.datatype
+        if datatype is not None:
+            datatype = str(datatype)
+        return ('L', str(term), datatype, term.language)
+    if isinstance(term, rdflib.term.BNode):
+        return ('B', str(term), None, None)
+    return ('U', str(term), None, None)
+
+
+def _rowToTerm(kind, value, datatype, lang):
+    """
+    Returns the RDF term stored in the specified row of the TERM table.
+    """
+    if kind == 'L':
+        if datatype is not None:
+            datatype = rdflib.term.URIRef(datatype)
+        return rdflib.term.Literal(value, lang=lang, datatype=datatype)
+    if kind == 'B':
+        return rdflib.term.BNode(value)
+    return rdflib.term.URIRef(value)
+
+
+class SqliteTripleStore(rdflib.store.Store):
+    """
+    A read-only rdflib store over the RDF graph saved in an association
+    DB. Its connections come from the SQLite connection pool, so the graph
+    is read through the OS page cache shared by all server processes
+    rather than held in memory by each of them.
+    """
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, dbFile):
+        super(SqliteTripleStore, self).__init__()
+        self._dataSource = sqlite_backend.SqliteBackedDataSource(dbFile)
+
+    def _getTermId(self, term):
+        kind, value, datatype, lang = _termToRow(term)
+        query = self._dataSource._dbconn.execute(
+            "SELECT id FROM TERM WHERE value = ? AND kind = ? AND "
+            "datatype IS ? AND lang IS ?", (value, kind, datatype, lang))
+        row = query.fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def triples(self, triple_pattern, context=None):
+        clauses = []
+        args = []
+        for column, term in zip(['s', 'p', 'o'], triple_pattern):
+            if term is not None:
+                termId = self._getTermId(term)
+                if termId is None:
+                    return
+                clauses.append("TRIPLE.{} = ?".format(column))
+                args.append(termId)
+        sql = (
+            "SELECT s.kind, s.value, s.datatype, s.lang, "
+            "p.kind, p.value, p.datatype, p.lang, "
+            "o.kind, o.value, o.datatype, o.lang FROM TRIPLE "
+            "JOIN TERM s ON s.id = TRIPLE.s "
+            "JOIN TERM p ON p.id = TRIPLE.p "
+            "JOIN TERM o ON o.id = TRIPLE.o")
+        if len(clauses) > 0:
+            sql += " WHERE " + " AND ".join(clauses)
+        for row in self._dataSource._dbconn.execute(sql, args):
+            yield (
+                _rowToTerm(*row[0:4]), _rowToTerm(*row[4:8]),
+                _rowToTerm(*row[8:12])), iter(())
+
+    def __len__(self, context=None):
+        query = self._dataSource._dbconn.execute(
+            "SELECT COUNT(*) FROM TRIPLE")
+        return query.fetchone()[0]
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def namespaces(self):
+        query = self._dataSource._dbconn.execute(
+            "SELECT prefix, namespace FROM NAMESPACE ORDER BY id")
+        for prefix, namespace in query.fetchall():
+            yield prefix, rdflib.term.URIRef(namespace)
+
+    def namespace(self, prefix):
+        query = self._dataSource._dbconn.execute(
+            "SELECT namespace FROM NAMESPACE WHERE prefix = ?", (prefix,))
+        row = query.fetchone()
+        if row is None:
+            return None
+        return rdflib.term.URIRef(row[0])
+
+    def prefix(self, namespace):
+        query = self._dataSource._dbconn.execute(
+            "SELECT prefix FROM NAMESPACE WHERE namespace = ?",
+            (str(namespace),))
+        row = query.fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def bind(self, prefix, namespace, override=True, replace=False):
+        # The prefixes of the graph were saved with it
+        pass
+
+    def add(self, triple, context, quoted=False):
+        raise exceptions.NotImplementedException(
+            "The compiled RDF graph is read-only")
+
+    def remove(self, triple, context=None):
+        raise exceptions.NotImplementedException(
+            "The compiled RDF graph is read-only")
+
+
 class AbstractPhenotypeAssociationSet(datamodel.DatamodelObject):
     compoundIdClass = datamodel.PhenotypeAssociationSetCompoundId
 
@@ -40,7 +239,8 @@ class SimulatedPhenotypeAssociationSet(AbstractPhenotypeAssociationSet):
             parentContainer, localId)
         self._numAssociations = numAssociations
 
-    def getAssociations(self, request=None, featureSets=[]):
+    def getAssociations(self, request=None, featureSets=[],
+                        phenotypeOntology=None):
         associations = []
         # no request, return a generic set of associations
         if request is None:
@@ -208,7 +408,7 @@ class G2PUtility(object):
         Formats the ontology term object for query
         """
         elementClause = None
-        if not isinstance(terms, collections.Iterable):
+        if not isinstance(terms, collections.abc.Iterable):
             terms = [terms]
         elements = []
         for term in terms:
@@ -239,7 +439,7 @@ class G2PUtility(object):
         Formats a set of identifiers for query
         """
         elementClause = None
-        if isinstance(element, collections.Iterable):
+        if isinstance(element, collections.abc.Iterable):
             elements = []
             for _id in element:
                 elements.append('?{} = <{}> '.format(
@@ -454,30 +654,86 @@ class RdfPhenotypeAssociationSet(G2PUtility, AbstractPhenotypeAssociationSet):
         super(RdfPhenotypeAssociationSet, self).__init__(
             parentContainer, localId)
 
-        # initialize graph
-        self._rdfGraph = rdflib.ConjunctiveGraph()
         # save the path
         self._dataUrl = dataDir
+        self._graph = None
+        self._version = None
+        self._associationDb = None
+        if self._isAssociationDbCurrent():
+            # The graph saved in the DB is opened on first use
+            self._associationDb = PhenotypeAssociationDbBackend(
+                getAssociationDbPath(dataDir))
+        else:
+            self._parseDataFiles()
 
-        self._scanDataFiles(dataDir, ['*.ttl'])
+    @property
+    def _rdfGraph(self):
+        """
+        The RDF graph of this set, either parsed from its RDF files or
+        read from its association DB.
+        """
+        if self._graph is None:
+            self._graph = rdflib.Graph(
+                store=SqliteTripleStore(getAssociationDbPath(self._dataUrl)))
+            self._readVersion()
+        return self._graph
 
+    def _parseDataFiles(self):
+        """
+        Parses the RDF files of this set into an in-memory graph.
+        """
+        # initialize graph
+        self._graph = rdflib.ConjunctiveGraph()
+        self._scanDataFiles(self._dataUrl, ['*.ttl'])
+        self._readVersion()
+
+    def _readVersion(self):
         # extract version
         cgdTTL = rdflib.URIRef("http://data.monarchinitiative.org/ttl/cgd.ttl")
         versionInfo = rdflib.URIRef(
             'http://www.w3.org/2002/07/owl#versionInfo')
         self._version = None
-        for _, _, obj in self._rdfGraph.triples((cgdTTL, versionInfo, None)):
+        for _, _, obj in self._graph.triples((cgdTTL, versionInfo, None)):
             self._version = obj.toPython()
 
     def getAssociations(
-            self, request=None, featureSets=[]):
+            self, request=None, featureSets=[], phenotypeOntology=None):
         """
         This query is the main search mechanism.
         It queries the graph for annotations that match the
         AND of [feature,environment,phenotype].
+
+        If a phenotypeOntology is given for a SearchPhenotypesRequest with
+        a type, only the associations whose phenotype type is that term or
+        one of its descendants in the ontology are returned.
         """
         if len(featureSets) == 0:
             featureSets = self.getParentContainer().getFeatureSets()
+        if self._associationDb is not None:
+            associationList = self._queryAssociationDb(request, featureSets)
+        else:
+            associationList = self._queryRdfGraph(request, featureSets)
+
+        if phenotypeOntology is not None and request.type.term_id:
+            ancestorId = ontologies.toOboId(request.type.term_id)
+            associationList = [
+                association for association in associationList
+                if phenotypeOntology.isDescendant(
+                    ontologies.toOboId(
+                        association['phenotype'].get(TYPE, '')),
+                    ancestorId)]
+
+        # create GA4GH objects
+        associations = [
+            self._toGA4GH(assoc, featureSets) for
+            assoc in associationList]
+        return associations
+
+    def _queryRdfGraph(self, request, featureSets):
+        """
+        Returns the list of association dicts matching the specified
+        request, queried from the RDF graph.
+        """
         # query to do search
         query = self._formatFilterQuery(request, featureSets)
         associations = self._rdfGraph.query(query)
@@ -514,12 +770,216 @@ class RdfPhenotypeAssociationSet(G2PUtility, AbstractPhenotypeAssociationSet):
                 # elements of an association: environment, evidence,
                 # feature, phenotype and sources, each with their
                 # references (labels or URIrefs)
+        return associationList
 
-        # create GA4GH objects
-        associations = [
-            self._toGA4GH(assoc, featureSets) for
-            assoc in associationList]
-        return associations
+    def _queryAssociationDb(self, request, featureSets):
+        """
+        Returns the list of association dicts matching the specified
+        request, queried from the compiled association DB.
+        """
+        clauses, args = self._formatFilterSql(request, featureSets)
+        with self._associationDb as dataSource:
+            associationList = dataSource.searchAssociationsInDb(
+                clauses, args)
+            subjects = set()
+            for association in associationList:
+                subjects.update((
+                    association['feature'], association['environment'],
+                    association['phenotype']))
+            details = dataSource.getDetailsInDb(subjects)
+        for association in associationList:
+            for key in ['feature', 'environment', 'phenotype']:
+                detail = dict(details[association[key]])
+                detail['id'] = association[key]
+                association[key] = detail
+            association['evidence'] = association['phenotype'][HAS_QUALITY]
+            association['id'] = association['association']
+        return associationList
+
+    def _formatLabelSql(self, element_type):
+        """
+        Returns an SQL clause matching the label of the element of an
+        association against a regular expression.
+        """
+        return (
+            "EXISTS (SELECT 1 FROM DETAIL WHERE DETAIL.subject = "
+            "ASSOCIATION.{} AND DETAIL.predicate = ? AND "
+            "DETAIL.object REGEXP ?)").format(element_type)
+
+    def _formatFilterSql(self, request=None, featureSets=[]):
+        """
+        Returns the list of SQL clauses over the ASSOCIATION table and
+        their arguments that filter the associations as the request asks,
+        with the same semantics as the SPARQL query filters.
+        """
+        clauses = []
+        args = []
+        if issubclass(request.__class__,
+                      protocol.SearchGenotypePhenotypeRequest):
+            if request.feature_ids:
+                featureClauses = []
+                for featureId, feature in self._getFeatureFilters(
+                        request, featureSets):
+                    if feature is None:
+                        featureClauses.append("feature = ?")
+                        args.append(featureId)
+                    else:
+                        featureClauses.append(self._formatLabelSql('feature'))
+                        args.extend([LABEL, feature.gene_symbol])
+                if len(featureClauses) > 0:
+                    clauses.append("({})".format(" OR ".join(featureClauses)))
+            evidenceClauses = []
+            for evidence in request.evidence:
+                if evidence.description:
+                    evidenceClauses.append(
+                        self._formatLabelSql('environment'))
+                    args.extend([LABEL, evidence.description])
+            if len(evidenceClauses) > 0:
+                clauses.append("({})".format(" OR ".join(evidenceClauses)))
+            if request.phenotype_ids:
+                clauses.append("phenotype IN ({})".format(
+                    ", ".join(["?"] * len(request.phenotype_ids))))
+                args.extend(request.phenotype_ids)
+
+        if issubclass(request.__class__, protocol.SearchPhenotypesRequest):
+            if request.id:
+                clauses.append("phenotype = ?")
+                args.append(request.id)
+            if request.description:
+                clauses.append(self._formatLabelSql('phenotype'))
+                args.extend([LABEL, request.description])
+            if len(request.qualifiers) > 0:
+                qualities = [
+                    term.term_id or self._toNamespaceURL(term.term)
+                    for term in request.qualifiers]
+                clauses.append(
+                    "EXISTS (SELECT 1 FROM DETAIL WHERE DETAIL.subject = "
+                    "ASSOCIATION.phenotype AND DETAIL.predicate = ? AND "
+                    "DETAIL.object IN ({}))".format(
+                        ", ".join(["?"] * len(qualities))))
+                args.append(HAS_QUALITY)
+                args.extend(qualities)
+        return clauses, args
+
+    def compile(self):
+        """
+        Compiles the RDF graph of this set and its associations into the
+        association DB, replacing any existing one.
+        """
+        dbPath = getAssociationDbPath(self._dataUrl)
+        tmpPath = dbPath + ".tmp"
+        if os.path.exists(tmpPath):
+            os.unlink(tmpPath)
+        if self._associationDb is not None:
+            self._associationDb = None
+            self._parseDataFiles()
+        results = self._rdfGraph.query(self._formatFilterQuery())
+        associationRows = []
+        subjects = []
+        for binding in results.bindings:
+            if '?feature' in binding:
+                association = self._bindingsToDict(binding)
+                associationRows.append(tuple(
+                    association.get(column)
+                    for column in _associationColumns))
+                subjects.extend([
+                    binding[rdflib.term.Variable(key)]
+                    for key in ['feature', 'environment', 'phenotype']])
+        subjects = list(collections.OrderedDict.fromkeys(subjects))
+        dbconn = sqlite3.connect(tmpPath)
+        try:
+            dbconn.execute(
+                "CREATE TABLE ASSOCIATION (id INTEGER PRIMARY KEY, {})".format(
+                    ", ".join(
+                        "{} TEXT".format(column)
+                        for column in _associationColumns)))
+            dbconn.executemany(
+                "INSERT INTO ASSOCIATION ({}) VALUES ({})".format(
+                    ", ".join(_associationColumns),
+                    ", ".join(["?"] * len(_associationColumns))),
+                associationRows)
+            dbconn.execute(
+                "CREATE TABLE DETAIL (id INTEGER PRIMARY KEY, "
+                "subject TEXT, predicate TEXT, object)")
+            dbconn.executemany(
+                "INSERT INTO DETAIL (subject, predicate, object) "
+                "VALUES (:subject, :predicate, :object)",
+                self._detailTuples(subjects))
+            for column in ['feature', 'environment', 'phenotype']:
+                dbconn.execute(
+                    "CREATE INDEX ASSOCIATION_{0} ON ASSOCIATION ({0})".format(
+                        column))
+            dbconn.execute(
+                "CREATE INDEX DETAIL_subject ON DETAIL (subject, predicate)")
+            self._writeGraph(dbconn)
+            dbconn.execute(
+                "PRAGMA user_version = {:d}".format(ASSOCIATION_DB_VERSION))
+            dbconn.commit()
+        finally:
+            dbconn.close()
+        os.replace(tmpPath, dbPath)
+        self._associationDb = PhenotypeAssociationDbBackend(dbPath)
+
+    def _writeGraph(self, dbconn):
+        """
+        Saves the RDF graph of this set into the TERM, TRIPLE and
+        NAMESPACE tables of the specified association DB connection.
+        """
+        dbconn.execute(
+            "CREATE TABLE TERM (id INTEGER PRIMARY KEY, kind TEXT, "
+            "value TEXT, datatype TEXT, lang TEXT)")
+        dbconn.execute(
+            "CREATE TABLE TRIPLE (s INTEGER, p INTEGER, o INTEGER)")
+        dbconn.execute(
+            "CREATE TABLE NAMESPACE (id INTEGER PRIMARY KEY, prefix TEXT, "
+            "namespace TEXT)")
+        termIds = {}
+
+        def getTermId(term):
+            row = _termToRow(term)
+            termId = termIds.get(row)
+            if termId is None:
+                termId = termIds[row] = len(termIds) + 1
+            return termId
+
+        dbconn.executemany(
+            "INSERT INTO TRIPLE (s, p, o) VALUES (?, ?, ?)",
+            ((getTermId(subject), getTermId(predicate), getTermId(object_))
+             for subject, predicate, object_ in self._rdfGraph.triples(
+                 (None, None, None))))
+        dbconn.executemany(
+            "INSERT INTO TERM (id, kind, value, datatype, lang) "
+            "VALUES (?, ?, ?, ?, ?)",
+            ((termId,) + row for row, termId in termIds.items()))
+        dbconn.executemany(
+            "INSERT INTO NAMESPACE (prefix, namespace) VALUES (?, ?)",
+            ((prefix, str(namespace))
+             for prefix, namespace in self._rdfGraph.namespaces()))
+        dbconn.execute("CREATE INDEX TERM_value ON TERM (value)")
+        dbconn.execute("CREATE INDEX TRIPLE_spo ON TRIPLE (s, p, o)")
+        dbconn.execute("CREATE INDEX TRIPLE_po ON TRIPLE (p, o)")
+        dbconn.execute("CREATE INDEX TRIPLE_o ON TRIPLE (o)")
+
+    def _isAssociationDbCurrent(self):
+        """
+        Returns True if the association DB of this set exists, has the
+        current layout and is newer than all of its RDF files.
+        """
+        dbPath = getAssociationDbPath(self._dataUrl)
+        if not os.path.exists(dbPath):
+            return False
+        dbconn = sqlite3.connect(
+            "file:{}?mode=ro".format(os.path.abspath(dbPath)), uri=True)
+        try:
+            version = dbconn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            dbconn.close()
+        if version != ASSOCIATION_DB_VERSION:
+            return False
+        dbModified = os.path.getmtime(dbPath)
+        return all(
+            os.path.getmtime(filename) <= dbModified
+            for filename in glob.glob(os.path.join(self._dataUrl, '*.ttl')))
 
     def _formatFilterQuery(self, request=None, featureSets=[]):
         """
@@ -542,29 +1002,41 @@ class RdfPhenotypeAssociationSet(G2PUtility, AbstractPhenotypeAssociationSet):
         query = query.replace("#%FILTER%", filter)
         return query
 
+    def _getFeatureFilters(self, request, featureSets):
+        """
+        Returns the list of (featureId, feature) pairs to match for the
+        feature_ids of the specified request. Either the ID of the feature
+        in the graph is known, or the feature is matched by its label.
+        """
+        featureFilters = []
+        for featureId in request.feature_ids:
+            for featureSet in featureSets:
+                try:
+                    compoundId = datamodel.FeatureCompoundId.parse(featureId)
+                    # we have a compoundId, so use it to lookup
+                    if compoundId.feature_set == self.getLocalId():
+                        featureFilters.append((compoundId.featureId, None))
+                        break
+                    else:
+                        feature = featureSet.getFeature(compoundId)
+                        if feature:
+                            featureFilters.append((None, feature))
+                            break
+                except Exception:
+                    featureFilters.append(("NO-FIND", None))
+        return featureFilters
+
     def _filterSearchGenotypePhenotypeRequest(self, request, featureSets):
         filters = []
         if request.feature_ids:
             featureFilters = []
-            for featureId in request.feature_ids:
-                for featureSet in featureSets:
-                    try:
-                        compoundId = datamodel.FeatureCompoundId.parse(featureId)
-                        # we have a compoundId, so use it to lookup
-                        if compoundId.feature_set == self.getLocalId():
-                            featureFilters.append(
-                                self._formatId(
-                                    compoundId.featureId, 'feature'))
-                            break
-                        else:
-                            feature = featureSet.getFeature(compoundId)
-                            if feature:
-                                featureFilters.append(
-                                    self._formatFeatureClause(feature))
-                                break
-                    except Exception:
-                        featureFilters.append(
-                            self._formatId("NO-FIND", 'feature'))
+            for featureId, feature in self._getFeatureFilters(
+                    request, featureSets):
+                if feature is None:
+                    featureFilters.append(
+                        self._formatId(featureId, 'feature'))
+                else:
+                    featureFilters.append(self._formatFeatureClause(feature))
             if len(featureFilters) > 0:
                 filters.append("({})".format(" || ".join(featureFilters)))
 
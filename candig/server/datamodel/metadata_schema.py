@@ -0,0 +1,478 @@
+"""
+The fields of the clinical and pipeline metadata tables.
+
+Besides the fields common to every table (id, datasetId, created, updated,
+name, description and attributes), each record holds the string fields
+listed here. Each of them is paired with an integer field of the same name
+suffixed by "Tier", holding the lowest access tier allowed to see the value.
+Both the datamodel classes and the repository models are built from these
+lists. Fields are listed in the order records are projected onto their
+protocol elements, since a field without a tier hides the fields after it.
+"""
+
+import collections
+
+
+def getTierField(field):
+    """
+    Returns the name of the field holding the access tier of field.
+    """
+    return field + "Tier"
+
+
+CLINICAL_TABLES = collections.OrderedDict([
+    ("Patient", (
+        "patientId",
+        "otherIds",
+        "dateOfBirth",
+        "gender",
+        "ethnicity",
+        "race",
+        "provinceOfResidence",
+        "dateOfDeath",
+        "causeOfDeath",
+        "autopsyTissueForResearch",
+        "priorMalignancy",
+        "dateOfPriorMalignancy",
+        "familyHistoryAndRiskFactors",
+        "familyHistoryOfPredispositionSyndrome",
+        "detailsOfPredispositionSyndrome",
+        "geneticCancerSyndrome",
+        "otherGeneticConditionOrSignificantComorbidity",
+        "occupationalOrEnvironmentalExposure",
+    )),
+    ("Enrollment", (
+        "patientId",
+        "enrollmentInstitution",
+        "enrollmentApprovalDate",
+        "crossEnrollment",
+        "otherPersonalizedMedicineStudyName",
+        "otherPersonalizedMedicineStudyId",
+        "ageAtEnrollment",
+        "eligibilityCategory",
+        "statusAtEnrollment",
+        "primaryOncologistName",
+        "primaryOncologistContact",
+        "referringPhysicianName",
+        "referringPhysicianContact",
+        "summaryOfIdRequest",
+        "treatingCentreName",
+        "treatingCentreProvince",
+    )),
+    ("Consent", (
+        "patientId",
+        "consentId",
+        "consentDate",
+        "consentVersion",
+        "patientConsentedTo",
+        "reasonForRejection",
+        "wasAssentObtained",
+        "dateOfAssent",
+        "assentFormVersion",
+        "ifAssentNotObtainedWhyNot",
+        "reconsentDate",
+        "reconsentVersion",
+        "consentingCoordinatorName",
+        "previouslyConsented",
+        "nameOfOtherBiobank",
+        "hasConsentBeenWithdrawn",
+        "dateOfConsentWithdrawal",
+        "typeOfConsentWithdrawal",
+        "reasonForConsentWithdrawal",
+        "consentFormComplete",
+    )),
+    ("Diagnosis", (
+        "patientId",
+        "diagnosisId",
+        "diagnosisDate",
+        "ageAtDiagnosis",
+        "cancerType",
+        "classification",
+        "cancerSite",
+        "histology",
+        "methodOfDefinitiveDiagnosis",
+        "sampleType",
+        "sampleSite",
+        "tumorGrade",
+        "gradingSystemUsed",
+        "sitesOfMetastases",
+        "stagingSystem",
+        "versionOrEditionOfTheStagingSystem",
+        "specificTumorStageAtDiagnosis",
+        "prognosticBiomarkers",
+        "biomarkerQuantification",
+        "additionalMolecularTesting",
+        "additionalTestType",
+        "laboratoryName",
+        "laboratoryAddress",
+        "siteOfMetastases",
+        "stagingSystemVersion",
+        "specificStage",
+        "cancerSpecificBiomarkers",
+        "additionalMolecularDiagnosticTestingPerformed",
+        "additionalTest",
+    )),
+    ("Sample", (
+        "patientId",
+        "sampleId",
+        "diagnosisId",
+        "localBiobankId",
+        "collectionDate",
+        "collectionHospital",
+        "sampleType",
+        "tissueDiseaseState",
+        "anatomicSiteTheSampleObtainedFrom",
+        "cancerType",
+        "cancerSubtype",
+        "pathologyReportId",
+        "morphologicalCode",
+        "topologicalCode",
+        "shippingDate",
+        "receivedDate",
+        "qualityControlPerformed",
+        "estimatedTumorContent",
+        "quantity",
+        "units",
+        "associatedBiobank",
+        "otherBiobank",
+        "sopFollowed",
+        "ifNotExplainAnyDeviation",
+        "recordingDate",
+        "startInterval",
+    )),
+    ("Treatment", (
+        "patientId",
+        "courseNumber",
+        "therapeuticModality",
+        "systematicTherapyAgentName",
+        "treatmentPlanType",
+        "treatmentIntent",
+        "startDate",
+        "stopDate",
+        "reasonForEndingTheTreatment",
+        "responseToTreatment",
+        "responseCriteriaUsed",
+        "dateOfRecurrenceOrProgressionAfterThisTreatment",
+        "unexpectedOrUnusualToxicityDuringTreatment",
+        "drugIdNumbers",
+        "diagnosisId",
+        "treatmentPlanId",
+    )),
+    ("Outcome", (
+        "patientId",
+        "physicalExamId",
+        "dateOfAssessment",
+        "diseaseResponseOrStatus",
+        "otherResponseClassification",
+        "minimalResidualDiseaseAssessment",
+        "methodOfResponseEvaluation",
+        "responseCriteriaUsed",
+        "summaryStage",
+        "sitesOfAnyProgressionOrRecurrence",
+        "vitalStatus",
+        "height",
+        "weight",
+        "heightUnits",
+        "weightUnits",
+        "performanceStatus",
+        "overallSurvivalInMonths",
+        "diseaseFreeSurvivalInMonths",
+        "siteOfRelapseOrProgression",
+        "intervalProgressionOrRecurrence",
+        "intervalRegressionOrDecreaseInDisease",
+        "levelOfMalignancy",
+        "treatmentInducedNeoplasmSite",
+        "dateOfDiagnosisOfTreatmentInducedNeoplasm",
+    )),
+    ("Complication", (
+        "patientId",
+        "date",
+        "lateComplicationOfTherapyDeveloped",
+        "lateToxicityDetail",
+        "suspectedTreatmentInducedNeoplasmDeveloped",
+        "treatmentInducedNeoplasmDetails",
+    )),
+    ("Tumourboard", (
+        "patientId",
+        "dateOfMolecularTumorBoard",
+        "typeOfSampleAnalyzed",
+        "typeOfTumourSampleAnalyzed",
+        "analysesDiscussed",
+        "somaticSampleType",
+        "normalExpressionComparator",
+        "diseaseExpressionComparator",
+        "hasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancer",
+        "actionableTargetFound",
+        "molecularTumorBoardRecommendation",
+        "germlineDnaSampleId",
+        "tumorDnaSampleId",
+        "tumorRnaSampleId",
+        "germlineSnvDiscussed",
+        "somaticSnvDiscussed",
+        "cnvsDiscussed",
+        "structuralVariantDiscussed",
+        "classificationOfVariants",
+        "clinicalValidationProgress",
+        "typeOfValidation",
+        "agentOrDrugClass",
+        "levelOfEvidenceForExpressionTargetAgentMatch",
+        "didTreatmentPlanChangeBasedOnProfilingResult",
+        "howTreatmentHasAlteredBasedOnProfiling",
+        "reasonTreatmentPlanDidNotChangeBasedOnProfiling",
+        "detailsOfTreatmentPlanImpact",
+        "patientOrFamilyInformedOfGermlineVariant",
+        "patientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfiling",
+        "summaryReport",
+        "actionableExpressionOutlier",
+        "actionableGermlineVariant",
+        "germlineVariantsDrug",
+        "germlineVariantsDrugClass",
+        "germlineVariantsDiscussed",
+        "actionableSomaticVariants",
+        "somaticVariantsDrug",
+        "somaticVariantsDrugClass",
+        "somaticVariantsDiscussed",
+        "anyActionableExpressionOutlier",
+        "expressionDrug",
+        "expressionDrugClass",
+        "expressionTypeOfAnalysisUsed",
+        "expressionTypeOfInformationUtility",
+        "expressionAlteredGene",
+        "expressionNonActionableGene",
+        "expressionTypeOfAlteration",
+        "anyActionableGermlineVariants",
+        "germlineVariantsTypeOfAnalysisUsed",
+        "germlineVariantsClassificationOfVariants",
+        "germlineVariantsTypeOfInformationUtility",
+        "anyActionableSomaticVariants",
+        "somaticVariantsTypeOfAnalysisUsed",
+        "somaticVariantsTypeOfInformationUtility",
+        "somaticVariantsNonActionable",
+    )),
+    ("Chemotherapy", (
+        "patientId",
+        "courseNumber",
+        "startDate",
+        "stopDate",
+        "systematicTherapyAgentName",
+        "route",
+        "dose",
+        "doseFrequency",
+        "doseUnit",
+        "daysPerCycle",
+        "numberOfCycle",
+        "treatmentIntent",
+        "treatingCentreName",
+        "type",
+        "protocolCode",
+        "recordingDate",
+        "treatmentPlanId",
+    )),
+    ("Radiotherapy", (
+        "patientId",
+        "courseNumber",
+        "startDate",
+        "stopDate",
+        "therapeuticModality",
+        "baseline",
+        "testResult",
+        "testResultStd",
+        "treatingCentreName",
+        "startIntervalRad",
+        "startIntervalRadRaw",
+        "recordingDate",
+        "adjacentFields",
+        "adjacentFractions",
+        "complete",
+        "brachytherapyDose",
+        "radiotherapyDose",
+        "siteNumber",
+        "technique",
+        "treatedRegion",
+        "treatmentPlanId",
+        "radiationType",
+        "radiationSite",
+        "totalDose",
+        "boostSite",
+        "boostDose",
+    )),
+    ("Surgery", (
+        "patientId",
+        "startDate",
+        "stopDate",
+        "sampleId",
+        "collectionTimePoint",
+        "diagnosisDate",
+        "site",
+        "type",
+        "recordingDate",
+        "treatmentPlanId",
+        "courseNumber",
+    )),
+    ("Immunotherapy", (
+        "patientId",
+        "startDate",
+        "immunotherapyType",
+        "immunotherapyTarget",
+        "immunotherapyDetail",
+        "treatmentPlanId",
+        "courseNumber",
+    )),
+    ("Celltransplant", (
+        "patientId",
+        "startDate",
+        "cellSource",
+        "donorType",
+        "treatmentPlanId",
+        "courseNumber",
+    )),
+    ("Slide", (
+        "patientId",
+        "sampleId",
+        "slideId",
+        "slideOtherId",
+        "lymphocyteInfiltrationPercent",
+        "tumorNucleiPercent",
+        "monocyteInfiltrationPercent",
+        "normalCellsPercent",
+        "tumorCellsPercent",
+        "stromalCellsPercent",
+        "eosinophilInfiltrationPercent",
+        "neutrophilInfiltrationPercent",
+        "granulocyteInfiltrationPercent",
+        "necrosisPercent",
+        "inflammatoryInfiltrationPercent",
+        "proliferatingCellsNumber",
+        "sectionLocation",
+    )),
+    ("Study", (
+        "patientId",
+        "startDate",
+        "endDate",
+        "status",
+        "recordingDate",
+    )),
+    ("Labtest", (
+        "patientId",
+        "startDate",
+        "endDate",
+        "collectionDate",
+        "eventType",
+        "testResults",
+        "timePoint",
+        "recordingDate",
+    )),
+])
+
+PIPELINE_TABLES = collections.OrderedDict([
+    ("Extraction", (
+        "extractionId",
+        "sampleId",
+        "rnaBlood",
+        "dnaBlood",
+        "rnaTissue",
+        "dnaTissue",
+        "site",
+    )),
+    ("Sequencing", (
+        "sequencingId",
+        "sampleId",
+        "dnaLibraryKit",
+        "dnaSeqPlatform",
+        "dnaReadLength",
+        "rnaLibraryKit",
+        "rnaSeqPlatform",
+        "rnaReadLength",
+        "pcrCycles",
+        "extractionId",
+        "site",
+    )),
+    ("Alignment", (
+        "alignmentId",
+        "sampleId",
+        "inHousePipeline",
+        "alignmentTool",
+        "mergeTool",
+        "markDuplicates",
+        "realignerTarget",
+        "indelRealigner",
+        "baseRecalibrator",
+        "printReads",
+        "idxStats",
+        "flagStat",
+        "coverage",
+        "insertSizeMetrics",
+        "fastqc",
+        "reference",
+        "sequencingId",
+        "site",
+    )),
+    ("VariantCalling", (
+        "variantCallingId",
+        "sampleId",
+        "inHousePipeline",
+        "variantCaller",
+        "tabulate",
+        "annotation",
+        "mergeTool",
+        "rdaToTab",
+        "delly",
+        "postFilter",
+        "clipFilter",
+        "cosmic",
+        "dbSnp",
+        "alignmentId",
+        "site",
+    )),
+    ("FusionDetection", (
+        "fusionDetectionId",
+        "sampleId",
+        "inHousePipeline",
+        "svDetection",
+        "fusionDetection",
+        "realignment",
+        "annotation",
+        "genomeReference",
+        "geneModels",
+        "alignmentId",
+        "site",
+    )),
+    ("ExpressionAnalysis", (
+        "expressionAnalysisId",
+        "sampleId",
+        "readLength",
+        "reference",
+        "alignmentTool",
+        "bamHandling",
+        "expressionEstimation",
+        "sequencingId",
+        "site",
+    )),
+])
+
+# Columns kept in the repository for compatibility with older releases,
+# which are no longer part of the protocol
+LEGACY_FIELDS = {
+    "Treatment": ("systematicTherapyAgentName", "drugIdNumbers"),
+}
+
+
+def getColumns(tableName):
+    """
+    Returns all the fields of the clinical or pipeline metadata table
+    with the specified name, in the order of its columns.
+    """
+    if tableName in CLINICAL_TABLES:
+        return CLINICAL_TABLES[tableName]
+    return PIPELINE_TABLES[tableName]
+
+
+def getFields(tableName):
+    """
+    Returns the fields of the clinical or pipeline metadata table with
+    the specified name that are part of the protocol, in order.
+    """
+    legacyFields = LEGACY_FIELDS.get(tableName, ())
+    return tuple(
+        field for field in getColumns(tableName)
+        if field not in legacyFields)
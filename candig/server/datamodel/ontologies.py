@@ -2,8 +2,12 @@
 Support for Ontologies.
 """
 
+import bisect
 import collections
+import hashlib
+import json
 import os.path
+import threading
 
 import candig.server.exceptions as exceptions
 import candig.server.datamodel.obo_parser as obo_parser
@@ -13,6 +17,39 @@ import candig.schemas.protocol as protocol
 
 SEQUENCE_ONTOLOGY_PREFIX = "SO"
 
+# Bump this when the layout of the compiled ontology changes, so that stale
+# compiled files are ignored and rewritten.
+COMPILED_ONTOLOGY_VERSION = 3
+
+
+def getCompiledOntologyPath(dataUrl):
+    """
+    Returns the path of the compiled form of the specified OBO file.
+    """
+    return dataUrl + ".compiled"
+
+
+def toOboId(termId):
+    """
+    Returns the OBO style ID (e.g. "HP:0000118") of the specified term ID,
+    which may also be an OBO PURL such as
+    "http://purl.obolibrary.org/obo/HP_0000118".
+    """
+    if termId.startswith("http") and "/obo/" in termId:
+        return termId.rsplit("/", 1)[1].replace("_", ":", 1)
+    return termId
+
+
+def _hashFile(path):
+    """
+    Returns the SHA-256 hex digest of the contents of the specified file.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as fileHandle:
+        for block in iter(lambda: fileHandle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
 
 class OboReader(obo_parser.OBOReader):
     """
@@ -40,6 +77,12 @@ class Ontology(object):
         self._dataUrl = None
         # There can be duplicate names, so we need to store a list of IDs.
         self._nameIdMap = collections.defaultdict(list)
+        self._idNameMap = {}
+        self._parentIds = {}
+        # The subsumption index, see _buildSubsumptionIndex
+        self._postOrder = {}
+        self._postOrderIds = []
+        self._descendantIntervals = {}
 
     def _readFile(self):
         if not os.path.exists(self._dataUrl):
@@ -52,6 +95,8 @@ class Ontology(object):
                     self._dataUrl, "Duplicate ID {}".format(record.id))
             ids.add(record.id)
             self._nameIdMap[record.name].append(record.id)
+            self._idNameMap[record.id] = record.name
+            self._parentIds[record.id] = record._parents
         self._sourceVersion = reader.format_version
         if len(ids) == 0:
             raise exceptions.OntologyFileFormatException(
@@ -59,23 +104,178 @@ class Ontology(object):
         # To get prefix, pull out an ID and parse it.
         self._ontologyPrefix = record.id.split(":")[0]
         self._sourceVersion = reader.data_version
+        self._buildSubsumptionIndex()
+
+    def _buildSubsumptionIndex(self):
+        """
+        Numbers the terms in post-order over a depth first spanning tree of
+        the is_a DAG, and labels each term with the intervals of post-order
+        numbers covering all of its descendants. The intervals of a term are
+        its own spanning subtree merged with those of its children, so
+        multiple inheritance is accounted for, and checking whether a term
+        is a descendant of another is a binary search over a handful of
+        intervals.
+        """
+        children = collections.defaultdict(list)
+        roots = []
+        for termId, parentIds in self._parentIds.items():
+            knownParents = [
+                parentId for parentId in parentIds
+                if parentId in self._parentIds]
+            for parentId in knownParents:
+                children[parentId].append(termId)
+            if len(knownParents) == 0:
+                roots.append(termId)
+        postOrder = {}
+        postOrderIds = []
+        subtreeStart = {}
+        # Terms caught in an is_a cycle have no root, so they are visited
+        # after the roots.
+        for root in roots + sorted(self._parentIds):
+            if root in subtreeStart:
+                continue
+            subtreeStart[root] = len(postOrderIds)
+            stack = [(root, iter(children[root]))]
+            while len(stack) > 0:
+                termId, childIter = stack[-1]
+                child = next(childIter, None)
+                if child is None:
+                    stack.pop()
+                    postOrder[termId] = len(postOrderIds)
+                    postOrderIds.append(termId)
+                elif child not in subtreeStart:
+                    subtreeStart[child] = len(postOrderIds)
+                    stack.append((child, iter(children[child])))
+        intervals = {}
+        for termId in postOrderIds:
+            termIntervals = [(subtreeStart[termId], postOrder[termId])]
+            for child in children[termId]:
+                if child in intervals:
+                    termIntervals.extend(zip(*intervals[child]))
+            termIntervals.sort()
+            starts, ends = [], []
+            for start, end in termIntervals:
+                if len(ends) > 0 and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            intervals[termId] = (tuple(starts), tuple(ends))
+        self._postOrder = postOrder
+        self._postOrderIds = postOrderIds
+        self._descendantIntervals = intervals
+
+    def _getCompiledState(self):
+        """
+        Returns the parsed state of this ontology as stored in the compiled
+        file.
+        """
+        return {
+            "sourceVersion": self._sourceVersion,
+            "ontologyPrefix": self._ontologyPrefix,
+            "nameIdMap": dict(self._nameIdMap),
+            "idNameMap": self._idNameMap,
+            "parentIds": self._parentIds,
+            "postOrderIds": self._postOrderIds,
+            "descendantIntervals": self._descendantIntervals,
+        }
+
+    def _setCompiledState(self, state):
+        self._sourceVersion = state["sourceVersion"]
+        self._ontologyPrefix = state["ontologyPrefix"]
+        self._nameIdMap = collections.defaultdict(list, state["nameIdMap"])
+        self._idNameMap = state["idNameMap"]
+        self._parentIds = state["parentIds"]
+        self._postOrderIds = state["postOrderIds"]
+        self._postOrder = {
+            termId: i for i, termId in enumerate(self._postOrderIds)}
+        self._descendantIntervals = {
+            termId: (tuple(starts), tuple(ends))
+            for termId, (starts, ends)
+            in state["descendantIntervals"].items()}
+
+    def compile(self):
+        """
+        Writes the parsed ontology next to its OBO file, keyed by the size,
+        modification time and hash of the OBO file, so that later loads can
+        skip parsing it. The compiled file is plain JSON, so reading it
+        cannot run code. It is written to a temporary file named after
+        the process and thread and renamed into place, as the server
+        workers may compile it at the same time.
+        """
+        stat = os.stat(self._dataUrl)
+        compiled = {
+            "version": COMPILED_ONTOLOGY_VERSION,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": _hashFile(self._dataUrl),
+            "state": self._getCompiledState(),
+        }
+        compiledPath = getCompiledOntologyPath(self._dataUrl)
+        tempPath = "{}.{}.{}.tmp".format(
+            compiledPath, os.getpid(), threading.get_ident())
+        try:
+            with open(tempPath, "w") as compiledFile:
+                json.dump(compiled, compiledFile)
+            os.replace(tempPath, compiledPath)
+        except BaseException:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            raise
+
+    def _readCompiled(self):
+        """
+        Populates this ontology from its compiled file and returns True, or
+        returns False if there is no compiled file matching the OBO file.
+        The OBO file is only hashed when its size or modification time
+        differs from the one compiled.
+        """
+        compiledPath = getCompiledOntologyPath(self._dataUrl)
+        try:
+            with open(compiledPath) as compiledFile:
+                compiled = json.load(compiledFile)
+            stat = os.stat(self._dataUrl)
+        except (EnvironmentError, ValueError):
+            return False
+        if not isinstance(compiled, dict) or \
+                compiled.get("version") != COMPILED_ONTOLOGY_VERSION:
+            return False
+        if (compiled["size"], compiled["mtime"]) != \
+                (stat.st_size, stat.st_mtime_ns) and \
+                compiled["sha256"] != _hashFile(self._dataUrl):
+            return False
+        self._setCompiledState(compiled["state"])
+        return True
 
     def populateFromFile(self, dataUrl):
         """
         Populates this ontology map from the specified dataUrl.
         This reads the ontology term name and ID pairs from the
-        specified file.
+        specified file, and compiles them for faster loading where the
+        directory is writable.
         """
         self._dataUrl = dataUrl
         self._readFile()
+        try:
+            self.compile()
+        except EnvironmentError:
+            pass
 
     def populateFromRow(self, ontologyRecord):
         """
         Populates this Ontology using values in the specified DB row.
+        The compiled form of the OBO file is used when it is up to date;
+        otherwise the OBO file is parsed and, where the directory is
+        writable, compiled again.
         """
         self._id = ontologyRecord.id
         self._dataUrl = ontologyRecord.dataurl
-        self._readFile()
+        if not self._readCompiled():
+            self._readFile()
+            try:
+                self.compile()
+            except EnvironmentError:
+                pass
         # TODO sanity check the stored values against what we have just read.
 
     def getId(self):
@@ -113,11 +313,30 @@ class Ontology(object):
         Returns the ontology term name corresponding to the specified IDs.
         If the term name is not found, return the empty list.
         """
-        for name, termIds in self._nameIdMap.items():
-            # because it is a list of ids
-            for termId in termIds:
-                if id == termId:
-                    return name
+        return self._idNameMap.get(id)
+
+    def isDescendant(self, termId, ancestorId):
+        """
+        Returns True if the term with the specified ID is the specified
+        ancestor term or one of its is_a descendants.
+        """
+        position = self._postOrder.get(termId)
+        intervals = self._descendantIntervals.get(ancestorId)
+        if position is None or intervals is None:
+            return False
+        starts, ends = intervals
+        index = bisect.bisect_right(starts, position) - 1
+        return index >= 0 and position <= ends[index]
+
+    def getDescendantIds(self, termId):
+        """
+        Returns the IDs of the specified term and all of its is_a
+        descendants. If the term is not found, return the empty list.
+        """
+        descendantIds = []
+        for start, end in zip(*self._descendantIntervals.get(termId, ((), ()))):
+            descendantIds.extend(self._postOrderIds[start:end + 1])
+        return descendantIds
 
     def getGaTermByName(self, name):
         """
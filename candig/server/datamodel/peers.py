@@ -4,6 +4,7 @@ Peer datamodel for exchanging data about GA4GH services.
 
 import json
 import re
+import time
 import urllib.parse
 
 import candig.server.exceptions as exceptions
@@ -33,6 +34,63 @@ def isUrl(urlString):
     return regex.match(urlString) and urlparseValid
 
 
+class PeerHealth(object):
+    """
+    The health of a peer, as last seen by probing it: its round trip time,
+    the protocol version and search formats it reports and the number of
+    consecutive failed probes or requests.
+    """
+    def __init__(self):
+        self._rtt = None
+        self._version = None
+        self._searchFormats = ()
+        self._lastChecked = None
+        self._failures = 0
+
+    def recordSuccess(self, rtt, version=None, searchFormats=()):
+        """
+        Records a successful probe taking the specified round trip time,
+        in seconds, of a peer answering federated searches in JSON and
+        the specified other mimetypes.
+        """
+        self._rtt = rtt
+        if version is not None:
+            self._version = version
+        self._searchFormats = tuple(searchFormats)
+        self._lastChecked = time.time()
+        self._failures = 0
+        return self
+
+    def recordFailure(self):
+        """
+        Records a failed probe or request.
+        """
+        self._lastChecked = time.time()
+        self._failures += 1
+        return self
+
+    def isHealthy(self):
+        """
+        Returns False if the last probe or request to the peer failed.
+        """
+        return self._failures == 0
+
+    def getRtt(self):
+        return self._rtt
+
+    def getVersion(self):
+        return self._version
+
+    def getSearchFormats(self):
+        return self._searchFormats
+
+    def getLastChecked(self):
+        return self._lastChecked
+
+    def getFailures(self):
+        return self._failures
+
+
 class Peer(object):
     """
     This class represents an abstract Peer object.
@@ -42,6 +100,7 @@ class Peer(object):
     def __init__(self, url, attributes={}, record=None):
         self._url = ""
         self._attributes = {}
+        self._health = None
         self.setUrl(url) \
             .setAttributes(attributes)
         if record is not None:
@@ -64,6 +123,36 @@ class Peer(object):
             url = ''.join((url, '/'))
         return url
 
+    def setHealth(self, health):
+        """
+        Sets the PeerHealth of this peer.
+        """
+        self._health = health
+        return self
+
+    def getHealth(self):
+        """
+        Returns the PeerHealth of this peer, or None if it was never
+        probed.
+        """
+        return self._health
+
+    def isHealthy(self):
+        """
+        Returns False if the peer is known to be down. Peers that were
+        never probed are assumed to be up.
+        """
+        return self._health is None or self._health.isHealthy()
+
+    def acceptsSearchFormat(self, mimetype):
+        """
+        Returns True if the peer was last probed as answering federated
+        searches in the specified mimetype besides JSON.
+        """
+        return (
+            self._health is not None and
+            mimetype in self._health.getSearchFormats())
+
     def setAttributes(self, attributes):
         """
         Sets the attributes message to the provided value.
@@ -317,9 +317,9 @@ class AbstractReadGroupSet(datamodel.DatamodelObject):
         Returns a string ID suitable for use in the specified GA
         ReadAlignment object in this ReadGroupSet.
         """
-        compoundId = datamodel.ReadAlignmentCompoundId(
-            self.getCompoundId(), gaAlignment.fragment_name)
-        return str(compoundId)
+        formatter = self.getCompoundId().getChildIdFormatter(
+            datamodel.ReadAlignmentCompoundId)
+        return formatter(gaAlignment.fragment_name)
 
     def getStats(self):
         """
@@ -3,6 +3,11 @@ Module responsible for translating feature expression data into GA4GH native
 objects.
 """
 
+import json
+import os
+
+import numpy as np
+
 import candig.server.datamodel as datamodel
 import candig.server.exceptions as exceptions
 import candig.server.sqlite_backend as sqlite_backend
@@ -21,9 +26,111 @@ import candig.schemas.protocol as protocol
 
     Desired GA4GH objects will be generated on the fly by the dictionaries
     returned by database queries and sent to the backend.
+
+    Alongside the .db file rnaseq2ga also writes a dense genes x samples
+    float32 matrix of the expression values (<db>.matrix.npy) and its name
+    index (<db>.matrix.json).  The matrix is memory-mapped to serve whole
+    sub-matrices without materializing an object per expression level.
 """
 
 
+def getExpressionMatrixPaths(dbFilePath):
+    """
+    Returns the (matrix, index) file paths of the expression matrix store
+    kept alongside the specified RNA quantification .db file.
+    """
+    return dbFilePath + ".matrix.npy", dbFilePath + ".matrix.json"
+
+
+def selectExpressionSubMatrix(values, rows, cols, threshold=None):
+    """
+    Returns the (rows, values) of the sub-matrix of the specified values at
+    the specified row and column indexes. If a threshold is given, only the
+    rows where at least one selected value is above it are kept. Missing
+    values are NaN.
+    """
+    subMatrix = values[np.ix_(rows, cols)]
+    if threshold is not None and subMatrix.size > 0:
+        with np.errstate(invalid="ignore"):
+            keep = (subMatrix > threshold).any(axis=1)
+        subMatrix = subMatrix[keep]
+        rows = [row for row, kept in zip(rows, keep) if kept]
+    return rows, subMatrix
+
+
+def buildExpressionMatrix(records, names, samples, threshold=None):
+    """
+    Returns the (names, samples, values) dense sub-matrix built from the
+    specified (name, sample, expression) records. If names is empty, the
+    rows are every name in the records, sorted.
+    """
+    allNames = sorted({name for name, _, _ in records})
+    nameIndex = {name: i for i, name in enumerate(allNames)}
+    sampleIndex = {sample: i for i, sample in enumerate(samples)}
+    values = np.full((len(allNames), len(samples)), np.nan, np.float32)
+    for name, sample, expression in records:
+        col = sampleIndex.get(sample)
+        if col is not None:
+            values[nameIndex[name], col] = expression
+    if len(names) > 0:
+        rows = [nameIndex[name] for name in names if name in nameIndex]
+    else:
+        rows = list(range(len(allNames)))
+    rows, values = selectExpressionSubMatrix(
+        values, rows, list(range(len(samples))), threshold)
+    return [allNames[row] for row in rows], samples, values
+
+
+class ExpressionMatrix(object):
+    """
+    A memory-mapped genes x samples matrix of expression values, as written
+    by rnaseq2ga next to an RNA quantification .db file.
+    """
+    def __init__(self, dbFilePath):
+        matrixPath, indexPath = getExpressionMatrixPaths(dbFilePath)
+        with open(indexPath) as indexFile:
+            index = json.load(indexFile)
+        self._names = index["names"]
+        self._samples = index["samples"]
+        self._nameIndex = {name: i for i, name in enumerate(self._names)}
+        self._sampleIndex = {
+            sample: i for i, sample in enumerate(self._samples)}
+        self._values = np.load(matrixPath, mmap_mode="r")
+
+    @classmethod
+    def exists(cls, dbFilePath):
+        """
+        Returns True if an expression matrix has been written for the
+        specified .db file.
+        """
+        return all(map(os.path.exists, getExpressionMatrixPaths(dbFilePath)))
+
+    def getSamples(self):
+        return self._samples
+
+    def getSubMatrix(self, names=[], samples=[], threshold=None):
+        """
+        Returns the (names, samples, values) of the sub-matrix for the
+        specified feature names and samples (rna quantification names).
+        Empty lists select everything; unknown names and samples are
+        ignored.
+        """
+        if len(names) > 0:
+            rows = [self._nameIndex[name] for name in names
+                    if name in self._nameIndex]
+        else:
+            rows = list(range(len(self._names)))
+        if len(samples) > 0:
+            cols = [self._sampleIndex[sample] for sample in samples
+                    if sample in self._sampleIndex]
+        else:
+            cols = list(range(len(self._samples)))
+        rows, values = selectExpressionSubMatrix(
+            self._values, rows, cols, threshold)
+        return ([self._names[row] for row in rows],
+                [self._samples[col] for col in cols], values)
+
+
 class AbstractExpressionLevel(datamodel.DatamodelObject):
     """
     An abstract base class of a expression level
@@ -42,6 +149,12 @@ class AbstractExpressionLevel(datamodel.DatamodelObject):
         self._confIntervalLow = 0.0
         self._confIntervalHigh = 0.0
 
+    def getName(self):
+        return self._name
+
+    def getExpression(self):
+        return self._expression
+
     def toProtocolElement(self, tier=0):
         protocolElement = protocol.ExpressionLevel()
         protocolElement.id = self.getId()
@@ -75,9 +188,6 @@ class SqliteExpressionLevel(AbstractExpressionLevel):
         self._confIntervalLow = record["conf_low"]
         self._confIntervalHigh = record["conf_hi"]
 
-    def getName(self):
-        return self._name
-
 
 class AbstractRnaQuantificationSet(datamodel.DatamodelObject):
     """
@@ -111,6 +221,22 @@ class AbstractRnaQuantificationSet(datamodel.DatamodelObject):
         return [self._rnaQuantificationIdMap[id_] for
                 id_ in self._rnaQuantificationIds]
 
+    def getExpressionMatrix(self, names=[], samples=[], threshold=None):
+        """
+        Returns the (names, samples, values) dense sub-matrix of expression
+        values for the specified feature names and samples (rna
+        quantification names) in this set, where values is a float32 numpy
+        array with NaN for missing entries. Empty lists select everything.
+        """
+        rnaQuants = self.getRnaQuantifications()
+        if len(samples) == 0:
+            samples = [rnaQuant.getLocalId() for rnaQuant in rnaQuants]
+        records = [
+            (level.getName(), rnaQuant.getLocalId(), level.getExpression())
+            for rnaQuant in rnaQuants if rnaQuant.getLocalId() in samples
+            for level in rnaQuant.getExpressionLevels(names=names)]
+        return buildExpressionMatrix(records, names, samples, threshold)
+
     def getReferenceSet(self):
         """
         Returns the reference set associated with this RnaQuantificationSet.
@@ -153,6 +279,7 @@ class SqliteRnaQuantificationSet(AbstractRnaQuantificationSet):
             parentContainer, name)
         self._dbFilePath = None
         self._db = None
+        self._expressionMatrix = None
 
     def getDataUrl(self):
         """
@@ -161,6 +288,31 @@ class SqliteRnaQuantificationSet(AbstractRnaQuantificationSet):
         """
         return self._dbFilePath
 
+    def getExpressionMatrix(self, names=[], samples=[], threshold=None):
+        """
+        Returns the (names, samples, values) dense sub-matrix of expression
+        values for the specified feature names and samples (rna
+        quantification names) in this set, where values is a float32 numpy
+        array with NaN for missing entries. Reads the memory-mapped matrix
+        store when one exists, and falls back to a single query on the
+        Expression table otherwise.
+        """
+        if self._expressionMatrix is None and \
+                ExpressionMatrix.exists(self._dbFilePath):
+            self._expressionMatrix = ExpressionMatrix(self._dbFilePath)
+        if self._expressionMatrix is not None:
+            return self._expressionMatrix.getSubMatrix(
+                names=names, samples=samples, threshold=threshold)
+        with self._db as dataSource:
+            records = [
+                (row["name"], row["rna_quantification_id"], row["expression"])
+                for row in dataSource.searchExpressionMatrixInDb(
+                    names=names, samples=samples)]
+        if len(samples) == 0:
+            samples = [rnaQuant.getLocalId()
+                       for rnaQuant in self.getRnaQuantifications()]
+        return buildExpressionMatrix(records, names, samples, threshold)
+
     def populateFromFile(self, dataUrl):
         """
         Populates the instance variables of this RnaQuantificationSet from the
@@ -412,6 +564,26 @@ class SqliteRnaBackend(sqlite_backend.SqliteBackedDataSource):
         query = self._dbconn.execute(sql, sql_args)
         return sqlite_backend.iterativeFetch(query)
 
+    def searchExpressionMatrixInDb(self, names=[], samples=[]):
+        """
+        :param names: list of feature names to restrict the search to
+        :param samples: list of quantification ids to restrict the search to
+        :return an iterator of (name, rna_quantification_id, expression)
+            dictionaries.
+        """
+        sql = ("SELECT name, rna_quantification_id, expression "
+               "FROM Expression WHERE 1 ")
+        sql_args = ()
+        if len(names) > 0:
+            sql += "AND name in ({}) ".format(",".join("?" * len(names)))
+            sql_args += tuple(names)
+        if len(samples) > 0:
+            sql += "AND rna_quantification_id in ({}) ".format(
+                ",".join("?" * len(samples)))
+            sql_args += tuple(samples)
+        query = self._dbconn.execute(sql, sql_args)
+        return sqlite_backend.iterativeFetch(query)
+
     def getExpressionLevelById(self, expressionId):
         """
         :param expressionId: the ExpressionLevel ID
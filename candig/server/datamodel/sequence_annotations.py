@@ -5,6 +5,7 @@ into GA4GH native objects.
 
 import json
 import random
+import sqlite3
 
 import candig.server.datamodel as datamodel
 import candig.server.sqlite_backend as sqlite_backend
@@ -35,7 +36,8 @@ GFF3 data is represented by rows in a single table, named FEATURE.
 The columns of the FEATURE table correspond to the columns of a GFF3,
 with three additional columns prepended representing the ID
 of this feature, the ID of its parent (if any), and a whitespace
-separated array of its child IDs.
+separated array of its child IDs. Older DBs store the child IDs as a
+JSON array instead, which is still supported.
 
 _featureColumns pairs represent the ordered (column_name, column_type).
 """
@@ -55,6 +57,79 @@ _featureColumns = [
     ('transcript_name', 'TEXT'),  # as found in GFF3 attributes
     ('attributes', 'TEXT')]  # JSON encoding of attributes dict
 
+"""
+Feature DBs may carry an optional R*Tree index over the feature intervals,
+stored in a virtual table named FEATURE_RTREE sharing the ids of the
+FEATURE table. When present it is used to answer range overlap queries,
+which would otherwise scan every feature of a reference up to the end of
+the requested range. Its first dimension is the code of the reference of
+the feature, given by the FEATURE_REFERENCE table, so that the ranges of
+one reference are searched without going through the overlapping ranges
+of the others. The R*Tree stores coordinates as 32 bit floats, so the
+exact range predicates are still applied to the FEATURE rows it returns.
+DBs indexed without the reference dimension are searched without the
+index until it is rebuilt.
+"""
+_spatialIndexTableName = "FEATURE_RTREE"
+_referenceCodeTableName = "FEATURE_REFERENCE"
+
+
+def serializeChildIds(childIds):
+    """
+    Returns the whitespace separated form of the specified child IDs
+    stored in the child_ids column of the FEATURE table.
+    """
+    return " ".join(str(childId) for childId in childIds)
+
+
+def _splitChildIds(childIds):
+    """
+    Returns the list of child IDs stored in a child_ids column value,
+    which is either whitespace separated or, in older DBs, a JSON array.
+    """
+    if not childIds:
+        return []
+    if childIds[0] == "[":
+        return json.loads(childIds)
+    return childIds.split()
+
+
+def createSpatialIndex(dbFile):
+    """
+    Builds the R*Tree index over the features stored in the specified
+    feature DB file, replacing any existing one.
+
+    :param dbFile: string holding the full path to the feature DB file
+    :return: the number of features indexed
+    """
+    dbconn = sqlite3.connect(dbFile)
+    try:
+        dbconn.execute("DROP TABLE IF EXISTS {}".format(
+            _spatialIndexTableName))
+        dbconn.execute("DROP TABLE IF EXISTS {}".format(
+            _referenceCodeTableName))
+        dbconn.execute(
+            "CREATE TABLE {} (code INTEGER PRIMARY KEY, "
+            "reference_name TEXT UNIQUE)".format(_referenceCodeTableName))
+        dbconn.execute(
+            "INSERT INTO {} (reference_name) SELECT DISTINCT reference_name "
+            "FROM FEATURE WHERE reference_name IS NOT NULL "
+            "ORDER BY reference_name".format(_referenceCodeTableName))
+        dbconn.execute(
+            "CREATE VIRTUAL TABLE {} USING rtree("
+            "id, min_ref, max_ref, min_pos, max_pos)".format(
+                _spatialIndexTableName))
+        cursor = dbconn.execute(
+            "INSERT INTO {0} SELECT FEATURE.id, "
+            "IFNULL({1}.code, 0), IFNULL({1}.code, 0), start, end "
+            "FROM FEATURE LEFT JOIN {1} "
+            "ON {1}.reference_name = FEATURE.reference_name".format(
+                _spatialIndexTableName, _referenceCodeTableName))
+        dbconn.commit()
+        return cursor.rowcount
+    finally:
+        dbconn.close()
+
 
 class Gff3DbBackend(sqlite_backend.SqliteBackedDataSource):
     """
@@ -72,6 +147,27 @@ class Gff3DbBackend(sqlite_backend.SqliteBackedDataSource):
         super(Gff3DbBackend, self).__init__(dbFile)
         self.featureColumnNames = [f[0] for f in _featureColumns]
         self.featureColumnTypes = [f[1] for f in _featureColumns]
+        self._hasSpatialIndex = None
+
+    def hasSpatialIndex(self):
+        """
+        Returns True if this feature DB carries an R*Tree index over the
+        references and intervals of the features.
+        """
+        if self._hasSpatialIndex is None:
+            sql = "SELECT COUNT(*) FROM sqlite_master WHERE name IN (?, ?)"
+            query = self._dbconn.execute(
+                sql, (_spatialIndexTableName, _referenceCodeTableName))
+            self._hasSpatialIndex = query.fetchone()[0] == 2
+        return self._hasSpatialIndex
+
+    def getFeatureTypes(self):
+        """
+        Returns the list of distinct feature type names in this feature DB.
+        """
+        sql = "SELECT DISTINCT type FROM FEATURE WHERE id > 1"
+        query = self._dbconn.execute(sql)
+        return [row[0] for row in query.fetchall()]
 
     def featuresQuery(self, **kwargs):
         """
@@ -80,8 +176,31 @@ class Gff3DbBackend(sqlite_backend.SqliteBackedDataSource):
         """
         # TODO: Optimize by refactoring out string concatenation
         sql = ""
-        sql_rows = "SELECT * FROM FEATURE WHERE id > 1 "
+        sql_rows = "SELECT FEATURE.* FROM FEATURE WHERE FEATURE.id > 1 "
         sql_args = ()
+        rangeQuery = (kwargs.get('start') is not None or
+                      kwargs.get('end') is not None)
+        if rangeQuery and self.hasSpatialIndex():
+            # Drive the query from the R*Tree, the CROSS JOIN forces
+            # SQLite to use it as the outer loop.
+            sql_rows = (
+                "SELECT FEATURE.* FROM {0} CROSS JOIN FEATURE "
+                "ON FEATURE.id = {0}.id WHERE FEATURE.id > 1 ").format(
+                _spatialIndexTableName)
+            if kwargs.get('referenceName'):
+                sql_rows += (
+                    "AND {0}.min_ref = (SELECT code FROM {1} "
+                    "WHERE reference_name = ?) ").format(
+                    _spatialIndexTableName, _referenceCodeTableName)
+                sql_args += (kwargs.get('referenceName'),)
+            if kwargs.get('start') is not None:
+                sql_rows += "AND {}.max_pos >= ? ".format(
+                    _spatialIndexTableName)
+                sql_args += (kwargs.get('start'),)
+            if kwargs.get('end') is not None:
+                sql_rows += "AND {}.min_pos <= ? ".format(
+                    _spatialIndexTableName)
+                sql_args += (kwargs.get('end'),)
         if 'name' in kwargs and kwargs['name']:
             sql += "AND name = ? "
             sql_args += (kwargs.get('name'),)
@@ -107,7 +226,7 @@ class Gff3DbBackend(sqlite_backend.SqliteBackedDataSource):
             sql += ") "
             sql_args += tuple(kwargs.get('featureTypes'))
         sql_rows += sql
-        sql_rows += " ORDER BY reference_name, start, end ASC "
+        sql_rows += " ORDER BY reference_name, start, end, FEATURE.id ASC "
         return sql_rows, sql_args
 
     def searchFeaturesInDb(
@@ -204,12 +323,11 @@ class AbstractFeatureSet(datamodel.DatamodelObject):
         :return: string representing ID for the specified GA4GH protocol
             Feature object in this FeatureSet.
         """
-        if featureId is not None and featureId != "":
-            compoundId = datamodel.FeatureCompoundId(
-                self.getCompoundId(), str(featureId))
-        else:
-            compoundId = ""
-        return str(compoundId)
+        if featureId is None or featureId == "":
+            return ""
+        formatter = self.getCompoundId().getChildIdFormatter(
+            datamodel.FeatureCompoundId)
+        return formatter(str(featureId))
 
 
 class SimulatedFeatureSet(AbstractFeatureSet):
@@ -270,7 +388,8 @@ class SimulatedFeatureSet(AbstractFeatureSet):
     def getFeatures(self, referenceName=None, start=None, end=None,
                     startIndex=None, maxResults=None,
                     featureTypes=None, parentId=None,
-                    name=None, geneSymbol=None, numFeatures=10):
+                    name=None, geneSymbol=None, includeDescendants=False,
+                    numFeatures=10):
         """
         Returns a set number of simulated features.
 
@@ -283,6 +402,8 @@ class SimulatedFeatureSet(AbstractFeatureSet):
         :param parentId: optional parentId to limit query.
         :param name: the name of the feature
         :param geneSymbol: the symbol for the gene the features are on
+        :param includeDescendants: ignored, simulated feature types are
+            not drawn from an ontology.
         :param numFeatures: number of features to generate in the return.
             10 is a reasonable (if arbitrary) default.
         :return: Yields feature list
@@ -313,6 +434,8 @@ class Gff3DbFeatureSet(AbstractFeatureSet):
         self._ontology = None
         self._dbFilePath = None
         self._db = None
+        self._featureTypeTerms = {}
+        self._featureTypes = None
 
     def setOntology(self, ontology):
         """
@@ -320,6 +443,40 @@ class Gff3DbFeatureSet(AbstractFeatureSet):
         specified value.
         """
         self._ontology = ontology
+        self._featureTypeTerms = {}
+
+    def _expandFeatureTypes(self, dataSource, featureTypes):
+        """
+        Returns the feature types in this feature set that are one of the
+        specified feature types, given as ontology term names or IDs, or
+        one of their descendants in the ontology.
+        """
+        ancestorIds = set()
+        for featureType in featureTypes:
+            ancestorIds.update(self._ontology.getTermIds(featureType))
+            if self._ontology.getTermName(featureType) is not None:
+                ancestorIds.add(featureType)
+        if self._featureTypes is None:
+            self._featureTypes = dataSource.getFeatureTypes()
+        expanded = set(featureTypes)
+        for featureType in self._featureTypes:
+            for termId in self._ontology.getTermIds(featureType):
+                if any(self._ontology.isDescendant(termId, ancestorId)
+                       for ancestorId in ancestorIds):
+                    expanded.add(featureType)
+        return sorted(expanded)
+
+    def _getFeatureTypeTerm(self, featureType):
+        """
+        Returns the GA4GH OntologyTerm for the specified feature type
+        name. There are only a handful of distinct types in a feature
+        set, so the terms are built once and then copied into features.
+        """
+        term = self._featureTypeTerms.get(featureType)
+        if term is None:
+            term = self._ontology.getGaTermByName(featureType)
+            self._featureTypeTerms[featureType] = term
+        return term
 
     def getOntology(self):
         """
@@ -391,11 +548,11 @@ class Gff3DbFeatureSet(AbstractFeatureSet):
         else:
             # default to positive strand
             gaFeature.strand = protocol.POS_STRAND
-        gaFeature.child_ids.extend(list(map(
+        gaFeature.child_ids.extend(map(
             self.getCompoundIdForFeatureId,
-            json.loads(feature['child_ids']))))
+            _splitChildIds(feature['child_ids'])))
         gaFeature.feature_type.CopyFrom(
-            self._ontology.getGaTermByName(feature['type']))
+            self._getFeatureTypeTerm(feature['type']))
         attributes = json.loads(feature['attributes'])
         # TODO: Identify which values are ExternalIdentifiers and OntologyTerms
         for key in attributes:
@@ -408,7 +565,7 @@ class Gff3DbFeatureSet(AbstractFeatureSet):
     def getFeatures(self, referenceName=None, start=None, end=None,
                     startIndex=None, maxResults=None,
                     featureTypes=None, parentId=None,
-                    name=None, geneSymbol=None):
+                    name=None, geneSymbol=None, includeDescendants=False):
         """
         method passed to runSearchRequest to fulfill the request
         :param str referenceName: name of reference (ex: "chr1")
@@ -420,9 +577,14 @@ class Gff3DbFeatureSet(AbstractFeatureSet):
         :param parentId: none or featureID of parent
         :param name: the name of the feature
         :param geneSymbol: the symbol for the gene the features are on
+        :param includeDescendants: if True, also match features whose type
+            is a descendant of one of the featureTypes in the ontology
         :return: yields a protocol.Feature at a time
         """
         with self._db as dataSource:
+            if includeDescendants and featureTypes:
+                featureTypes = self._expandFeatureTypes(
+                    dataSource, featureTypes)
             features = dataSource.searchFeaturesInDb(
                 startIndex, maxResults,
                 referenceName=referenceName,
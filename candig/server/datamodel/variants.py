@@ -287,19 +287,18 @@ class AbstractVariantSet(datamodel.DatamodelObject):
         object in this variant set.
         """
         md5 = self.hashVariant(gaVariant)
-        compoundId = datamodel.VariantCompoundId(
-            self.getCompoundId(), gaVariant.reference_name,
-            str(gaVariant.start), md5)
-        return str(compoundId)
+        formatter = self.getCompoundId().getChildIdFormatter(
+            datamodel.VariantCompoundId)
+        return formatter(gaVariant.reference_name, str(gaVariant.start), md5)
 
     def getCallSetId(self, sampleName):
         """
         Returns the callSetId for the specified sampleName in this
         VariantSet.
         """
-        compoundId = datamodel.CallSetCompoundId(
-            self.getCompoundId(), sampleName)
-        return str(compoundId)
+        formatter = self.getCompoundId().getChildIdFormatter(
+            datamodel.CallSetCompoundId)
+        return formatter(sampleName)
 
     def setPatientId(self, patientId):
         """
@@ -1046,10 +1045,9 @@ class AbstractVariantAnnotationSet(datamodel.DatamodelObject):
         :return:  compoundId String
         """
         md5 = self.hashVariantAnnotation(gaVariant, gaAnnotation)
-        compoundId = datamodel.VariantAnnotationCompoundId(
-            self.getCompoundId(), gaVariant.reference_name,
-            str(gaVariant.start), md5)
-        return str(compoundId)
+        formatter = self.getCompoundId().getChildIdFormatter(
+            datamodel.VariantAnnotationCompoundId)
+        return formatter(gaVariant.reference_name, str(gaVariant.start), md5)
 
 
 class SimulatedVariantAnnotationSet(AbstractVariantAnnotationSet):
@@ -2,6 +2,8 @@
 The backing data store for the GA4GH server
 """
 
+import collections
+import contextlib
 import json
 import os
 import datetime
@@ -22,6 +24,7 @@ import candig.server.datamodel.peers as peers
 import candig.server.exceptions as exceptions
 import candig.server.repo.models as models
 import candig.server.datamodel.clinical_metadata as clinical_metadata
+import candig.server.datamodel.metadata_schema as metadata_schema
 import candig.server.datamodel.pipeline_metadata as pipeline_metadata
 
 import candig.schemas.protocol as protocol
@@ -1854,62 +1857,117 @@ class SqlDataRepository(AbstractDataRepository):
     def _createPatientTable(self):
         self.database.create_tables([models.Patient])
 
-    def insertPatient(self, patient):
+    def _insertMetadataRecord(self, model, record):
         """
-        Inserts the specified patient into this repository.
+        Inserts the specified clinical or pipeline metadata record into
+        the table of the specified model.
         """
         try:
-            models.Patient.create(
+            model.create(
                 # Common fields
-                id=patient.getId(),
-                datasetId=patient.getParentContainer().getId(),
-                created=patient.getCreated(),
-                updated=patient.getUpdated(),
-                name=patient.getLocalId(),
-                description=patient.getDescription(),
-                attributes=json.dumps(patient.getAttributes()),
+                id=record.getId(),
+                datasetId=record.getParentContainer().getId(),
+                created=record.getCreated(),
+                updated=record.getUpdated(),
+                name=record.getLocalId(),
+                description=record.getDescription(),
+                attributes=json.dumps(record.getAttributes()),
                 # Unique fields
-                patientId = patient.getPatientId(),
-                patientIdTier = patient.getPatientIdTier(),
-                otherIds = patient.getOtherIds(),
-                otherIdsTier = patient.getOtherIdsTier(),
-                dateOfBirth = patient.getDateOfBirth(),
-                dateOfBirthTier = patient.getDateOfBirthTier(),
-                gender = patient.getGender(),
-                genderTier = patient.getGenderTier(),
-                ethnicity = patient.getEthnicity(),
-                ethnicityTier = patient.getEthnicityTier(),
-                race = patient.getRace(),
-                raceTier = patient.getRaceTier(),
-                provinceOfResidence = patient.getProvinceOfResidence(),
-                provinceOfResidenceTier = patient.getProvinceOfResidenceTier(),
-                dateOfDeath = patient.getDateOfDeath(),
-                dateOfDeathTier = patient.getDateOfDeathTier(),
-                causeOfDeath = patient.getCauseOfDeath(),
-                causeOfDeathTier = patient.getCauseOfDeathTier(),
-                autopsyTissueForResearch = patient.getAutopsyTissueForResearch(),
-                autopsyTissueForResearchTier = patient.getAutopsyTissueForResearchTier(),
-                priorMalignancy = patient.getPriorMalignancy(),
-                priorMalignancyTier = patient.getPriorMalignancyTier(),
-                dateOfPriorMalignancy = patient.getDateOfPriorMalignancy(),
-                dateOfPriorMalignancyTier = patient.getDateOfPriorMalignancyTier(),
-                familyHistoryAndRiskFactors = patient.getFamilyHistoryAndRiskFactors(),
-                familyHistoryAndRiskFactorsTier = patient.getFamilyHistoryAndRiskFactorsTier(),
-                familyHistoryOfPredispositionSyndrome = patient.getFamilyHistoryOfPredispositionSyndrome(),
-                familyHistoryOfPredispositionSyndromeTier = patient.getFamilyHistoryOfPredispositionSyndromeTier(),
-                detailsOfPredispositionSyndrome = patient.getDetailsOfPredispositionSyndrome(),
-                detailsOfPredispositionSyndromeTier = patient.getDetailsOfPredispositionSyndromeTier(),
-                geneticCancerSyndrome = patient.getGeneticCancerSyndrome(),
-                geneticCancerSyndromeTier = patient.getGeneticCancerSyndromeTier(),
-                otherGeneticConditionOrSignificantComorbidity = patient.getOtherGeneticConditionOrSignificantComorbidity(),
-                otherGeneticConditionOrSignificantComorbidityTier = patient.getOtherGeneticConditionOrSignificantComorbidityTier(),
-                occupationalOrEnvironmentalExposure = patient.getOccupationalOrEnvironmentalExposure(),
-                occupationalOrEnvironmentalExposureTier = patient.getOccupationalOrEnvironmentalExposureTier(),
-            )
+                **record.getFieldValues())
         except Exception:
             raise exceptions.DuplicateNameException(
-                patient.getLocalId(),
-                patient.getParentContainer().getLocalId())
+                record.getLocalId(),
+                record.getParentContainer().getLocalId())
+
+    def insertMetadataRecords(self, records):
+        """
+        Inserts the specified clinical and pipeline metadata records in a
+        single transaction, replacing the records of the same name in
+        their dataset. Replaced records keep their creation time, and
+        records without a creation or update time get the time of the
+        insertion. The rows of each table are written by one INSERT
+        statement upserting on the dataset and name.
+        """
+        recordsByTable = collections.OrderedDict()
+        for record in records:
+            recordsByTable.setdefault(type(record).__name__, []).append(record)
+        now = datetime.datetime.now().isoformat()
+        with self.database.atomic():
+            for tableName, tableRecords in recordsByTable.items():
+                model = getattr(models, tableName)
+                fieldNames = metadata_schema.getFields(tableName)
+                columns = [
+                    model.id, model.datasetid, model.created, model.updated,
+                    model.name, model.description, model.attributes]
+                for field in fieldNames:
+                    columns.append(getattr(model, field))
+                    columns.append(
+                        getattr(model, metadata_schema.getTierField(field)))
+                rows = []
+                for record in tableRecords:
+                    row = [
+                        record.getId(),
+                        record.getParentContainer().getId(),
+                        record.getCreated() or now,
+                        record.getUpdated() or now,
+                        record.getLocalId(),
+                        record.getDescription(),
+                        json.dumps(record.getAttributes())]
+                    fieldValues = record.getFieldValues()
+                    for field in fieldNames:
+                        row.append(fieldValues[field])
+                        row.append(
+                            fieldValues[metadata_schema.getTierField(field)])
+                    rows.append(row)
+                updatedColumns = [
+                    column for column in columns
+                    if column.name not in ("id", "created")]
+                # Peewee spends more time building a multi-row statement
+                # than SQLite takes to run it, so the statement is built
+                # for one row and run for all of them
+                sql, params = model.insert_many(
+                    rows[:1], fields=columns).on_conflict(
+                        conflict_target=[model.datasetid, model.name],
+                        preserve=updatedColumns).sql()
+                if len(params) != len(columns):
+                    raise exceptions.RepoManagerException(
+                        "Cannot insert the '{}' records: the upsert statement "
+                        "takes {} parameters for {} columns".format(
+                            tableName, len(params), len(columns)))
+                self.database.cursor().executemany(sql, rows)
+
+    @contextlib.contextmanager
+    def bulkLoad(self):
+        """
+        Tunes the connection to the database for writing many rows: the
+        commits are not synced to disk, and the page cache and temporary
+        tables are held in memory. A crash of the process still rolls
+        back the transaction in progress, but a crash of the system may
+        corrupt the database. The previous settings are restored on exit.
+        """
+        pragmas = collections.OrderedDict([
+            ("synchronous", "OFF"),
+            ("cache_size", -65536),
+            ("temp_store", "MEMORY"),
+        ])
+        previous = {
+            name: self.database.execute_sql(
+                "PRAGMA {}".format(name)).fetchone()[0]
+            for name in pragmas}
+        for name, value in pragmas.items():
+            self.database.execute_sql("PRAGMA {} = {}".format(name, value))
+        try:
+            yield
+        finally:
+            for name, value in previous.items():
+                self.database.execute_sql(
+                    "PRAGMA {} = {}".format(name, value))
+
+    def insertPatient(self, patient):
+        """
+        Inserts the specified patient into this repository.
+        """
+        self._insertMetadataRecord(models.Patient, patient)
 
     def _readClinPipeTable(self, dataset, pw_model, datamodel, addMethod):
         """
@@ -1935,55 +1993,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified enrollment into this repository.
         """
-        try:
-            models.Enrollment.create(
-                # Common fields
-                id=enrollment.getId(),
-                datasetId=enrollment.getParentContainer().getId(),
-                created=enrollment.getCreated(),
-                updated=enrollment.getUpdated(),
-                name=enrollment.getLocalId(),
-                description=enrollment.getDescription(),
-                attributes=json.dumps(enrollment.getAttributes()),
-
-                # Unique fields
-                patientId = enrollment.getPatientId(),
-                patientIdTier = enrollment.getPatientIdTier(),
-                enrollmentInstitution = enrollment.getEnrollmentInstitution(),
-                enrollmentInstitutionTier = enrollment.getEnrollmentInstitutionTier(),
-                enrollmentApprovalDate = enrollment.getEnrollmentApprovalDate(),
-                enrollmentApprovalDateTier = enrollment.getEnrollmentApprovalDateTier(),
-                crossEnrollment = enrollment.getCrossEnrollment(),
-                crossEnrollmentTier = enrollment.getCrossEnrollmentTier(),
-                otherPersonalizedMedicineStudyName = enrollment.getOtherPersonalizedMedicineStudyName(),
-                otherPersonalizedMedicineStudyNameTier = enrollment.getOtherPersonalizedMedicineStudyNameTier(),
-                otherPersonalizedMedicineStudyId = enrollment.getOtherPersonalizedMedicineStudyId(),
-                otherPersonalizedMedicineStudyIdTier = enrollment.getOtherPersonalizedMedicineStudyIdTier(),
-                ageAtEnrollment = enrollment.getAgeAtEnrollment(),
-                ageAtEnrollmentTier = enrollment.getAgeAtEnrollmentTier(),
-                eligibilityCategory = enrollment.getEligibilityCategory(),
-                eligibilityCategoryTier = enrollment.getEligibilityCategoryTier(),
-                statusAtEnrollment = enrollment.getStatusAtEnrollment(),
-                statusAtEnrollmentTier = enrollment.getStatusAtEnrollmentTier(),
-                primaryOncologistName = enrollment.getPrimaryOncologistName(),
-                primaryOncologistNameTier = enrollment.getPrimaryOncologistNameTier(),
-                primaryOncologistContact = enrollment.getPrimaryOncologistContact(),
-                primaryOncologistContactTier = enrollment.getPrimaryOncologistContactTier(),
-                referringPhysicianName = enrollment.getReferringPhysicianName(),
-                referringPhysicianNameTier = enrollment.getReferringPhysicianNameTier(),
-                referringPhysicianContact = enrollment.getReferringPhysicianContact(),
-                referringPhysicianContactTier = enrollment.getReferringPhysicianContactTier(),
-                summaryOfIdRequest = enrollment.getSummaryOfIdRequest(),
-                summaryOfIdRequestTier = enrollment.getSummaryOfIdRequestTier(),
-                treatingCentreName = enrollment.getTreatingCentreName(),
-                treatingCentreNameTier = enrollment.getTreatingCentreNameTier(),
-                treatingCentreProvince = enrollment.getTreatingCentreProvince(),
-                treatingCentreProvinceTier = enrollment.getTreatingCentreProvinceTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                enrollment.getLocalId(),
-                enrollment.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Enrollment, enrollment)
 
     def _readEnrollmentTable(self):
         """
@@ -1999,63 +2009,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified consent into this repository.
         """
-        try:
-            models.Consent.create(
-                # Common fields
-                id=consent.getId(),
-                datasetId=consent.getParentContainer().getId(),
-                created=consent.getCreated(),
-                updated=consent.getUpdated(),
-                name=consent.getLocalId(),
-                description=consent.getDescription(),
-                attributes=json.dumps(consent.getAttributes()),
-
-                # Unique fields
-                patientId = consent.getPatientId(),
-                patientIdTier = consent.getPatientIdTier(),
-                consentId = consent.getConsentId(),
-                consentIdTier = consent.getConsentIdTier(),
-                consentDate = consent.getConsentDate(),
-                consentDateTier = consent.getConsentDateTier(),
-                consentVersion = consent.getConsentVersion(),
-                consentVersionTier = consent.getConsentVersionTier(),
-                patientConsentedTo = consent.getPatientConsentedTo(),
-                patientConsentedToTier = consent.getPatientConsentedToTier(),
-                reasonForRejection = consent.getReasonForRejection(),
-                reasonForRejectionTier = consent.getReasonForRejectionTier(),
-                wasAssentObtained = consent.getWasAssentObtained(),
-                wasAssentObtainedTier = consent.getWasAssentObtainedTier(),
-                dateOfAssent = consent.getDateOfAssent(),
-                dateOfAssentTier = consent.getDateOfAssentTier(),
-                assentFormVersion = consent.getAssentFormVersion(),
-                assentFormVersionTier = consent.getAssentFormVersionTier(),
-                ifAssentNotObtainedWhyNot = consent.getIfAssentNotObtainedWhyNot(),
-                ifAssentNotObtainedWhyNotTier = consent.getIfAssentNotObtainedWhyNotTier(),
-                reconsentDate = consent.getReconsentDate(),
-                reconsentDateTier = consent.getReconsentDateTier(),
-                reconsentVersion = consent.getReconsentVersion(),
-                reconsentVersionTier = consent.getReconsentVersionTier(),
-                consentingCoordinatorName = consent.getConsentingCoordinatorName(),
-                consentingCoordinatorNameTier = consent.getConsentingCoordinatorNameTier(),
-                previouslyConsented = consent.getPreviouslyConsented(),
-                previouslyConsentedTier = consent.getPreviouslyConsentedTier(),
-                nameOfOtherBiobank = consent.getNameOfOtherBiobank(),
-                nameOfOtherBiobankTier = consent.getNameOfOtherBiobankTier(),
-                hasConsentBeenWithdrawn = consent.getHasConsentBeenWithdrawn(),
-                hasConsentBeenWithdrawnTier = consent.getHasConsentBeenWithdrawnTier(),
-                dateOfConsentWithdrawal = consent.getDateOfConsentWithdrawal(),
-                dateOfConsentWithdrawalTier = consent.getDateOfConsentWithdrawalTier(),
-                typeOfConsentWithdrawal = consent.getTypeOfConsentWithdrawal(),
-                typeOfConsentWithdrawalTier = consent.getTypeOfConsentWithdrawalTier(),
-                reasonForConsentWithdrawal = consent.getReasonForConsentWithdrawal(),
-                reasonForConsentWithdrawalTier = consent.getReasonForConsentWithdrawalTier(),
-                consentFormComplete = consent.getConsentFormComplete(),
-                consentFormCompleteTier = consent.getConsentFormCompleteTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                consent.getLocalId(),
-                consent.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Consent, consent)
 
     def _readConsentTable(self):
         """
@@ -2071,81 +2025,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified diagnosis into this repository.
         """
-        try:
-            models.Diagnosis.create(
-                # Common fields
-                id=diagnosis.getId(),
-                datasetId=diagnosis.getParentContainer().getId(),
-                created=diagnosis.getCreated(),
-                updated=diagnosis.getUpdated(),
-                name=diagnosis.getLocalId(),
-                description=diagnosis.getDescription(),
-                attributes=json.dumps(diagnosis.getAttributes()),
-
-                # Unique fields
-                patientId = diagnosis.getPatientId(),
-                patientIdTier = diagnosis.getPatientIdTier(),
-                diagnosisId = diagnosis.getDiagnosisId(),
-                diagnosisIdTier = diagnosis.getDiagnosisIdTier(),
-                diagnosisDate = diagnosis.getDiagnosisDate(),
-                diagnosisDateTier = diagnosis.getDiagnosisDateTier(),
-                ageAtDiagnosis = diagnosis.getAgeAtDiagnosis(),
-                ageAtDiagnosisTier = diagnosis.getAgeAtDiagnosisTier(),
-                cancerType = diagnosis.getCancerType(),
-                cancerTypeTier = diagnosis.getCancerTypeTier(),
-                classification = diagnosis.getClassification(),
-                classificationTier = diagnosis.getClassificationTier(),
-                cancerSite = diagnosis.getCancerSite(),
-                cancerSiteTier = diagnosis.getCancerSiteTier(),
-                histology = diagnosis.getHistology(),
-                histologyTier = diagnosis.getHistologyTier(),
-                methodOfDefinitiveDiagnosis = diagnosis.getMethodOfDefinitiveDiagnosis(),
-                methodOfDefinitiveDiagnosisTier = diagnosis.getMethodOfDefinitiveDiagnosisTier(),
-                sampleType = diagnosis.getSampleType(),
-                sampleTypeTier = diagnosis.getSampleTypeTier(),
-                sampleSite = diagnosis.getSampleSite(),
-                sampleSiteTier = diagnosis.getSampleSiteTier(),
-                tumorGrade = diagnosis.getTumorGrade(),
-                tumorGradeTier = diagnosis.getTumorGradeTier(),
-                gradingSystemUsed = diagnosis.getGradingSystemUsed(),
-                gradingSystemUsedTier = diagnosis.getGradingSystemUsedTier(),
-                sitesOfMetastases = diagnosis.getSitesOfMetastases(),
-                sitesOfMetastasesTier = diagnosis.getSitesOfMetastasesTier(),
-                stagingSystem = diagnosis.getStagingSystem(),
-                stagingSystemTier = diagnosis.getStagingSystemTier(),
-                versionOrEditionOfTheStagingSystem = diagnosis.getVersionOrEditionOfTheStagingSystem(),
-                versionOrEditionOfTheStagingSystemTier = diagnosis.getVersionOrEditionOfTheStagingSystemTier(),
-                specificTumorStageAtDiagnosis = diagnosis.getSpecificTumorStageAtDiagnosis(),
-                specificTumorStageAtDiagnosisTier = diagnosis.getSpecificTumorStageAtDiagnosisTier(),
-                prognosticBiomarkers = diagnosis.getPrognosticBiomarkers(),
-                prognosticBiomarkersTier = diagnosis.getPrognosticBiomarkersTier(),
-                biomarkerQuantification = diagnosis.getBiomarkerQuantification(),
-                biomarkerQuantificationTier = diagnosis.getBiomarkerQuantificationTier(),
-                additionalMolecularTesting = diagnosis.getAdditionalMolecularTesting(),
-                additionalMolecularTestingTier = diagnosis.getAdditionalMolecularTestingTier(),
-                additionalTestType = diagnosis.getAdditionalTestType(),
-                additionalTestTypeTier = diagnosis.getAdditionalTestTypeTier(),
-                laboratoryName = diagnosis.getLaboratoryName(),
-                laboratoryNameTier = diagnosis.getLaboratoryNameTier(),
-                laboratoryAddress = diagnosis.getLaboratoryAddress(),
-                laboratoryAddressTier = diagnosis.getLaboratoryAddressTier(),
-                siteOfMetastases = diagnosis.getSiteOfMetastases(),
-                siteOfMetastasesTier = diagnosis.getSiteOfMetastasesTier(),
-                stagingSystemVersion = diagnosis.getStagingSystemVersion(),
-                stagingSystemVersionTier = diagnosis.getStagingSystemVersionTier(),
-                specificStage = diagnosis.getSpecificStage(),
-                specificStageTier = diagnosis.getSpecificStageTier(),
-                cancerSpecificBiomarkers = diagnosis.getCancerSpecificBiomarkers(),
-                cancerSpecificBiomarkersTier = diagnosis.getCancerSpecificBiomarkersTier(),
-                additionalMolecularDiagnosticTestingPerformed = diagnosis.getAdditionalMolecularDiagnosticTestingPerformed(),
-                additionalMolecularDiagnosticTestingPerformedTier = diagnosis.getAdditionalMolecularDiagnosticTestingPerformedTier(),
-                additionalTest = diagnosis.getAdditionalTest(),
-                additionalTestTier = diagnosis.getAdditionalTestTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                diagnosis.getLocalId(),
-                diagnosis.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Diagnosis, diagnosis)
 
     def _readDiagnosisTable(self):
         """
@@ -2161,71 +2041,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified sample into this repository.
         """
-        try:
-            models.Sample.create(
-                # Common fields
-                id=sample.getId(),
-                datasetId=sample.getParentContainer().getId(),
-                created=sample.getCreated(),
-                updated=sample.getUpdated(),
-                name=sample.getLocalId(),
-                description=sample.getDescription(),
-                attributes=json.dumps(sample.getAttributes()),
-
-                # Unique fields
-                patientId = sample.getPatientId(),
-                patientIdTier = sample.getPatientIdTier(),
-                sampleId = sample.getSampleId(),
-                sampleIdTier = sample.getSampleIdTier(),
-                diagnosisId = sample.getDiagnosisId(),
-                diagnosisIdTier = sample.getDiagnosisIdTier(),
-                localBiobankId = sample.getLocalBiobankId(),
-                localBiobankIdTier = sample.getLocalBiobankIdTier(),
-                collectionDate = sample.getCollectionDate(),
-                collectionDateTier = sample.getCollectionDateTier(),
-                collectionHospital = sample.getCollectionHospital(),
-                collectionHospitalTier = sample.getCollectionHospitalTier(),
-                sampleType = sample.getSampleType(),
-                sampleTypeTier = sample.getSampleTypeTier(),
-                tissueDiseaseState = sample.getTissueDiseaseState(),
-                tissueDiseaseStateTier = sample.getTissueDiseaseStateTier(),
-                anatomicSiteTheSampleObtainedFrom = sample.getAnatomicSiteTheSampleObtainedFrom(),
-                anatomicSiteTheSampleObtainedFromTier = sample.getAnatomicSiteTheSampleObtainedFromTier(),
-                cancerType = sample.getCancerType(),
-                cancerTypeTier = sample.getCancerTypeTier(),
-                cancerSubtype = sample.getCancerSubtype(),
-                cancerSubtypeTier = sample.getCancerSubtypeTier(),
-                pathologyReportId = sample.getPathologyReportId(),
-                pathologyReportIdTier = sample.getPathologyReportIdTier(),
-                morphologicalCode = sample.getMorphologicalCode(),
-                morphologicalCodeTier = sample.getMorphologicalCodeTier(),
-                topologicalCode = sample.getTopologicalCode(),
-                topologicalCodeTier = sample.getTopologicalCodeTier(),
-                shippingDate = sample.getShippingDate(),
-                shippingDateTier = sample.getShippingDateTier(),
-                receivedDate = sample.getReceivedDate(),
-                receivedDateTier = sample.getReceivedDateTier(),
-                qualityControlPerformed = sample.getQualityControlPerformed(),
-                qualityControlPerformedTier = sample.getQualityControlPerformedTier(),
-                estimatedTumorContent = sample.getEstimatedTumorContent(),
-                estimatedTumorContentTier = sample.getEstimatedTumorContentTier(),
-                quantity = sample.getQuantity(),
-                quantityTier = sample.getQuantityTier(),
-                units = sample.getUnits(),
-                unitsTier = sample.getUnitsTier(),
-                associatedBiobank = sample.getAssociatedBiobank(),
-                associatedBiobankTier = sample.getAssociatedBiobankTier(),
-                otherBiobank = sample.getOtherBiobank(),
-                otherBiobankTier = sample.getOtherBiobankTier(),
-                sopFollowed = sample.getSopFollowed(),
-                sopFollowedTier = sample.getSopFollowedTier(),
-                ifNotExplainAnyDeviation = sample.getIfNotExplainAnyDeviation(),
-                ifNotExplainAnyDeviationTier = sample.getIfNotExplainAnyDeviationTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                sample.getLocalId(),
-                sample.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Sample, sample)
 
     def _readSampleTable(self):
         """
@@ -2241,47 +2057,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified treatment into this repository.
         """
-        try:
-            models.Treatment.create(
-                # Common fields
-                id=treatment.getId(),
-                datasetId=treatment.getParentContainer().getId(),
-                created=treatment.getCreated(),
-                updated=treatment.getUpdated(),
-                name=treatment.getLocalId(),
-                description=treatment.getDescription(),
-                attributes=json.dumps(treatment.getAttributes()),
-
-                # Unique fields
-                patientId = treatment.getPatientId(),
-                patientIdTier = treatment.getPatientIdTier(),
-                courseNumber = treatment.getCourseNumber(),
-                courseNumberTier = treatment.getCourseNumberTier(),
-                therapeuticModality = treatment.getTherapeuticModality(),
-                therapeuticModalityTier = treatment.getTherapeuticModalityTier(),
-                treatmentPlanType = treatment.getTreatmentPlanType(),
-                treatmentPlanTypeTier = treatment.getTreatmentPlanTypeTier(),
-                treatmentIntent = treatment.getTreatmentIntent(),
-                treatmentIntentTier = treatment.getTreatmentIntentTier(),
-                startDate = treatment.getStartDate(),
-                startDateTier = treatment.getStartDateTier(),
-                stopDate = treatment.getStopDate(),
-                stopDateTier = treatment.getStopDateTier(),
-                reasonForEndingTheTreatment = treatment.getReasonForEndingTheTreatment(),
-                reasonForEndingTheTreatmentTier = treatment.getReasonForEndingTheTreatmentTier(),
-                responseToTreatment = treatment.getResponseToTreatment(),
-                responseToTreatmentTier = treatment.getResponseToTreatmentTier(),
-                responseCriteriaUsed = treatment.getResponseCriteriaUsed(),
-                responseCriteriaUsedTier = treatment.getResponseCriteriaUsedTier(),
-                dateOfRecurrenceOrProgressionAfterThisTreatment = treatment.getDateOfRecurrenceOrProgressionAfterThisTreatment(),
-                dateOfRecurrenceOrProgressionAfterThisTreatmentTier = treatment.getDateOfRecurrenceOrProgressionAfterThisTreatmentTier(),
-                unexpectedOrUnusualToxicityDuringTreatment = treatment.getUnexpectedOrUnusualToxicityDuringTreatment(),
-                unexpectedOrUnusualToxicityDuringTreatmentTier = treatment.getUnexpectedOrUnusualToxicityDuringTreatmentTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                treatment.getLocalId(),
-                treatment.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Treatment, treatment)
 
     def _readTreatmentTable(self):
         """
@@ -2297,67 +2073,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified outcome into this repository.
         """
-        try:
-            models.Outcome.create(
-                # Common fields
-                id=outcome.getId(),
-                datasetId=outcome.getParentContainer().getId(),
-                created=outcome.getCreated(),
-                updated=outcome.getUpdated(),
-                name=outcome.getLocalId(),
-                description=outcome.getDescription(),
-                attributes=json.dumps(outcome.getAttributes()),
-
-                # Unique fields
-                patientId = outcome.getPatientId(),
-                patientIdTier = outcome.getPatientIdTier(),
-                physicalExamId = outcome.getPhysicalExamId(),
-                physicalExamIdTier = outcome.getPhysicalExamIdTier(),
-                dateOfAssessment = outcome.getDateOfAssessment(),
-                dateOfAssessmentTier = outcome.getDateOfAssessmentTier(),
-                diseaseResponseOrStatus = outcome.getDiseaseResponseOrStatus(),
-                diseaseResponseOrStatusTier = outcome.getDiseaseResponseOrStatusTier(),
-                otherResponseClassification = outcome.getOtherResponseClassification(),
-                otherResponseClassificationTier = outcome.getOtherResponseClassificationTier(),
-                minimalResidualDiseaseAssessment = outcome.getMinimalResidualDiseaseAssessment(),
-                minimalResidualDiseaseAssessmentTier = outcome.getMinimalResidualDiseaseAssessmentTier(),
-                methodOfResponseEvaluation = outcome.getMethodOfResponseEvaluation(),
-                methodOfResponseEvaluationTier = outcome.getMethodOfResponseEvaluationTier(),
-                responseCriteriaUsed = outcome.getResponseCriteriaUsed(),
-                responseCriteriaUsedTier = outcome.getResponseCriteriaUsedTier(),
-                summaryStage = outcome.getSummaryStage(),
-                summaryStageTier = outcome.getSummaryStageTier(),
-                sitesOfAnyProgressionOrRecurrence = outcome.getSitesOfAnyProgressionOrRecurrence(),
-                sitesOfAnyProgressionOrRecurrenceTier = outcome.getSitesOfAnyProgressionOrRecurrenceTier(),
-                vitalStatus = outcome.getVitalStatus(),
-                vitalStatusTier = outcome.getVitalStatusTier(),
-                height = outcome.getHeight(),
-                heightTier = outcome.getHeightTier(),
-                weight = outcome.getWeight(),
-                weightTier = outcome.getWeightTier(),
-                heightUnits = outcome.getHeightUnits(),
-                heightUnitsTier = outcome.getHeightUnitsTier(),
-                weightUnits = outcome.getWeightUnits(),
-                weightUnitsTier = outcome.getWeightUnitsTier(),
-                performanceStatus = outcome.getPerformanceStatus(),
-                performanceStatusTier = outcome.getPerformanceStatusTier(),
-                siteOfRelapseOrProgression = outcome.getSiteOfRelapseOrProgression(),
-                siteOfRelapseOrProgressionTier = outcome.getSiteOfRelapseOrProgressionTier(),
-                intervalProgressionOrRecurrence = outcome.getIntervalProgressionOrRecurrence(),
-                intervalProgressionOrRecurrenceTier = outcome.getIntervalProgressionOrRecurrenceTier(),
-                intervalRegressionOrDecreaseInDisease = outcome.getIntervalRegressionOrDecreaseInDisease(),
-                intervalRegressionOrDecreaseInDiseaseTier = outcome.getIntervalRegressionOrDecreaseInDiseaseTier(),
-                levelOfMalignancy = outcome.getLevelOfMalignancy(),
-                levelOfMalignancyTier = outcome.getLevelOfMalignancyTier(),
-                treatmentInducedNeoplasmSite = outcome.getTreatmentInducedNeoplasmSite(),
-                treatmentInducedNeoplasmSiteTier = outcome.getTreatmentInducedNeoplasmSiteTier(),
-                dateOfDiagnosisOfTreatmentInducedNeoplasm = outcome.getDateOfDiagnosisOfTreatmentInducedNeoplasm(),
-                dateOfDiagnosisOfTreatmentInducedNeoplasmTier = outcome.getDateOfDiagnosisOfTreatmentInducedNeoplasmTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                outcome.getLocalId(),
-                outcome.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Outcome, outcome)
 
     def _readOutcomeTable(self):
         """
@@ -2373,35 +2089,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified complication into this repository.
         """
-        try:
-            models.Complication.create(
-                # Common fields
-                id=complication.getId(),
-                datasetId=complication.getParentContainer().getId(),
-                created=complication.getCreated(),
-                updated=complication.getUpdated(),
-                name=complication.getLocalId(),
-                description=complication.getDescription(),
-                attributes=json.dumps(complication.getAttributes()),
-
-                # Unique fields
-                patientId = complication.getPatientId(),
-                patientIdTier = complication.getPatientIdTier(),
-                date = complication.getDate(),
-                dateTier = complication.getDateTier(),
-                lateComplicationOfTherapyDeveloped = complication.getLateComplicationOfTherapyDeveloped(),
-                lateComplicationOfTherapyDevelopedTier = complication.getLateComplicationOfTherapyDevelopedTier(),
-                lateToxicityDetail = complication.getLateToxicityDetail(),
-                lateToxicityDetailTier = complication.getLateToxicityDetailTier(),
-                suspectedTreatmentInducedNeoplasmDeveloped = complication.getSuspectedTreatmentInducedNeoplasmDeveloped(),
-                suspectedTreatmentInducedNeoplasmDevelopedTier = complication.getSuspectedTreatmentInducedNeoplasmDevelopedTier(),
-                treatmentInducedNeoplasmDetails = complication.getTreatmentInducedNeoplasmDetails(),
-                treatmentInducedNeoplasmDetailsTier = complication.getTreatmentInducedNeoplasmDetailsTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                complication.getLocalId(),
-                complication.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Complication, complication)
 
     def _readComplicationTable(self):
         """
@@ -2417,133 +2105,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified tumourboard into this repository.
         """
-        try:
-            models.Tumourboard.create(
-                # Common fields
-                id=tumourboard.getId(),
-                datasetId=tumourboard.getParentContainer().getId(),
-                created=tumourboard.getCreated(),
-                updated=tumourboard.getUpdated(),
-                name=tumourboard.getLocalId(),
-                description=tumourboard.getDescription(),
-                attributes=json.dumps(tumourboard.getAttributes()),
-
-                # Unique fields
-                patientId = tumourboard.getPatientId(),
-                patientIdTier = tumourboard.getPatientIdTier(),
-                dateOfMolecularTumorBoard = tumourboard.getDateOfMolecularTumorBoard(),
-                dateOfMolecularTumorBoardTier = tumourboard.getDateOfMolecularTumorBoardTier(),
-                typeOfSampleAnalyzed = tumourboard.getTypeOfSampleAnalyzed(),
-                typeOfSampleAnalyzedTier = tumourboard.getTypeOfSampleAnalyzedTier(),
-                typeOfTumourSampleAnalyzed = tumourboard.getTypeOfTumourSampleAnalyzed(),
-                typeOfTumourSampleAnalyzedTier = tumourboard.getTypeOfTumourSampleAnalyzedTier(),
-                analysesDiscussed = tumourboard.getAnalysesDiscussed(),
-                analysesDiscussedTier = tumourboard.getAnalysesDiscussedTier(),
-                somaticSampleType = tumourboard.getSomaticSampleType(),
-                somaticSampleTypeTier = tumourboard.getSomaticSampleTypeTier(),
-                normalExpressionComparator = tumourboard.getNormalExpressionComparator(),
-                normalExpressionComparatorTier = tumourboard.getNormalExpressionComparatorTier(),
-                diseaseExpressionComparator = tumourboard.getDiseaseExpressionComparator(),
-                diseaseExpressionComparatorTier = tumourboard.getDiseaseExpressionComparatorTier(),
-                hasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancer = tumourboard.getHasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancer(),
-                hasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancerTier = tumourboard.getHasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancerTier(),
-                actionableTargetFound = tumourboard.getActionableTargetFound(),
-                actionableTargetFoundTier = tumourboard.getActionableTargetFoundTier(),
-                molecularTumorBoardRecommendation = tumourboard.getMolecularTumorBoardRecommendation(),
-                molecularTumorBoardRecommendationTier = tumourboard.getMolecularTumorBoardRecommendationTier(),
-                germlineDnaSampleId = tumourboard.getGermlineDnaSampleId(),
-                germlineDnaSampleIdTier = tumourboard.getGermlineDnaSampleIdTier(),
-                tumorDnaSampleId = tumourboard.getTumorDnaSampleId(),
-                tumorDnaSampleIdTier = tumourboard.getTumorDnaSampleIdTier(),
-                tumorRnaSampleId = tumourboard.getTumorRnaSampleId(),
-                tumorRnaSampleIdTier = tumourboard.getTumorRnaSampleIdTier(),
-                germlineSnvDiscussed = tumourboard.getGermlineSnvDiscussed(),
-                germlineSnvDiscussedTier = tumourboard.getGermlineSnvDiscussedTier(),
-                somaticSnvDiscussed = tumourboard.getSomaticSnvDiscussed(),
-                somaticSnvDiscussedTier = tumourboard.getSomaticSnvDiscussedTier(),
-                cnvsDiscussed = tumourboard.getCnvsDiscussed(),
-                cnvsDiscussedTier = tumourboard.getCnvsDiscussedTier(),
-                structuralVariantDiscussed = tumourboard.getStructuralVariantDiscussed(),
-                structuralVariantDiscussedTier = tumourboard.getStructuralVariantDiscussedTier(),
-                classificationOfVariants = tumourboard.getClassificationOfVariants(),
-                classificationOfVariantsTier = tumourboard.getClassificationOfVariantsTier(),
-                clinicalValidationProgress = tumourboard.getClinicalValidationProgress(),
-                clinicalValidationProgressTier = tumourboard.getClinicalValidationProgressTier(),
-                typeOfValidation = tumourboard.getTypeOfValidation(),
-                typeOfValidationTier = tumourboard.getTypeOfValidationTier(),
-                agentOrDrugClass = tumourboard.getAgentOrDrugClass(),
-                agentOrDrugClassTier = tumourboard.getAgentOrDrugClassTier(),
-                levelOfEvidenceForExpressionTargetAgentMatch = tumourboard.getLevelOfEvidenceForExpressionTargetAgentMatch(),
-                levelOfEvidenceForExpressionTargetAgentMatchTier = tumourboard.getLevelOfEvidenceForExpressionTargetAgentMatchTier(),
-                didTreatmentPlanChangeBasedOnProfilingResult = tumourboard.getDidTreatmentPlanChangeBasedOnProfilingResult(),
-                didTreatmentPlanChangeBasedOnProfilingResultTier = tumourboard.getDidTreatmentPlanChangeBasedOnProfilingResultTier(),
-                howTreatmentHasAlteredBasedOnProfiling = tumourboard.getHowTreatmentHasAlteredBasedOnProfiling(),
-                howTreatmentHasAlteredBasedOnProfilingTier = tumourboard.getHowTreatmentHasAlteredBasedOnProfilingTier(),
-                reasonTreatmentPlanDidNotChangeBasedOnProfiling = tumourboard.getReasonTreatmentPlanDidNotChangeBasedOnProfiling(),
-                reasonTreatmentPlanDidNotChangeBasedOnProfilingTier = tumourboard.getReasonTreatmentPlanDidNotChangeBasedOnProfilingTier(),
-                detailsOfTreatmentPlanImpact = tumourboard.getDetailsOfTreatmentPlanImpact(),
-                detailsOfTreatmentPlanImpactTier = tumourboard.getDetailsOfTreatmentPlanImpactTier(),
-                patientOrFamilyInformedOfGermlineVariant = tumourboard.getPatientOrFamilyInformedOfGermlineVariant(),
-                patientOrFamilyInformedOfGermlineVariantTier = tumourboard.getPatientOrFamilyInformedOfGermlineVariantTier(),
-                patientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfiling = tumourboard.getPatientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfiling(),
-                patientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfilingTier = tumourboard.getPatientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfilingTier(),
-                summaryReport = tumourboard.getSummaryReport(),
-                summaryReportTier = tumourboard.getSummaryReportTier(),
-                actionableExpressionOutlier = tumourboard.getActionableExpressionOutlier(),
-                actionableExpressionOutlierTier = tumourboard.getActionableExpressionOutlierTier(),
-                actionableGermlineVariant = tumourboard.getActionableGermlineVariant(),
-                actionableGermlineVariantTier = tumourboard.getActionableGermlineVariantTier(),
-                germlineVariantsDrug = tumourboard.getGermlineVariantsDrug(),
-                germlineVariantsDrugTier = tumourboard.getGermlineVariantsDrugTier(),
-                germlineVariantsDrugClass = tumourboard.getGermlineVariantsDrugClass(),
-                germlineVariantsDrugClassTier = tumourboard.getGermlineVariantsDrugClassTier(),
-                germlineVariantsDiscussed = tumourboard.getGermlineVariantsDiscussed(),
-                germlineVariantsDiscussedTier = tumourboard.getGermlineVariantsDiscussedTier(),
-                actionableSomaticVariants = tumourboard.getActionableSomaticVariants(),
-                actionableSomaticVariantsTier = tumourboard.getActionableSomaticVariantsTier(),
-                somaticVariantsDrug = tumourboard.getSomaticVariantsDrug(),
-                somaticVariantsDrugTier = tumourboard.getSomaticVariantsDrugTier(),
-                somaticVariantsDrugClass = tumourboard.getSomaticVariantsDrugClass(),
-                somaticVariantsDrugClassTier = tumourboard.getSomaticVariantsDrugClassTier(),
-                somaticVariantsDiscussed = tumourboard.getSomaticVariantsDiscussed(),
-                somaticVariantsDiscussedTier = tumourboard.getSomaticVariantsDiscussedTier(),
-                anyActionableExpressionOutlier = tumourboard.getAnyActionableExpressionOutlier(),
-                anyActionableExpressionOutlierTier = tumourboard.getAnyActionableExpressionOutlierTier(),
-                expressionDrug = tumourboard.getExpressionDrug(),
-                expressionDrugTier = tumourboard.getExpressionDrugTier(),
-                expressionDrugClass = tumourboard.getExpressionDrugClass(),
-                expressionDrugClassTier = tumourboard.getExpressionDrugClassTier(),
-                expressionTypeOfAnalysisUsed = tumourboard.getExpressionTypeOfAnalysisUsed(),
-                expressionTypeOfAnalysisUsedTier = tumourboard.getExpressionTypeOfAnalysisUsedTier(),
-                expressionTypeOfInformationUtility = tumourboard.getExpressionTypeOfInformationUtility(),
-                expressionTypeOfInformationUtilityTier = tumourboard.getExpressionTypeOfInformationUtilityTier(),
-                expressionAlteredGene = tumourboard.getExpressionAlteredGene(),
-                expressionAlteredGeneTier = tumourboard.getExpressionAlteredGeneTier(),
-                expressionNonActionableGene = tumourboard.getExpressionNonActionableGene(),
-                expressionNonActionableGeneTier = tumourboard.getExpressionNonActionableGeneTier(),
-                expressionTypeOfAlteration = tumourboard.getExpressionTypeOfAlteration(),
-                expressionTypeOfAlterationTier = tumourboard.getExpressionTypeOfAlterationTier(),
-                anyActionableGermlineVariants = tumourboard.getAnyActionableGermlineVariants(),
-                anyActionableGermlineVariantsTier = tumourboard.getAnyActionableGermlineVariantsTier(),
-                germlineVariantsTypeOfAnalysisUsed = tumourboard.getGermlineVariantsTypeOfAnalysisUsed(),
-                germlineVariantsTypeOfAnalysisUsedTier = tumourboard.getGermlineVariantsTypeOfAnalysisUsedTier(),
-                germlineVariantsClassificationOfVariants = tumourboard.getGermlineVariantsClassificationOfVariants(),
-                germlineVariantsClassificationOfVariantsTier = tumourboard.getGermlineVariantsClassificationOfVariantsTier(),
-                germlineVariantsTypeOfInformationUtility = tumourboard.getGermlineVariantsTypeOfInformationUtility(),
-                germlineVariantsTypeOfInformationUtilityTier = tumourboard.getGermlineVariantsTypeOfInformationUtilityTier(),
-                anyActionableSomaticVariants = tumourboard.getAnyActionableSomaticVariants(),
-                anyActionableSomaticVariantsTier = tumourboard.getAnyActionableSomaticVariantsTier(),
-                somaticVariantsTypeOfAnalysisUsed = tumourboard.getSomaticVariantsTypeOfAnalysisUsed(),
-                somaticVariantsTypeOfAnalysisUsedTier = tumourboard.getSomaticVariantsTypeOfAnalysisUsedTier(),
-                somaticVariantsTypeOfInformationUtility = tumourboard.getSomaticVariantsTypeOfInformationUtility(),
-                somaticVariantsTypeOfInformationUtilityTier = tumourboard.getSomaticVariantsTypeOfInformationUtilityTier(),
-                somaticVariantsNonActionable = tumourboard.getSomaticVariantsNonActionable(),
-                somaticVariantsNonActionableTier = tumourboard.getSomaticVariantsNonActionableTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                tumourboard.getLocalId(),
-                tumourboard.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Tumourboard, tumourboard)
 
     def _readTumourboardTable(self):
         """
@@ -2559,57 +2121,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified chemotherapy into this repository.
         """
-        try:
-            models.Chemotherapy.create(
-                # Common fields
-                id=chemotherapy.getId(),
-                datasetId=chemotherapy.getParentContainer().getId(),
-                created=chemotherapy.getCreated(),
-                updated=chemotherapy.getUpdated(),
-                name=chemotherapy.getLocalId(),
-                description=chemotherapy.getDescription(),
-                attributes=json.dumps(chemotherapy.getAttributes()),
-
-                # Unique fields
-                patientId=chemotherapy.getPatientId(),
-                patientIdTier=chemotherapy.getPatientIdTier(),
-                courseNumber=chemotherapy.getCourseNumber(),
-                courseNumberTier=chemotherapy.getCourseNumberTier(),
-                startDate=chemotherapy.getStartDate(),
-                startDateTier=chemotherapy.getStartDateTier(),
-                stopDate=chemotherapy.getStopDate(),
-                stopDateTier=chemotherapy.getStopDateTier(),
-                systematicTherapyAgentName=chemotherapy.getSystematicTherapyAgentName(),
-                systematicTherapyAgentNameTier=chemotherapy.getSystematicTherapyAgentNameTier(),
-                route=chemotherapy.getRoute(),
-                routeTier=chemotherapy.getRouteTier(),
-                dose=chemotherapy.getDose(),
-                doseTier=chemotherapy.getDoseTier(),
-                doseFrequency=chemotherapy.getDoseFrequency(),
-                doseFrequencyTier=chemotherapy.getDoseFrequencyTier(),
-                doseUnit=chemotherapy.getDoseUnit(),
-                doseUnitTier=chemotherapy.getDoseUnitTier(),
-                daysPerCycle=chemotherapy.getDaysPerCycle(),
-                daysPerCycleTier=chemotherapy.getDaysPerCycleTier(),
-                numberOfCycle=chemotherapy.getNumberOfCycle(),
-                numberOfCycleTier=chemotherapy.getNumberOfCycleTier(),
-                treatmentIntent=chemotherapy.getTreatmentIntent(),
-                treatmentIntentTier=chemotherapy.getTreatmentIntentTier(),
-                treatingCentreName=chemotherapy.getTreatingCentreName(),
-                treatingCentreNameTier=chemotherapy.getTreatingCentreNameTier(),
-                type=chemotherapy.getType(),
-                typeTier=chemotherapy.getTypeTier(),
-                protocolCode=chemotherapy.getProtocolCode(),
-                protocolCodeTier=chemotherapy.getProtocolCodeTier(),
-                recordingDate=chemotherapy.getRecordingDate(),
-                recordingDateTier=chemotherapy.getRecordingDateTier(),
-                treatmentPlanId=chemotherapy.getTreatmentPlanId(),
-                treatmentPlanIdTier=chemotherapy.getTreatmentPlanIdTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                chemotherapy.getLocalId(),
-                chemotherapy.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Chemotherapy, chemotherapy)
 
     def _readChemotherapyTable(self):
         """
@@ -2625,76 +2137,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified radiotherapy into this repository.
         """
-        try:
-            models.Radiotherapy.create(
-                # Common fields
-                id=radiotherapy.getId(),
-                datasetId=radiotherapy.getParentContainer().getId(),
-                created=radiotherapy.getCreated(),
-                updated=radiotherapy.getUpdated(),
-                name=radiotherapy.getLocalId(),
-                description=radiotherapy.getDescription(),
-                attributes=json.dumps(radiotherapy.getAttributes()),
-
-                # Unique fields
-                patientId=radiotherapy.getPatientId(),
-                patientIdTier=radiotherapy.getPatientIdTier(),
-                courseNumber=radiotherapy.getCourseNumber(),
-                courseNumberTier=radiotherapy.getCourseNumberTier(),
-                startDate=radiotherapy.getStartDate(),
-                startDateTier=radiotherapy.getStartDateTier(),
-                stopDate=radiotherapy.getStopDate(),
-                stopDateTier=radiotherapy.getStopDateTier(),
-                therapeuticModality=radiotherapy.getTherapeuticModality(),
-                therapeuticModalityTier=radiotherapy.getTherapeuticModalityTier(),
-                baseline=radiotherapy.getBaseline(),
-                baselineTier=radiotherapy.getBaselineTier(),
-                testResult=radiotherapy.getTestResult(),
-                testResultTier=radiotherapy.getTestResultTier(),
-                testResultStd=radiotherapy.getTestResultStd(),
-                testResultStdTier=radiotherapy.getTestResultStdTier(),
-                treatingCentreName=radiotherapy.getTreatingCentreName(),
-                treatingCentreNameTier=radiotherapy.getTreatingCentreNameTier(),
-                startIntervalRad=radiotherapy.getStartIntervalRad(),
-                startIntervalRadTier=radiotherapy.getStartIntervalRadTier(),
-                startIntervalRadRaw=radiotherapy.getStartIntervalRadRaw(),
-                startIntervalRadRawTier=radiotherapy.getStartIntervalRadRawTier(),
-                recordingDate=radiotherapy.getRecordingDate(),
-                recordingDateTier=radiotherapy.getRecordingDateTier(),
-                adjacentFields=radiotherapy.getAdjacentFields(),
-                adjacentFieldsTier=radiotherapy.getAdjacentFieldsTier(),
-                adjacentFractions=radiotherapy.getAdjacentFractions(),
-                adjacentFractionsTier=radiotherapy.getAdjacentFractionsTier(),
-                complete=radiotherapy.getComplete(),
-                completeTier=radiotherapy.getCompleteTier(),
-                brachytherapyDose=radiotherapy.getBrachytherapyDose(),
-                brachytherapyDoseTier=radiotherapy.getBrachytherapyDoseTier(),
-                radiotherapyDose=radiotherapy.getRadiotherapyDose(),
-                radiotherapyDoseTier=radiotherapy.getRadiotherapyDoseTier(),
-                siteNumber=radiotherapy.getSiteNumber(),
-                siteNumberTier=radiotherapy.getSiteNumberTier(),
-                technique=radiotherapy.getTechnique(),
-                techniqueTier=radiotherapy.getTechniqueTier(),
-                treatedRegion=radiotherapy.getTreatedRegion(),
-                treatedRegionTier=radiotherapy.getTreatedRegionTier(),
-                treatmentPlanId=radiotherapy.getTreatmentPlanId(),
-                treatmentPlanIdTier=radiotherapy.getTreatmentPlanIdTier(),
-                radiationType=radiotherapy.getRadiationType(),
-                radiationTypeTier=radiotherapy.getRadiationTypeTier(),
-                radiationSite=radiotherapy.getRadiationSite(),
-                radiationSiteTier=radiotherapy.getRadiationSiteTier(),
-                totalDose=radiotherapy.getTotalDose(),
-                totalDoseTier=radiotherapy.getTotalDoseTier(),
-                boostSite=radiotherapy.getBoostSite(),
-                boostSiteTier=radiotherapy.getBoostSiteTier(),
-                boostDose=radiotherapy.getBoostDose(),
-                boostDoseTier=radiotherapy.getBoostDoseTier()
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                radiotherapy.getLocalId(),
-                radiotherapy.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Radiotherapy, radiotherapy)
 
     def _readRadiotherapyTable(self):
         """
@@ -2710,46 +2153,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified surgery into this repository.
         """
-        try:
-            models.Surgery.create(
-                # Common fields
-                id=surgery.getId(),
-                datasetId=surgery.getParentContainer().getId(),
-                created=surgery.getCreated(),
-                updated=surgery.getUpdated(),
-                name=surgery.getLocalId(),
-                description=surgery.getDescription(),
-                attributes=json.dumps(surgery.getAttributes()),
-
-                # Unique fields
-                patientId=surgery.getPatientId(),
-                patientIdTier=surgery.getPatientIdTier(),
-                startDate=surgery.getStartDate(),
-                startDateTier=surgery.getStartDateTier(),
-                stopDate=surgery.getStopDate(),
-                stopDateTier=surgery.getStopDateTier(),
-                sampleId=surgery.getSampleId(),
-                sampleIdTier=surgery.getSampleIdTier(),
-                collectionTimePoint=surgery.getCollectionTimePoint(),
-                collectionTimePointTier=surgery.getCollectionTimePointTier(),
-                diagnosisDate=surgery.getDiagnosisDate(),
-                diagnosisDateTier=surgery.getDiagnosisDateTier(),
-                site=surgery.getSite(),
-                siteTier=surgery.getSiteTier(),
-                type=surgery.getType(),
-                typeTier=surgery.getTypeTier(),
-                recordingDate=surgery.getRecordingDate(),
-                recordingDateTier=surgery.getRecordingDateTier(),
-                treatmentPlanId=surgery.getTreatmentPlanId(),
-                treatmentPlanIdTier=surgery.getTreatmentPlanIdTier(),
-                courseNumber=surgery.getCourseNumber(),
-                courseNumberTier=surgery.getCourseNumberTier()
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                surgery.getLocalId(),
-                surgery.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Surgery, surgery)
 
     def _readSurgeryTable(self):
         """
@@ -2765,38 +2169,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified immunotherapy into this repository.
         """
-        try:
-            models.Immunotherapy.create(
-                # Common fields
-                id=immunotherapy.getId(),
-                datasetId=immunotherapy.getParentContainer().getId(),
-                created=immunotherapy.getCreated(),
-                updated=immunotherapy.getUpdated(),
-                name=immunotherapy.getLocalId(),
-                description=immunotherapy.getDescription(),
-                attributes=json.dumps(immunotherapy.getAttributes()),
-
-                # Unique fields
-                patientId=immunotherapy.getPatientId(),
-                patientIdTier=immunotherapy.getPatientIdTier(),
-                startDate=immunotherapy.getStartDate(),
-                startDateTier=immunotherapy.getStartDateTier(),
-                immunotherapyType=immunotherapy.getImmunotherapyType(),
-                immunotherapyTypeTier=immunotherapy.getImmunotherapyTypeTier(),
-                immunotherapyTarget=immunotherapy.getImmunotherapyTarget(),
-                immunotherapyTargetTier=immunotherapy.getImmunotherapyTargetTier(),
-                immunotherapyDetail=immunotherapy.getImmunotherapyDetail(),
-                immunotherapyDetailTier=immunotherapy.getImmunotherapyDetailTier(),
-                treatmentPlanId=immunotherapy.getTreatmentPlanId(),
-                treatmentPlanIdTier=immunotherapy.getTreatmentPlanIdTier(),
-                courseNumber=immunotherapy.getCourseNumber(),
-                courseNumberTier=immunotherapy.getCourseNumberTier()
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                immunotherapy.getLocalId(),
-                immunotherapy.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Immunotherapy, immunotherapy)
 
     def _readImmunotherapyTable(self):
         """
@@ -2812,36 +2185,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified celltransplant into this repository.
         """
-        try:
-            models.Celltransplant.create(
-                # Common fields
-                id=celltransplant.getId(),
-                datasetId=celltransplant.getParentContainer().getId(),
-                created=celltransplant.getCreated(),
-                updated=celltransplant.getUpdated(),
-                name=celltransplant.getLocalId(),
-                description=celltransplant.getDescription(),
-                attributes=json.dumps(celltransplant.getAttributes()),
-
-                # Unique fields
-                patientId=celltransplant.getPatientId(),
-                patientIdTier=celltransplant.getPatientIdTier(),
-                startDate=celltransplant.getStartDate(),
-                startDateTier=celltransplant.getStartDateTier(),
-                cellSource=celltransplant.getCellSource(),
-                cellSourceTier=celltransplant.getCellSourceTier(),
-                donorType=celltransplant.getDonorType(),
-                donorTypeTier=celltransplant.getDonorTypeTier(),
-                treatmentPlanId=celltransplant.getTreatmentPlanId(),
-                treatmentPlanIdTier=celltransplant.getTreatmentPlanIdTier(),
-                courseNumber=celltransplant.getCourseNumber(),
-                courseNumberTier=celltransplant.getCourseNumberTier()
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                celltransplant.getLocalId(),
-                celltransplant.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Celltransplant, celltransplant)
 
     def _readCelltransplantTable(self):
         """
@@ -2857,58 +2201,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified slide into this repository.
         """
-        try:
-            models.Slide.create(
-                # Common fields
-                id=slide.getId(),
-                datasetId=slide.getParentContainer().getId(),
-                created=slide.getCreated(),
-                updated=slide.getUpdated(),
-                name=slide.getLocalId(),
-                description=slide.getDescription(),
-                attributes=json.dumps(slide.getAttributes()),
-
-                # Unique fields
-                patientId=slide.getPatientId(),
-                patientIdTier=slide.getPatientIdTier(),
-                sampleId=slide.getSampleId(),
-                sampleIdTier=slide.getSampleIdTier(),
-                slideId=slide.getSlideId(),
-                slideIdTier=slide.getSlideIdTier(),
-                slideOtherId=slide.getSlideOtherId(),
-                slideOtherIdTier=slide.getSlideOtherIdTier(),
-                lymphocyteInfiltrationPercent=slide.getLymphocyteInfiltrationPercent(),
-                lymphocyteInfiltrationPercentTier=slide.getLymphocyteInfiltrationPercentTier(),
-                tumorNucleiPercent=slide.getTumorNucleiPercent(),
-                tumorNucleiPercentTier=slide.getTumorNucleiPercentTier(),
-                monocyteInfiltrationPercent=slide.getMonocyteInfiltrationPercent(),
-                monocyteInfiltrationPercentTier=slide.getMonocyteInfiltrationPercentTier(),
-                normalCellsPercent=slide.getNormalCellsPercent(),
-                normalCellsPercentTier=slide.getNormalCellsPercentTier(),
-                tumorCellsPercent=slide.getTumorCellsPercent(),
-                tumorCellsPercentTier=slide.getTumorCellsPercentTier(),
-                stromalCellsPercent=slide.getStromalCellsPercent(),
-                stromalCellsPercentTier=slide.getStromalCellsPercentTier(),
-                eosinophilInfiltrationPercent=slide.getEosinophilInfiltrationPercent(),
-                eosinophilInfiltrationPercentTier=slide.getEosinophilInfiltrationPercentTier(),
-                neutrophilInfiltrationPercent=slide.getNeutrophilInfiltrationPercent(),
-                neutrophilInfiltrationPercentTier=slide.getNeutrophilInfiltrationPercentTier(),
-                granulocyteInfiltrationPercent=slide.getGranulocyteInfiltrationPercent(),
-                granulocyteInfiltrationPercentTier=slide.getGranulocyteInfiltrationPercentTier(),
-                necrosisPercent=slide.getNecrosisPercent(),
-                necrosisPercentTier=slide.getNecrosisPercentTier(),
-                inflammatoryInfiltrationPercent=slide.getInflammatoryInfiltrationPercent(),
-                inflammatoryInfiltrationPercentTier=slide.getInflammatoryInfiltrationPercentTier(),
-                proliferatingCellsNumber=slide.getProliferatingCellsNumber(),
-                proliferatingCellsNumberTier=slide.getProliferatingCellsNumberTier(),
-                sectionLocation=slide.getSectionLocation(),
-                sectionLocationTier=slide.getSectionLocationTier(),
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                slide.getLocalId(),
-                slide.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Slide, slide)
 
     def _readSlideTable(self):
         """
@@ -2924,34 +2217,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified study into this repository.
         """
-        try:
-            models.Study.create(
-                # Common fields
-                id=study.getId(),
-                datasetId=study.getParentContainer().getId(),
-                created=study.getCreated(),
-                updated=study.getUpdated(),
-                name=study.getLocalId(),
-                description=study.getDescription(),
-                attributes=json.dumps(study.getAttributes()),
-
-                # Unique fields
-                patientId=study.getPatientId(),
-                patientIdTier=study.getPatientIdTier(),
-                startDate=study.getStartDate(),
-                startDateTier=study.getStartDateTier(),
-                endDate=study.getEndDate(),
-                endDateTier=study.getEndDateTier(),
-                status=study.getStatus(),
-                statusTier=study.getStatusTier(),
-                recordingDate=study.getRecordingDate(),
-                recordingDateTier=study.getRecordingDateTier(),
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                study.getLocalId(),
-                study.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Study, study)
 
     def _readStudyTable(self):
         """
@@ -2967,40 +2233,7 @@ class SqlDataRepository(AbstractDataRepository):
         """
         Inserts the specified labtest into this repository.
         """
-        try:
-            models.Labtest.create(
-                # Common fields
-                id=labtest.getId(),
-                datasetId=labtest.getParentContainer().getId(),
-                created=labtest.getCreated(),
-                updated=labtest.getUpdated(),
-                name=labtest.getLocalId(),
-                description=labtest.getDescription(),
-                attributes=json.dumps(labtest.getAttributes()),
-
-                # Unique fields
-                patientId=labtest.getPatientId(),
-                patientIdTier=labtest.getPatientIdTier(),
-                startDate=labtest.getStartDate(),
-                startDateTier=labtest.getStartDateTier(),
-                collectionDate=labtest.getCollectionDate(),
-                collectionDateTier=labtest.getCollectionDateTier(),
-                endDate=labtest.getEndDate(),
-                endDateTier=labtest.getEndDateTier(),
-                eventType=labtest.getEventType(),
-                eventTypeTier=labtest.getEventTypeTier(),
-                testResults=labtest.getTestResults(),
-                testResultsTier=labtest.getTestResultsTier(),
-                timePoint=labtest.getTimePoint(),
-                timePointTier=labtest.getTimePointTier(),
-                recordingDate=labtest.getRecordingDate(),
-                recordingDateTier=labtest.getRecordingDateTier(),
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                labtest.getLocalId(),
-                labtest.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Labtest, labtest)
 
     def _readLabtestTable(self):
         """
@@ -3014,38 +2247,9 @@ class SqlDataRepository(AbstractDataRepository):
 
     def insertExtraction(self, extraction):
         """
-        Inserts the specified patient into this repository.
+        Inserts the specified extraction into this repository.
         """
-        try:
-            models.Extraction.create(
-                # Common fields
-                id=extraction.getId(),
-                datasetId=extraction.getParentContainer().getId(),
-                created=extraction.getCreated(),
-                updated=extraction.getUpdated(),
-                name=extraction.getLocalId(),
-                description=extraction.getDescription(),
-                attributes=json.dumps(extraction.getAttributes()),
-                # Unique fields
-                extractionId=extraction.getExtractionId(),
-                extractionIdTier=extraction.getExtractionIdTier(),
-                sampleId=extraction.getSampleId(),
-                sampleIdTier=extraction.getSampleIdTier(),
-                rnaBlood=extraction.getRnaBlood(),
-                rnaBloodTier=extraction.getRnaBloodTier(),
-                dnaBlood=extraction.getDnaBlood(),
-                dnaBloodTier=extraction.getDnaBloodTier(),
-                rnaTissue=extraction.getRnaTissue(),
-                rnaTissueTier=extraction.getRnaTissueTier(),
-                dnaTissue=extraction.getDnaTissue(),
-                dnaTissueTier=extraction.getDnaTissueTier(),
-                site=extraction.getSite(),
-                siteTier=extraction.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                extraction.getLocalId(),
-                extraction.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Extraction, extraction)
 
     def _readExtractionTable(self):
         """
@@ -3059,46 +2263,9 @@ class SqlDataRepository(AbstractDataRepository):
 
     def insertSequencing(self, sequencing):
         """
-        Inserts the specified patient into this repository.
+        Inserts the specified sequencing into this repository.
         """
-        try:
-            models.Sequencing.create(
-                # Common fields
-                id=sequencing.getId(),
-                datasetId=sequencing.getParentContainer().getId(),
-                created=sequencing.getCreated(),
-                updated=sequencing.getUpdated(),
-                name=sequencing.getLocalId(),
-                description=sequencing.getDescription(),
-                attributes=json.dumps(sequencing.getAttributes()),
-                # Unique fields
-                sequencingId=sequencing.getSequencingId(),
-                sequencingIdTier=sequencing.getSequencingIdTier(),
-                sampleId=sequencing.getSampleId(),
-                sampleIdTier=sequencing.getSampleIdTier(),
-                dnaLibraryKit=sequencing.getDnaLibraryKit(),
-                dnaLibraryKitTier=sequencing.getDnaLibraryKitTier(),
-                dnaSeqPlatform=sequencing.getDnaSeqPlatform(),
-                dnaSeqPlatformTier=sequencing.getDnaSeqPlatformTier(),
-                dnaReadLength=sequencing.getDnaReadLength(),
-                dnaReadLengthTier=sequencing.getDnaReadLengthTier(),
-                rnaLibraryKit=sequencing.getRnaLibraryKit(),
-                rnaLibraryKitTier=sequencing.getRnaLibraryKitTier(),
-                rnaSeqPlatform=sequencing.getRnaSeqPlatform(),
-                rnaSeqPlatformTier=sequencing.getRnaSeqPlatformTier(),
-                rnaReadLength=sequencing.getRnaReadLength(),
-                rnaReadLengthTier=sequencing.getRnaReadLengthTier(),
-                pcrCycles=sequencing.getPcrCycles(),
-                pcrCyclesTier=sequencing.getPcrCyclesTier(),
-                extractionId=sequencing.getExtractionId(),
-                extractionIdTier=sequencing.getExtractionIdTier(),
-                site=sequencing.getSite(),
-                siteTier=sequencing.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                sequencing.getLocalId(),
-                sequencing.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Sequencing, sequencing)
 
     def _readSequencingTable(self):
         """
@@ -3112,60 +2279,9 @@ class SqlDataRepository(AbstractDataRepository):
 
     def insertAlignment(self, alignment):
         """
-        Inserts the specified patient into this repository.
+        Inserts the specified alignment into this repository.
         """
-        try:
-            models.Alignment.create(
-                # Common fields
-                id=alignment.getId(),
-                datasetId=alignment.getParentContainer().getId(),
-                created=alignment.getCreated(),
-                updated=alignment.getUpdated(),
-                name=alignment.getLocalId(),
-                description=alignment.getDescription(),
-                attributes=json.dumps(alignment.getAttributes()),
-                # Unique fields
-                alignmentId=alignment.getAlignmentId(),
-                alignmentIdTier=alignment.getAlignmentIdTier(),
-                sampleId=alignment.getSampleId(),
-                sampleIdTier=alignment.getSampleIdTier(),
-                alignmentTool=alignment.getAlignmentTool(),
-                alignmentToolTier=alignment.getAlignmentToolTier(),
-                mergeTool=alignment.getMergeTool(),
-                mergeToolTier=alignment.getMergeToolTier(),
-                inHousePipeline=alignment.getInHousePipeline(),
-                inHousePipelineTier=alignment.getInHousePipelineTier(),
-                markDuplicates=alignment.getMarkDuplicates(),
-                markDuplicatesTier=alignment.getMarkDuplicatesTier(),
-                realignerTarget=alignment.getRealignerTarget(),
-                realignerTargetTier=alignment.getRealignerTargetTier(),
-                indelRealigner=alignment.getIndelRealigner(),
-                indelRealignerTier=alignment.getIndelRealignerTier(),
-                coverage=alignment.getCoverage(),
-                coverageTier=alignment.getCoverageTier(),
-                baseRecalibrator=alignment.getBaseRecalibrator(),
-                baseRecalibratorTier=alignment.getBaseRecalibratorTier(),
-                printReads=alignment.getPrintReads(),
-                printReadsTier=alignment.getPrintReadsTier(),
-                idxStats=alignment.getIdxStats(),
-                idxStatsTier=alignment.getIdxStatsTier(),
-                flagStat=alignment.getFlagStat(),
-                flagStatTier=alignment.getFlagStatTier(),
-                insertSizeMetrics=alignment.getInsertSizeMetrics(),
-                insertSizeMetricsTier=alignment.getInsertSizeMetricsTier(),
-                fastqc=alignment.getFastqc(),
-                fastqcTier=alignment.getFastqcTier(),
-                reference=alignment.getReference(),
-                referenceTier=alignment.getReferenceTier(),
-                sequencingId=alignment.getSequencingId(),
-                sequencingIdTier=alignment.getSequencingIdTier(),
-                site=alignment.getSite(),
-                siteTier=alignment.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                alignment.getLocalId(),
-                alignment.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.Alignment, alignment)
 
     def _readAlignmentTable(self):
         """
@@ -3179,55 +2295,9 @@ class SqlDataRepository(AbstractDataRepository):
 
     def insertVariantCalling(self, variantCalling):
         """
-        Inserts the specified patient into this repository.
+        Inserts the specified variant calling into this repository.
         """
-        try:
-            models.VariantCalling.create(
-                # Common fields
-                id=variantCalling.getId(),
-                datasetId=variantCalling.getParentContainer().getId(),
-                created=variantCalling.getCreated(),
-                updated=variantCalling.getUpdated(),
-                name=variantCalling.getLocalId(),
-                description=variantCalling.getDescription(),
-                attributes=json.dumps(variantCalling.getAttributes()),
-                # Unique fields
-                variantCallingId=variantCalling.getVariantCallingId(),
-                variantCallingIdTier=variantCalling.getVariantCallingIdTier(),
-                sampleId=variantCalling.getSampleId(),
-                sampleIdTier=variantCalling.getSampleIdTier(),
-                variantCaller=variantCalling.getVariantCaller(),
-                variantCallerTier=variantCalling.getVariantCallerTier(),
-                tabulate=variantCalling.getTabulate(),
-                tabulateTier=variantCalling.getTabulateTier(),
-                inHousePipeline=variantCalling.getInHousePipeline(),
-                inHousePipelineTier=variantCalling.getInHousePipelineTier(),
-                annotation=variantCalling.getAnnotation(),
-                annotationTier=variantCalling.getAnnotationTier(),
-                mergeTool=variantCalling.getMergeTool(),
-                mergeToolTier=variantCalling.getMergeToolTier(),
-                rdaToTab=variantCalling.getRdaToTab(),
-                rdaToTabTier=variantCalling.getRdaToTabTier(),
-                delly=variantCalling.getDelly(),
-                dellyTier=variantCalling.getDellyTier(),
-                postFilter=variantCalling.getPostFilter(),
-                postFilterTier=variantCalling.getPostFilterTier(),
-                clipFilter=variantCalling.getClipFilter(),
-                clipFilterTier=variantCalling.getClipFilterTier(),
-                cosmic=variantCalling.getCosmic(),
-                cosmicTier=variantCalling.getCosmicTier(),
-                dbSnp=variantCalling.getDbSnp(),
-                dbSnpTier=variantCalling.getDbSnpTier(),
-                alignmentId=variantCalling.getAlignmentId(),
-                alignmentIdTier=variantCalling.getAlignmentIdTier(),
-                site=variantCalling.getSite(),
-                siteTier=variantCalling.getSiteTier()
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                variantCalling.getLocalId(),
-                variantCalling.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.VariantCalling, variantCalling)
 
     def _readVariantCallingTable(self):
         """
@@ -3241,46 +2311,9 @@ class SqlDataRepository(AbstractDataRepository):
 
     def insertFusionDetection(self, fusionDetection):
         """
-        Inserts the specified patient into this repository.
+        Inserts the specified fusion detection into this repository.
         """
-        try:
-            models.FusionDetection.create(
-                # Common fields
-                id=fusionDetection.getId(),
-                datasetId=fusionDetection.getParentContainer().getId(),
-                created=fusionDetection.getCreated(),
-                updated=fusionDetection.getUpdated(),
-                name=fusionDetection.getLocalId(),
-                description=fusionDetection.getDescription(),
-                attributes=json.dumps(fusionDetection.getAttributes()),
-                # Unique fields
-                fusionDetectionId=fusionDetection.getFusionDetectionId(),
-                fusionDetectionIdTier=fusionDetection.getFusionDetectionIdTier(),
-                sampleId=fusionDetection.getSampleId(),
-                sampleIdTier=fusionDetection.getSampleIdTier(),
-                inHousePipeline=fusionDetection.getInHousePipeline(),
-                inHousePipelineTier=fusionDetection.getInHousePipelineTier(),
-                svDetection=fusionDetection.getSvDetection(),
-                svDetectionTier=fusionDetection.getSvDetectionTier(),
-                fusionDetection=fusionDetection.getFusionDetection(),
-                fusionDetectionTier=fusionDetection.getFusionDetectionTier(),
-                realignment=fusionDetection.getRealignment(),
-                realignmentTier=fusionDetection.getRealignmentTier(),
-                annotation=fusionDetection.getAnnotation(),
-                annotationTier=fusionDetection.getAnnotationTier(),
-                genomeReference=fusionDetection.getGenomeReference(),
-                genomeReferenceTier=fusionDetection.getGenomeReferenceTier(),
-                geneModels=fusionDetection.getGeneModels(),
-                geneModelsTier=fusionDetection.getGeneModelsTier(),
-                alignmentId=fusionDetection.getAlignmentId(),
-                alignmentIdTier=fusionDetection.getAlignmentIdTier(),
-                site=fusionDetection.getSite(),
-                siteTier=fusionDetection.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                fusionDetection.getLocalId(),
-                fusionDetection.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.FusionDetection, fusionDetection)
 
     def _readFusionDetectionTable(self):
         """
@@ -3294,42 +2327,9 @@ class SqlDataRepository(AbstractDataRepository):
 
     def insertExpressionAnalysis(self, expressionAnalysis):
         """
-        Inserts the specified patient into this repository.
+        Inserts the specified expression analysis into this repository.
         """
-        try:
-            models.ExpressionAnalysis.create(
-                # Common fields
-                id=expressionAnalysis.getId(),
-                datasetId=expressionAnalysis.getParentContainer().getId(),
-                created=expressionAnalysis.getCreated(),
-                updated=expressionAnalysis.getUpdated(),
-                name=expressionAnalysis.getLocalId(),
-                description=expressionAnalysis.getDescription(),
-                attributes=json.dumps(expressionAnalysis.getAttributes()),
-                # Unique fields
-                expressionAnalysisId=expressionAnalysis.getExpressionAnalysisId(),
-                expressionAnalysisIdTier=expressionAnalysis.getExpressionAnalysisIdTier(),
-                sampleId=expressionAnalysis.getSampleId(),
-                sampleIdTier=expressionAnalysis.getSampleIdTier(),
-                readLength=expressionAnalysis.getReadLength(),
-                readLengthTier=expressionAnalysis.getReadLengthTier(),
-                reference=expressionAnalysis.getReference(),
-                referenceTier=expressionAnalysis.getReferenceTier(),
-                alignmentTool=expressionAnalysis.getAlignmentTool(),
-                alignmentToolTier=expressionAnalysis.getAlignmentToolTier(),
-                bamHandling=expressionAnalysis.getBamHandling(),
-                bamHandlingTier=expressionAnalysis.getBamHandlingTier(),
-                expressionEstimation=expressionAnalysis.getExpressionEstimation(),
-                expressionEstimationTier=expressionAnalysis.getExpressionEstimationTier(),
-                sequencingId=expressionAnalysis.getSequencingId(),
-                sequencingIdTier=expressionAnalysis.getSequencingIdTier(),
-                site=expressionAnalysis.getSite(),
-                siteTier=expressionAnalysis.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                expressionAnalysis.getLocalId(),
-                expressionAnalysis.getParentContainer().getLocalId())
+        self._insertMetadataRecord(models.ExpressionAnalysis, expressionAnalysis)
 
     def _readExpressionAnalysisTable(self):
         """
@@ -3556,6 +2556,13 @@ class SqlDataRepository(AbstractDataRepository):
         """
         os.unlink(self._dbFilename)
 
+    def loadDatasets(self):
+        """
+        Loads the datasets of this data repository into memory, without
+        their contents, for updates that only need the datasets.
+        """
+        self._readDatasetTable()
+
     def load(self):
         """
         Loads this data repository into memory.
@@ -908,3 +908,13 @@ class UnsupportedFormatException(RepoManagerException):
     def __init__(self, dataFormat):
         msg = "Unsupported format: {}".format(dataFormat)
         super(UnsupportedFormatException, self).__init__(msg)
+
+
+class InvalidMetadataRecordException(RepoManagerException):
+    """
+    A clinical or pipeline metadata record to ingest is invalid.
+    """
+    def __init__(self, position, tableName, reason):
+        msg = "Invalid '{}' record in metadata object {}: {}".format(
+            tableName, position, reason)
+        super(InvalidMetadataRecordException, self).__init__(msg)
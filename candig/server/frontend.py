@@ -4,16 +4,19 @@ The Flask frontend for the GA4GH API.
 
 import os
 import datetime
+import hmac
 import socket
+import time
 import urllib.parse
 import functools
+import inspect
 import json
-import math
 
 import flask
 from flask_cors import CORS
 import humanize
 import werkzeug
+import werkzeug.http
 import oic
 # from oic.oic import AuthorizationRequest, Client
 import oic.oauth2
@@ -28,16 +31,22 @@ from itertools import chain
 
 import candig.server
 import candig.server.backend as backend
+import candig.server.compression as compression
 import candig.server.datamodel as datamodel
 import candig.server.exceptions as exceptions
+import candig.server.metrics as metrics
 import candig.server.datarepo as datarepo
 import candig.server.auth as auth
+import candig.server.auth.access_list as access_list
+import candig.server.auth.opa as opa
 import candig.server.network as network
+import candig.server.paging as paging
+import candig.server.response_builder as response_builder
+import candig.server.sqlite_backend as sqlite_backend
+import candig.server.tracing as tracing
 
 import candig.schemas.protocol as protocol
 
-import base64
-import pandas as pd
 from collections import Counter, defaultdict
 
 from requests_futures.sessions import FuturesSession
@@ -231,84 +240,17 @@ class ServerStatus(object):
         return app.backend.getDataRepository().getOntologyByName(name)
 
 
-class UserAccessMap(object):
-    """
-    Loads local authorization info from an access list file to the backend
-    ACL tsv file header row contains list of project names(ID)
-    """
-    def __init__(self, logger=None):
-        self.user_access_map = {}
-        self.file_path = app.config.get('ACCESS_LIST')
-
-        if not self.file_path:
-            raise exceptions.ConfigurationException("No user access list defined")
-
-        try:
-            self.access_list = pd.read_csv(self.file_path, sep='\t', index_col=['issuer', 'username'])
-            # Detect duplicated (issuer, username) tuples
-            for issuer_user in self.access_list.index[self.access_list.index.duplicated()]:
-                raise ValueError(
-                    "Duplicate entries detected for {}. "
-                    "User access disabled until ACL resolved.".format(issuer_user))
-        except (IOError, ValueError) as err:
-            self.access_list = None
-            if logger:
-                logger.error(err)
-
-        self.list_updated = os.path.getmtime(self.file_path)
-
-    def initializeUserAccess(self):
-        # Convert user access table into a dictionary
-        if self.access_list is not None:
-            self.user_access_map = self.access_list.to_dict(orient='index')
-
-        # Remove non set values
-        self.user_access_map = {
-            user: {project: level
-                   for project, level in value.items() if self.validateAccessLevel(level)
-                   }
-            for user, value in self.user_access_map.items()
-        }
-
-    def validateAccessLevel(self, level):
-        """
-        Returns True if the level is one of 0, 1, 2, 3, 4, this indicates the user has some access to the dataset.
-        Returns False if the level is one of empty string or X, this indicates the user has no access to the dataset.
-        Raise an exception otherwise, this indicates that there's illegal characters specified as 'level'.
-
-        The support for empty string will be deprecated and removed in future releases.
-        """
-        try:
-            if 0 <= int(level) <= 4:
-                return True
-        except (ValueError, TypeError):
-            if level == "X" or level == " ":
-                return False
-            elif math.isnan(level):
-                return False
-
-        raise exceptions.InvalidAccessListException(level)
-
-    def getUserAccessMap(self, issuer, username):
-        try:
-            access_map = self.user_access_map[(issuer, username)]
-        except KeyError:
-            access_map = {}
-        return access_map
-
-    def getFilePath(self):
-        return self.file_path
-
-    def getListUpdated(self):
-        return self.list_updated
-
-
 def load_access_map():
     """
-    Reloads the user access map from file
+    Loads the user access map from file and watches it for changes
     """
-    app.access_map = UserAccessMap(app.logger)
-    app.access_map.initializeUserAccess()
+    if getattr(app, 'access_map', None) is not None:
+        app.access_map.stop()
+    app.access_map = access_list.UserAccessMap(
+        app.config.get('ACCESS_LIST'),
+        pollInterval=app.config.get('ACCESS_LIST_POLL_INTERVAL', 5),
+        logger=app.logger)
+    app.access_map.load().start()
 
 
 def reset():
@@ -400,6 +342,22 @@ def configure(configFile=None, baseConfig="ProductionConfig",
     # Setup file handle cache max size
     datamodel.fileHandleCache.setMaxCacheSize(
         app.config["FILE_HANDLE_CACHE_MAX_SIZE"])
+    # Setup the cache of serialized clinical and pipeline records
+    datamodel.serializedElementCache.setMaxSize(
+        app.config["SERIALIZED_ELEMENT_CACHE_SIZE"])
+    datamodel.serializedElementCache.clear()
+    # Setup the cursors of the search results
+    paging.cursorRegistry.configure(
+        maxSize=app.config["SEARCH_CURSOR_CACHE_SIZE"],
+        timeToLive=app.config["SEARCH_CURSOR_TTL"])
+    paging.cursorRegistry.clear()
+    # Setup the pooled SQLite connections
+    sqlite_backend.connectionPool.configure(
+        readOnly=app.config["SQLITE_READ_ONLY"],
+        immutable=app.config["SQLITE_IMMUTABLE"],
+        mmapSize=app.config["SQLITE_MMAP_SIZE"],
+        cacheSize=app.config["SQLITE_CACHE_SIZE"],
+        cachedStatements=app.config["SQLITE_CACHED_STATEMENTS"])
     # Setup CORS
     try:
         CORS(app, allow_headers='Content-Type')
@@ -407,7 +365,14 @@ def configure(configFile=None, baseConfig="ProductionConfig",
         pass
     app.serverStatus = ServerStatus()
 
+    # Setup the runtime metrics
+    metrics.metricsRegistry.configure(
+        directory=app.config["METRICS_MULTIPROCESS_DIR"],
+        syncInterval=app.config["METRICS_SYNC_INTERVAL"])
+    loadStart = time.perf_counter()
     app.backend = _configure_backend(app)
+    metrics.metricsRegistry.setGauge(
+        metrics.REPOSITORY_LOAD_TIME, time.perf_counter() - loadStart)
     if app.config.get('SECRET_KEY'):
         app.secret_key = app.config['SECRET_KEY']
     elif app.config.get('OIDC_PROVIDER'):
@@ -420,10 +385,12 @@ def configure(configFile=None, baseConfig="ProductionConfig",
     app.cache = FileSystemCache(
         app.cache_dir, threshold=5000, default_timeout=600, mode=384)
     # Peer service initialization
-    network.initialize(
+    app.peerManager = network.initialize(
         app.config.get('INITIAL_PEERS'),
         app.backend.getDataRepository(),
-        app.logger)
+        app.logger,
+        timeout=app.config["PEER_TIMEOUT"],
+        probeInterval=app.config["PEER_PROBE_INTERVAL"])
     app.oidcClient = None
     app.myPort = port
     if app.config.get('AUTH0_ENABLED'):
@@ -472,8 +439,18 @@ def configure(configFile=None, baseConfig="ProductionConfig",
             app.oidcClient.store_registration_info(response)
 
     # Set user access map from file if using a gateway to authenticate
-    if app.config.get("TYK_ENABLED") and not app.config.get("OPA_SERVER"):
-        load_access_map()
+    app.tokenPayloadCache = opa.TokenPayloadCache()
+    app.opaClient = None
+    if app.config.get("TYK_ENABLED"):
+        if app.config.get("OPA_SERVER"):
+            app.opaClient = opa.OpaClient(
+                app.config["OPA_SERVER"],
+                serverToken=app.config.get("OPA_SERVER_TOKEN", ''),
+                timeout=app.config.get("OPA_TIMEOUT", 5),
+                cacheTtl=app.config.get("OPA_CACHE_TTL", 60),
+                cacheSize=app.config.get("OPA_CACHE_SIZE", 1024))
+        else:
+            load_access_map()
 
 
 def chooseReturnMimetype(request):
@@ -489,6 +466,8 @@ def getFlaskResponse(responseString, httpStatus=200,
                      mimetype="application/json"):
     """
     Returns a Flask response object for the specified data and HTTP status.
+    The data is either a string or an iterator of strings, which is
+    streamed to the client.
     """
     return flask.Response(responseString, status=httpStatus, mimetype=mimetype)
 
@@ -505,14 +484,17 @@ def federation(endpoint, request, return_mimetype, request_type='POST'):
     request: string
         Request send along with the query, like: id for GET requests
     return_mimetype: string
-        'http/json or application/json'
+        'http/json or application/json', or a protobuf mimetype
     request_type: string
         Specify whether the request is a "GET" or a "POST" request
 
     Returns:
     ========
-    responseObject: json string
-        Merged responses from the servers. responseObject structure:
+    response: flask.Response
+        Streams the merged responses from the servers. Search responses
+        requested as protobuf are returned as the merged protobuf search
+        response, and peers are always queried for protobuf search
+        responses. Otherwise the responseObject structure is:
 
     {
     "status": {
@@ -535,7 +517,16 @@ def federation(endpoint, request, return_mimetype, request_type='POST'):
 
     """
     request_dictionary = flask.request
-    federationResponse = FederationResponse(request, endpoint, return_mimetype, request_dictionary)
+    # The pages of search requests are written out record by record,
+    # without being parsed back from their serialization, and are merged
+    # with the protobuf responses of the peers
+    stream = (
+        request_type == 'POST' and
+        endpoint not in [app.backend.runCountQuery,
+                         app.backend.runSearchBeaconRangeVariants] and
+        _acceptsStream(endpoint))
+    federationResponse = FederationResponse(
+        request, endpoint, return_mimetype, request_dictionary, stream=stream)
     federationResponse.handleLocalRequest()
 
     # Apply federation by default or if it was specifically requested
@@ -550,6 +541,11 @@ def federation(endpoint, request, return_mimetype, request_type='POST'):
             raise exceptions.ObjectWithIdNotFoundException(request)
         elif request_type == 'POST':
             raise exceptions.ObjectWithIdNotFoundException(json.loads(request))
+    elif federationResponse.isProtocolResponse():
+        results = responseObject['results']
+        return getFlaskResponse(
+            protocol.serialize(results, return_mimetype),
+            mimetype=_getProtocolMimetype(return_mimetype, results))
     else:
         # Update total when it's a POST request
         if request_type == 'POST':
@@ -587,35 +583,65 @@ def federation(endpoint, request, return_mimetype, request_type='POST'):
                     responseObject['status']['Queried peers']:
                 responseObject['status']['Valid response'] = True
 
-    return json.dumps(responseObject)
+    return getFlaskResponse(
+        response_builder.iterJson(responseObject), mimetype=return_mimetype)
 
 
-def _parseTokenPayload(token):
+def _getProtocolMimetype(mimetype, protocolObject):
+    """
+    Returns the mimetype of the specified protobuf response, which names
+    its message type so that peers can decode it
+    """
+    return '{}; messageType={}'.format(
+        mimetype, protocolObject.DESCRIPTOR.full_name)
 
-    try:
-        token_payload = token.split(".")[1]
 
-        # make sure token is padded properly for b64 decoding
-        padding = len(token_payload) % 4
-        if padding != 0:
-            token_payload += '=' * (4 - padding)
-        decoded_payload = base64.b64decode(token_payload)
+@functools.lru_cache(maxsize=None)
+def _getProtocolClasses():
+    return {
+        class_.DESCRIPTOR.full_name: class_
+        for class_ in protocol.getProtocolClasses()}
+
+
+def _getProtocolClass(contentType):
+    """
+    Returns the protocol class named by the messageType parameter of the
+    specified Content-Type header, or None if it names no protocol class
+    """
+    _, options = werkzeug.http.parse_options_header(contentType)
+    return _getProtocolClasses().get(options.get('messageType'))
+
+
+def _acceptsStream(endpoint):
+    """
+    Returns True if the endpoint can return its response builder instead
+    of the serialized response.
+    """
+    try:
+        return 'stream' in inspect.signature(endpoint).parameters
+    except (TypeError, ValueError):
+        return False
 
-    except IndexError:
-        decoded_payload = '{}'
 
-    return json.loads(decoded_payload)
+def _parseTokenPayload(token):
+    """
+    Returns the decoded payload of the token, memoized across requests
+    """
+    return app.tokenPayloadCache.get(token)
 
 
 class FederationResponse(object):
 
-    def __init__(self, request, endpoint, return_mimetype, request_dict):
+    def __init__(self, request, endpoint, return_mimetype, request_dict,
+                 stream=False):
         self.results = {}
+        self.responseClass = None
         self.status = []
         self.request = request
         self.endpoint = endpoint
         self.return_mimetype = return_mimetype
         self.request_dict = request_dict
+        self.stream = stream
         self.token, self.access_map = self.handleAccessPermission()
 
     def handleAccessPermission(self):
@@ -638,22 +664,10 @@ class FederationResponse(object):
                 issuer = parsed_payload.get('iss')
                 username = parsed_payload.get('preferred_username')
 
-                if app.config.get("OPA_SERVER"):
-                    payload = json.dumps({
-                        "input": {
-                            "token": access_token.split(' ')[1],
-                            "body": {
-                                "method": "GET", # Opa only accepts GET right now
-                                "path": self.request_dict.path
-                            }
-                        }
-                    })
-                    headers = {
-                        'Authorization': 'Bearer ' + app.config.get("OPA_SERVER_TOKEN"),
-                        'Content-Type': 'application/json'
-                    }
-                    response = requests.request("POST", app.config.get("OPA_SERVER"), headers=headers, data=payload)
-                    res_datasets = response.json()["result"]
+                if app.opaClient is not None:
+                    res_datasets = app.opaClient.getDatasets(
+                        access_token, self.request_dict.path,
+                        tokenPayload=parsed_payload)
                     # all datasets returned by OPA are assigned access level 4
                     for i in res_datasets:
                         access_map[i] = 4
@@ -675,13 +689,28 @@ class FederationResponse(object):
         make local data request and set the results and status for a FederationResponse
         """
         try:
-            self.results = json.loads(
-                self.endpoint(
+            if self.stream:
+                responseBuilder = self.endpoint(
                     self.request,
                     return_mimetype=self.return_mimetype,
-                    access_map=self.access_map
+                    access_map=self.access_map,
+                    stream=True
+                )
+                self.responseClass = responseBuilder.getResponseClass()
+                if self.isProtocolResponse():
+                    results = responseBuilder.getProtocolResponse()
+                    if results.ListFields():
+                        self.results = results
+                else:
+                    self.results = responseBuilder.getJsonResponse()
+            else:
+                self.results = json.loads(
+                    self.endpoint(
+                        self.request,
+                        return_mimetype=self.return_mimetype,
+                        access_map=self.access_map
+                    )
                 )
-            )
 
             self.status.append(200)
 
@@ -704,27 +733,95 @@ class FederationResponse(object):
             'Federation': 'False',
             'Authorization': self.token,
         }
+        # search responses are exchanged as protobuf with the peers that
+        # advertise it, the others get the request as before
+        protobuf_header = dict(
+            header, **{'Content-Type': 'application/json',
+                       'Accept': 'application/protobuf'})
 
-        # generate peer uri
+        # generate peer uri, skipping the peers known to be down
         uri_list = []
-        for peer in app.serverStatus.getPeers():
+        peer_list = []
+        header_list = []
+        for peer in app.peerManager.getPeers():
+            if not peer.isHealthy():
+                self.status.append(503)
+                metrics.metricsRegistry.increment(
+                    metrics.PEER_RESPONSES, labels={"status": "503"})
+                continue
             uri = self.request_dict.url.replace(
                 self.request_dict.host_url,
                 peer.getUrl(),
             )
             uri_list.append(uri)
-
-        for future_response in self.async_requests(uri_list, request_type, header):
+            peer_list.append(peer)
+            if self.responseClass is not None and peer.acceptsSearchFormat(
+                    'application/protobuf'):
+                header_list.append(protobuf_header)
+            else:
+                header_list.append(header)
+
+        trace = tracing.getCurrentTrace()
+        requestStart = time.perf_counter()
+        future_responses = self.async_requests(
+            uri_list, request_type, header_list)
+        responseEnds = {}
+        if trace is not None:
+            for future_response in future_responses:
+                future_response.add_done_callback(
+                    lambda future: responseEnds.setdefault(
+                        future, time.perf_counter()))
+        for peer, future_response in zip(peer_list, future_responses):
             try:
                 response = future_response.result()
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                app.peerManager.recordFailure(peer.getUrl())
                 self.status.append(503)
+                metrics.metricsRegistry.increment(
+                    metrics.PEER_RESPONSES, labels={"status": "503"})
+                continue
+            finally:
+                if trace is not None:
+                    trace.addSpan(
+                        "peer", requestStart,
+                        responseEnds.get(future_response, time.perf_counter()),
+                        {"peer.url": peer.getUrl()})
+            responseClass = None
+            if response.status_code == 200:
+                responseClass = _getProtocolClass(
+                    response.headers.get('Content-Type', ''))
+            if responseClass is not None and \
+                    responseClass is not self.responseClass:
+                # Only the responses of the type requested are decoded,
+                # a peer answering with another one is treated as failed
+                app.peerManager.recordFailure(peer.getUrl())
+                self.status.append(502)
+                metrics.metricsRegistry.increment(
+                    metrics.PEER_RESPONSES, labels={"status": "502"})
                 continue
             self.status.append(response.status_code)
+            metrics.metricsRegistry.increment(
+                metrics.PEER_RESPONSES,
+                labels={"status": str(response.status_code)})
             # If the call was successful append the results
             if response.status_code == 200:
                 try:
-                    if request_type == 'GET':
+                    if responseClass is not None:
+                        self.mergeProtocolResponse(
+                            protocol.fromProtobufString(
+                                response.content, responseClass))
+
+                    elif self.isProtocolResponse():
+                        # Peers that don't send protobuf answer in JSON,
+                        # which is decoded as the type of the local response
+                        peer_response = response.json()['results']
+                        peer_response.pop('total', None)
+                        if self.responseClass is not None:
+                            self.mergeProtocolResponse(protocol.fromJson(
+                                json.dumps(peer_response),
+                                self.responseClass))
+
+                    elif request_type == 'GET':
                         self.results = response.json()['results']
 
                     elif request_type == 'POST':
@@ -740,7 +837,8 @@ class FederationResponse(object):
                                     continue
                                 for record in peer_response[key]:
                                     self.results[key].append(record)
-                except ValueError:
+                except (ValueError, protocol.json_format.ParseError,
+                        protocol.message.DecodeError):
                     pass
 
         if self.endpoint == app.backend.runCountQuery and self.results:
@@ -749,6 +847,38 @@ class FederationResponse(object):
         if self.endpoint == app.backend.runSearchBeaconRangeVariants:
             self.beaconifyRangeVariants()
 
+    def isProtocolResponse(self):
+        """
+        Returns True if the merged results are a protobuf search response
+        """
+        return (
+            self.stream and
+            self.return_mimetype in response_builder.PROTOBUF_MIMETYPES)
+
+    def mergeProtocolResponse(self, peerResponse):
+        """
+        Appends the values of the protobuf search response of a peer to the
+        results, keeping the first page token that was set
+        """
+        valueListName = protocol.getValueListName(type(peerResponse))
+        values = getattr(peerResponse, valueListName)
+        if self.isProtocolResponse():
+            if not self.results:
+                if peerResponse.ListFields():
+                    self.results = peerResponse
+                return
+            getattr(self.results, valueListName).extend(values)
+            if not self.results.next_page_token:
+                self.results.next_page_token = peerResponse.next_page_token
+        else:
+            if values:
+                field = peerResponse.DESCRIPTOR.fields_by_name[valueListName]
+                self.results.setdefault(field.json_name, []).extend(
+                    response_builder.JsonFragment(protocol.toJson(value))
+                    for value in values)
+            if peerResponse.next_page_token and 'nextPageToken' not in self.results:
+                self.results['nextPageToken'] = peerResponse.next_page_token
+
     def variantsFilter(self, variant):
         """
         A helper that filters out variants with below specified threshold
@@ -815,21 +945,22 @@ class FederationResponse(object):
         """
         return {'status': self.status, 'results': self.results}
 
-    def async_requests(self, uri_list, request_type, header):
+    def async_requests(self, uri_list, request_type, header_list):
         """
-        Use futures session type to async process peer requests
+        Use futures session type to async process peer requests, sending
+        each uri its own headers
         :return: list of future responses
         """
         async_session = FuturesSession(max_workers=10)  # capping max threads
         if request_type == "GET":
             responses = [
-                async_session.get(uri, headers=header)
-                for uri in uri_list
+                async_session.get(uri, headers=header, timeout=10)
+                for uri, header in zip(uri_list, header_list)
             ]
         elif request_type == "POST":
             responses = [
                 async_session.post(uri, json=json.loads(self.request), headers=header, timeout=10)
-                for uri in uri_list
+                for uri, header in zip(uri_list, header_list)
             ]
         else:
             responses = []
@@ -850,13 +981,12 @@ def handleHttpPost(request, endpoint):
         request = request.get_data()
     if request == '' or request is None:
         request = '{}'
-    responseStr = federation(
+    return federation(
         endpoint,
         request,
         return_mimetype=return_mimetype,
         request_type='POST'
     )
-    return getFlaskResponse(responseStr, mimetype=return_mimetype)
 
 
 def handleList(endpoint, request):
@@ -875,13 +1005,12 @@ def handleHttpGet(id_, endpoint):
     """
     request = flask.request
     return_mimetype = chooseReturnMimetype(request)
-    responseStr = federation(
+    return federation(
         endpoint,
         id_,
         return_mimetype=return_mimetype,
         request_type='GET'
     )
-    return getFlaskResponse(responseStr, mimetype=return_mimetype)
 
 
 def handleHttpOptions():
@@ -929,16 +1058,138 @@ def handleException(exception):
                                 mimetype=return_mimetype)
 
 
-@app.before_request
-def checkAuthorization():
-    if app.config.get("TYK_ENABLED") and not app.config.get("OPA_SERVER"):
-        if app.access_map.getListUpdated() != os.path.getmtime(app.access_map.getFilePath()):
-            if app.logger:
-                app.logger.info(
-                    "local access_list.txt updated -> reloading backend list"
-                )
-            load_access_map()
+def _collectMetrics(registry):
+    """
+    Sets the metrics of the caches and of the data repository
+    """
+    # The name, statistics and number of entries key of each cache
+    caches = [
+        ("fileHandle", datamodel.fileHandleCache.getStats(), "openFiles"),
+        ("serializedElement", datamodel.serializedElementCache.getStats(),
+         "elements"),
+        ("searchCursor", paging.cursorRegistry.getStats(), "cursors"),
+        ("sqliteConnection", sqlite_backend.connectionPool.getStats(),
+         "openConnections"),
+    ]
+    if getattr(app, 'opaClient', None) is not None:
+        caches.append((
+            "opaDecision", app.opaClient.getStats(), "cachedDecisions"))
+    for cache, stats, entriesKey in caches:
+        labels = {"cache": cache}
+        registry.setCounter(metrics.CACHE_HITS, stats["hits"], labels)
+        registry.setCounter(metrics.CACHE_MISSES, stats["misses"], labels)
+        if "evictions" in stats:
+            registry.setCounter(
+                metrics.CACHE_EVICTIONS, stats["evictions"], labels)
+        registry.setGauge(metrics.CACHE_ENTRIES, stats[entriesKey], labels)
+    if getattr(app, 'backend', None) is None:
         return
+    dataRepository = app.backend.getDataRepository()
+    objectCounts = Counter({"datasets": dataRepository.getNumDatasets()})
+    for dataset in dataRepository.getDatasets():
+        objectCounts.update(dataset.getObjectCounts())
+    for table, count in objectCounts.items():
+        registry.setGauge(
+            metrics.REPOSITORY_OBJECTS, count, {"table": table})
+
+
+metrics.metricsRegistry.addCollector(_collectMetrics)
+
+
+@app.before_request
+def start_request_metrics():
+    """
+    Records the start time of the request when the metrics are enabled
+    """
+    if app.config.get("METRICS_ENABLED", False):
+        flask.request.environ["candig.requestStart"] = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """
+    Records the count, duration and response size of the request. This
+    runs after the other hooks, so the size is that of the compressed body.
+    """
+    requestStart = flask.request.environ.pop("candig.requestStart", None)
+    if requestStart is None:
+        return response
+    registry = metrics.metricsRegistry
+    rule = flask.request.url_rule
+    labels = {
+        "endpoint": rule.rule if rule is not None else "unmatched",
+        "method": flask.request.method,
+    }
+    registry.increment(
+        metrics.HTTP_REQUESTS,
+        labels=dict(labels, status=str(response.status_code)))
+    registry.observe(
+        metrics.HTTP_REQUEST_DURATION, time.perf_counter() - requestStart,
+        labels)
+    if response.is_streamed:
+        response.response = _countResponseBytes(response.response, labels)
+    else:
+        registry.increment(
+            metrics.HTTP_RESPONSE_BYTES, response.calculate_content_length() or 0,
+            labels)
+    registry.sync()
+    return response
+
+
+def _countResponseBytes(chunks, labels):
+    for chunk in chunks:
+        metrics.metricsRegistry.increment(
+            metrics.HTTP_RESPONSE_BYTES, len(chunk), labels)
+        yield chunk
+
+
+@app.before_request
+def start_trace():
+    """
+    Starts tracing the stages of the request when tracing is enabled
+    """
+    if app.config.get("REQUEST_TRACING", False):
+        flask.request.environ["candig.traceToken"] = tracing.startTrace(
+            flask.request.path, {"http.method": flask.request.method})
+
+
+@app.after_request
+def end_trace(response):
+    """
+    Reports the timings of the stages of a traced request in the
+    Server-Timing header of the response, and logs its spans as OTLP JSON
+    """
+    token = flask.request.environ.pop("candig.traceToken", None)
+    if token is None:
+        return response
+    trace = tracing.endTrace(token)
+    trace.getRootSpan().attributes["http.status_code"] = response.status_code
+    response.headers["Server-Timing"] = trace.getServerTiming()
+    if app.config.get("REQUEST_TRACING_LOG", False):
+        logging.getLogger(tracing.__name__).info(json.dumps(trace.toJson()))
+    return response
+
+
+@app.teardown_request
+def reset_trace(exception):
+    """
+    Stops tracing the requests that failed before their response was made
+    """
+    token = flask.request.environ.pop("candig.traceToken", None)
+    if token is not None:
+        tracing.endTrace(token)
+
+
+@app.after_request
+def advertise_search_formats(response):
+    """
+    Lists the formats federated searches can be answered in on the /info
+    responses, which peers probe
+    """
+    if flask.request.endpoint == 'getInfo':
+        response.headers[network.SEARCH_FORMATS_HEADER] = \
+            'application/protobuf'
+    return response
 
 
 @app.after_request
@@ -950,6 +1201,35 @@ def prevent_cache(response):
     return response
 
 
+@app.after_request
+def compress_response(response):
+    """
+    Compresses the API responses with the content encoding negotiated from
+    the Accept-Encoding header of the request
+    """
+    if (not app.config.get("RESPONSE_COMPRESSION", True) or
+            response.mimetype not in protocol.MIMETYPES or
+            response.direct_passthrough or
+            'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = compression.chooseEncoding(flask.request.accept_encodings)
+    if encoding is None:
+        return response
+    compressor = compression.Compressor(
+        encoding, level=app.config.get("RESPONSE_COMPRESSION_LEVEL", 6))
+    if response.is_streamed:
+        response.response = compressor.iterCompress(response.response)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < app.config.get("RESPONSE_COMPRESSION_MIN_SIZE", 1024):
+            return response
+        response.set_data(compressor.compress(data))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
 def handleFlaskGetRequest(id_, flaskRequest, endpoint):
     """
     Handles the specified flask request for one of the GET URLs
@@ -1020,6 +1300,26 @@ def swagger():
     return flask.render_template('swagger.html')
 
 
+@app.route('/metrics')
+def getMetrics():
+    if not app.config.get("METRICS_ENABLED", False):
+        raise exceptions.PathNotFoundException()
+    token = app.config.get("METRICS_TOKEN")
+    if not token:
+        return requires_auth(_renderMetrics)()
+    authorization = flask.request.headers.get('Authorization', '')
+    if not hmac.compare_digest(
+            authorization.encode(), "Bearer {}".format(token).encode()):
+        raise exceptions.NotAuthorizedException()
+    return _renderMetrics()
+
+
+def _renderMetrics():
+    return flask.Response(
+        metrics.metricsRegistry.render(),
+        content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.route('/serverinfo')
 @requires_auth
 def server_info():
@@ -1645,6 +1945,13 @@ def searchExpressionLevels():
         flask.request, app.backend.runSearchExpressionLevels)
 
 
+@DisplayedRoute('/expressionmatrix/search', postMethod=True)
+@requires_auth
+def searchExpressionMatrix():
+    return handleFlaskPostRequest(
+        flask.request, app.backend.runSearchExpressionMatrix)
+
+
 @DisplayedRoute(
     '/variantsets/<no(search):id>',
     pathDisplay='/variantsets/<id>')
@@ -0,0 +1,420 @@
+"""
+Runtime metrics of the server, exposed in the Prometheus text format by
+the /metrics endpoint.
+
+Metrics are kept in memory by each process. When the server runs in
+several processes, such as gunicorn workers, each process writes its
+metrics to a file of a shared directory every few seconds, and the
+process answering /metrics merges the files of all the processes.
+Counters and histograms are summed over every process that wrote a file,
+so that they keep increasing when workers are restarted, while gauges
+only cover the live processes. The files of the processes that have
+exited are folded into one file, so the directory doesn't grow as
+workers are recycled.
+"""
+import contextlib
+import fcntl
+import json
+import math
+import os
+import threading
+import time
+
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# How the gauges of several processes are merged
+SUM = "sum"
+MAX = "max"
+
+# The file holding the counters and histograms of the exited processes
+EXITED_SNAPSHOT_FILE = "metrics_exited.json"
+
+
+def _labelsKey(labels):
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _formatValue(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _formatLabels(labels):
+    if not labels:
+        return ""
+    return "{{{}}}".format(",".join(
+        '{}="{}"'.format(key, str(value).replace(
+            "\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels))
+
+
+def _getSnapshotPid(fileName):
+    """
+    Returns the process ID of the snapshot file of the specified name, or
+    None if it isn't the snapshot of a process.
+    """
+    if not fileName.startswith("metrics_") or not fileName.endswith(".json"):
+        return None
+    try:
+        return int(fileName[len("metrics_"):-len(".json")])
+    except ValueError:
+        return None
+
+
+def _mergeSnapshot(counters, histograms, snapshot):
+    """
+    Adds the counters and histograms of the specified snapshot to the
+    specified dictionaries, keyed by (name, labels).
+    """
+    for name, labels, value in snapshot["counters"]:
+        key = (name, tuple(map(tuple, labels)))
+        counters[key] = counters.get(key, 0) + value
+    for name, labels, values in snapshot["histograms"]:
+        key = (name, tuple(map(tuple, labels)))
+        histogram = histograms.setdefault(key, [0] * len(values))
+        for index, value in enumerate(values):
+            histogram[index] += value
+
+
+def _isAlive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class MetricsRegistry(object):
+    """
+    The counters, gauges and histograms of the server. Metrics are
+    identified by their name and a dictionary of labels, and are
+    described once with their type and help text.
+
+    Collectors are functions called before the metrics are written out
+    or rendered, which set the metrics read from other components, such
+    as the statistics of the caches.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._descriptions = {}
+        self._collectors = []
+        self._directory = None
+        self._syncInterval = 5
+        self._lastSync = 0
+        self.reset()
+
+    def configure(self, directory=None, syncInterval=5):
+        """
+        Sets the directory the metrics of each process are written to,
+        and the minimum number of seconds between two writes. Without a
+        directory, only the metrics of the current process are rendered.
+        """
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._syncInterval = syncInterval
+        self._lastSync = 0
+
+    def reset(self):
+        """
+        Drops the recorded values of all the metrics.
+        """
+        with self._lock:
+            self._counters = {}
+            self._gauges = {}
+            self._histograms = {}
+
+    def describe(self, name, metricType, helpText, aggregate=SUM):
+        """
+        Declares the metric of the specified name and type. The aggregate
+        is how gauges of several processes are merged, SUM or MAX.
+        """
+        self._descriptions[name] = (metricType, helpText, aggregate)
+
+    def addCollector(self, collector):
+        """
+        Adds a function called with this registry before the metrics are
+        written out or rendered.
+        """
+        self._collectors.append(collector)
+
+    def increment(self, name, value=1, labels=None):
+        key = (name, _labelsKey(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def setCounter(self, name, value, labels=None):
+        """
+        Sets a counter to the total kept by another component.
+        """
+        with self._lock:
+            self._counters[(name, _labelsKey(labels))] = value
+
+    def setGauge(self, name, value, labels=None):
+        with self._lock:
+            self._gauges[(name, _labelsKey(labels))] = value
+
+    def observe(self, name, value, labels=None):
+        """
+        Records an observation of a histogram.
+        """
+        key = (name, _labelsKey(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self._buckets) + 2)
+            for index, bound in enumerate(self._buckets):
+                if value <= bound:
+                    histogram[index] += 1
+                    break
+            else:
+                histogram[len(self._buckets)] += 1
+            histogram[-1] += value
+
+    def _collect(self):
+        for collector in self._collectors:
+            collector(self)
+
+    def getSnapshot(self):
+        """
+        Returns the metrics of this process as a JSON serializable
+        dictionary.
+        """
+        self._collect()
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "buckets": list(self._buckets),
+                "counters": [
+                    [name, labels, value]
+                    for (name, labels), value in self._counters.items()],
+                "gauges": [
+                    [name, labels, value]
+                    for (name, labels), value in self._gauges.items()],
+                "histograms": [
+                    [name, labels, values]
+                    for (name, labels), values in self._histograms.items()],
+            }
+
+    def _getSnapshotPath(self, pid):
+        return os.path.join(self._directory, "metrics_{}.json".format(pid))
+
+    def sync(self, force=False):
+        """
+        Writes the metrics of this process to the metrics directory, if
+        there is one and they weren't written in the last syncInterval
+        seconds, or force is True.
+        """
+        if self._directory is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._lastSync < self._syncInterval:
+            return
+        self._lastSync = now
+        self._writeSnapshot(self.getSnapshot())
+
+    def _writeSnapshot(self, snapshot, fileName=None):
+        if fileName is None:
+            path = self._getSnapshotPath(snapshot["pid"])
+        else:
+            path = os.path.join(self._directory, fileName)
+        tempPath = "{}.{}.tmp".format(path, threading.get_ident())
+        with open(tempPath, "w") as snapshotFile:
+            json.dump(snapshot, snapshotFile)
+        os.replace(tempPath, path)
+
+    def _readSnapshot(self, fileName):
+        with open(os.path.join(self._directory, fileName)) as snapshotFile:
+            return json.load(snapshotFile)
+
+    @contextlib.contextmanager
+    def _lockDirectory(self):
+        """
+        Holds the lock that the processes take turns through to fold and
+        read the snapshot files, so that no snapshot is counted twice.
+        """
+        with open(os.path.join(self._directory, "metrics.lock"), "a") \
+                as lockFile:
+            fcntl.flock(lockFile, fcntl.LOCK_EX)
+            yield
+
+    def _foldExitedSnapshots(self):
+        """
+        Adds the counters and histograms of the processes that have exited
+        to the EXITED_SNAPSHOT_FILE, and removes their snapshot files. The
+        caller must hold the lock of the directory.
+        """
+        exited = [
+            fileName for fileName in os.listdir(self._directory)
+            if _getSnapshotPid(fileName) not in (None, os.getpid()) and
+            not _isAlive(_getSnapshotPid(fileName))]
+        if len(exited) == 0:
+            return
+        counters = {}
+        histograms = {}
+        try:
+            _mergeSnapshot(
+                counters, histograms,
+                self._readSnapshot(EXITED_SNAPSHOT_FILE))
+        except (OSError, ValueError):
+            pass
+        for fileName in exited:
+            try:
+                snapshot = self._readSnapshot(fileName)
+            except (OSError, ValueError):
+                continue
+            # Histograms of other buckets can't be merged, and would
+            # be left out of the rendered metrics anyway
+            if snapshot["buckets"] != list(self._buckets):
+                snapshot = dict(snapshot, histograms=[])
+            _mergeSnapshot(counters, histograms, snapshot)
+        self._writeSnapshot({
+            "pid": None,
+            "buckets": list(self._buckets),
+            "counters": [
+                [name, labels, value]
+                for (name, labels), value in counters.items()],
+            "gauges": [],
+            "histograms": [
+                [name, labels, values]
+                for (name, labels), values in histograms.items()],
+        }, EXITED_SNAPSHOT_FILE)
+        for fileName in exited:
+            try:
+                os.remove(os.path.join(self._directory, fileName))
+            except OSError:
+                pass
+
+    def _getSnapshots(self):
+        snapshot = self.getSnapshot()
+        snapshots = [snapshot]
+        if self._directory is None:
+            return snapshots
+        self._lastSync = time.monotonic()
+        self._writeSnapshot(snapshot)
+        with self._lockDirectory():
+            self._foldExitedSnapshots()
+            for fileName in os.listdir(self._directory):
+                if (not fileName.startswith("metrics_") or
+                        not fileName.endswith(".json") or
+                        fileName == "metrics_{}.json".format(snapshot["pid"])):
+                    continue
+                try:
+                    snapshots.append(self._readSnapshot(fileName))
+                except (OSError, ValueError):
+                    continue
+        return snapshots
+
+    def collect(self):
+        """
+        Returns the (counters, gauges, histograms) dictionaries of the
+        metrics merged over all the processes, keyed by (name, labels).
+        Histograms map to a list of the bucket counts followed by the
+        count of the values over the last bucket and the sum of the values.
+        """
+        counters = {}
+        gauges = {}
+        histograms = {}
+        for snapshot in self._getSnapshots():
+            if snapshot["buckets"] != list(self._buckets):
+                snapshot = dict(snapshot, histograms=[])
+            _mergeSnapshot(counters, histograms, snapshot)
+            # The exited processes have no pid
+            if snapshot["pid"] == os.getpid() or (
+                    snapshot["pid"] is not None and
+                    _isAlive(snapshot["pid"])):
+                for name, labels, value in snapshot["gauges"]:
+                    key = (name, tuple(map(tuple, labels)))
+                    if key not in gauges:
+                        gauges[key] = value
+                    elif self._descriptions.get(name, (None, None, SUM))[2] == MAX:
+                        gauges[key] = max(gauges[key], value)
+                    else:
+                        gauges[key] += value
+        return counters, gauges, histograms
+
+    def render(self):
+        """
+        Returns the metrics of all the processes in the Prometheus text
+        exposition format.
+        """
+        counters, gauges, histograms = self.collect()
+        samples = {}
+        for values in (counters, gauges):
+            for (name, labels), value in sorted(values.items()):
+                samples.setdefault(name, []).append(
+                    "{}{} {}".format(name, _formatLabels(labels), _formatValue(value)))
+        for (name, labels), values in sorted(histograms.items()):
+            lines = samples.setdefault(name, [])
+            cumulative = 0
+            for bound, count in zip(self._buckets + (math.inf,), values[:-1]):
+                cumulative += count
+                lines.append("{}_bucket{} {}".format(
+                    name, _formatLabels(labels + (("le", _formatValue(bound)),)),
+                    cumulative))
+            lines.append("{}_sum{} {}".format(
+                name, _formatLabels(labels), _formatValue(values[-1])))
+            lines.append("{}_count{} {}".format(
+                name, _formatLabels(labels), cumulative))
+        output = []
+        for name in sorted(samples):
+            if name in self._descriptions:
+                metricType, helpText, _ = self._descriptions[name]
+                output.append("# HELP {} {}".format(name, helpText))
+                output.append("# TYPE {} {}".format(name, metricType))
+            output.extend(samples[name])
+        return "\n".join(output) + "\n"
+
+
+# The metrics of the server
+metricsRegistry = MetricsRegistry()
+
+HTTP_REQUESTS = "candig_http_requests_total"
+HTTP_REQUEST_DURATION = "candig_http_request_duration_seconds"
+HTTP_RESPONSE_BYTES = "candig_http_response_bytes_total"
+PEER_RESPONSES = "candig_peer_responses_total"
+REPOSITORY_LOAD_TIME = "candig_repository_load_seconds"
+REPOSITORY_OBJECTS = "candig_repository_objects"
+CACHE_HITS = "candig_cache_hits_total"
+CACHE_MISSES = "candig_cache_misses_total"
+CACHE_EVICTIONS = "candig_cache_evictions_total"
+CACHE_ENTRIES = "candig_cache_entries"
+
+metricsRegistry.describe(
+    HTTP_REQUESTS, COUNTER,
+    "Number of requests by endpoint, method and status code")
+metricsRegistry.describe(
+    HTTP_REQUEST_DURATION, HISTOGRAM,
+    "Time taken to make the responses, by endpoint and method")
+metricsRegistry.describe(
+    HTTP_RESPONSE_BYTES, COUNTER,
+    "Bytes of response bodies served, by endpoint and method")
+metricsRegistry.describe(
+    PEER_RESPONSES, COUNTER,
+    "Responses of the peers to federated requests, by status code")
+metricsRegistry.describe(
+    REPOSITORY_LOAD_TIME, GAUGE,
+    "Time taken to load the data repository", aggregate=MAX)
+metricsRegistry.describe(
+    REPOSITORY_OBJECTS, GAUGE,
+    "Number of objects of the data repository, by table", aggregate=MAX)
+metricsRegistry.describe(
+    CACHE_HITS, COUNTER, "Number of cache hits, by cache")
+metricsRegistry.describe(
+    CACHE_MISSES, COUNTER, "Number of cache misses, by cache")
+metricsRegistry.describe(
+    CACHE_EVICTIONS, COUNTER, "Number of entries evicted, by cache")
+metricsRegistry.describe(
+    CACHE_ENTRIES, GAUGE, "Number of entries held, by cache")
@@ -2,13 +2,23 @@
 Provides methods to initialize the server's peer to peer connections.
 """
 
+import concurrent.futures
 import os
+import threading
+import time
+
 import requests
 
 import candig.server.datamodel as datamodel
+import candig.server.datamodel.peers as peers
 import candig.server.exceptions as exceptions
 
 
+# The header in which a server lists, on its /info responses, the formats
+# it can answer federated search requests in besides JSON
+SEARCH_FORMATS_HEADER = "CanDIG-Search-Formats"
+
+
 def getInitialPeerList(filePath, logger=None):
     """
     Attempts to get a list of peers from a file specified in configuration.
@@ -22,17 +32,19 @@ def getInitialPeerList(filePath, logger=None):
     startup and will log a warning if the file isn't found.
     """
     ret = []
-    try:
-        with open(filePath) as textFile:
-            ret = textFile.readlines()
-    except:
-        pass
-    if len(ret) == 0:
+    error = None
+    if filePath is not None:
+        try:
+            with open(filePath) as textFile:
+                ret = [line.strip() for line in textFile]
+        except EnvironmentError as exc:
+            error = exc
+    if len(ret) == 0 and filePath is not None:
         if logger:
-            logger.warn("Couldn't load the initial "
-                        "peer list. Try adding a "
-                        "file named 'initial_peers.txt' "
-                        "to {}".format(os.getcwd()))
+            logger.warning("Couldn't load the initial "
+                           "peer list ({}). Try adding a "
+                           "file named 'initial_peers.txt' "
+                           "to {}".format(error, os.getcwd()))
     # Remove lines that start with a hash or are empty.
     return [x for x in ret if x != "" and not x.find("#") != -1]
 
@@ -53,18 +65,187 @@ def insertInitialPeer(dataRepository, url, logger=None):
     except exceptions.BadUrlException as exc:
         if logger:
             logger.debug("A URL in the initial "
-                         "peer list {} was malformed. {}".format(url), exc)
+                         "peer list {} was malformed. {}".format(url, exc))
+
+
+def announce(peerUrl, timeout, logger=None):
+    """
+    Announces the specified peer URL to that peer, returning True if the
+    announcement was delivered.
+    """
+    headers = {'content-type': 'application/json'}
+    data = {"peer": {"url": peerUrl}}
+    url = "{}/announce".format(peerUrl.rstrip("/"))
+    try:
+        requests.post(url, headers=headers, json=data, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        if logger:
+            logger.info("Couldn't announce to initial peer {}".format(
+                (e, url)))
+        return False
+    return True
+
+
+class PeerManager(object):
+    """
+    Keeps track of the health of the peers of the repository from a
+    background thread. The thread first announces this server to the
+    initial peers, then probes the /info endpoint of every peer each
+    probeInterval seconds, recording the round trip time, protocol
+    version and search formats of the peers that answer, and marking the
+    others as down.
+    Federated requests failing on a peer also mark it as down until it
+    answers a probe again.
 
+    Threads do not survive a fork, so the thread is started again in
+    pre-forked server workers the first time they use the manager.
+    """
+    def __init__(self, dataRepository, timeout=5, probeInterval=60,
+                 maxWorkers=10, logger=None):
+        self._dataRepository = dataRepository
+        self._timeout = timeout
+        self._probeInterval = probeInterval
+        self._maxWorkers = maxWorkers
+        self._logger = logger
+        self._health = {}
+        self._initialPeers = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def start(self, initialPeers=[]):
+        """
+        Starts the background thread, announcing this server to the
+        specified initial peer URLs.
+        """
+        self._initialPeers = list(initialPeers)
+        self._ensureStarted()
+        return self
+
+    def stop(self):
+        """
+        Stops the background thread.
+        """
+        self._stopped.set()
+
+    def _ensureStarted(self):
+        if self._stopped.is_set():
+            return
+        pid = os.getpid()
+        with self._lock:
+            if self._thread is not None and self._pid == pid:
+                return
+            if self._pid is not None and self._pid != pid:
+                # The announcements were made by the parent process
+                self._initialPeers = []
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="PeerManager")
+            self._thread.daemon = True
+            self._thread.start()
 
-def initialize(filePath, dataRepository, logger=None):
-    for initialPeer in getInitialPeerList(filePath):
+    def _run(self):
+        for url in self._initialPeers:
+            if self._stopped.is_set():
+                return
+            announce(url, self._timeout, self._logger)
+        self._initialPeers = []
+        if self._probeInterval <= 0:
+            return
+        while not self._stopped.is_set():
+            try:
+                self.probeAll()
+            except Exception as exc:
+                if self._logger:
+                    self._logger.warning(
+                        "Couldn't probe the peers: {}".format(exc))
+            self._stopped.wait(self._probeInterval)
+
+    def _getHealth(self, url):
+        with self._lock:
+            health = self._health.get(url)
+            if health is None:
+                health = self._health[url] = peers.PeerHealth()
+            return health
+
+    def probe(self, peer):
+        """
+        Probes the /info endpoint of the specified peer and records its
+        health. Any response other than a server error means the peer
+        is up.
+        """
+        url = "{}info".format(peer.getUrl())
+        start = time.time()
         try:
-            headers = {'content-type': 'application/json'}
-            data = {"peer": {"url": initialPeer}}
-            url = "{}/announce".format(initialPeer.rstrip("/"))
-            requests.post(url, headers=headers, json=data)
-        except Exception as e:
-            if logger:
-                logger.info("Couldn't announce to initial peer {}".format(
-                    (e, url)))
+            response = requests.get(url, timeout=self._timeout)
+        except requests.exceptions.RequestException:
+            self.recordFailure(peer.getUrl())
+            return
+        rtt = time.time() - start
+        if response.status_code >= 500:
+            self.recordFailure(peer.getUrl())
+            return
+        version = None
+        if response.status_code == 200:
+            try:
+                version = response.json()["results"].get("protocolVersion")
+            except (ValueError, KeyError, AttributeError):
+                pass
+        searchFormats = [
+            searchFormat.strip() for searchFormat in response.headers.get(
+                SEARCH_FORMATS_HEADER, "").split(",")
+            if searchFormat.strip()]
+        self._getHealth(peer.getUrl()).recordSuccess(
+            rtt, version, searchFormats)
+
+    def probeAll(self):
+        """
+        Probes all the peers of the repository concurrently.
+        """
+        peerList = self._dataRepository.getPeers()
+        if len(peerList) == 0:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._maxWorkers) as executor:
+            list(executor.map(self.probe, peerList))
+
+    def recordFailure(self, url):
+        """
+        Marks the peer with the specified URL as down until it answers
+        a probe again. Without probing, peers are never marked down.
+        """
+        if self._probeInterval > 0:
+            self._getHealth(url).recordFailure()
+
+    def getPeers(self):
+        """
+        Returns the peers of the repository with their health, the
+        healthy peers ordered by round trip time first.
+        """
+        self._ensureStarted()
+        peerList = self._dataRepository.getPeers()
+        with self._lock:
+            for peer in peerList:
+                peer.setHealth(self._health.get(peer.getUrl()))
+
+        def sortKey(peer):
+            health = peer.getHealth()
+            rtt = None if health is None else health.getRtt()
+            return (not peer.isHealthy(), rtt is None, rtt or 0)
+        return sorted(peerList, key=sortKey)
+
+
+def initialize(filePath, dataRepository, logger=None, timeout=5,
+               probeInterval=60):
+    """
+    Adds the initial peers to the repository and returns a started
+    PeerManager, which announces this server to them in the background.
+    """
+    initialPeers = getInitialPeerList(filePath, logger)
+    for initialPeer in initialPeers:
         insertInitialPeer(dataRepository, initialPeer, logger)
+    peerManager = PeerManager(
+        dataRepository, timeout=timeout, probeInterval=probeInterval,
+        logger=logger)
+    return peerManager.start(initialPeers)
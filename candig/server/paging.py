@@ -4,6 +4,11 @@ the object stream at the appropriate point
 """
 
 
+import collections
+import hashlib
+import threading
+import time
+
 import candig.server.exceptions as exceptions
 
 
@@ -27,6 +32,146 @@ def _parsePageToken(pageToken, numValues):
     return values
 
 
+def parseCursorPageToken(pageToken):
+    """
+    Parses the specified cursor page token and returns a (cursorId, offset)
+    tuple. Cursor page tokens are either the ID of a cursor and an offset
+    seperated by a colon, or the offset on its own, in which case the
+    returned cursorId is None.
+    """
+    if not pageToken:
+        return None, 0
+    cursorId, _, offset = pageToken.rpartition(":")
+    try:
+        offset = int(offset)
+    except ValueError:
+        msg = "Malformed integers in page token"
+        raise exceptions.BadPageTokenException(msg)
+    if offset < 0:
+        raise exceptions.BadPageTokenException("Negative offset in page token")
+    return cursorId or None, offset
+
+
+def getCursorPageToken(cursorId, offset):
+    """
+    Returns the page token resuming the iteration over the specified
+    cursor at the specified offset.
+    """
+    if cursorId is None:
+        return str(offset)
+    return "{}:{}".format(cursorId, offset)
+
+
+class CursorRegistry(object):
+    """
+    Bounded store of the result lists of the search requests, so that
+    the following pages of a search are read from the list computed for
+    the first page instead of filtering the whole dataset again.
+
+    Each list is stored under a cursor, whose ID is derived from the key
+    identifying the search (the endpoint, the dataset and the filters),
+    and that the page tokens of the search refer to. The least recently
+    used cursors are evicted when there are more than maxSize of them, and
+    cursors expire timeToLive seconds after they were registered. The
+    page tokens of an evicted or expired cursor still hold the offset in
+    the results, so the search then resumes from the recomputed list.
+    """
+    def __init__(self, maxSize=1024, timeToLive=600):
+        self._cursors = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._maxSize = maxSize
+        self._timeToLive = timeToLive
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+
+    def configure(self, maxSize=None, timeToLive=None):
+        """
+        Sets the maximum number of cursors and the number of seconds they
+        are kept for. A maxSize of 0 disables the registry.
+        """
+        with self._lock:
+            if maxSize is not None:
+                if maxSize < 0:
+                    raise ValueError(
+                        "The size of the registry must be a positive value")
+                self._maxSize = maxSize
+            if timeToLive is not None:
+                self._timeToLive = timeToLive
+            self._evict()
+
+    def getCursorId(self, key):
+        """
+        Returns the ID of the cursor of the specified key, a tuple of
+        strings.
+        """
+        digest = hashlib.sha1("\0".join(key).encode())
+        return digest.hexdigest()[:16]
+
+    def _evict(self):
+        while len(self._cursors) > self._maxSize:
+            self._cursors.popitem(last=False)
+
+    def register(self, key, objectList):
+        """
+        Stores the specified list of results under the cursor of the
+        specified key, and returns the ID of the cursor, or None if the
+        registry is disabled.
+        """
+        if self._maxSize == 0:
+            return None
+        cursorId = self.getCursorId(key)
+        with self._lock:
+            self._cursors.pop(cursorId, None)
+            self._cursors[cursorId] = (key, objectList, time.monotonic())
+            self._evict()
+        return cursorId
+
+    def get(self, cursorId, key):
+        """
+        Returns the list of results stored under the specified cursor, or
+        None if the cursor doesn't exist, has expired or wasn't registered
+        for the specified key.
+        """
+        with self._lock:
+            cursor = self._cursors.get(cursorId)
+            if cursor is None or cursor[0] != key:
+                self._misses += 1
+                return None
+            if time.monotonic() - cursor[2] > self._timeToLive:
+                del self._cursors[cursorId]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._cursors.move_to_end(cursorId)
+            self._hits += 1
+            return cursor[1]
+
+    def clear(self):
+        """
+        Removes all the cursors.
+        """
+        with self._lock:
+            self._cursors.clear()
+
+    def getStats(self):
+        """
+        Returns a dictionary of the registry statistics.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "cursors": len(self._cursors),
+                "maxSize": self._maxSize,
+            }
+
+
+# The cursors of the clinical, pipeline and advanced search requests
+cursorRegistry = CursorRegistry()
+
+
 def _parseIntegerArgument(args, key, defaultValue):
     """
     Attempts to parse the specified key in the specified argument
@@ -408,9 +553,11 @@ class FeaturesIterator(SequenceIterator):
     """
     Iterates through features
     """
-    def __init__(self, request, featureSet, parentId):
+    def __init__(self, request, featureSet, parentId,
+                 includeDescendants=False):
         self._featureSet = featureSet
         self._parentId = parentId
+        self._includeDescendants = includeDescendants
         super(FeaturesIterator, self).__init__(request)
 
     def _initialize(self):
@@ -432,7 +579,8 @@ class FeaturesIterator(SequenceIterator):
             self._request.feature_types,
             self._parentId,
             self._request.name,
-            self._request.gene_symbol))
+            self._request.gene_symbol,
+            includeDescendants=self._includeDescendants))
         return iterator
 
     def _prepare(self, obj):
@@ -443,8 +591,9 @@ class ContinuousIterator(SequenceIterator):
     """
     Iterates through continuous data
     """
-    def __init__(self, request, continuousSet):
+    def __init__(self, request, continuousSet, resolution=None):
         self._continuousSet = continuousSet
+        self._resolution = resolution
         super(ContinuousIterator, self).__init__(request)
 
     def _initialize(self):
@@ -460,7 +609,8 @@ class ContinuousIterator(SequenceIterator):
         iterator = list(self._continuousSet.getContinuous(
             self._request.reference_name,
             self._start,
-            self._end))
+            self._end,
+            resolution=self._resolution))
         return iterator
 
     def _prepare(self, obj):
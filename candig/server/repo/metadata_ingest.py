@@ -0,0 +1,212 @@
+"""
+Bulk ingest of clinical and pipeline metadata records.
+
+The records are read from the JSON documents of the ingest format, where
+a "metadata" or "pipeline_metadata" list holds objects mapping table
+names to a record or a list of records, or from NDJSON with one such
+object, or one such document, per line. Records are validated and named
+a batch at a time, and each batch is upserted into the repository in one
+transaction, so that loading a file again updates its records in place.
+"""
+
+import collections
+import itertools
+import json
+
+import candig.server.datamodel.clinical_metadata as clinical_metadata
+import candig.server.datamodel.metadata_schema as metadata_schema
+import candig.server.datamodel.pipeline_metadata as pipeline_metadata
+import candig.server.exceptions as exceptions
+
+
+DOCUMENT_KEYS = ("metadata", "pipeline_metadata")
+
+# The fields whose values make up the name of the records without a
+# localId. The patient or sample ID comes first, and is followed by the
+# values of the other fields that are set, at least one of which must be.
+RECORD_NAME_FIELDS = {
+    "Patient": ("patientId",),
+    "Enrollment": ("patientId", "enrollmentApprovalDate"),
+    "Consent": ("patientId", "consentDate"),
+    "Diagnosis": ("patientId", "diagnosisDate"),
+    "Sample": ("patientId", "sampleId"),
+    "Treatment": ("patientId", "startDate"),
+    "Outcome": ("patientId", "dateOfAssessment"),
+    "Complication": ("patientId", "date"),
+    "Tumourboard": ("patientId", "dateOfMolecularTumorBoard"),
+    "Chemotherapy": (
+        "patientId", "treatmentPlanId", "systematicTherapyAgentName"),
+    "Radiotherapy": (
+        "patientId", "courseNumber", "treatmentPlanId", "startDate"),
+    "Surgery": ("patientId", "treatmentPlanId", "startDate", "sampleId"),
+    "Immunotherapy": ("patientId", "treatmentPlanId", "startDate"),
+    "Celltransplant": ("patientId", "treatmentPlanId", "startDate"),
+    "Slide": ("patientId", "slideId"),
+    "Study": ("patientId", "startDate"),
+    "Labtest": ("patientId", "startDate"),
+    "Extraction": ("sampleId", "extractionId"),
+    "Sequencing": ("sampleId", "sequencingId"),
+    "Alignment": ("sampleId", "alignmentId"),
+    "VariantCalling": ("sampleId", "variantCallingId"),
+    "FusionDetection": ("sampleId", "fusionDetectionId"),
+    "ExpressionAnalysis": ("sampleId", "expressionAnalysisId"),
+}
+
+
+def getRecordClass(tableName):
+    """
+    Returns the datamodel class of the records of the specified table, or
+    None if there is no such clinical or pipeline metadata table.
+    """
+    if tableName in metadata_schema.CLINICAL_TABLES:
+        return getattr(clinical_metadata, tableName)
+    if tableName in metadata_schema.PIPELINE_TABLES:
+        return getattr(pipeline_metadata, tableName)
+    return None
+
+
+def getRecordName(tableName, values):
+    """
+    Returns the name of the record of the specified table holding the
+    specified values: its localId if it has one, or else the values of
+    its fields listed in RECORD_NAME_FIELDS joined by underscores.
+    """
+    if values.get("localId"):
+        return values["localId"]
+    fields = RECORD_NAME_FIELDS[tableName]
+    parts = [str(values[field]) for field in fields if values.get(field)]
+    if not values.get(fields[0]) or len(parts) < min(len(fields), 2):
+        raise ValueError(
+            "a localId or values of {} are needed to name the record".format(
+                " and ".join(fields[:2]) if len(fields) <= 2 else
+                "{} and one of {}".format(fields[0], ", ".join(fields[1:]))))
+    return "_".join(parts)
+
+
+def _getDocumentObjects(document):
+    if not isinstance(document, dict):
+        raise exceptions.JsonFileOpenException(
+            "metadata objects must be JSON objects")
+    for key in DOCUMENT_KEYS:
+        if key in document:
+            if not isinstance(document[key], list):
+                raise exceptions.JsonFileOpenException(
+                    "'{}' must be a list".format(key))
+            return document[key]
+    return [document]
+
+
+def readMetadataObjects(stream):
+    """
+    Yields the metadata objects, each mapping table names to records, of
+    the JSON document or NDJSON lines read from the specified text stream.
+    NDJSON is read a line at a time, while a document that doesn't fit
+    on its first line is parsed as a whole.
+    """
+    firstLine = stream.readline()
+    while firstLine and not firstLine.strip():
+        firstLine = stream.readline()
+    try:
+        json.loads(firstLine)
+    except ValueError:
+        try:
+            document = json.loads(firstLine + stream.read())
+        except ValueError as exc:
+            raise exceptions.JsonFileOpenException(exc)
+        for metadataObject in _getDocumentObjects(document):
+            yield metadataObject
+        return
+    for lineNumber, line in enumerate(
+            itertools.chain([firstLine], stream), 1):
+        if not line.strip():
+            continue
+        try:
+            document = json.loads(line)
+        except ValueError as exc:
+            raise exceptions.JsonFileOpenException(
+                "line {}: {}".format(lineNumber, exc))
+        for metadataObject in _getDocumentObjects(document):
+            yield metadataObject
+
+
+class MetadataIngester(object):
+    """
+    Validates clinical and pipeline metadata records and upserts them
+    into a dataset of a repository opened in write mode, batchSize
+    records at a time.
+
+    Invalid records raise an InvalidMetadataRecordException, in which
+    case the records of the previous batches are already in the
+    repository, unless skipInvalid is True, in which case they are left
+    out and their exceptions are kept in getErrors.
+    """
+    def __init__(self, repo, dataset, batchSize=1000, skipInvalid=False):
+        self._repo = repo
+        self._dataset = dataset
+        self._batchSize = batchSize
+        self._skipInvalid = skipInvalid
+        self._batch = []
+        self._counts = collections.Counter()
+        self._errors = []
+
+    def getCounts(self):
+        """
+        Returns a Counter of the number of records loaded by table.
+        """
+        return collections.Counter(self._counts)
+
+    def getErrors(self):
+        return list(self._errors)
+
+    def makeRecord(self, tableName, values):
+        """
+        Returns the record of the specified table populated from the
+        specified dictionary of values, raising a ValueError if they
+        are invalid.
+        """
+        recordClass = getRecordClass(tableName)
+        if recordClass is None:
+            raise ValueError("unknown table")
+        if not isinstance(values, dict):
+            raise ValueError("records must be JSON objects")
+        values = dict(values)
+        name = getRecordName(tableName, values)
+        values.pop("localId", None)
+        values.pop(metadata_schema.getTierField("localId"), None)
+        record = recordClass(self._dataset, name)
+        try:
+            record.populateFromJson(json.dumps(values))
+        except exceptions.InvalidJsonException:
+            raise ValueError("values of the wrong type")
+        return record
+
+    def _flush(self):
+        if self._batch:
+            self._repo.insertMetadataRecords(self._batch)
+            self._counts.update(
+                type(record).__name__ for record in self._batch)
+            self._batch = []
+
+    def ingest(self, metadataObjects):
+        """
+        Loads the records of the specified metadata objects, and returns
+        a Counter of the number of records loaded by table.
+        """
+        for position, metadataObject in enumerate(metadataObjects, 1):
+            for tableName, values in metadataObject.items():
+                records = values if isinstance(values, list) else [values]
+                for recordValues in records:
+                    try:
+                        record = self.makeRecord(tableName, recordValues)
+                    except ValueError as exc:
+                        error = exceptions.InvalidMetadataRecordException(
+                            position, tableName, exc)
+                        if not self._skipInvalid:
+                            raise error
+                        self._errors.append(error)
+                        continue
+                    self._batch.append(record)
+            if len(self._batch) >= self._batchSize:
+                self._flush()
+        self._flush()
+        return self.getCounts()
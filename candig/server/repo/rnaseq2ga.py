@@ -1,7 +1,14 @@
 import sqlite3
 import csv
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
 
 import candig.server.exceptions as exceptions
+import candig.server.datamodel.rna_quantification as rna_quantification
 
 
 SUPPORTED_RNA_INPUT_FORMATS = ["cufflinks", "kallisto", "rsem"]
@@ -13,11 +20,13 @@ class RnaSqliteStore(object):
     tables.
     """
     def __init__(self, sqliteFileName):
+        self._sqliteFileName = sqliteFileName
         self._dbConn = sqlite3.connect(sqliteFileName)
         self._cursor = self._dbConn.cursor()
         self._batchSize = 2000
         self._rnaValueList = []
         self._expressionValueList = []
+        self._bulkLoad = False
 
     def createTables(self):
         # annotationIds is a comma separated list
@@ -60,7 +69,8 @@ class RnaSqliteStore(object):
         if len(self._rnaValueList) > 0:
             sql = "INSERT INTO RnaQuantification VALUES (?,?,?,?,?,?,?,?,?)"
             self._cursor.executemany(sql, self._rnaValueList)
-            self._dbConn.commit()
+            if not self._bulkLoad:
+                self._dbConn.commit()
             self._rnaValueList = []
 
     def addExpression(self, datafields):
@@ -73,11 +83,21 @@ class RnaSqliteStore(object):
         if len(self._expressionValueList) >= self._batchSize:
             self.batchAddExpression()
 
+    def addExpressions(self, datafieldsList):
+        """
+        Adds a list of Expressions to the db. See addExpression for the
+        order of the datafields.
+        """
+        self._expressionValueList.extend(datafieldsList)
+        if len(self._expressionValueList) >= self._batchSize:
+            self.batchAddExpression()
+
     def batchAddExpression(self):
         if len(self._expressionValueList) > 0:
             sql = "INSERT INTO Expression VALUES (?,?,?,?,?,?,?,?,?,?)"
             self._cursor.executemany(sql, self._expressionValueList)
-            self._dbConn.commit()
+            if not self._bulkLoad:
+                self._dbConn.commit()
             self._expressionValueList = []
 
     def createIndices(self):
@@ -86,16 +106,152 @@ class RnaSqliteStore(object):
         take a long time.
         """
 
-        sql = '''CREATE INDEX name_index
+        sql = '''CREATE INDEX IF NOT EXISTS name_index
                  ON Expression (name)'''
         self._cursor.execute(sql)
         self._dbConn.commit()
 
-        sql = '''CREATE INDEX expression_index
+        sql = '''CREATE INDEX IF NOT EXISTS expression_index
                  ON Expression (expression)'''
         self._cursor.execute(sql)
         self._dbConn.commit()
 
+        sql = '''CREATE INDEX IF NOT EXISTS quantification_index
+                 ON Expression (rna_quantification_id)'''
+        self._cursor.execute(sql)
+        self._dbConn.commit()
+
+    def dropIndices(self):
+        """
+        Drops the indices made by createIndices, so that they are not
+        maintained row by row during a bulk load.
+        """
+        self._cursor.execute("DROP INDEX IF EXISTS name_index")
+        self._cursor.execute("DROP INDEX IF EXISTS expression_index")
+        self._cursor.execute("DROP INDEX IF EXISTS quantification_index")
+        self._dbConn.commit()
+
+    def beginBulkLoad(self, batchSize=100000):
+        """
+        Switches the db to bulk loading: the journal goes to a write-ahead
+        log without syncing, indices are dropped, and rows are committed
+        in one transaction by endBulkLoad instead of once per batch.
+        """
+        self._cursor.execute("PRAGMA journal_mode=WAL")
+        self._cursor.execute("PRAGMA synchronous=OFF")
+        self.dropIndices()
+        self._batchSize = batchSize
+        self._bulkLoad = True
+
+    def endBulkLoad(self):
+        """
+        Commits the rows added since beginBulkLoad, rebuilds the indices
+        and the expression matrix, and puts the journal back into the
+        default rollback mode, so the server can open the db read-only.
+        """
+        self.batchaddRNAQuantification()
+        self.batchAddExpression()
+        self._dbConn.commit()
+        self._finishBulkLoad()
+        self.writeExpressionMatrix()
+
+    def abortBulkLoad(self):
+        """
+        Discards the rows added since beginBulkLoad, and puts the
+        indices and the journal back as endBulkLoad does.
+        """
+        self._dbConn.rollback()
+        self._rnaValueList = []
+        self._expressionValueList = []
+        self._finishBulkLoad()
+
+    def _finishBulkLoad(self):
+        self._bulkLoad = False
+        self._batchSize = 2000
+        self.createIndices()
+        self._cursor.execute("PRAGMA synchronous=FULL")
+        self._cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._cursor.execute("PRAGMA journal_mode=DELETE")
+
+    def _getExpressionEntries(self, columnIndex, names, nameIndex):
+        """
+        Returns the (rows, cols, values) of the expression levels of the
+        rnaQuantifications of columnIndex, which maps their ids to their
+        columns, adding any unseen feature names to names and nameIndex.
+        A single rnaQuantification is looked up through its index, and
+        more are read in a single scan of the Expression table.
+        """
+        sql = "SELECT rna_quantification_id, name, expression FROM Expression"
+        args = ()
+        if len(columnIndex) == 1:
+            sql += " WHERE rna_quantification_id = ?"
+            args = tuple(columnIndex)
+        rows = []
+        cols = []
+        values = []
+        for sample, name, expression in self._cursor.execute(sql, args):
+            col = columnIndex.get(sample)
+            if col is None:
+                continue
+            if name not in nameIndex:
+                nameIndex[name] = len(names)
+                names.append(name)
+            rows.append(nameIndex[name])
+            cols.append(col)
+            values.append(expression)
+        return rows, cols, np.array(values, dtype=np.float32)
+
+    def writeExpressionMatrix(self, rnaQuantificationId=None):
+        """
+        Writes the genes x samples expression matrix store kept alongside
+        the db. If the existing store already holds every other
+        quantification, only the column for the specified
+        rnaQuantificationId is appended; otherwise the whole matrix is
+        rebuilt from the Expression table. During a bulk load, the matrix
+        is only written once, by endBulkLoad.
+        """
+        if self._bulkLoad:
+            return
+        matrixPath, indexPath = rna_quantification.getExpressionMatrixPaths(
+            self._sqliteFileName)
+        samples = [row[0] for row in self._cursor.execute(
+            "SELECT id FROM RnaQuantification ORDER BY rowid").fetchall()]
+        names = []
+        matrix = None
+        if rnaQuantificationId is not None and \
+                rna_quantification.ExpressionMatrix.exists(
+                    self._sqliteFileName):
+            with open(indexPath) as indexFile:
+                index = json.load(indexFile)
+            previousSamples = [
+                sample for sample in samples if sample != rnaQuantificationId]
+            if index["samples"] == previousSamples:
+                names = index["names"]
+                matrix = np.load(matrixPath)
+                samples = previousSamples + [rnaQuantificationId]
+                newSamples = [rnaQuantificationId]
+        if matrix is None:
+            matrix = np.empty((0, 0), dtype=np.float32)
+            newSamples = samples
+        nameIndex = {name: i for i, name in enumerate(names)}
+        columnIndex = {
+            sample: col
+            for col, sample in enumerate(newSamples, matrix.shape[1])}
+        rows, cols, values = self._getExpressionEntries(
+            columnIndex, names, nameIndex)
+        expanded = np.full(
+            (len(names), len(samples)), np.nan, dtype=np.float32)
+        expanded[:matrix.shape[0], :matrix.shape[1]] = matrix
+        expanded[rows, cols] = values
+        # Write to temporary files and rename them into place so that a
+        # server with the old matrix mapped keeps a consistent view.
+        with open(matrixPath + ".tmp", "wb") as matrixFile:
+            np.save(matrixFile, expanded)
+        with open(indexPath + ".tmp", "w") as indexFile:
+            json.dump({"names": names, "samples": samples}, indexFile)
+        os.replace(matrixPath + ".tmp", matrixPath)
+        os.replace(indexPath + ".tmp", indexPath)
+
 
 class AbstractWriter(object):
     """
@@ -136,6 +292,16 @@ class AbstractWriter(object):
         Reads the quantification results file and adds entries to the
         specified database.
         """
+        for datafields in self.parseExpression(
+                rnaQuantificationId, quantfilename):
+            self._db.addExpression(datafields)
+        self._db.batchAddExpression()
+
+    def parseExpression(self, rnaQuantificationId, quantfilename):
+        """
+        Reads the quantification results file and yields the datafields of
+        its Expression rows.
+        """
         isNormalized = self._isNormalized
         units = self._units
         with open(quantfilename, "r") as quantFile:
@@ -162,12 +328,10 @@ class AbstractWriter(object):
                     confidenceHi = float(expression[confColHiNum])
                     score = (confidenceLow + confidenceHi) / 2
 
-                datafields = (expressionId, rnaQuantificationId, name,
-                              expressionLevel, isNormalized, rawCount, score,
-                              units, confidenceLow, confidenceHi)
-                self._db.addExpression(datafields)
+                yield (expressionId, rnaQuantificationId, name,
+                       expressionLevel, isNormalized, rawCount, score,
+                       units, confidenceLow, confidenceHi)
                 expressionId += 1
-            self._db.batchAddExpression()
 
 
 class CufflinksWriter(AbstractWriter):
@@ -246,6 +410,19 @@ class KallistoWriter(AbstractWriter):
         self.setUnits(units)
 
 
+def getWriter(rnaType, rnaDB, featureType="gene", dataset=None):
+    """
+    Returns the writer for the specified quantification output type.
+    """
+    if rnaType == "cufflinks":
+        return CufflinksWriter(rnaDB, featureType, dataset=dataset)
+    elif rnaType == "kallisto":
+        return KallistoWriter(rnaDB, featureType, dataset=dataset)
+    elif rnaType == "rsem":
+        return RsemWriter(rnaDB, featureType, dataset=dataset)
+    raise exceptions.UnsupportedFormatException(rnaType)
+
+
 def writeRnaseqTable(rnaDB, analysisIds, description, annotationId,
                      readGroupId="", programs="", biosampleId="", sampleId="", patientId=""):
     if readGroupId is None:
@@ -262,16 +439,11 @@ def writeExpressionTable(writer, data):
         writer.writeExpression(rnaQuantId, quantFilename)
 
 
-def rnaseq2ga(quantificationFilename, sqlFilename, localName, rnaType,
-              dataset=None, featureType="gene",
-              description="", programs="", featureSetNames="",
-              readGroupSetNames="", biosampleId="", sampleId="", patientId=""):
+def getAnnotationIds(dataset, featureSetNames, readGroupSetNames):
     """
-    Reads RNA Quantification data in one of several formats and stores the data
-    in a sqlite database for use by the GA4GH reference server.
-
-    Supports the following quantification output types:
-    Cufflinks, kallisto, RSEM.
+    Returns the comma separated (featureSetIds, readGroupIds) for the
+    specified comma separated feature set and read group set names in the
+    dataset.
     """
     readGroupSetName = ""
     if readGroupSetNames:
@@ -290,16 +462,93 @@ def rnaseq2ga(quantificationFilename, sqlFilename, localName, rnaType,
             readGroupSet = dataset.getReadGroupSetByName(readGroupSetName)
             readGroupIds = ",".join(
                 [x.getId() for x in readGroupSet.getReadGroups()])
+    return featureSetIds, readGroupIds
+
+
+def rnaseq2ga(quantificationFilename, sqlFilename, localName, rnaType,
+              dataset=None, featureType="gene",
+              description="", programs="", featureSetNames="",
+              readGroupSetNames="", biosampleId="", sampleId="", patientId=""):
+    """
+    Reads RNA Quantification data in one of several formats and stores the data
+    in a sqlite database for use by the GA4GH reference server.
+
+    Supports the following quantification output types:
+    Cufflinks, kallisto, RSEM.
+    """
+    featureSetIds, readGroupIds = getAnnotationIds(
+        dataset, featureSetNames, readGroupSetNames)
     if rnaType not in SUPPORTED_RNA_INPUT_FORMATS:
         raise exceptions.UnsupportedFormatException(rnaType)
     rnaDB = RnaSqliteStore(sqlFilename)
-    if rnaType == "cufflinks":
-        writer = CufflinksWriter(rnaDB, featureType, dataset=dataset)
-    elif rnaType == "kallisto":
-        writer = KallistoWriter(rnaDB, featureType, dataset=dataset)
-    elif rnaType == "rsem":
-        writer = RsemWriter(rnaDB, featureType, dataset=dataset)
+    writer = getWriter(rnaType, rnaDB, featureType, dataset=dataset)
     writeRnaseqTable(rnaDB, [localName], description, featureSetIds,
                      readGroupId=readGroupIds, programs=programs,
                      biosampleId=biosampleId, sampleId=sampleId, patientId=patientId)
     writeExpressionTable(writer, [(localName, quantificationFilename)])
+    rnaDB.writeExpressionMatrix(localName)
+
+
+def _parseQuantificationFile(args):
+    """
+    Parses a quantification file in a worker process, returning the list of
+    its Expression rows.
+    """
+    rnaType, featureType, rnaQuantificationId, quantificationFilename = args
+    writer = getWriter(rnaType, None, featureType)
+    return list(writer.parseExpression(
+        rnaQuantificationId, quantificationFilename))
+
+
+def bulkRnaseq2ga(quantifications, sqlFilename, rnaType, dataset=None,
+                  featureType="gene", description="", programs="",
+                  featureSetNames="", readGroupSetNames="", processes=None,
+                  progress=None):
+    """
+    Loads many RNA quantifications into the sqlite database in one pass.
+
+    quantifications is a list of (localName, quantificationFilename,
+    biosampleId, sampleId, patientId) tuples. The files are parsed in a pool
+    of processes (all CPUs by default; 1 parses in this process) and their
+    rows streamed into the database in large transactions, with the indices
+    and the expression matrix built once at the end. If given, progress is called after each file with
+    (filesDone, rowsDone, elapsedSeconds).
+    """
+    if rnaType not in SUPPORTED_RNA_INPUT_FORMATS:
+        raise exceptions.UnsupportedFormatException(rnaType)
+    featureSetIds, readGroupIds = getAnnotationIds(
+        dataset, featureSetNames, readGroupSetNames)
+    rnaDB = RnaSqliteStore(sqlFilename)
+    rnaDB.beginBulkLoad()
+    startTime = time.time()
+    rowsDone = 0
+    tasks = [(rnaType, featureType, localName, quantificationFilename)
+             for localName, quantificationFilename, _, _, _
+             in quantifications]
+    pool = None
+    if processes == 1:
+        parsed = map(_parseQuantificationFile, tasks)
+    else:
+        pool = multiprocessing.Pool(processes)
+        parsed = pool.imap(_parseQuantificationFile, tasks)
+    try:
+        for filesDone, (quantification, rows) in enumerate(
+                zip(quantifications, parsed), 1):
+            localName, _, biosampleId, sampleId, patientId = quantification
+            writeRnaseqTable(
+                rnaDB, [localName], description, featureSetIds,
+                readGroupId=readGroupIds, programs=programs,
+                biosampleId=biosampleId, sampleId=sampleId,
+                patientId=patientId)
+            rnaDB.addExpressions(rows)
+            rowsDone += len(rows)
+            if progress is not None:
+                progress(filesDone, rowsDone, time.time() - startTime)
+    except BaseException:
+        rnaDB.abortBulkLoad()
+        raise
+    finally:
+        if pool is not None:
+            pool.terminate()
+    rnaDB.endBulkLoad()
+    return rowsDone
@@ -2,9 +2,75 @@
 Class that builds the responses to the client
 """
 
+import json
+
 import candig.schemas.pb as pb
 import candig.schemas.protocol as protocol
 
+import candig.server.datamodel as datamodel
+
+PROTOBUF_MIMETYPES = ["application/protobuf", "application/x-protobuf"]
+
+STREAM_CHUNK_SIZE = 64 * 1024
+""" The approximate size (in bytes) of the chunks written by iterJson. """
+
+
+class JsonFragment(object):
+    """
+    Wraps a string holding the JSON serialization of a value, so that
+    iterJson writes it out as is.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def getData(self):
+        return self._data
+
+
+def _iterJsonPieces(value):
+    if isinstance(value, JsonFragment):
+        yield value.getData()
+    elif isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        separator = "{"
+        for key, item in value.items():
+            yield separator + json.dumps(key) + ": "
+            yield from _iterJsonPieces(item)
+            separator = ", "
+        yield "{}" if separator == "{" else "}"
+    elif isinstance(value, list):
+        separator = "["
+        for item in value:
+            if isinstance(item, JsonFragment):
+                yield separator + item.getData()
+            else:
+                yield separator + json.dumps(item)
+            separator = ", "
+        yield "[]" if separator == "[" else "]"
+    else:
+        yield json.dumps(value)
+
+
+def iterJson(value, chunkSize=STREAM_CHUNK_SIZE):
+    """
+    Yields the JSON serialization of the specified value, formatted as
+    json.dumps would format it, in chunks of about chunkSize characters.
+    The items of lists are serialized one at a time, and JsonFragments
+    are written out without being parsed again.
+    """
+    chunk = []
+    size = 0
+    for piece in _iterJsonPieces(value):
+        chunk.append(piece)
+        size += len(piece)
+        if size >= chunkSize:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk)
+
 
 class SearchResponseBuilder(object):
     """
@@ -23,10 +89,18 @@ class SearchResponseBuilder(object):
         self._maxBufferSize = maxBufferSize
         self._numElements = 0
         self._nextPageToken = None
+        self._responseClass = responseClass
         self._protoObject = responseClass()
         self._valueListName = protocol.getValueListName(responseClass)
         self._bufferSize = self._protoObject.ByteSize()
         self._return_mimetype = return_mimetype
+        self._jsonValues = []
+
+    def getResponseClass(self):
+        """
+        Returns the protocol class of the response being built.
+        """
+        return self._responseClass
 
     def getPageSize(self):
         """
@@ -60,13 +134,27 @@ class SearchResponseBuilder(object):
     def addValue(self, protocolElement):
         """
         Appends the specified protocolElement to the value list for this
-        response.
+        response. JSON responses keep the serialization of each value,
+        and the cached serialization of a CachedProtocolElement is
+        spliced into the response as is.
         """
         self._numElements += 1
-        self._bufferSize += protocolElement.ByteSize()
-        attr = getattr(self._protoObject, self._valueListName)
-        obj = attr.add()
-        obj.CopyFrom(protocolElement)
+        if isinstance(protocolElement, datamodel.CachedProtocolElement):
+            if self._return_mimetype in PROTOBUF_MIMETYPES:
+                data = protocolElement.serialize()
+                attr = getattr(self._protoObject, self._valueListName)
+                attr.add().MergeFromString(data)
+            else:
+                data = protocolElement.serialize(self._return_mimetype)
+                self._jsonValues.append(data)
+            self._bufferSize += len(data)
+        elif self._return_mimetype in PROTOBUF_MIMETYPES:
+            self._bufferSize += protocolElement.ByteSize()
+            attr = getattr(self._protoObject, self._valueListName)
+            attr.add().CopyFrom(protocolElement)
+        else:
+            self._bufferSize += protocolElement.ByteSize()
+            self._jsonValues.append(protocol.toJson(protocolElement))
 
     def isFull(self):
         """
@@ -89,5 +177,48 @@ class SearchResponseBuilder(object):
         been built by this SearchResponseBuilder.
         """
         self._protoObject.next_page_token = pb.string(self._nextPageToken)
+        if self._jsonValues:
+            return self._getSplicedJsonResponse()
         s = protocol.serialize(self._protoObject, self._return_mimetype)
         return s
+
+    def getProtocolResponse(self):
+        """
+        Returns the response object that has been built by this
+        SearchResponseBuilder. Only applies to protobuf responses.
+        """
+        self._protoObject.next_page_token = pb.string(self._nextPageToken)
+        return self._protoObject
+
+    def getJsonResponse(self):
+        """
+        Returns the JSON response that has been built by this
+        SearchResponseBuilder as a dictionary, in which the values are
+        JsonFragments holding their serializations. Only applies to JSON
+        responses.
+        """
+        self._protoObject.next_page_token = pb.string(self._nextPageToken)
+        response = {}
+        if self._jsonValues:
+            field = self._protoObject.DESCRIPTOR.fields_by_name[
+                self._valueListName]
+            response[field.json_name] = [
+                JsonFragment(value) for value in self._jsonValues]
+        response.update(json.loads(protocol.toJson(self._protoObject)))
+        return response
+
+    def _getSplicedJsonResponse(self):
+        """
+        Returns the JSON response with the serialized values spliced in,
+        formatted as protocol.toJson would format the whole response.
+        """
+        field = self._protoObject.DESCRIPTOR.fields_by_name[
+            self._valueListName]
+        otherFields = protocol.toJson(self._protoObject)
+        if otherFields != "{}":
+            otherFields = ", " + otherFields[1:]
+        else:
+            otherFields = "}"
+        return "{{{}: [{}]{}".format(
+            json.dumps(field.json_name), ", ".join(self._jsonValues),
+            otherFields)
@@ -35,8 +35,55 @@ class BaseConfig(object):
 
     FILE_HANDLE_CACHE_MAX_SIZE = 500
 
+    # Total length in bytes of the serialized clinical and pipeline
+    # records cached for each access tier. 0 disables the cache.
+    SERIALIZED_ELEMENT_CACHE_SIZE = 64 * 1024 * 1024  # 64MB
+
+    # Number of search result lists kept for the following pages of the
+    # clinical, pipeline and advanced searches, and the number of seconds
+    # they are kept for. 0 disables the cursors.
+    SEARCH_CURSOR_CACHE_SIZE = 1024
+    SEARCH_CURSOR_TTL = 600
+
+    # Options for the pooled SQLite connections used by the feature
+    # and RNA quantification backends.
+    SQLITE_READ_ONLY = True
+    SQLITE_IMMUTABLE = True
+    SQLITE_MMAP_SIZE = 256 * 1024 * 1024  # 256MB
+    SQLITE_CACHE_SIZE = -64 * 1024  # 64MB, negative values are in KiB
+    SQLITE_CACHED_STATEMENTS = 100
+
     LANDING_MESSAGE_HTML = "landing_message.html"
 
+    # Compression of the API responses, with gzip or zstd as negotiated
+    # from the Accept-Encoding header. Responses that aren't streamed are
+    # only compressed from RESPONSE_COMPRESSION_MIN_SIZE bytes.
+    RESPONSE_COMPRESSION = True
+    RESPONSE_COMPRESSION_LEVEL = 6
+    RESPONSE_COMPRESSION_MIN_SIZE = 1024
+
+    # Tracing of the stages of the requests, reported in the Server-Timing
+    # header of the responses and optionally logged as OTLP JSON.
+    REQUEST_TRACING = False
+    REQUEST_TRACING_LOG = False
+
+    # Runtime metrics served in the Prometheus format at /metrics. Set
+    # METRICS_MULTIPROCESS_DIR to a directory shared by the server
+    # processes when running several workers. When METRICS_TOKEN is set,
+    # scrapers must send it as a bearer token; otherwise /metrics requires
+    # the same authentication as the other endpoints.
+    METRICS_ENABLED = False
+    METRICS_MULTIPROCESS_DIR = None
+    METRICS_SYNC_INTERVAL = 5
+    METRICS_TOKEN = None
+
+    # Timeout in seconds of the announcements and health probes sent to
+    # peers, and the number of seconds between two probes of every peer.
+    # Setting the interval to 0 disables probing, and no peer is then
+    # skipped by federated requests.
+    PEER_TIMEOUT = 5
+    PEER_PROBE_INTERVAL = 60
+
 
 class ComplianceConfig(BaseConfig):
     """
@@ -199,12 +246,19 @@ class TykConfig(KeycloakOidConfig):
     For example, OPA_SERVER = 'http://localhost:8000/v1/data/permissions/datasets'.
     OPA_SERVER_TOKEN needs to be set to the same secret token in OPA in order to be 
     authorized to visit the OPA dataset permission endpoint.
+    OPA decisions are cached per token and path for OPA_CACHE_TTL seconds, but never
+    past the token's expiry; OPA_TIMEOUT is the timeout of the requests to OPA.
+    Otherwise ACCESS_LIST is checked for changes every ACCESS_LIST_POLL_INTERVAL seconds.
     
     To start a dev flask server using this config add in launch option, -c TykConfig
     """
     OPA_SERVER = None
     OPA_SERVER_TOKEN = ''
+    OPA_TIMEOUT = 5
+    OPA_CACHE_TTL = 60
+    OPA_CACHE_SIZE = 1024
     ACCESS_LIST = "access_list.txt"
+    ACCESS_LIST_POLL_INTERVAL = 5
 
     TYK_ENABLED = True
     TYK_SERVER = 'http://localhost:8008'
@@ -4,7 +4,18 @@ optimized for typical REST queries as defined by the GA4GH server.
 """
 
 
+import os
+import re
 import sqlite3
+import sys
+import threading
+
+
+# Deterministic functions let SQLite factor their calls out of the
+# loops of a query. The option needs Python 3.8 and SQLite 3.8.3.
+_FUNCTION_OPTIONS = {"deterministic": True} if (
+    sys.version_info >= (3, 8) and
+    sqlite3.sqlite_version_info >= (3, 8, 3)) else {}
 
 
 def sqliteRowsToDicts(sqliteRows):
@@ -29,6 +40,16 @@ def sqliteRowToDict(sqliteRow):
     return dict(list(zip(sqliteRow.keys(), sqliteRow)))
 
 
+def regexp(pattern, value):
+    """
+    Implements the SQLite REGEXP operator, which returns True if the
+    regular expression pattern is found in the value.
+    """
+    if value is None:
+        return False
+    return re.search(pattern, str(value)) is not None
+
+
 def limitsSql(startIndex=0, maxResults=0):
     """
     Construct a SQL LIMIT clause
@@ -66,23 +87,201 @@ def fetchOne(query):
     return sqliteRowToDict(query.fetchone())
 
 
+class SqliteConnectionPool(object):
+    """
+    Pool of long-lived SQLite connections keyed by database file and
+    thread. sqlite3 connections may not be shared between threads, so
+    every thread gets its own connection to each database file, which
+    is then reused by all subsequent requests served by that thread.
+    This saves the connection setup and schema parse on every request
+    and keeps the SQLite page cache warm.
+
+    The server opens connections read-only through a URI. When the
+    database files are known not to change while the server is running
+    they can also be opened as immutable, which lets SQLite skip all
+    locking.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._pid = os.getpid()
+        self._hits = 0
+        self._misses = 0
+        # Initialize the values even if they will be set up by the config
+        self._readOnly = False
+        self._immutable = False
+        self._mmapSize = 0
+        self._cacheSize = -2000
+        self._cachedStatements = 100
+
+    def configure(
+            self, readOnly=False, immutable=False, mmapSize=0,
+            cacheSize=-2000, cachedStatements=100):
+        """
+        Sets the options used for connections opened from now on.
+        Connections that are already open are closed so that the new
+        settings apply to every connection handed out.
+
+        :param readOnly: open the databases in read-only mode
+        :param immutable: tell SQLite the database files never change
+        :param mmapSize: value of the mmap_size PRAGMA, in bytes
+        :param cacheSize: value of the cache_size PRAGMA; negative values
+            are in KiB, positive values in pages
+        :param cachedStatements: number of prepared statements cached
+            per connection
+        """
+        if cachedStatements < 0:
+            raise ValueError(
+                "The number of cached statements must not be negative")
+        self.closeAll()
+        self._readOnly = readOnly
+        self._immutable = immutable
+        self._mmapSize = mmapSize
+        self._cacheSize = cacheSize
+        self._cachedStatements = cachedStatements
+
+    def _getUri(self, dbFile):
+        """
+        Returns the URI used to open the specified database file.
+        """
+        params = []
+        if self._readOnly:
+            params.append("mode=ro")
+        if self._immutable:
+            params.append("immutable=1")
+        uri = "file:{}".format(os.path.abspath(dbFile))
+        if params:
+            uri += "?" + "&".join(params)
+        return uri
+
+    def _connect(self, dbFile):
+        """
+        Opens a new connection to the specified database file.
+        """
+        dbconn = sqlite3.connect(
+            self._getUri(dbFile), uri=True, check_same_thread=False,
+            cached_statements=self._cachedStatements)
+        # row_factory setting is magic pixie dust to retrieve rows
+        # as dictionaries. sqliteRows2dict relies on this.
+        dbconn.row_factory = sqlite3.Row
+        dbconn.create_function("REGEXP", 2, regexp, **_FUNCTION_OPTIONS)
+        dbconn.execute("PRAGMA mmap_size = {:d}".format(self._mmapSize))
+        dbconn.execute("PRAGMA cache_size = {:d}".format(self._cacheSize))
+        return dbconn
+
+    def _checkFork(self):
+        """
+        Drops all connections inherited from a parent process, as is
+        the case for pre-forked server workers. SQLite connections must
+        not be carried over a fork.
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            with self._lock:
+                self._local = threading.local()
+                self._connections = []
+                self._pid = pid
+
+    def getConnection(self, dbFile):
+        """
+        Returns the connection to the specified database file owned by
+        the calling thread, opening it if necessary.
+        """
+        self._checkFork()
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        dbconn = connections.get(dbFile)
+        if dbconn is not None:
+            with self._lock:
+                self._hits += 1
+            return dbconn
+        dbconn = self._connect(dbFile)
+        connections[dbFile] = dbconn
+        with self._lock:
+            # Threads are often short lived, as when the server starts
+            # one per request, so the connections they leave behind are
+            # closed whenever a new one is opened.
+            self._closeDeadThreadConnections()
+            self._misses += 1
+            self._connections.append(
+                (threading.current_thread(), dbFile, dbconn))
+        return dbconn
+
+    def _closeDeadThreadConnections(self):
+        """
+        Closes the connections owned by threads that have exited. The
+        caller must hold the lock.
+        """
+        alive = []
+        for thread, dbFile, dbconn in self._connections:
+            if thread.is_alive():
+                alive.append((thread, dbFile, dbconn))
+            else:
+                dbconn.close()
+        self._connections = alive
+
+    def closeAll(self):
+        """
+        Closes every connection held by the pool.
+        """
+        with self._lock:
+            for _, _, dbconn in self._connections:
+                dbconn.close()
+            self._connections = []
+            self._local = threading.local()
+
+    def getStats(self):
+        """
+        Returns a dictionary describing the usage of the pool.
+        """
+        with self._lock:
+            self._closeDeadThreadConnections()
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "openConnections": len(self._connections),
+                "databases": len(set(
+                    dbFile for _, dbFile, _ in self._connections)),
+            }
+
+
+# Per-thread pool of open SQLite connections
+connectionPool = SqliteConnectionPool()
+
+
 class SqliteBackedDataSource(object):
     """
     Abstract class that sets up a SQLite database source
-    as a context-managed data source.
+    as a context-managed data source. Connections are borrowed from
+    the module level connectionPool and stay open between uses. Within
+    a with block the connection is borrowed once, so that the pool
+    counts one use per operation rather than one per query.
     """
     def __init__(self, dbFile):
         """
         :param dbFile: string holding the full path to the database file.
         """
         self._dbFile = dbFile
+        self._local = threading.local()
+
+    @property
+    def _dbconn(self):
+        dbconn = getattr(self._local, "dbconn", None)
+        if dbconn is None:
+            return connectionPool.getConnection(self._dbFile)
+        return dbconn
 
     def __enter__(self):
-        self._dbconn = sqlite3.connect(self._dbFile)
-        # row_factory setting is magic pixie dust to retrieve rows
-        # as dictionaries. sqliteRows2dict relies on this.
-        self._dbconn.row_factory = sqlite3.Row
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.dbconn = connectionPool.getConnection(self._dbFile)
+        self._local.depth = depth + 1
         return self
 
     def __exit__(self, type, value, traceback):
-        self._dbconn.close()
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            self._local.dbconn = None
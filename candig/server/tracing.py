@@ -0,0 +1,249 @@
+"""
+Tracing of the stages of the API requests.
+
+A trace is started for each request when tracing is enabled, and the
+stages of the request record spans in it, through the span context
+manager or the traced decorator. Traces are held in a thread-local,
+as each request is handled by a single thread, so the stages don't need
+to pass them around, and recording a span costs a single attribute
+lookup while no trace is started.
+
+The spans of a trace are reported as a Server-Timing header, and as
+JSON in the format of the OpenTelemetry (OTLP) trace exports.
+"""
+import functools
+import secrets
+import threading
+import time
+
+
+_local = threading.local()
+
+
+class Span(object):
+    """
+    A stage of a traced request, timed in seconds of the performance
+    counter.
+    """
+    __slots__ = ("name", "spanId", "parentSpanId", "start", "end", "attributes")
+
+    def __init__(self, name, parentSpanId=None, attributes=None, start=None):
+        self.name = name
+        self.spanId = secrets.token_hex(8)
+        self.parentSpanId = parentSpanId
+        self.start = time.perf_counter() if start is None else start
+        self.end = None
+        self.attributes = attributes or {}
+
+    def getDuration(self):
+        """
+        Returns the duration of the span in milliseconds.
+        """
+        return (self.end - self.start) * 1000
+
+
+class Trace(object):
+    """
+    The spans recorded while handling a request. Spans are opened and
+    closed in the thread handling the request. Spans timed by other
+    threads, such as the requests to the peers, are added with addSpan.
+    """
+    def __init__(self, name, attributes=None):
+        self.traceId = secrets.token_hex(16)
+        self._unixStart = time.time()
+        self._lock = threading.Lock()
+        self._root = Span(name, attributes=attributes)
+        self._spans = [self._root]
+        self._openSpans = [self._root]
+
+    def getRootSpan(self):
+        return self._root
+
+    def getSpans(self):
+        with self._lock:
+            return list(self._spans)
+
+    def startSpan(self, name, attributes=None):
+        """
+        Opens a span below the innermost open span and returns it, or None
+        if the innermost open span has the same name, so that recursive
+        calls are timed once.
+        """
+        parent = self._openSpans[-1]
+        if parent.name == name:
+            return None
+        span = Span(name, parent.spanId, attributes)
+        with self._lock:
+            self._spans.append(span)
+        self._openSpans.append(span)
+        return span
+
+    def endSpan(self, span):
+        span.end = time.perf_counter()
+        self._openSpans.remove(span)
+
+    def addSpan(self, name, start, end, attributes=None):
+        """
+        Adds a span of the specified performance counter times in
+        seconds below the root span. This may be called from any thread.
+        """
+        span = Span(name, self._root.spanId, attributes, start)
+        span.end = end
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    def end(self):
+        """
+        Closes the root span, and the spans still open.
+        """
+        while self._openSpans:
+            self.endSpan(self._openSpans[-1])
+
+    def getServerTiming(self):
+        """
+        Returns the value of the Server-Timing header for the spans,
+        giving the total duration of the spans of each name.
+        """
+        durations = {}
+        for span in self.getSpans()[1:]:
+            if span.end is not None:
+                durations[span.name] = durations.get(span.name, 0) + span.getDuration()
+        metrics = ["{};dur={:.3f}".format(name, duration)
+                   for name, duration in durations.items()]
+        if self._root.end is not None:
+            metrics.append("total;dur={:.3f}".format(self._root.getDuration()))
+        return ", ".join(metrics)
+
+    def _toUnixNano(self, counter):
+        return int((self._unixStart + counter - self._root.start) * 1e9)
+
+    def toJson(self):
+        """
+        Returns the spans as a dictionary in the OTLP JSON format.
+        """
+        spans = []
+        for span in self.getSpans():
+            jsonSpan = {
+                "traceId": self.traceId,
+                "spanId": span.spanId,
+                "name": span.name,
+                "kind": 2 if span is self._root else 1,
+                "startTimeUnixNano": str(self._toUnixNano(span.start)),
+                "endTimeUnixNano": str(self._toUnixNano(
+                    span.start if span.end is None else span.end)),
+                "attributes": [
+                    {"key": key, "value": {"stringValue": str(value)}}
+                    for key, value in span.attributes.items()],
+            }
+            if span.parentSpanId is not None:
+                jsonSpan["parentSpanId"] = span.parentSpanId
+            spans.append(jsonSpan)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name",
+                     "value": {"stringValue": "candig-server"}}]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": spans,
+                }],
+            }]
+        }
+
+
+class _SpanContext(object):
+
+    __slots__ = ("_trace", "_name", "_attributes", "_span")
+
+    def __init__(self, trace, name, attributes):
+        self._trace = trace
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self):
+        self._span = self._trace.startSpan(self._name, self._attributes)
+        return self._span
+
+    def __exit__(self, excType, excValue, traceback):
+        if self._span is not None:
+            self._trace.endSpan(self._span)
+        return False
+
+
+class _NoSpanContext(object):
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, excType, excValue, traceback):
+        return False
+
+
+_noSpanContext = _NoSpanContext()
+
+
+class _TraceToken(object):
+
+    __slots__ = ("previousTrace",)
+
+    def __init__(self, previousTrace):
+        self.previousTrace = previousTrace
+
+
+def startTrace(name, attributes=None):
+    """
+    Starts tracing the current request, and returns the token to pass
+    to endTrace.
+    """
+    token = _TraceToken(getCurrentTrace())
+    _local.trace = Trace(name, attributes)
+    return token
+
+
+def endTrace(token):
+    """
+    Stops tracing the current request, and returns its Trace.
+    """
+    trace = getCurrentTrace()
+    _local.trace = token.previousTrace
+    if trace is not None:
+        trace.end()
+    return trace
+
+
+def getCurrentTrace():
+    """
+    Returns the Trace of the current request, or None if it isn't traced.
+    """
+    return getattr(_local, "trace", None)
+
+
+def span(name, attributes=None):
+    """
+    Returns a context manager timing the enclosed stage of the current
+    request as a span of the specified name.
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return _noSpanContext
+    return _SpanContext(trace, name, attributes)
+
+
+def traced(name):
+    """
+    Decorates a function so that its calls are timed as spans of the
+    specified name.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            trace = getattr(_local, "trace", None)
+            if trace is None:
+                return function(*args, **kwargs)
+            with _SpanContext(trace, name, None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,112 @@
+"""
+Measures the time taken to generate and parse the compound IDs of
+variants, read alignments and call sets, the way the server does for
+each object of a search response.
+
+Each benchmark is run with the compound ID classes themselves and with
+the cached child ID formatters and memoized parsing the datamodel uses.
+"""
+
+import argparse
+import time
+
+import glue
+
+glue.ga4ghImportGlue()
+import candig.server.datamodel as datamodel  # noqa
+import candig.server.datamodel.datasets as datasets  # noqa
+import candig.server.datamodel.reads as reads  # noqa
+import candig.server.datamodel.variants as variants  # noqa
+
+
+def _time(function, numObjects):
+    startTime = time.perf_counter()
+    function()
+    return (time.perf_counter() - startTime) / numObjects * 1e6
+
+
+def _report(name, numObjects, baseline, optimized):
+    print("{}: {} objects".format(name, numObjects))
+    print("  compound ID class: {:.2f} us per ID".format(baseline))
+    print("  datamodel: {:.2f} us per ID ({:.1f}x)".format(
+        optimized, baseline / optimized))
+
+
+def benchmarkVariantIds(variantSet, numObjects):
+    parentId = variantSet.getCompoundId()
+    localIds = [
+        ("chr1", str(start), "{:032x}".format(start))
+        for start in range(numObjects)]
+
+    def construct():
+        for localId in localIds:
+            str(datamodel.VariantCompoundId(parentId, *localId))
+
+    def formatIds():
+        formatter = parentId.getChildIdFormatter(datamodel.VariantCompoundId)
+        for localId in localIds:
+            formatter(*localId)
+
+    _report(
+        "Variant IDs", numObjects,
+        _time(construct, numObjects), _time(formatIds, numObjects))
+
+
+def benchmarkReadAlignmentIds(readGroupSet, numObjects):
+    parentId = readGroupSet.getCompoundId()
+    fragmentNames = ["fragment{}".format(i) for i in range(numObjects)]
+
+    def construct():
+        for fragmentName in fragmentNames:
+            str(datamodel.ReadAlignmentCompoundId(parentId, fragmentName))
+
+    def formatIds():
+        formatter = parentId.getChildIdFormatter(
+            datamodel.ReadAlignmentCompoundId)
+        for fragmentName in fragmentNames:
+            formatter(fragmentName)
+
+    _report(
+        "Read alignment IDs", numObjects,
+        _time(construct, numObjects), _time(formatIds, numObjects))
+
+
+def benchmarkCallSetParse(variantSet, numObjects, numCallSets):
+    # Requests refer to the same few call sets over and over
+    callSetIds = [
+        variantSet.getCallSetId("sample{}".format(i))
+        for i in range(numCallSets)]
+    requestIds = [callSetIds[i % numCallSets] for i in range(numObjects)]
+
+    def parse():
+        for callSetId in requestIds:
+            datamodel.CallSetCompoundId._parse(callSetId)
+
+    def memoizedParse():
+        for callSetId in requestIds:
+            datamodel.CallSetCompoundId.parse(callSetId)
+
+    _report(
+        "Call set ID parsing", numObjects,
+        _time(parse, numObjects), _time(memoizedParse, numObjects))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--numObjects", type=int, default=1000000,
+        help="The number of IDs to generate or parse")
+    parser.add_argument(
+        "--numCallSets", type=int, default=1000,
+        help="The number of distinct call set IDs to parse")
+    args = parser.parse_args()
+    dataset = datasets.Dataset("dataset1")
+    variantSet = variants.AbstractVariantSet(dataset, "variantSet1")
+    readGroupSet = reads.AbstractReadGroupSet(dataset, "readGroupSet1")
+    benchmarkVariantIds(variantSet, args.numObjects)
+    benchmarkReadAlignmentIds(readGroupSet, args.numObjects)
+    benchmarkCallSetParse(variantSet, args.numObjects, args.numCallSets)
+
+
+if __name__ == "__main__":
+    main()
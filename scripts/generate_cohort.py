@@ -0,0 +1,636 @@
+"""
+Generates a synthetic cohort for load and scale testing.
+
+Writes a registry DB holding a dataset of patients with records in every
+clinical and pipeline metadata table, each field with an access tier,
+and per-patient bgzipped, tabix-indexed VCFs registered as variant sets
+of their patients. The reference set of the VCFs is either an existing
+bgzipped FASTA, or random sequences written alongside the VCFs.
+
+The number of records of each table per patient or sample, the values
+of the fields, the access tiers, and the number and allele frequencies
+of the variants are drawn from the distributions in DEFAULT_DISTRIBUTIONS,
+which a JSON file given with --distributions can override (see
+--printDistributions). The data only depends on the parameters and the
+seed.
+"""
+
+import argparse
+import bisect
+import copy
+import datetime
+import itertools
+import json
+import os
+import random
+import sys
+import time
+
+import pysam
+
+import glue
+
+glue.ga4ghImportGlue()
+import candig.server.datamodel.clinical_metadata as clinical_metadata  # noqa
+import candig.server.datamodel.datasets as datasets  # noqa
+import candig.server.datamodel.metadata_schema as metadata_schema  # noqa
+import candig.server.datamodel.pipeline_metadata as pipeline_metadata  # noqa
+import candig.server.datamodel.references as references  # noqa
+import candig.server.datamodel.variants as variants  # noqa
+import candig.server.datarepo as datarepo  # noqa
+import candig.server.repo.models as models  # noqa
+
+
+# The tables holding records of the samples of the patients, rather than
+# of the patients themselves
+SAMPLE_TABLES = (
+    "Slide", "Extraction", "Sequencing", "Alignment", "VariantCalling",
+    "FusionDetection", "ExpressionAnalysis")
+
+DEFAULT_DISTRIBUTIONS = {
+    # The probabilities of a patient (or a sample, for the tables of
+    # SAMPLE_TABLES) having 0, 1, 2... records of each table
+    "recordCounts": {
+        "Patient": [0, 1],
+        "Enrollment": [0.05, 0.95],
+        "Consent": [0.02, 0.9, 0.08],
+        "Diagnosis": [0, 0.85, 0.12, 0.03],
+        "Sample": [0, 0.6, 0.3, 0.1],
+        "Treatment": [0.2, 0.5, 0.2, 0.1],
+        "Outcome": [0.1, 0.6, 0.2, 0.1],
+        "Complication": [0.7, 0.25, 0.05],
+        "Tumourboard": [0.6, 0.35, 0.05],
+        "Chemotherapy": [0.4, 0.4, 0.2],
+        "Radiotherapy": [0.6, 0.3, 0.1],
+        "Surgery": [0.5, 0.45, 0.05],
+        "Immunotherapy": [0.85, 0.15],
+        "Celltransplant": [0.95, 0.05],
+        "Study": [0.3, 0.6, 0.1],
+        "Labtest": [0.2, 0.3, 0.3, 0.2],
+        "Slide": [0.4, 0.5, 0.1],
+        "Extraction": [0.1, 0.9],
+        "Sequencing": [0.2, 0.8],
+        "Alignment": [0.2, 0.8],
+        "VariantCalling": [0.2, 0.8],
+        "FusionDetection": [0.6, 0.4],
+        "ExpressionAnalysis": [0.5, 0.5],
+    },
+    # The probabilities of the access tiers 0 to 4 of the fields. The
+    # tier of each field is drawn once per table.
+    "tiers": [0.3, 0.3, 0.2, 0.1, 0.1],
+    # The tiers of the fields holding the IDs of the records
+    "idTier": 0,
+    # The probability of a value being missing
+    "missing": 0.1,
+    # The weights of the values of categorical fields, by field or by
+    # "Table.field". Other fields get dates, numbers or one of
+    # vocabularySize values weighted by a Zipf distribution.
+    "values": {
+        "gender": {"Female": 0.51, "Male": 0.49},
+        "provinceOfResidence": {
+            "Ontario": 0.39, "Quebec": 0.23, "British Columbia": 0.13,
+            "Alberta": 0.12, "Manitoba": 0.04, "Saskatchewan": 0.03,
+            "Nova Scotia": 0.03, "New Brunswick": 0.02,
+            "Newfoundland and Labrador": 0.01},
+        "ethnicity": {
+            "Caucasian": 0.6, "Asian": 0.2, "Indigenous": 0.05,
+            "Black": 0.05, "Hispanic": 0.05, "Other": 0.05},
+        "cancerType": {
+            "Breast cancer": 0.25, "Lung cancer": 0.2,
+            "Colorectal cancer": 0.2, "Prostate cancer": 0.2,
+            "Pancreatic cancer": 0.1, "Ovarian cancer": 0.05},
+        "sampleType": {"primary": 0.6, "metastatic": 0.25, "normal": 0.15},
+        "treatingCentreName": {
+            "Toronto": 0.35, "Montreal": 0.25, "Vancouver": 0.2,
+            "Calgary": 0.1, "Halifax": 0.1},
+        "vitalStatus": {"Alive": 0.7, "Deceased": 0.3},
+    },
+    "vocabularySize": 10,
+    # The years of the dates
+    "years": [1990, 2020],
+    "dateOfBirthYears": [1930, 2005],
+    # The number of variant sites shared by the cohort, the
+    # Beta(alpha, beta) distribution of their allele frequencies, and the
+    # normal distribution of the number of variants of each VCF. The
+    # sites of each VCF are drawn in proportion to their frequency of
+    # carriers, and their genotypes follow the Hardy-Weinberg proportions.
+    "variants": {
+        "numSites": 100000,
+        "alleleFrequency": {"alpha": 0.5, "beta": 4.0},
+        "perVcf": {"mean": 5000, "sd": 1000},
+    },
+}
+
+_NUMERIC_SUFFIXES = (
+    "Percent", "InMonths", "Number", "Length", "Cycles", "Dose", "dose",
+    "height", "weight", "quantity", "Content")
+
+
+def _getIdField(tableName):
+    return tableName[0].lower() + tableName[1:] + "Id"
+
+
+# The fields referring to the records of a table
+_ID_FIELDS = frozenset(map(_getIdField, itertools.chain(
+    metadata_schema.CLINICAL_TABLES, metadata_schema.PIPELINE_TABLES)))
+
+
+# The columns of the metadata tables preceding their fields, in the order
+# of the rows made by CohortGenerator._makeRow
+_COMMON_COLUMNS = (
+    "id", "datasetId", "created", "updated", "name", "description",
+    "attributes")
+
+
+def _getRecordClass(tableName):
+    if tableName in metadata_schema.CLINICAL_TABLES:
+        return getattr(clinical_metadata, tableName)
+    return getattr(pipeline_metadata, tableName)
+
+
+def mergeDistributions(distributions, overrides):
+    """
+    Returns the distributions updated with the overrides, merging the
+    nested dictionaries.
+    """
+    merged = copy.deepcopy(distributions)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = mergeDistributions(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class _WeightedChoice(object):
+    """
+    Draws values of the specified weights from a random generator.
+    """
+    def __init__(self, randomGenerator, values, weights):
+        self._random = randomGenerator
+        self._values = list(values)
+        self._cumulativeWeights = list(itertools.accumulate(weights))
+        self._total = self._cumulativeWeights[-1]
+
+    def __call__(self):
+        return self._values[bisect.bisect_right(
+            self._cumulativeWeights, self._random.random() * self._total)]
+
+
+class CohortGenerator(object):
+    """
+    Writes a synthetic cohort to a registry DB, with its VCFs and
+    reference set in the data directory. generate writes all of it;
+    callers adding other data to the repository can call the steps in
+    turn instead: open, writeReferenceSet, writeDataset,
+    writeMetadataRecords, writeVariantSets and close.
+    """
+    def __init__(
+            self, registryPath, dataDirectory, numPatients=100000,
+            numVcfs=1000, distributions=None, seed=0, datasetName="cohort",
+            referenceSetPath=None, numReferences=22, referenceLength=1000000,
+            progress=None):
+        self._registryPath = registryPath
+        self._dataDirectory = dataDirectory
+        self._numPatients = numPatients
+        self._numVcfs = min(numVcfs, numPatients)
+        self._distributions = mergeDistributions(
+            DEFAULT_DISTRIBUTIONS, distributions or {})
+        self._random = random.Random(seed)
+        self._datasetName = datasetName
+        self._referenceSetPath = referenceSetPath
+        self._numReferences = numReferences
+        self._referenceLength = referenceLength
+        self._progress = progress
+        self._timestamp = datetime.datetime(2020, 1, 1).isoformat()
+        self._repo = None
+        self._dataset = None
+        self._referenceSet = None
+        self._referenceLengths = None
+        self._sampleIds = {}
+        self._vcfPatients = None
+        self._valueGenerators = {}
+        self._tiers = {}
+        self._recordCounts = None
+
+    def getRepository(self):
+        return self._repo
+
+    def getDataset(self):
+        return self._dataset
+
+    def getReferenceSet(self):
+        return self._referenceSet
+
+    def getReferenceSetPath(self):
+        return self._referenceSetPath
+
+    def getReferenceLengths(self):
+        """
+        Returns the (referenceName, length) pairs of the reference set.
+        """
+        return list(self._referenceLengths)
+
+    def getPatientId(self, index):
+        return "PATIENT_{}".format(index)
+
+    def getSampleIds(self, patientId):
+        return self._sampleIds.get(patientId, [])
+
+    def _report(self, message):
+        if self._progress is not None:
+            self._progress(message)
+
+    def _getPath(self, *names):
+        path = os.path.join(self._dataDirectory, *names)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def generate(self):
+        self.open()
+        self.writeReferenceSet()
+        self.writeDataset()
+        self.writeMetadataRecords()
+        self.writeVariantSets()
+        self.close()
+
+    def open(self):
+        """
+        Creates the registry DB, which must not exist.
+        """
+        self._repo = datarepo.SqlDataRepository(self._registryPath)
+        self._repo.open(datarepo.MODE_WRITE)
+        self._repo.initialise()
+        # The registry is rebuilt from scratch if the generation fails,
+        # so it needn't survive a crash meanwhile
+        self._repo.database.execute_sql("PRAGMA synchronous=OFF")
+        self._repo.database.execute_sql("PRAGMA journal_mode=MEMORY")
+
+    def close(self):
+        self._repo.commit()
+        self._repo.close()
+
+    def writeReferenceSet(self):
+        """
+        Registers the reference set, writing random sequences if no
+        FASTA was given.
+        """
+        if self._referenceSetPath is None:
+            self._referenceSetPath = self._writeReferenceSequences()
+        name = os.path.basename(self._referenceSetPath).split(".")[0]
+        self._referenceSet = references.HtslibReferenceSet(name)
+        self._referenceSet.populateFromFile(
+            os.path.abspath(self._referenceSetPath))
+        self._referenceSet.setAssemblyId(name)
+        self._repo.insertReferenceSet(self._referenceSet)
+        with pysam.FastaFile(self._referenceSetPath) as fastaFile:
+            self._referenceLengths = list(
+                zip(fastaFile.references, fastaFile.lengths))
+
+    def _writeReferenceSequences(self):
+        fastaPath = self._getPath("references", "synthetic.fa")
+        bases = bytes(b"ACGT"[i % 4] for i in range(256))
+        with open(fastaPath, "w") as fastaFile:
+            for index in range(self._numReferences):
+                sequence = self._random.getrandbits(
+                    8 * self._referenceLength).to_bytes(
+                        self._referenceLength, "little").translate(
+                            bases).decode()
+                fastaFile.write(">{}\n".format(index + 1))
+                for start in range(0, len(sequence), 60):
+                    fastaFile.write(sequence[start:start + 60] + "\n")
+        pysam.tabix_compress(fastaPath, fastaPath + ".gz", force=True)
+        os.unlink(fastaPath)
+        pysam.faidx(fastaPath + ".gz")
+        return fastaPath + ".gz"
+
+    def writeDataset(self):
+        self._dataset = datasets.Dataset(self._datasetName)
+        self._dataset.setDescription("Synthetic cohort of {} patients".format(
+            self._numPatients))
+        self._repo.insertDataset(self._dataset)
+
+    def _getValueGenerator(self, tableName, field):
+        """
+        Returns a function returning random values of the specified field.
+        """
+        key = (tableName, field)
+        if key in self._valueGenerators:
+            return self._valueGenerators[key]
+        values = self._distributions["values"]
+        weights = values.get("{}.{}".format(tableName, field), values.get(field))
+        if weights is not None:
+            generator = _WeightedChoice(
+                self._random, weights.keys(), weights.values())
+        elif field == "dateOfBirth" or "Date" in field or "date" in field:
+            firstYear, lastYear = self._distributions[
+                "dateOfBirthYears" if field == "dateOfBirth" else "years"]
+            start = datetime.date(firstYear, 1, 1).toordinal()
+            end = datetime.date(lastYear, 12, 31).toordinal()
+
+            def generator():
+                return datetime.date.fromordinal(
+                    self._random.randint(start, end)).isoformat()
+        elif field.startswith("age") or field.endswith(_NUMERIC_SUFFIXES):
+            def generator():
+                return str(self._random.randint(1, 100))
+        else:
+            size = self._distributions["vocabularySize"]
+            generator = _WeightedChoice(
+                self._random,
+                ["{} {}".format(field, i + 1) for i in range(size)],
+                [1 / (i + 1) for i in range(size)])
+        self._valueGenerators[key] = generator
+        return generator
+
+    def _getTiers(self, tableName):
+        """
+        Returns the tiers of the fields of the specified table, by field.
+        """
+        if tableName not in self._tiers:
+            drawTier = _WeightedChoice(
+                self._random, range(5), self._distributions["tiers"])
+            idTier = self._distributions["idTier"]
+            self._tiers[tableName] = {
+                field: idTier if field.endswith("Id") else drawTier()
+                for field in metadata_schema.getFields(tableName)}
+        return self._tiers[tableName]
+
+    def _makeRow(self, tableName, name, ids):
+        """
+        Returns the values of the columns of a record of the specified
+        table, with the IDs of the records it refers to taken from ids.
+        """
+        record = _getRecordClass(tableName)(self._dataset, name)
+        row = [
+            record.getId(), self._dataset.getId(), self._timestamp,
+            self._timestamp, name, None, "{}"]
+        tiers = self._getTiers(tableName)
+        missing = self._distributions["missing"]
+        for field in metadata_schema.getColumns(tableName):
+            if field not in tiers:
+                # Legacy columns aren't part of the records
+                row.extend((None, None))
+            elif field in _ID_FIELDS:
+                row.extend((ids.get(field), tiers[field]))
+            elif self._random.random() < missing:
+                row.extend((None, tiers[field]))
+            else:
+                row.extend((
+                    self._getValueGenerator(tableName, field)(),
+                    tiers[field]))
+        return row
+
+    def _drawCount(self, tableName):
+        return self._recordCounts[tableName]()
+
+    def _makePatientRows(self, index, rows):
+        """
+        Appends the rows of the records of the patient of the specified
+        index to the lists of rows of their tables.
+        """
+        patientId = self.getPatientId(index)
+        sampleIds = []
+        diagnosisIds = []
+        for tableName in metadata_schema.CLINICAL_TABLES:
+            if tableName in SAMPLE_TABLES:
+                continue
+            for count in range(self._drawCount(tableName)):
+                if tableName == "Patient":
+                    name = patientId
+                else:
+                    name = "{}_{}_{}".format(patientId, tableName, count)
+                ids = {"patientId": patientId, _getIdField(tableName): name}
+                if diagnosisIds and tableName != "Diagnosis":
+                    ids["diagnosisId"] = self._random.choice(diagnosisIds)
+                rows[tableName].append(self._makeRow(tableName, name, ids))
+                if tableName == "Diagnosis":
+                    diagnosisIds.append(name)
+                elif tableName == "Sample":
+                    sampleIds.append(name)
+        for sampleId in sampleIds:
+            # The records of the pipeline refer to the last record of the
+            # previous steps
+            ids = {"patientId": patientId, "sampleId": sampleId}
+            for tableName in SAMPLE_TABLES:
+                idField = _getIdField(tableName)
+                for count in range(self._drawCount(tableName)):
+                    name = "{}_{}_{}".format(sampleId, tableName, count)
+                    ids[idField] = name
+                    rows[tableName].append(self._makeRow(tableName, name, ids))
+        self._sampleIds[patientId] = sampleIds
+
+    def _insertRows(self, tableName, rows):
+        # Building the rows into a peewee insert_many query costs more
+        # than inserting them, so they are bound to a prepared statement
+        model = getattr(models, tableName)
+        columns = list(_COMMON_COLUMNS)
+        for field in metadata_schema.getColumns(tableName):
+            columns.extend((field, metadata_schema.getTierField(field)))
+        sql = 'INSERT INTO "{}" ({}) VALUES ({})'.format(
+            model._meta.table_name,
+            ", ".join('"{}"'.format(column) for column in columns),
+            ", ".join("?" * len(columns)))
+        with self._repo.database.atomic():
+            self._repo.database.cursor().executemany(sql, rows)
+
+    def writeMetadataRecords(self, batchSize=1000):
+        """
+        Writes the clinical and pipeline records of the patients, in
+        transactions of the records of batchSize patients.
+        """
+        self._recordCounts = {
+            tableName: _WeightedChoice(self._random, range(len(weights)), weights)
+            for tableName, weights in
+            self._distributions["recordCounts"].items()}
+        for tableName in itertools.chain(
+                metadata_schema.CLINICAL_TABLES,
+                metadata_schema.PIPELINE_TABLES):
+            self._recordCounts.setdefault(
+                tableName, _WeightedChoice(self._random, [0], [1]))
+        self._vcfPatients = set(self._random.sample(
+            range(self._numPatients), self._numVcfs))
+        startTime = time.time()
+        numRecords = 0
+        for start in range(0, self._numPatients, batchSize):
+            rows = {tableName: [] for tableName in self._recordCounts}
+            for index in range(
+                    start, min(start + batchSize, self._numPatients)):
+                self._makePatientRows(index, rows)
+            for tableName, tableRows in rows.items():
+                if tableRows:
+                    self._insertRows(tableName, tableRows)
+                    numRecords += len(tableRows)
+            self._report("{}/{} patients, {} records, {:.0f} records/s".format(
+                min(start + batchSize, self._numPatients), self._numPatients,
+                numRecords, numRecords / max(time.time() - startTime, 1e-6)))
+
+    def _makeSites(self, fastaFile):
+        """
+        Returns the variant sites of the cohort as sorted (referenceName,
+        position, ref, alt, alleleFrequency) tuples, with the cumulative
+        frequencies of their carriers.
+        """
+        variantDistributions = self._distributions["variants"]
+        alpha = variantDistributions["alleleFrequency"]["alpha"]
+        beta = variantDistributions["alleleFrequency"]["beta"]
+        totalLength = sum(length for _, length in self._referenceLengths)
+        sites = []
+        for referenceName, length in self._referenceLengths:
+            numSites = min(length, round(
+                variantDistributions["numSites"] * length / totalLength))
+            for position in sorted(self._random.sample(range(length), numSites)):
+                ref = fastaFile.fetch(
+                    referenceName, position, position + 1).upper()
+                if ref not in "ACGT":
+                    continue
+                alt = self._random.choice(
+                    [base for base in "ACGT" if base != ref])
+                alleleFrequency = min(max(
+                    self._random.betavariate(alpha, beta), 1e-4), 1.0)
+                sites.append(
+                    (referenceName, position, ref, alt, alleleFrequency))
+        carrierFrequencies = itertools.accumulate(
+            1 - (1 - site[4]) ** 2 for site in sites)
+        return sites, list(carrierFrequencies)
+
+    def _writeVcf(self, patientId, sampleId, sites, cumulativeWeights):
+        perVcf = self._distributions["variants"]["perVcf"]
+        numVariants = min(len(sites), max(0, round(self._random.gauss(
+            perVcf["mean"], perVcf["sd"]))))
+        indexes = sorted(set(self._random.choices(
+            range(len(sites)), cum_weights=cumulativeWeights,
+            k=numVariants)))
+        vcfPath = self._getPath("variants", "{}.vcf".format(patientId))
+        with open(vcfPath, "w") as vcfFile:
+            vcfFile.write("##fileformat=VCFv4.2\n")
+            vcfFile.write("##reference={}\n".format(
+                self._referenceSet.getLocalId()))
+            for referenceName, length in self._referenceLengths:
+                vcfFile.write("##contig=<ID={},length={}>\n".format(
+                    referenceName, length))
+            vcfFile.write(
+                '##FORMAT=<ID=GT,Number=1,Type=String,'
+                'Description="Genotype">\n')
+            vcfFile.write("\t".join([
+                "#CHROM", "POS", "ID", "REF", "ALT", "QUAL", "FILTER", "INFO",
+                "FORMAT", sampleId]) + "\n")
+            for index in indexes:
+                referenceName, position, ref, alt, alleleFrequency = \
+                    sites[index]
+                # The chance of a carrier being homozygous
+                homozygous = self._random.random() < (
+                    alleleFrequency / (2 - alleleFrequency))
+                vcfFile.write("\t".join([
+                    referenceName, str(position + 1), ".", ref, alt, "50",
+                    "PASS", ".", "GT", "1/1" if homozygous else "0/1"]) + "\n")
+        return pysam.tabix_index(vcfPath, preset="vcf", force=True)
+
+    def writeVariantSets(self):
+        """
+        Writes a VCF for each of the patients chosen by
+        writeMetadataRecords, and registers it as a variant set of the
+        patient and their first sample.
+        """
+        with pysam.FastaFile(self._referenceSetPath) as fastaFile:
+            sites, cumulativeWeights = self._makeSites(fastaFile)
+        for count, index in enumerate(sorted(self._vcfPatients), 1):
+            patientId = self.getPatientId(index)
+            sampleIds = self.getSampleIds(patientId)
+            sampleId = sampleIds[0] if sampleIds else patientId
+            vcfPath = self._writeVcf(
+                patientId, sampleId, sites, cumulativeWeights)
+            variantSet = variants.HtslibVariantSet(
+                self._dataset, "{}_variants".format(patientId))
+            variantSet.populateFromFile([vcfPath], [vcfPath + ".tbi"])
+            variantSet.setReferenceSet(self._referenceSet)
+            variantSet.setPatientId(patientId)
+            variantSet.setSampleId(sampleId)
+            self._repo.insertVariantSet(variantSet)
+            if count % 100 == 0 or count == len(self._vcfPatients):
+                self._report("{}/{} VCFs".format(count, len(self._vcfPatients)))
+
+
+def parseArgs():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "registryPath", nargs="?",
+        help="The registry DB to write")
+    parser.add_argument(
+        "--dataDirectory", default=None,
+        help="The directory the VCFs and reference set are written to "
+             "(default: the directory of the registry DB)")
+    parser.add_argument(
+        "--numPatients", type=int, default=100000,
+        help="The number of patients (default: %(default)s)")
+    parser.add_argument(
+        "--numVcfs", type=int, default=1000,
+        help="The number of patients with a VCF (default: %(default)s)")
+    parser.add_argument(
+        "--distributions", default=None, metavar="JSON_FILE",
+        help="A JSON file overriding the default distributions")
+    parser.add_argument(
+        "--printDistributions", action="store_true",
+        help="Print the default distributions as JSON and exit")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="The seed of the random generator (default: %(default)s)")
+    parser.add_argument(
+        "--datasetName", default="cohort",
+        help="The name of the dataset (default: %(default)s)")
+    parser.add_argument(
+        "--referenceSet", default=None, metavar="FASTA",
+        help="A bgzipped and faidx-indexed FASTA of the reference set of "
+             "the VCFs (default: random sequences)")
+    parser.add_argument(
+        "--numReferences", type=int, default=22,
+        help="The number of random reference sequences "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--referenceLength", type=int, default=1000000,
+        help="The length of the random reference sequences "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="Overwrite the registry DB if it exists")
+    args = parser.parse_args()
+    if not args.printDistributions and args.registryPath is None:
+        parser.error("the registry path is required")
+    return args
+
+
+def main():
+    args = parseArgs()
+    if args.printDistributions:
+        json.dump(DEFAULT_DISTRIBUTIONS, sys.stdout, indent=2)
+        print()
+        return
+    if os.path.exists(args.registryPath):
+        if not args.force:
+            print("'{}' already exists, use --force to overwrite it".format(
+                args.registryPath), file=sys.stderr)
+            sys.exit(1)
+        os.unlink(args.registryPath)
+    distributions = None
+    if args.distributions is not None:
+        with open(args.distributions) as distributionsFile:
+            distributions = json.load(distributionsFile)
+    dataDirectory = args.dataDirectory
+    if dataDirectory is None:
+        dataDirectory = os.path.dirname(os.path.abspath(args.registryPath))
+    startTime = time.time()
+    generator = CohortGenerator(
+        args.registryPath, dataDirectory, numPatients=args.numPatients,
+        numVcfs=args.numVcfs, distributions=distributions, seed=args.seed,
+        datasetName=args.datasetName, referenceSetPath=args.referenceSet,
+        numReferences=args.numReferences,
+        referenceLength=args.referenceLength, progress=print)
+    generator.generate()
+    print("generated '{}' in {:.0f}s".format(
+        args.registryPath, time.time() - startTime))
+
+
+if __name__ == "__main__":
+    main()
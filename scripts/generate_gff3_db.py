@@ -18,13 +18,14 @@ import glue
 
 glue.ga4ghImportGlue()
 import candig.server.gff3 as gff3  # NOQA
+import candig.server.datamodel.sequence_annotations as sequence_annotations  # NOQA
 
 # TODO: Shift this to use the Gff3DbBackend class.
 
 # The columns of the FEATURE table correspond to the columns of a GFF3,
 # with three additional columns prepended representing the ID of this feature,
 # the ID of its parent (if any), and a whitespace separated array
-# of its child IDs.
+# of its child IDs, which the server splits without parsing JSON.
 
 _dbTableSQL = (
     "CREATE TABLE FEATURE( "
@@ -55,13 +56,16 @@ class Gff32Db(object):
     by iterating through the resulting parsed dictionary object
     (gff3Data.byfeatureName).
     """
-    def __init__(self, inputFile, outputFile):
+    def __init__(self, inputFile, outputFile, spatialIndex=False):
         """
         :param inputFile: source GFF3 filename (can be a full path)
         :param outputFile: destination sqlite filename (ditto)
+        :param spatialIndex: also build the R*Tree index used for
+            range queries
         """
         self.gff3File = inputFile
         self.dbFile = outputFile
+        self.spatialIndex = spatialIndex
         self.valueList = []
         self.batchSize = 100
         if os.path.exists(outputFile):
@@ -99,7 +103,7 @@ class Gff32Db(object):
                 values = (
                     feature.uniqueId,
                     parentId,
-                    _db_serialize(childIds),
+                    sequence_annotations.serializeChildIds(childIds),
                     feature.seqname,
                     feature.source,
                     feature.type,
@@ -121,6 +125,8 @@ class Gff32Db(object):
 
         dbcur.close()
         dbconn.close()
+        if self.spatialIndex:
+            sequence_annotations.createSpatialIndex(self.dbFile)
 
 
 @utils.Timed()
@@ -135,9 +141,12 @@ def main():
         "--inputFile", "-i",
         help="Path to input GFF3 file.",
         default='.')
+    parser.add_argument(
+        "--spatialIndex", "-s", action="store_true", default=False,
+        help="Build an R*Tree index to speed up range queries.")
     parser.add_argument('--verbose', '-v', action='count', default=0)
     args = parser.parse_args()
-    g2d = Gff32Db(args.inputFile, args.outputFile)
+    g2d = Gff32Db(args.inputFile, args.outputFile, args.spatialIndex)
     g2d.run()
 
 
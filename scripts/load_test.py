@@ -0,0 +1,800 @@
+"""
+Load tests of a federation of servers.
+
+Starts a number of servers on ephemeral local ports, each serving its
+own copy of a registry DB and listing all the others as its peers, then
+sends them a mix of /search, /count, patient and variant search requests
+at a target rate for a fixed duration. Every request goes to the servers
+in turn, and federates to all their peers. The test is repeated for each
+of the requested numbers of servers, to show how the latency and
+throughput change as peers are added.
+
+Peers are reached through proxies, which can delay the requests made to
+them and fail a share of them, either answering 503 or dropping the
+connection, and which count the requests and errors of each peer. The
+health probes of the peers go through the proxies too, so a failed probe
+makes the servers skip the peer until its next probe, as they would a
+peer that is down; their responses then miss the results of the peer and
+are reported as partial.
+
+The registry is either an existing one, or a synthetic cohort written by
+generate_cohort.py. The latencies are measured from the time each request
+was scheduled at, so that requests waiting for a busy client thread are
+counted as slow instead of not being sent, and the results are written
+as JSON.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import datetime
+import http.server
+import json
+import os
+import random
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+import glue
+
+glue.ga4ghImportGlue()
+import candig.server.datarepo as datarepo  # noqa
+
+import generate_cohort  # noqa
+
+
+SERVER_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+DATASET_NAME = "loadtest"
+QUERY_TYPES = ["search", "count", "patients", "variants"]
+
+# The headers of a response that are not forwarded by the proxies, as
+# the proxies send the decoded body in one piece
+_HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "transfer-encoding", "content-encoding",
+    "content-length", "proxy-authenticate", "proxy-authorization", "te",
+    "trailers", "upgrade"}
+
+
+def _getFreePort():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(sortedValues, percent):
+    if not sortedValues:
+        return None
+    index = max(0, int(round(percent / 100 * len(sortedValues))) - 1)
+    return sortedValues[min(index, len(sortedValues) - 1)]
+
+
+def _getLatencyStats(latencies):
+    """
+    Returns the percentiles, mean and maximum of the latencies, in
+    milliseconds.
+    """
+    latencies = sorted(latency * 1000 for latency in latencies)
+    if not latencies:
+        return {}
+    return {
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "mean": sum(latencies) / len(latencies),
+        "max": latencies[-1],
+    }
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    # http.server.ThreadingHTTPServer is new in Python 3.7
+    daemon_threads = True
+
+
+class _ProxyRequestHandler(http.server.BaseHTTPRequestHandler):
+
+    def _forward(self):
+        self.server.proxy.forward(self)
+
+    do_GET = _forward
+    do_POST = _forward
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FaultInjectingProxy(object):
+    """
+    An HTTP proxy in front of a server, through which its peers reach
+    it. Each request is delayed by the latency, give or take the jitter,
+    and the failure rate is the share of the requests that fail: the
+    proxy either answers them with a 503 or, in the "drop" mode, closes
+    the connection without answering.
+    """
+    def __init__(self, targetUrl, latency=0, jitter=0, failureRate=0,
+                 failureMode="error", seed=0):
+        self._targetUrl = targetUrl.rstrip("/")
+        self._latency = latency
+        self._jitter = jitter
+        self._failureRate = failureRate
+        self._failureMode = failureMode
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=100)
+        self._session.mount("http://", adapter)
+        self._httpServer = None
+        self.resetStats()
+
+    def getUrl(self):
+        return "http://127.0.0.1:{}/".format(
+            self._httpServer.server_address[1])
+
+    def getTargetUrl(self):
+        return self._targetUrl + "/"
+
+    def start(self):
+        self._httpServer = _ThreadingHTTPServer(
+            ("127.0.0.1", 0), _ProxyRequestHandler)
+        self._httpServer.proxy = self
+        thread = threading.Thread(
+            target=self._httpServer.serve_forever, name="FaultInjectingProxy")
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        if self._httpServer is not None:
+            self._httpServer.shutdown()
+            self._httpServer.server_close()
+        self._session.close()
+
+    def resetStats(self):
+        with self._lock:
+            self._requests = 0
+            self._injectedFailures = 0
+            self._errors = 0
+            self._latencies = []
+
+    def getStats(self):
+        """
+        Returns the number of requests made to the server through the
+        proxy since the stats were last reset, the number of those that
+        failed, including the injected failures, and the percentiles of
+        the response times of the server.
+        """
+        with self._lock:
+            stats = {
+                "requests": self._requests,
+                "errors": self._errors,
+                "injectedFailures": self._injectedFailures,
+                "errorRate": (
+                    self._errors / self._requests if self._requests else 0),
+            }
+            stats["latency"] = _getLatencyStats(self._latencies)
+        return stats
+
+    def _draw(self):
+        with self._lock:
+            self._requests += 1
+            fail = self._random.random() < self._failureRate
+            if fail:
+                self._injectedFailures += 1
+                self._errors += 1
+            delay = self._latency
+            if self._jitter:
+                delay = max(0, self._random.uniform(
+                    delay - self._jitter, delay + self._jitter))
+        return fail, delay
+
+    def forward(self, handler):
+        fail, delay = self._draw()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            if self._failureMode == "drop":
+                handler.close_connection = True
+            else:
+                handler.send_error(503)
+            return
+        length = int(handler.headers.get("Content-Length", 0))
+        body = handler.rfile.read(length) if length else None
+        headers = {
+            key: value for key, value in handler.headers.items()
+            if key.lower() not in _HOP_BY_HOP_HEADERS and
+            key.lower() != "host"}
+        start = time.perf_counter()
+        try:
+            response = self._session.request(
+                handler.command, self._targetUrl + handler.path,
+                data=body, headers=headers, timeout=60)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._errors += 1
+            handler.send_error(502)
+            return
+        with self._lock:
+            self._latencies.append(time.perf_counter() - start)
+            if response.status_code >= 500:
+                self._errors += 1
+        handler.send_response(response.status_code)
+        for key, value in response.headers.items():
+            if key.lower() not in _HOP_BY_HOP_HEADERS:
+                handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(response.content)))
+        handler.end_headers()
+        handler.wfile.write(response.content)
+
+
+class ServerProcess(object):
+    """
+    A server run in a subprocess, serving a copy of the registry DB with
+    the specified peers, from a working directory holding its
+    configuration and log.
+    """
+    def __init__(self, port, registryPath, directory, peerUrls,
+                 config=None, workers=None):
+        self._port = port
+        self._registryPath = registryPath
+        self._directory = directory
+        self._peerUrls = peerUrls
+        self._config = config or {}
+        self._workers = workers
+        self._process = None
+        self._logFile = None
+
+    def getUrl(self):
+        return "http://127.0.0.1:{}/".format(self._port)
+
+    def getLogPath(self):
+        return os.path.join(self._directory, "server.log")
+
+    def _writeConfig(self):
+        os.makedirs(self._directory, exist_ok=True)
+        registryPath = os.path.join(self._directory, "registry.db")
+        shutil.copyfile(self._registryPath, registryPath)
+        peersPath = os.path.join(self._directory, "peers.txt")
+        with open(peersPath, "w") as peersFile:
+            for url in self._peerUrls:
+                print(url, file=peersFile)
+        config = {
+            "DATA_SOURCE": registryPath,
+            "INITIAL_PEERS": peersPath,
+            "CACHE_DIRECTORY": os.path.join(self._directory, "cache"),
+            "REQUEST_VALIDATION": False,
+            "DEBUG": False,
+        }
+        config.update(self._config)
+        configPath = os.path.join(self._directory, "config.py")
+        with open(configPath, "w") as configFile:
+            for key, value in sorted(config.items()):
+                print("{} = {!r}".format(key, value), file=configFile)
+        return configPath
+
+    def start(self, timeout=120):
+        """
+        Starts the server and waits for it to answer.
+        """
+        configPath = self._writeConfig()
+        command = [
+            sys.executable, "server_dev.py", "--dont-use-reloader",
+            "--disable-urllib-warnings", "--host", "127.0.0.1",
+            "--port", str(self._port), "--config", "TestConfig",
+            "--config-file", configPath]
+        if self._workers is not None:
+            command += ["--gunicorn", "--workers", str(self._workers)]
+        self._logFile = open(self.getLogPath(), "w")
+        self._process = subprocess.Popen(
+            command, stdout=self._logFile, stderr=subprocess.STDOUT,
+            cwd=SERVER_DIRECTORY)
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._process.poll() is not None:
+                raise RuntimeError(
+                    "the server on port {} exited, see '{}'".format(
+                        self._port, self.getLogPath()))
+            try:
+                requests.get(self.getUrl(), timeout=1)
+                return
+            except requests.exceptions.RequestException:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(
+                    "the server on port {} didn't start in {}s".format(
+                        self._port, timeout))
+            time.sleep(0.2)
+
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        if self._logFile is not None:
+            self._logFile.close()
+
+
+class Federation(object):
+    """
+    A number of servers, each listing the proxies of all the others as
+    its peers, or the other servers themselves when direct is True.
+    """
+    def __init__(self, numServers, registryPath, directory, latency=0,
+                 jitter=0, failureRate=0, failureMode="error", direct=False,
+                 config=None, workers=None, seed=0):
+        self._numServers = numServers
+        self._registryPath = registryPath
+        self._directory = directory
+        self._proxyOptions = {
+            "latency": latency, "jitter": jitter,
+            "failureRate": failureRate, "failureMode": failureMode}
+        self._direct = direct
+        self._config = config
+        self._workers = workers
+        self._seed = seed
+        self._servers = []
+        self._proxies = []
+
+    def getServerUrls(self):
+        return [server.getUrl() for server in self._servers]
+
+    def getProxies(self):
+        return list(self._proxies)
+
+    def start(self):
+        ports = [_getFreePort() for _ in range(self._numServers)]
+        targetUrls = ["http://127.0.0.1:{}/".format(port) for port in ports]
+        if self._direct:
+            peerUrls = targetUrls
+        else:
+            for index, url in enumerate(targetUrls):
+                proxy = FaultInjectingProxy(
+                    url, seed=self._seed + index, **self._proxyOptions)
+                proxy.start()
+                self._proxies.append(proxy)
+            peerUrls = [proxy.getUrl() for proxy in self._proxies]
+        for index, port in enumerate(ports):
+            self._servers.append(ServerProcess(
+                port, self._registryPath,
+                os.path.join(self._directory, "server{}".format(index)),
+                peerUrls[:index] + peerUrls[index + 1:],
+                config=self._config, workers=self._workers))
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._numServers) as executor:
+            list(executor.map(ServerProcess.start, self._servers))
+
+    def stop(self):
+        for server in self._servers:
+            server.stop()
+        for proxy in self._proxies:
+            proxy.stop()
+
+
+class QueryMix(object):
+    """
+    Draws requests of the query types in proportion to their weights.
+    The requests target the dataset, and the variant searches a random
+    window of a tenth of a reference of its variant sets.
+    """
+    def __init__(self, registryPath, weights, pageSize, datasetName=None,
+                 seed=0):
+        repo = datarepo.SqlDataRepository(registryPath)
+        repo.open(datarepo.MODE_READ)
+        repo.load()
+        if datasetName is None:
+            self._dataset = repo.getDatasets()[0]
+        else:
+            self._dataset = repo.getDatasetByName(datasetName)
+        self._reference = None
+        variantSets = self._dataset.getVariantSets()
+        if variantSets:
+            referenceSet = variantSets[0].getReferenceSet()
+            self._reference = referenceSet.getReferences()[0]
+        repo.close()
+        self._types = [name for name in QUERY_TYPES if weights.get(name)]
+        if "variants" in self._types and self._reference is None:
+            raise ValueError("the dataset has no variant sets")
+        self._weights = [weights[name] for name in self._types]
+        self._pageSize = pageSize
+        self._random = random.Random(seed)
+
+    def _getClinicalQuery(self):
+        return {
+            "datasetId": self._dataset.getId(),
+            "logic": {"and": [{"id": "A"}, {"id": "B", "negate": True}]},
+            "components": [
+                {"id": "A", "patients": {"filters": [
+                    {"field": "gender", "operator": "==",
+                     "value": "Female"}]}},
+                {"id": "B", "diagnoses": {"filters": [
+                    {"field": "cancerType", "operator": "==",
+                     "value": "Breast cancer"}]}},
+            ],
+        }
+
+    def _getSearchRequest(self):
+        request = self._getClinicalQuery()
+        request["results"] = [{"table": "patients"}]
+        request["pageSize"] = self._pageSize
+        return "/search", request
+
+    def _getCountRequest(self):
+        request = self._getClinicalQuery()
+        request["results"] = [
+            {"table": "patients",
+             "fields": ["gender", "provinceOfResidence"]}]
+        return "/count", request
+
+    def _getPatientsRequest(self):
+        return "/patients/search", {
+            "datasetId": self._dataset.getId(),
+            "filters": [
+                {"field": "provinceOfResidence", "operator": "==",
+                 "value": "Ontario"}],
+            "pageSize": self._pageSize}
+
+    def _getVariantsRequest(self):
+        length = self._reference.getLength() // 10
+        start = self._random.randrange(
+            self._reference.getLength() - length + 1)
+        return "/variants/search", {
+            "datasetId": self._dataset.getId(),
+            "referenceName": self._reference.getLocalId(),
+            "start": start, "end": start + length,
+            "pageSize": self._pageSize}
+
+    def draw(self):
+        """
+        Returns the query type, path and body of a request.
+        """
+        queryType = self._random.choices(self._types, self._weights)[0]
+        getRequest = {
+            "search": self._getSearchRequest,
+            "count": self._getCountRequest,
+            "patients": self._getPatientsRequest,
+            "variants": self._getVariantsRequest,
+        }[queryType]
+        path, request = getRequest()
+        return queryType, path, request
+
+
+Sample = collections.namedtuple(
+    "Sample",
+    ["queryType", "serverUrl", "scheduled", "end", "status", "partial"])
+
+
+class LoadGenerator(object):
+    """
+    Sends the requests of a query mix to the servers in turn at a
+    constant rate, from a pool of client threads. The requests of the
+    warmup are sent but not recorded.
+    """
+    def __init__(self, serverUrls, queryMix, qps, concurrency=64,
+                 timeout=60):
+        self._serverUrls = serverUrls
+        self._queryMix = queryMix
+        self._qps = qps
+        self._concurrency = concurrency
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _getSession(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _send(self, queryType, serverUrl, path, request, scheduled):
+        try:
+            response = self._getSession().post(
+                serverUrl.rstrip("/") + path, data=json.dumps(request), timeout=self._timeout,
+                headers={"Content-Type": "application/json",
+                         "Accept": "application/json"})
+            status = response.status_code
+            end = time.monotonic()
+        except requests.exceptions.RequestException as exc:
+            return Sample(
+                queryType, serverUrl, scheduled, time.monotonic(),
+                type(exc).__name__, False)
+        partial = False
+        if status == 200:
+            try:
+                federationStatus = response.json()["status"]
+                partial = (federationStatus["Successful communications"] <
+                           federationStatus["Known peers"])
+            except (ValueError, KeyError, TypeError):
+                pass
+        return Sample(queryType, serverUrl, scheduled, end, status, partial)
+
+    def run(self, duration, warmup=0, onWarmedUp=None):
+        """
+        Sends requests for warmup plus duration seconds and returns the
+        samples of those sent after the warmup. onWarmedUp is called when
+        the warmup ends.
+        """
+        futures = []
+        start = time.monotonic()
+        measureStart = start + warmup
+        end = measureStart + duration
+        warmedUp = warmup <= 0
+        if warmedUp and onWarmedUp is not None:
+            onWarmedUp()
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._concurrency) as executor:
+            for count in range(int(self._qps * (warmup + duration))):
+                scheduled = start + count / self._qps
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if not warmedUp and scheduled >= measureStart:
+                    warmedUp = True
+                    if onWarmedUp is not None:
+                        onWarmedUp()
+                queryType, path, request = self._queryMix.draw()
+                serverUrl = self._serverUrls[count % len(self._serverUrls)]
+                future = executor.submit(
+                    self._send, queryType, serverUrl, path, request,
+                    scheduled)
+                if scheduled >= measureStart:
+                    futures.append(future)
+                if scheduled >= end:
+                    break
+        return [future.result() for future in futures]
+
+
+def summarize(samples):
+    """
+    Returns the number of requests, errors, throughput and latency
+    percentiles of the samples, by query type and server as well as
+    overall. Partial responses are the successful responses missing the
+    results of some peers, which failed or were skipped as down.
+    """
+    def getStats(subset):
+        errors = sum(1 for sample in subset if sample.status != 200)
+        return {
+            "requests": len(subset),
+            "errors": errors,
+            "errorRate": errors / len(subset) if subset else 0,
+            "partialResponses": sum(1 for sample in subset if sample.partial),
+            "latency": _getLatencyStats(
+                [sample.end - sample.scheduled for sample in subset]),
+        }
+
+    stats = getStats(samples)
+    if samples:
+        elapsed = (max(sample.end for sample in samples) -
+                   min(sample.scheduled for sample in samples))
+        stats["throughput"] = sum(
+            1 for sample in samples if sample.status == 200) / elapsed
+    stats["statuses"] = dict(collections.Counter(
+        str(sample.status) for sample in samples))
+    for key, field in [("queries", "queryType"), ("servers", "serverUrl")]:
+        groups = collections.defaultdict(list)
+        for sample in samples:
+            groups[getattr(sample, field)].append(sample)
+        stats[key] = {
+            name: getStats(subset) for name, subset in sorted(groups.items())}
+    return stats
+
+
+def _parseMix(value):
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in QUERY_TYPES:
+            raise argparse.ArgumentTypeError(
+                "unknown query type '{}'".format(name))
+        try:
+            weights[name] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                "invalid weight '{}'".format(weight))
+    return weights
+
+
+def _printStats(numServers, stats, peerStats):
+    latency = stats["latency"]
+    print("{} server(s): {} requests, {:.1f} req/s, {:.1%} errors, "
+          "{} partial, p50 {:.0f}ms p95 {:.0f}ms p99 {:.0f}ms".format(
+              numServers, stats["requests"], stats.get("throughput", 0),
+              stats["errorRate"], stats["partialResponses"],
+              latency.get("p50", 0),
+              latency.get("p95", 0), latency.get("p99", 0)))
+    for name, queryStats in stats["queries"].items():
+        latency = queryStats["latency"]
+        print("  {:<10} {:>6} requests, {:.1%} errors, p50 {:.0f}ms "
+              "p95 {:.0f}ms p99 {:.0f}ms".format(
+                  name, queryStats["requests"], queryStats["errorRate"],
+                  latency.get("p50", 0), latency.get("p95", 0),
+                  latency.get("p99", 0)))
+    for url, proxyStats in peerStats.items():
+        print("  peer {} {:>6} requests, {:.1%} errors".format(
+            url, proxyStats["requests"], proxyStats["errorRate"]))
+
+
+def parseArgs():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--numServers", type=int, nargs="+", default=[1, 2, 4],
+        help="The numbers of servers to test in turn "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--registryPath", default=None,
+        help="The registry DB served by every server (default: a "
+             "synthetic cohort)")
+    parser.add_argument(
+        "--datasetName", default=None,
+        help="The dataset of the requests (default: the first dataset)")
+    parser.add_argument(
+        "--dataDirectory", default=None,
+        help="The directory of the synthetic cohort, reused if it has "
+             "been generated already (default: a temporary directory)")
+    parser.add_argument(
+        "--numPatients", type=int, default=1000,
+        help="The number of patients of the synthetic cohort "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--numVcfs", type=int, default=10,
+        help="The number of VCFs of the synthetic cohort "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="The seed of the synthetic cohort, the requests and the "
+             "failures (default: %(default)s)")
+    parser.add_argument(
+        "--mix", type=_parseMix,
+        default="search=1,count=1,patients=1,variants=1",
+        help="The weights of the query types, among {} "
+             "(default: %(default)s)".format(", ".join(QUERY_TYPES)))
+    parser.add_argument(
+        "--qps", type=float, default=10,
+        help="The number of requests sent per second (default: %(default)s)")
+    parser.add_argument(
+        "--duration", type=float, default=30,
+        help="The number of seconds requests are recorded for "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--warmup", type=float, default=5,
+        help="The number of seconds requests are sent before they are "
+             "recorded (default: %(default)s)")
+    parser.add_argument(
+        "--concurrency", type=int, default=64,
+        help="The number of client threads (default: %(default)s)")
+    parser.add_argument(
+        "--timeout", type=float, default=60,
+        help="The timeout of the requests in seconds (default: %(default)s)")
+    parser.add_argument(
+        "--pageSize", type=int, default=100,
+        help="The page size of the searches (default: %(default)s)")
+    parser.add_argument(
+        "--latency", type=float, default=0,
+        help="The delay in seconds added to the requests made to the "
+             "peers (default: %(default)s)")
+    parser.add_argument(
+        "--jitter", type=float, default=0,
+        help="The maximum random variation of the delay in seconds "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--failureRate", type=float, default=0,
+        help="The share of the requests made to the peers that fail "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--failureMode", choices=["error", "drop"], default="error",
+        help="Whether the failed requests are answered with a 503 or "
+             "their connection is dropped (default: %(default)s)")
+    parser.add_argument(
+        "--direct", action="store_true",
+        help="Let the servers reach their peers directly, without the "
+             "proxies injecting latency and failures and counting the "
+             "requests of each peer")
+    parser.add_argument(
+        "--peerTimeout", type=float, default=5,
+        help="The PEER_TIMEOUT of the servers (default: %(default)s)")
+    parser.add_argument(
+        "--peerProbeInterval", type=float, default=60,
+        help="The PEER_PROBE_INTERVAL of the servers, 0 to never skip "
+             "peers (default: %(default)s)")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Run the servers with gunicorn and this number of workers "
+             "(default: the threaded development server)")
+    parser.add_argument(
+        "--output", default=None, metavar="RESULTS_FILE",
+        help="The JSON file the results are written to")
+    args = parser.parse_args()
+    if args.direct and (args.latency or args.failureRate):
+        parser.error("latency and failures can't be injected with --direct")
+    return args
+
+
+def main():
+    args = parseArgs()
+    workDirectory = tempfile.mkdtemp(prefix="candig-load-test-")
+    dataDirectory = args.dataDirectory
+    try:
+        registryPath = args.registryPath
+        datasetName = args.datasetName
+        if registryPath is None:
+            if dataDirectory is None:
+                dataDirectory = os.path.join(workDirectory, "cohort")
+            dataDirectory = os.path.abspath(dataDirectory)
+            registryPath = os.path.join(dataDirectory, "registry.db")
+            datasetName = DATASET_NAME
+            if os.path.exists(registryPath):
+                print("using the cohort at '{}'".format(registryPath))
+            else:
+                print("generating the cohort at '{}'".format(registryPath))
+                os.makedirs(dataDirectory, exist_ok=True)
+                generate_cohort.CohortGenerator(
+                    registryPath, dataDirectory,
+                    numPatients=args.numPatients, numVcfs=args.numVcfs,
+                    seed=args.seed, datasetName=DATASET_NAME,
+                    numReferences=2).generate()
+        registryPath = os.path.abspath(registryPath)
+
+        results = {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "parameters": {
+                key: value for key, value in vars(args).items()
+                if key != "output"},
+            "runs": [],
+        }
+        config = {
+            "PEER_TIMEOUT": args.peerTimeout,
+            "PEER_PROBE_INTERVAL": args.peerProbeInterval,
+        }
+        queryMix = QueryMix(
+            registryPath, args.mix, args.pageSize, datasetName=datasetName,
+            seed=args.seed)
+        for numServers in args.numServers:
+            federation = Federation(
+                numServers, registryPath,
+                os.path.join(workDirectory, "federation{}".format(numServers)),
+                latency=args.latency, jitter=args.jitter,
+                failureRate=args.failureRate, failureMode=args.failureMode,
+                direct=args.direct, config=config, workers=args.workers,
+                seed=args.seed)
+            try:
+                federation.start()
+                generator = LoadGenerator(
+                    federation.getServerUrls(), queryMix, args.qps,
+                    concurrency=args.concurrency, timeout=args.timeout)
+
+                def resetProxies():
+                    for proxy in federation.getProxies():
+                        proxy.resetStats()
+                samples = generator.run(
+                    args.duration, args.warmup, onWarmedUp=resetProxies)
+                peerStats = {
+                    proxy.getTargetUrl(): proxy.getStats()
+                    for proxy in federation.getProxies()}
+            finally:
+                federation.stop()
+            stats = summarize(samples)
+            stats["numServers"] = numServers
+            stats["peers"] = peerStats
+            results["runs"].append(stats)
+            _printStats(numServers, stats, peerStats)
+
+        if args.output is not None:
+            with open(args.output, "w") as resultsFile:
+                json.dump(results, resultsFile, indent=2)
+            print("results written to '{}'".format(args.output))
+    finally:
+        shutil.rmtree(workDirectory)
+
+
+if __name__ == "__main__":
+    main()
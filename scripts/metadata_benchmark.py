@@ -0,0 +1,98 @@
+"""
+Measures the memory used by each clinical or pipeline metadata record
+once loaded by the server, and the time taken to load the records.
+
+The records are synthetic rows with every field and tier set, read the
+way SqlDataRepository reads the clinical and pipeline tables.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import glue
+
+glue.ga4ghImportGlue()
+import candig.server.datamodel.clinical_metadata as clinical_metadata  # noqa
+import candig.server.datamodel.datasets as datasets  # noqa
+import candig.server.datamodel.pipeline_metadata as pipeline_metadata  # noqa
+import candig.server.repo.models as models  # noqa
+
+
+class Row(object):
+    """
+    Stands for a row of a peewee model.
+    """
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+
+def _makeRows(model, numRecords):
+    columns = [field.name for field in model._meta.sorted_fields]
+    rows = []
+    for i in range(numRecords):
+        values = {}
+        for column in columns:
+            if column.endswith("Tier"):
+                values[column] = i % 5
+            else:
+                values[column] = "{}-{}".format(column, i)
+        values["attributes"] = None
+        rows.append(Row(values))
+    return rows
+
+
+def benchmark(className, numRecords):
+    if hasattr(clinical_metadata, className):
+        datamodelClass = getattr(clinical_metadata, className)
+    else:
+        datamodelClass = getattr(pipeline_metadata, className)
+    rows = _makeRows(getattr(models, className), numRecords)
+    dataset = datasets.Dataset("dataset1")
+
+    startTime = time.perf_counter()
+    records = [
+        datamodelClass(dataset, row.name).populateFromRow(row)
+        for row in rows]
+    loadTime = time.perf_counter() - startTime
+
+    # Load them again to measure their size without slowing the timing
+    records = None
+    gc.collect()
+    tracemalloc.start()
+    records = [
+        datamodelClass(dataset, row.name).populateFromRow(row)
+        for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    startTime = time.perf_counter()
+    for record in records:
+        for tier in range(5):
+            record.toProtocolElement(tier)
+    projectionTime = time.perf_counter() - startTime
+
+    print("{}: {} records".format(className, numRecords))
+    print("  memory per record: {:.0f} bytes".format(size / numRecords))
+    print("  load time: {:.2f} us per record".format(
+        loadTime / numRecords * 1e6))
+    print("  toProtocolElement: {:.2f} us per record and tier".format(
+        projectionTime / numRecords / 5 * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--numRecords", type=int, default=20000,
+        help="The number of records to load")
+    parser.add_argument(
+        "classNames", nargs="*", default=["Patient", "Tumourboard"],
+        help="The metadata classes to benchmark")
+    args = parser.parse_args()
+    for className in args.classNames:
+        benchmark(className, args.numRecords)
+
+
+if __name__ == "__main__":
+    main()
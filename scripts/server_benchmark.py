@@ -1,181 +1,725 @@
 """
-Stand-alone benchmark for the GA4GH reference implementation.
+Benchmarks of the server on a synthetic data repository.
+
+The repository is generated in a working directory from the requested
+number of patients, written with generate_cohort.py, per-patient VCFs
+and BAMs, genes and RNA quantifications, and loaded by the server the way it is in production.
+Each benchmark then times a kind of request made through the Flask
+application: clinical searches, /search, /count, variant and gene
+searches, reads, features and expression levels, along with the startup
+of the server itself.
+
+The timings are written as JSON to the results directory, and a
+previous results file can be given to compare against, in which case the
+benchmarks whose median time grew over the threshold are reported and
+the script exits with a non-zero status. CPU profiles (cProfile) and
+allocation profiles (tracemalloc) of each benchmark can be recorded too.
 """
 
-import re
-import time
-import pstats
 import argparse
+import contextlib
 import cProfile
+import datetime
+import io
+import json
+import os
+import platform
+import pstats
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
 
-import guppy
+import pysam
 
 import glue
 
-import candig.schemas.protocol as protocol
-
 glue.ga4ghImportGlue()
-import candig.server.backend as backend  # noqa
-import candig.server.datarepo as datarepo  # noqa
+import candig.server.datamodel.ontologies as ontologies  # noqa
+import candig.server.datamodel.reads as reads  # noqa
+import candig.server.datamodel.rna_quantification as rna_quantification  # noqa
+import candig.server.datamodel.sequence_annotations as sequence_annotations  # noqa
+import candig.server.frontend as frontend  # noqa
+import candig.server.repo.rnaseq2ga as rnaseq2ga  # noqa
+
+import generate_cohort  # noqa
+import generate_gff3_db  # noqa
+
 
+SEQUENCE_ONTOLOGY_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir,
+    "tests", "data", "ontologies", "so-xp-simple.obo")
 
-class HeapProfilerBackend(backend.Backend):
-    def __init__(self, registryDb):
-        repo = datarepo.SqlDataRepository(registryDb)
-        repo.open(datarepo.MODE_READ)
-        super(HeapProfilerBackend, self).__init__(repo)
-        self.profiler = guppy.hpy()
+DATASET_NAME = "benchmark"
+READ_LENGTH = 100
 
-    def startProfile(self):
-        self.profiler.setrelheap()
 
-    def endProfile(self):
-        print(self.profiler.heap())
+class SyntheticRepository(object):
+    """
+    Writes a data repository of synthetic patients and genomic data
+    files to a directory. The patients, their clinical and pipeline
+    records and VCFs are written by the cohort generator, to which this
+    adds BAMs, a GFF3 DB of genes and RNA quantifications. The data is
+    drawn from random generators seeded with the specified seed, so that
+    a repository of the same parameters holds the same data.
+    """
+    def __init__(
+            self, directory, numPatients=1000, numVariantSets=10,
+            numVariants=10000, numReadGroupSets=2, numReads=10000,
+            numGenes=1000, numRnaQuantifications=10, numReferences=3,
+            referenceLength=1000000, seed=0):
+        self._directory = directory
+        self._numPatients = numPatients
+        self._numReadGroupSets = min(numReadGroupSets, numPatients)
+        self._numReads = numReads
+        self._numGenes = numGenes
+        self._numRnaQuantifications = min(numRnaQuantifications, numPatients)
+        self._random = random.Random(seed)
+        self._generator = generate_cohort.CohortGenerator(
+            self.getRegistryPath(), directory, numPatients=numPatients,
+            numVcfs=numVariantSets, seed=seed, datasetName=DATASET_NAME,
+            numReferences=numReferences, referenceLength=referenceLength,
+            distributions={"variants": {
+                "numSites": 4 * numVariants,
+                "perVcf": {"mean": numVariants, "sd": 0}}})
+        self._repo = None
+        self._dataset = None
+        self._referenceSet = None
+        self._referenceLengths = None
+        self._ontology = None
+
+    def getRegistryPath(self):
+        return os.path.join(self._directory, "registry.db")
+
+    def exists(self):
+        return os.path.exists(self.getRegistryPath())
+
+    def _getPath(self, *names):
+        path = os.path.join(self._directory, *names)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
 
+    def getGeneNames(self):
+        return ["GENE{}".format(i) for i in range(self._numGenes)]
 
-class CpuProfilerBackend(backend.Backend):
-    def __init__(self, registryDb):
-        repo = datarepo.SqlDataRepository(registryDb)
-        repo.open(datarepo.MODE_READ)
-        super(CpuProfilerBackend, self).__init__(repo)
-        self.profiler = cProfile.Profile()
+    def _getPatient(self, index):
+        """
+        Returns the ID of the patient of the specified index, and of
+        their first sample.
+        """
+        patientId = self._generator.getPatientId(index)
+        sampleIds = self._generator.getSampleIds(patientId)
+        return patientId, sampleIds[0] if sampleIds else patientId
 
-    def startProfile(self):
-        self.profiler.enable()
+    def build(self):
+        """
+        Writes the data files and the registry DB of the repository.
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        generator = self._generator
+        generator.open()
+        self._repo = generator.getRepository()
+        ontology = ontologies.Ontology("so-xp-simple")
+        ontology.populateFromFile(SEQUENCE_ONTOLOGY_FILE)
+        self._repo.insertOntology(ontology)
+        self._ontology = self._repo.getSqlOntologyByName(ontology.getName())
+        generator.writeReferenceSet()
+        generator.writeDataset()
+        generator.writeMetadataRecords()
+        generator.writeVariantSets()
+        self._dataset = generator.getDataset()
+        self._referenceSet = generator.getReferenceSet()
+        self._referenceLengths = generator.getReferenceLengths()
+        with pysam.FastaFile(generator.getReferenceSetPath()) as fastaFile:
+            for index in range(self._numReadGroupSets):
+                self._writeReadGroupSet(index, fastaFile)
+        self._writeFeatureSet()
+        self._writeRnaQuantificationSet()
+        generator.close()
 
-    def endProfile(self):
-        self.profiler.disable()
+    def _getPositions(self, count, margin=0):
+        """
+        Returns sorted (referenceName, position) pairs spread over the
+        references.
+        """
+        positions = []
+        for referenceName, length in self._referenceLengths:
+            positions.extend(
+                (referenceName, position) for position in sorted(
+                    self._random.sample(
+                        range(length - margin),
+                        count // len(self._referenceLengths))))
+        return positions
 
+    def _writeReadGroupSet(self, index, fastaFile):
+        patientId, sampleId = self._getPatient(index)
+        bamPath = self._getPath("reads", "{}.bam".format(patientId))
+        header = {
+            "HD": {"VN": "1.0", "SO": "coordinate"},
+            "SQ": [{"SN": referenceName, "LN": length}
+                   for referenceName, length in self._referenceLengths],
+            "RG": [{"ID": sampleId, "SM": sampleId}],
+        }
+        qualities = pysam.qualitystring_to_array("I" * READ_LENGTH)
+        with pysam.AlignmentFile(bamPath, "wb", header=header) as bamFile:
+            positions = self._getPositions(self._numReads, READ_LENGTH)
+            for readIndex, (referenceName, position) in enumerate(positions):
+                read = pysam.AlignedSegment(bamFile.header)
+                read.query_name = "read{}".format(readIndex)
+                read.query_sequence = fastaFile.fetch(
+                    referenceName, position, position + READ_LENGTH)
+                read.reference_name = referenceName
+                read.reference_start = position
+                read.mapping_quality = 60
+                read.cigartuples = [(0, READ_LENGTH)]
+                read.query_qualities = qualities
+                read.set_tag("RG", sampleId)
+                bamFile.write(read)
+        pysam.index(bamPath)
+        readGroupSet = reads.HtslibReadGroupSet(
+            self._dataset, "{}_reads".format(patientId))
+        readGroupSet.populateFromFile(bamPath, bamPath + ".bai")
+        readGroupSet.setReferenceSet(self._referenceSet)
+        readGroupSet.setPatientId(patientId)
+        readGroupSet.setSampleId(sampleId)
+        self._repo.insertReadGroupSet(readGroupSet)
 
-def _heavyQuery(variantSetId, callSetIds):
+    def _writeFeatureSet(self):
+        gff3Path = self._getPath("sequenceAnnotations", "genes.gff3")
+        dbPath = self._getPath("sequenceAnnotations", "genes.db")
+        geneNames = self.getGeneNames()
+        positions = self._getPositions(len(geneNames), 2000)
+        with open(gff3Path, "w") as gff3File:
+            gff3File.write("##gff-version 3\n")
+            for geneName, (referenceName, position) in zip(
+                    geneNames, positions):
+                start = position + 1
+                end = start + self._random.randint(500, 1999)
+                gff3File.write("\t".join([
+                    referenceName, "benchmark", "gene", str(start), str(end),
+                    ".", "+", ".", "ID={0};gene_name={0}".format(
+                        geneName)]) + "\n")
+                gff3File.write("\t".join([
+                    referenceName, "benchmark", "transcript", str(start),
+                    str(end), ".", "+", ".",
+                    "ID={0}.1;Parent={0};gene_name={0};"
+                    "transcript_name={0}.1".format(geneName)]) + "\n")
+        generate_gff3_db.Gff32Db(gff3Path, dbPath).run()
+        featureSet = sequence_annotations.Gff3DbFeatureSet(
+            self._dataset, "genes")
+        featureSet.setReferenceSet(self._referenceSet)
+        featureSet.setOntology(self._ontology)
+        featureSet.populateFromFile(dbPath)
+        self._repo.insertFeatureSet(featureSet)
+
+    def _writeRnaQuantificationSet(self):
+        if self._numRnaQuantifications == 0:
+            return
+        dbPath = self._getPath("rnaQuant", "expression.db")
+        quantifications = []
+        for index in range(self._numRnaQuantifications):
+            patientId, sampleId = self._getPatient(index)
+            quantificationPath = self._getPath(
+                "rnaQuant", "{}.tsv".format(patientId))
+            with open(quantificationPath, "w") as quantificationFile:
+                quantificationFile.write("\t".join([
+                    "gene_id", "expected_count", "TPM", "TPM_ci_lower_bound",
+                    "TPM_ci_upper_bound"]) + "\n")
+                for geneName in self.getGeneNames():
+                    level = self._random.lognormvariate(2, 1.5)
+                    quantificationFile.write("{}\t{:.1f}\t{:.3f}\t{:.3f}\t"
+                                             "{:.3f}\n".format(
+                                                 geneName, level * 10, level,
+                                                 level * 0.9, level * 1.1))
+            quantifications.append((
+                "{}_expression".format(patientId), quantificationPath, "",
+                sampleId, patientId))
+        rnaseq2ga.RnaSqliteStore(dbPath).createTables()
+        rnaseq2ga.bulkRnaseq2ga(
+            quantifications, dbPath, "rsem", dataset=self._dataset,
+            processes=1)
+        rnaQuantificationSet = rna_quantification.SqliteRnaQuantificationSet(
+            self._dataset, "expression")
+        rnaQuantificationSet.setReferenceSet(self._referenceSet)
+        rnaQuantificationSet.populateFromFile(dbPath)
+        self._repo.insertRnaQuantificationSet(rnaQuantificationSet)
+
+
+class ServerClient(object):
     """
-    Very heavy query: calls for the specified list of callSetIds
-    on chromosome 2 (11 pages, 90 seconds to fetch the entire thing
-    on a high-end desktop machine)
+    Makes requests to the Flask application serving a repository,
+    without the federation of the requests.
     """
-    request = protocol.SearchVariantsRequest()
-    request.reference_name = '2'
-    request.variant_set_id = variantSetId
-    for callSetId in callSetIds:
-        request.call_set_ids.add(callSetId)
-    request.page_size = 100
-    request.end = 100000
-    return request
+    def __init__(self, registryPath):
+        self._registryPath = registryPath
+        self._client = None
+        self.dataset = None
+
+    def start(self):
+        """
+        Configures the application for the repository, the way the
+        server does when it starts.
+        """
+        frontend.reset()
+        frontend.configure(baseConfig="TestConfig", extraConfig={
+            "DATA_SOURCE": self._registryPath,
+            "REQUEST_VALIDATION": False,
+        })
+        self._client = frontend.app.test_client()
+        repo = frontend.app.backend.getDataRepository()
+        self.dataset = repo.getDatasetByName(DATASET_NAME)
 
+    def post(self, path, request, allPages=True, allowNotFound=False):
+        """
+        Posts the request to the specified path, following the next page
+        tokens of the responses unless allPages is False, and returns
+        the decoded responses. A 404 response ends the results when
+        allowNotFound is True, as some endpoints answer it when nothing
+        matches.
+        """
+        request = dict(request)
+        responses = []
+        while True:
+            response = self._client.post(
+                path, data=json.dumps(request),
+                headers={"Content-Type": "application/json",
+                         "Accept": "application/json",
+                         "Federation": "False"})
+            if response.status_code == 404 and allowNotFound:
+                return responses
+            if response.status_code != 200:
+                raise RuntimeError("{} returned {}: {}".format(
+                    path, response.status_code,
+                    response.get_data(as_text=True)[:200]))
+            body = json.loads(response.get_data(as_text=True))
+            responses.append(body)
+            results = body.get("results", body)
+            pageToken = results.get("nextPageToken")
+            if not allPages or not pageToken:
+                return responses
+            request["pageToken"] = pageToken
 
-def timeOneSearch(queryString):
+
+class BenchmarkSuite(object):
     """
-    Returns (search result as JSON string, time elapsed during search)
+    The benchmarks of the server on a synthetic repository. Each method
+    whose name starts with "benchmark" makes one kind of request.
     """
-    startTime = time.clock()
-    resultString = backend.runSearchVariants(queryString)
-    endTime = time.clock()
-    elapsedTime = endTime - startTime
-    return resultString, elapsedTime
+    def __init__(self, repository, client, pageSize):
+        self._repository = repository
+        self._client = client
+        self._pageSize = pageSize
+        self._geneName = None
+
+    @classmethod
+    def getBenchmarkNames(cls):
+        return [name[len("benchmark"):] for name in sorted(dir(cls))
+                if name.startswith("benchmark")]
+
+    def getBenchmark(self, name):
+        return getattr(self, "benchmark" + name)
+
+    def _getRegion(self):
+        """
+        Returns the reference name, start and end of the first tenth of
+        the first reference.
+        """
+        variantSet = self._client.dataset.getVariantSets()[0]
+        reference = variantSet.getReferenceSet().getReferences()[0]
+        return reference.getLocalId(), 0, reference.getLength() // 10
+
+    def _getClinicalQuery(self):
+        return {
+            "datasetId": self._client.dataset.getId(),
+            "logic": {"and": [{"id": "A"}, {"id": "B", "negate": True}]},
+            "components": [
+                {"id": "A", "patients": {"filters": [
+                    {"field": "gender", "operator": "==",
+                     "value": "Female"}]}},
+                {"id": "B", "diagnoses": {"filters": [
+                    {"field": "cancerType", "operator": "==",
+                     "value": "Breast cancer"}]}},
+            ],
+        }
+
+    def benchmarkStartup(self):
+        self._client.start()
+
+    def benchmarkPatientsSearch(self):
+        self._client.post("/patients/search", {
+            "datasetId": self._client.dataset.getId(),
+            "filters": [
+                {"field": "provinceOfResidence", "operator": "==",
+                 "value": "Ontario"}],
+            "pageSize": self._pageSize})
+
+    def benchmarkSamplesSearch(self):
+        self._client.post("/samples/search", {
+            "datasetId": self._client.dataset.getId(),
+            "pageSize": self._pageSize})
+
+    def benchmarkQuerySearch(self):
+        request = self._getClinicalQuery()
+        request["results"] = [{"table": "patients"}]
+        request["pageSize"] = self._pageSize
+        self._client.post("/search", request)
+
+    def benchmarkQueryCount(self):
+        request = self._getClinicalQuery()
+        request["results"] = [
+            {"table": "patients",
+             "fields": ["gender", "provinceOfResidence"]}]
+        self._client.post("/count", request)
+
+    def benchmarkVariantsSearch(self):
+        referenceName, start, end = self._getRegion()
+        self._client.post("/variants/search", {
+            "datasetId": self._client.dataset.getId(),
+            "referenceName": referenceName, "start": start, "end": end,
+            "pageSize": self._pageSize})
+
+    def _getGeneName(self):
+        """
+        Returns the name of the first gene overlapping variants, or of the
+        first gene if none does, so that the benchmark times a search
+        returning variants where the repository has some.
+        """
+        if self._geneName is None:
+            geneNames = self._repository.getGeneNames()
+            self._geneName = geneNames[0]
+            for geneName in geneNames:
+                if self._client.post("/variantsbygenesearch", {
+                        "datasetId": self._client.dataset.getId(),
+                        "gene": geneName, "pageSize": 1},
+                        allPages=False, allowNotFound=True):
+                    self._geneName = geneName
+                    break
+        return self._geneName
+
+    def benchmarkVariantsByGeneSearch(self):
+        geneName = self._getGeneName()
+        self._client.post("/variantsbygenesearch", {
+            "datasetId": self._client.dataset.getId(),
+            "gene": geneName,
+            "pageSize": self._pageSize}, allowNotFound=True)
+
+    def benchmarkReadsSearch(self):
+        readGroupSets = self._client.dataset.getReadGroupSets()
+        if not readGroupSets:
+            return
+        readGroupSet = readGroupSets[0]
+        referenceName, start, end = self._getRegion()
+        reference = readGroupSet.getReferenceSet().getReferenceByName(
+            referenceName)
+        self._client.post("/reads/search", {
+            "readGroupIds": [
+                readGroup.getId()
+                for readGroup in readGroupSet.getReadGroups()],
+            "referenceId": reference.getId(), "start": start, "end": end,
+            "pageSize": self._pageSize})
+
+    def benchmarkFeaturesSearch(self):
+        # With few genes, the region may hold none of them
+        referenceName, start, end = self._getRegion()
+        self._client.post("/features/search", {
+            "featureSetId": self._client.dataset.getFeatureSets()[0].getId(),
+            "referenceName": referenceName, "start": start, "end": end,
+            "pageSize": self._pageSize}, allowNotFound=True)
+
+    def benchmarkExpressionLevelsSearch(self):
+        rnaQuantificationSets = self._client.dataset.getRnaQuantificationSets()
+        if not rnaQuantificationSets:
+            return
+        rnaQuantification = rnaQuantificationSets[0].getRnaQuantifications()[0]
+        self._client.post("/expressionlevels/search", {
+            "rnaQuantificationId": rnaQuantification.getId(),
+            "pageSize": self._pageSize})
+
 
+def _getCommit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
 
-def extractNextPageToken(resultString):
+
+@contextlib.contextmanager
+def _quiet():
     """
-    Calling GASearchVariantsResponse.fromJsonString() can be slower
-    than doing the variant search in the first place; instead we use
-    a regexp to extract the next page token.
+    Drops what the server prints while handling the requests.
     """
-    m = re.search('(?<=nextPageToken": )(?:")?([0-9]*?:[0-9]*)|null',
-                  resultString)
-    if m is not None:
-        return m.group(1)
-    return None
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
 
 
-def benchmarkOneQuery(request, repeatLimit=3, pageLimit=3):
+def runBenchmark(function, rounds, warmup):
     """
-    Repeat the query several times; perhaps don't go through *all* the
-    pages.  Returns minimum time to run backend.searchVariants() to execute
-    the query (as far as pageLimit allows), *not* including JSON
-    processing to prepare queries or parse responses.
+    Calls the function warmup times, then times rounds calls and returns
+    the statistics of the times in seconds.
     """
+    for _ in range(warmup):
+        function()
     times = []
-    queryString = protocol.toJson(request)
-    for i in range(0, repeatLimit):
-        resultString, elapsedTime = timeOneSearch(queryString)
-        accruedTime = elapsedTime
-        pageCount = 1
-        token = extractNextPageToken(resultString)
-        # Iterate to go beyond the first page of results.
-        while token is not None and pageCount < pageLimit:
-            pageRequest = request
-            pageRequest.page_token = token
-            pageRequestString = protocol.toJson(pageRequest)
-            resultString, elapsedTime = timeOneSearch(pageRequestString)
-            accruedTime += elapsedTime
-            pageCount = pageCount + 1
-            token = extractNextPageToken(resultString)
-        times.append(accruedTime)
-
-    # TODO: more sophisticated statistics. Sometimes we want min(),
-    # sometimes mean = sum() / len(), sometimes other measures,
-    # perhaps exclude outliers...
-
-    # If we compute average we should throw out at least the first one.
-    # return sum(times[2:])/len(times[2:])
-    return min(times)
-
-
-if __name__ == '__main__':
+    for _ in range(rounds):
+        startTime = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - startTime)
+    return {
+        "rounds": rounds,
+        "min": min(times),
+        "max": max(times),
+        "mean": statistics.mean(times),
+        "median": statistics.median(times),
+        "stdev": statistics.stdev(times) if rounds > 1 else 0.0,
+    }
+
+
+def profileCpu(function, profilePath, numFunctions=10):
+    """
+    Runs the function under cProfile, writes the profile to the specified
+    path and returns the functions taking the most cumulative time.
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(function)
+    profiler.dump_stats(profilePath)
+    stats = pstats.Stats(profiler)
+    stats.sort_stats("cumulative")
+    functions = []
+    for (fileName, line, name), (_, numCalls, totalTime, cumulativeTime, _) in \
+            sorted(stats.stats.items(), key=lambda item: -item[1][3]):
+        functions.append({
+            "function": "{}:{}({})".format(fileName, line, name),
+            "calls": numCalls,
+            "totalTime": totalTime,
+            "cumulativeTime": cumulativeTime,
+        })
+        if len(functions) == numFunctions:
+            break
+    return functions
+
+
+def profileMemory(function, numSites=10):
+    """
+    Runs the function under tracemalloc and returns the peak memory
+    allocated during the call, and the sites allocating the most memory
+    still held at its end.
+    """
+    tracemalloc.start(25)
+    try:
+        function()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak": peak,
+        "sites": [
+            {"site": str(statistic.traceback[0]), "size": statistic.size,
+             "count": statistic.count}
+            for statistic in snapshot.statistics("lineno")[:numSites]],
+    }
+
+
+def compareResults(results, baseline, threshold):
+    """
+    Prints the change of the median times from the baseline results,
+    and returns the names of the benchmarks slower than the threshold
+    allows.
+    """
+    regressions = []
+    if baseline["parameters"] != results["parameters"]:
+        print("warning: the baseline was run on a repository of "
+              "different parameters")
+    print("{:<26} {:>12} {:>12} {:>8}".format(
+        "benchmark", "baseline", "median", "change"))
+    for name in results.get("failures", {}):
+        if name in baseline["benchmarks"]:
+            regressions.append(name)
+            print("{:<26} {:>10.2f}ms {:>12} {:>8} REGRESSION".format(
+                name, baseline["benchmarks"][name]["median"] * 1000,
+                "failed", ""))
+    for name, stats in results["benchmarks"].items():
+        baselineStats = baseline["benchmarks"].get(name)
+        if baselineStats is None:
+            continue
+        change = stats["median"] / baselineStats["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = " REGRESSION"
+        print("{:<26} {:>10.2f}ms {:>10.2f}ms {:>+7.1%}{}".format(
+            name, baselineStats["median"] * 1000, stats["median"] * 1000,
+            change, flag))
+    return regressions
+
+
+def parseArgs():
     parser = argparse.ArgumentParser(
-        description="GA4GH reference server benchmark")
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument(
-        'variantSetId',
-        help="The variant set ID to run the query against")
+        "benchmarks", nargs="*", metavar="BENCHMARK",
+        help="The benchmarks to run, among {} (default: all)".format(
+            ", ".join(BenchmarkSuite.getBenchmarkNames())))
     parser.add_argument(
-        '--profile', default='none',
-        choices=['none', 'heap', 'cpu'],
-        help='"heap" runs a heap profiler once inside the backend, '
-             '"cpu" runs a cpu profiler.')
+        "--dataDirectory", default=None,
+        help="The directory of the synthetic repository, reused if it "
+             "has been built already (default: a temporary directory)")
     parser.add_argument(
-        '--repeatLimit', type=int, default=3, metavar='N',
-        help='how many times to run each test case (default: %(default)s)')
+        "--numPatients", type=int, default=1000,
+        help="The number of patients (default: %(default)s)")
     parser.add_argument(
-        '--pageLimit', type=int, default=3, metavar='N',
-        help='how many pages (max) to load '
-             'from each test case (default: %(default)s)')
+        "--numVariantSets", type=int, default=10,
+        help="The number of per-patient VCFs (default: %(default)s)")
     parser.add_argument(
-        "--callSetIds", "-c", default=[],
-        help="""Return variant calls which belong to call sets
-            with these IDs. Pass in IDs as a comma separated list (no spaces),
-            or '*' (with the single quotes!) to indicate 'all call sets'.
-            Omit this option to indicate 'no call sets'.
-            """)
-
+        "--numVariants", type=int, default=10000,
+        help="The number of variants of each VCF (default: %(default)s)")
+    parser.add_argument(
+        "--numReadGroupSets", type=int, default=2,
+        help="The number of per-patient BAMs (default: %(default)s)")
+    parser.add_argument(
+        "--numReads", type=int, default=10000,
+        help="The number of reads of each BAM (default: %(default)s)")
+    parser.add_argument(
+        "--numGenes", type=int, default=1000,
+        help="The number of genes of the GFF3 DB and of the RNA "
+             "quantifications (default: %(default)s)")
+    parser.add_argument(
+        "--numRnaQuantifications", type=int, default=10,
+        help="The number of per-patient RNA quantifications "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="The seed of the synthetic data (default: %(default)s)")
+    parser.add_argument(
+        "--rounds", type=int, default=5,
+        help="The number of timed runs of each benchmark "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--warmup", type=int, default=1,
+        help="The number of untimed runs of each benchmark before the "
+             "timed ones (default: %(default)s)")
+    parser.add_argument(
+        "--pageSize", type=int, default=100,
+        help="The page size of the searches (default: %(default)s)")
+    parser.add_argument(
+        "--cpuProfile", action="store_true",
+        help="Record a cProfile profile of each benchmark")
+    parser.add_argument(
+        "--memoryProfile", action="store_true",
+        help="Record the memory allocations of each benchmark")
+    parser.add_argument(
+        "--resultsDirectory", default="benchmark-results",
+        help="The directory the results and profiles are written to "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--compare", default=None, metavar="RESULTS_FILE",
+        help="A previous results file to compare the timings against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="The relative slowdown of the median time reported as a "
+             "regression (default: %(default)s)")
     args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BenchmarkSuite.getBenchmarkNames())
+    if unknown:
+        parser.error("unknown benchmarks: {}".format(", ".join(sorted(unknown))))
+    return args
+
+
+def main():
+    args = parseArgs()
+    parameters = {
+        "numPatients": args.numPatients,
+        "numVariantSets": args.numVariantSets,
+        "numVariants": args.numVariants,
+        "numReadGroupSets": args.numReadGroupSets,
+        "numReads": args.numReads,
+        "numGenes": args.numGenes,
+        "numRnaQuantifications": args.numRnaQuantifications,
+        "seed": args.seed,
+        "pageSize": args.pageSize,
+    }
+    dataDirectory = args.dataDirectory
+    if dataDirectory is None:
+        dataDirectory = tempfile.mkdtemp(prefix="candig-benchmark-")
+    repoParameters = dict(parameters)
+    del repoParameters["pageSize"]
+    repository = SyntheticRepository(dataDirectory, **repoParameters)
+    try:
+        if repository.exists():
+            print("using the repository at '{}'".format(
+                repository.getRegistryPath()))
+        else:
+            print("building the repository at '{}'".format(
+                repository.getRegistryPath()))
+            startTime = time.perf_counter()
+            with _quiet():
+                repository.build()
+            print("built in {:.1f}s".format(time.perf_counter() - startTime))
+
+        client = ServerClient(repository.getRegistryPath())
+        with _quiet():
+            client.start()
+        suite = BenchmarkSuite(repository, client, args.pageSize)
+        runName = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        profileDirectory = os.path.join(args.resultsDirectory, runName)
+        results = {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "commit": _getCommit(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "parameters": parameters,
+            "benchmarks": {},
+            "failures": {},
+        }
+        for name in args.benchmarks or suite.getBenchmarkNames():
+            function = suite.getBenchmark(name)
+            # A failing benchmark is reported, and the others still run
+            try:
+                with _quiet():
+                    stats = runBenchmark(function, args.rounds, args.warmup)
+                    if args.cpuProfile:
+                        os.makedirs(profileDirectory, exist_ok=True)
+                        stats["cpuProfile"] = profileCpu(
+                            function,
+                            os.path.join(profileDirectory, name + ".prof"))
+                    if args.memoryProfile:
+                        stats["memoryProfile"] = profileMemory(function)
+            except Exception as exc:
+                results["failures"][name] = str(exc)
+                print("{:<26} failed: {}".format(name, exc))
+                continue
+            results["benchmarks"][name] = stats
+            print("{:<26} median {:>10.2f}ms  min {:>10.2f}ms{}".format(
+                name, stats["median"] * 1000, stats["min"] * 1000,
+                "  peak {:.1f}MB".format(
+                    stats["memoryProfile"]["peak"] / 2 ** 20)
+                if args.memoryProfile else ""))
+
+        os.makedirs(args.resultsDirectory, exist_ok=True)
+        resultsPath = os.path.join(
+            args.resultsDirectory, "{}.json".format(runName))
+        with open(resultsPath, "w") as resultsFile:
+            json.dump(results, resultsFile, indent=2)
+        print("results written to '{}'".format(resultsPath))
+
+        if args.compare is not None:
+            with open(args.compare) as baselineFile:
+                baseline = json.load(baselineFile)
+            if compareResults(results, baseline, args.threshold):
+                sys.exit(1)
+        if results["failures"]:
+            sys.exit(1)
+    finally:
+        if args.dataDirectory is None:
+            shutil.rmtree(dataDirectory)
+
 
-    registryDb = "candig-example-data/registry.db"
-
-    if args.profile == 'heap':
-        backendClass = HeapProfilerBackend
-        backend = backendClass(registryDb)
-        args.repeatLimit = 1
-        args.pageLimit = 1
-    elif args.profile == 'cpu':
-        backendClass = CpuProfilerBackend
-        backend = backendClass(registryDb)
-    else:
-        repo = datarepo.SqlDataRepository(registryDb)
-        repo.open(datarepo.MODE_READ)
-        backend = backend.Backend(repo)
-    # Get our list of callSetids
-    callSetIds = args.callSetIds
-    if callSetIds != []:
-        callSetIds = None
-        if args.callSetIds != "*":
-            callSetIds = args.callSetIds.split(",")
-
-    minTime = benchmarkOneQuery(
-        _heavyQuery(args.variantSetId, callSetIds), args.repeatLimit,
-        args.pageLimit)
-    print(minTime)
-
-    if args.profile == 'cpu':
-        stats = pstats.Stats(backend.profiler)
-        stats.sort_stats('time')
-        stats.print_stats(.25)
+if __name__ == "__main__":
+    main()
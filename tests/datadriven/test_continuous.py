@@ -66,6 +66,36 @@ class TestContinuous(unittest.TestCase):
         self.assertEqual(tuples[9], (49306084, 17.5))
         self.assertEqual(len(tuples), 10)
 
+    def testReadBigWigResolution(self):
+        continuousObj = continuous.BigWigDataSource(self._bigWigFile)
+        generator = continuousObj.bigWigToProtocol(
+            "chr19", 49305000, 49306000, resolution=100)
+        objs = list(generator)
+        self.assertEqual(
+            [(obj.start, len(obj.values)) for obj in objs],
+            [(49305400, 1), (49305600, 1), (49305900, 1)])
+        self.assertEqual(objs[2].values[0], 20.0)
+        # a query that is not a multiple of the resolution ends with a
+        # shorter bin
+        generator = continuousObj.bigWigToProtocol(
+            "chr19", 49305850, 49305903, resolution=50)
+        objs = list(generator)
+        self.assertEqual(objs[0].start, 49305900)
+        self.assertEqual(list(objs[0].values), [20.0])
+
+    def testReadBigWigLongRuns(self):
+        continuousObj = continuous.BigWigDataSource(self._bigWigFile)
+        continuousObj._MAX_VALUES = 3
+        continuousObj._INCREMENT = 2
+        generator = continuousObj.bigWigToProtocol("chr19", 49305897, 49306090)
+        objs = list(generator)
+        self.assertEqual(
+            [(obj.start, len(obj.values)) for obj in objs],
+            [(49305900, 3), (49305903, 2), (49306080, 3), (49306083, 2)])
+        self.assertEqual(self.getTuples(objs), self.getTuples(
+            continuous.BigWigDataSource(self._bigWigFile).bigWigToProtocol(
+                "chr19", 49305897, 49306090)))
+
     def testReadBigWigAllNan(self):
         continuousObj = continuous.BigWigDataSource(self._bigWigFile)
         generator = continuousObj.bigWigToProtocol("chr19", 49305927, 49305997)
@@ -2,7 +2,11 @@
 Data-driven tests for g2p.
 """
 
+import glob
 import os
+import shutil
+import tempfile
+
 import rdflib
 
 import candig.server.datamodel.genotype_phenotype as genotype_phenotype
@@ -267,3 +271,60 @@ class PhenotypeAssociationSetTest(datadriven.DataDrivenTest):
         self.assertEqual(len(fpa_dict['featureIds']), 1)
         self.assertEqual(len(fpa_dict['evidence']), 1)
         self.assertEqual(len(fpa_dict['environmentalContexts']), 1)
+
+    def testCompiledAssociations(self):
+        tempDir = tempfile.mkdtemp(prefix="candig_g2p_test")
+        try:
+            for filename in glob.glob(os.path.join(self._dataPath, '*.ttl')):
+                shutil.copy(filename, tempDir)
+            rdfSet = genotype_phenotype.RdfPhenotypeAssociationSet(
+                self._dataset, self._localId, tempDir)
+            self.assertIsNone(rdfSet._associationDb)
+            rdfSet.compile()
+            self.assertTrue(os.path.exists(
+                genotype_phenotype.getAssociationDbPath(tempDir)))
+            compiledSet = genotype_phenotype.RdfPhenotypeAssociationSet(
+                self._dataset, self._localId, tempDir)
+            self.assertIsNotNone(compiledSet._associationDb)
+            rdfSet._associationDb = None
+            # The saved graph is only opened when needed
+            self.assertIsNone(compiledSet._graph)
+            self.assertEqual(
+                set(compiledSet._rdfGraph.triples((None, None, None))),
+                set(rdfSet._rdfGraph.triples((None, None, None))))
+            self.assertEqual(
+                list(compiledSet._rdfGraph.namespaces()),
+                list(rdfSet._rdfGraph.namespaces()))
+            self.assertEqual(compiledSet._version, rdfSet._version)
+
+            requests = [None]
+            request = protocol.SearchPhenotypesRequest()
+            request.description = "sensitivity"
+            requests.append(request)
+            request = protocol.SearchPhenotypesRequest()
+            request.id = 'http://ohsu.edu/cgd/30ebfd1a'
+            requests.append(request)
+            request = protocol.SearchPhenotypesRequest()
+            request.qualifiers.add().term_id = \
+                'http://ohsu.edu/cgd/sensitivity'
+            requests.append(request)
+            request = protocol.SearchGenotypePhenotypeRequest()
+            request.evidence.add().description = "sunitinib"
+            requests.append(request)
+            request = protocol.SearchGenotypePhenotypeRequest()
+            request.phenotype_ids.extend([
+                'http://ohsu.edu/cgd/30ebfd1a',
+                'http://ohsu.edu/cgd/87752f6c'])
+            requests.append(request)
+            for request in requests:
+                expected = [
+                    protocol.toJson(association)
+                    for association in rdfSet.getAssociations(request)]
+                self.assertGreater(len(expected), 0)
+                self.assertEqual(
+                    [protocol.toJson(association)
+                     for association in compiledSet.getAssociations(
+                         request)],
+                    expected)
+        finally:
+            shutil.rmtree(tempDir)
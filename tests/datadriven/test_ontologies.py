@@ -2,7 +2,9 @@
 Data-driven tests for ontologies.
 """
 
-import os.path
+import os
+import shutil
+import tempfile
 
 # TODO it may be a bit circular to use obo_parser as our method of
 # accessing ontology information, since this is the method we use
@@ -55,3 +57,89 @@ class OntologyTest(datadriven.DataDrivenTest):
     def testBadMappings(self):
         for badName in ["Not a term", None, 1234]:
             self.assertEqual(0, len(self._gaObject.getTermIds(badName)))
+
+    def testTermNames(self):
+        for term in self._oboReader:
+            self.assertEqual(self._gaObject.getTermName(term.id), term.name)
+        self.assertIsNone(self._gaObject.getTermName("Not an id"))
+
+    def testDescendants(self):
+        dag = obo_parser.GODag(self._gaObject.getDataUrl())
+        termIds = [term.id for term in self._oboReader]
+        for termId in termIds:
+            expected = dag[termId].get_all_children() | set([termId])
+            self.assertEqual(
+                set(self._gaObject.getDescendantIds(termId)), expected)
+            for otherId in termIds[::10]:
+                self.assertEqual(
+                    self._gaObject.isDescendant(otherId, termId),
+                    otherId in expected)
+        self.assertFalse(self._gaObject.isDescendant(termIds[0], "Not an id"))
+        self.assertFalse(self._gaObject.isDescendant("Not an id", termIds[0]))
+        self.assertEqual(self._gaObject.getDescendantIds("Not an id"), [])
+
+    def testCompiled(self):
+        class OntologyRecord(object):
+            id = "ontologyId"
+            dataurl = None
+
+        tempDir = tempfile.mkdtemp(prefix="candig_ontology_test")
+        try:
+            record = OntologyRecord()
+            record.dataurl = os.path.join(tempDir, "ontology.obo")
+            shutil.copyfile(self._gaObject.getDataUrl(), record.dataurl)
+            ontology = ontologies.Ontology(self._gaObject.getName())
+            ontology.populateFromFile(record.dataurl)
+            compiledPath = ontologies.getCompiledOntologyPath(record.dataurl)
+            self.assertTrue(os.path.exists(compiledPath))
+
+            # A touched but unchanged file still matches its compiled form
+            os.utime(record.dataurl, (0, 0))
+            loaded = ontologies.Ontology(self._gaObject.getName())
+            loaded._dataUrl = record.dataurl
+            self.assertTrue(loaded._readCompiled())
+            loaded.populateFromRow(record)
+            self.assertEqual(
+                loaded.getOntologyPrefix(),
+                self._gaObject.getOntologyPrefix())
+            for term in self._oboReader:
+                self.assertEqual(
+                    loaded.getTermIds(term.name),
+                    self._gaObject.getTermIds(term.name))
+                self.assertEqual(
+                    loaded.getDescendantIds(term.id),
+                    self._gaObject.getDescendantIds(term.id))
+
+            # A changed file is parsed again and compiled
+            with open(record.dataurl, "a") as oboFile:
+                oboFile.write("\n")
+            loaded = ontologies.Ontology(self._gaObject.getName())
+            loaded._dataUrl = record.dataurl
+            self.assertFalse(loaded._readCompiled())
+            loaded.populateFromRow(record)
+            reloaded = ontologies.Ontology(self._gaObject.getName())
+            reloaded._dataUrl = record.dataurl
+            self.assertTrue(reloaded._readCompiled())
+        finally:
+            shutil.rmtree(tempDir)
+
+    def testCompileFailure(self):
+        tempDir = tempfile.mkdtemp(prefix="candig_ontology_test")
+        try:
+            dataUrl = os.path.join(tempDir, "ontology.obo")
+            shutil.copyfile(self._gaObject.getDataUrl(), dataUrl)
+            # The compiled file cannot be written over a directory
+            os.mkdir(ontologies.getCompiledOntologyPath(dataUrl))
+            ontology = ontologies.Ontology(self._gaObject.getName())
+            ontology.populateFromFile(dataUrl)
+            self.assertEqual(
+                ontology.getOntologyPrefix(),
+                self._gaObject.getOntologyPrefix())
+            self.assertFalse(ontology._readCompiled())
+            # and its temporary file is removed
+            self.assertEqual(
+                sorted(os.listdir(tempDir)),
+                sorted(["ontology.obo", os.path.basename(
+                    ontologies.getCompiledOntologyPath(dataUrl))]))
+        finally:
+            shutil.rmtree(tempDir)
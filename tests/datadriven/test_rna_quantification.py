@@ -176,6 +176,24 @@ class RnaQuantificationTest(datadriven.DataDrivenTest):
             _expressionTestData["num_expression_entries"],
             len(expressionLevels))
 
+    def testSearchExpressionMatrix(self):
+        rnaQuantification = self._gaObject.getRnaQuantificationByIndex(0)
+        names, samples, values = self._gaObject.getExpressionMatrix()
+        self.assertEqual(samples, [rnaQuantification.getLocalId()])
+        expressionLevels = rnaQuantification.getExpressionLevels()
+        self.assertEqual(
+            sorted(names),
+            sorted(level.getName() for level in expressionLevels))
+        for level in expressionLevels:
+            self.assertAlmostEqual(
+                values[names.index(level.getName()), 0],
+                level.toProtocolElement().expression, ndigits=4)
+        names, samples, values = self._gaObject.getExpressionMatrix(
+            threshold=100.0)
+        self.assertEqual(
+            _expressionTestData["num_entries_over_threshold"], len(names))
+        self.assertEqual(values.shape, (len(names), 1))
+
     def testLoadRsemData(self):
         """
         Test ingest of rsem data.
@@ -190,5 +208,21 @@ class RnaQuantificationTest(datadriven.DataDrivenTest):
         rnaQuantId = "rqsId"
         rnaseq2ga.rnaseq2ga(testTsvFile, dbName, rnaQuantId,
                             'rsem', featureType="gene")
+        self.assertTrue(
+            rna_quantification.ExpressionMatrix.exists(dbName))
+        rnaseq2ga.rnaseq2ga(testTsvFile, dbName, "rqsId2",
+                            'rsem', featureType="gene")
+        matrix = rna_quantification.ExpressionMatrix(dbName)
+        self.assertEqual(matrix.getSamples(), [rnaQuantId, "rqsId2"])
+        names, samples, values = matrix.getSubMatrix(
+            names=[_expressionTestData["name"], "unknown"],
+            samples=["rqsId2"])
+        self.assertEqual(names, [_expressionTestData["name"]])
+        self.assertEqual(samples, ["rqsId2"])
+        self.assertAlmostEqual(
+            values[0, 0], _expressionTestData["expression"], ndigits=4)
+        names, samples, values = matrix.getSubMatrix(threshold=100.0)
+        self.assertEqual(names, ["ENSG00000076984.14"])
+        self.assertEqual(values.shape, (1, 2))
 
         shutil.rmtree(tempDir)
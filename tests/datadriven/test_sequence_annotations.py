@@ -178,6 +178,37 @@ class FeatureSetTests(datadriven.DataDrivenTest):
         self.assertEqual(len(features),
                          self._testData["featuresWithOntology"])
 
+    def testFetchFeaturesRestrictedByOntologyDescendants(self):
+        allFeatures = list(self._gaObject.getFeatures(
+            self._testData["referenceName"],
+            self._testData["region"][0],
+            self._testData["region"][1],
+            None, 1000))
+        for featureType in ["transcript", "region"]:
+            descendantIds = set()
+            for termId in self._ontology.getTermIds(featureType):
+                descendantIds.update(self._ontology.getDescendantIds(termId))
+            expected = [
+                feature.id for feature in allFeatures
+                if feature.feature_type.term_id in descendantIds]
+            features = self._gaObject.getFeatures(
+                self._testData["referenceName"],
+                self._testData["region"][0],
+                self._testData["region"][1],
+                None, 1000,
+                featureTypes=[featureType], includeDescendants=True)
+            self.assertEqual(
+                [feature.id for feature in features], expected)
+        features = list(self._gaObject.getFeatures(
+            self._testData["referenceName"],
+            self._testData["region"][0],
+            self._testData["region"][1],
+            None, 1000,
+            featureTypes=self._testData["ontologyRestriction"],
+            includeDescendants=True))
+        self.assertGreaterEqual(
+            len(features), self._testData["featuresWithOntology"])
+
     def testFetchFeaturesRestrictedByParent(self):
         parentId = ""
         if self._testData["sampleParentId"] is not None:
@@ -0,0 +1,82 @@
+"""
+Unit tests for the access list reader.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import candig.server.auth.access_list as access_list
+import candig.server.exceptions as exceptions
+
+
+class TestAccessList(unittest.TestCase):
+
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp()
+        self.filePath = os.path.join(self.tempDir, "access_list.txt")
+        self.issuer = "https://candigauth.bcgsc.ca/auth/realms/candig"
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def _write(self, rows, mtime=None):
+        with open(self.filePath, "w") as accessFile:
+            for row in rows:
+                accessFile.write("\t".join(row) + "\n")
+        if mtime is not None:
+            os.utime(self.filePath, (mtime, mtime))
+
+    def testParse(self):
+        self._write([
+            ["issuer", "username", "project1", "project2", "project3"],
+            [],
+            [self.issuer, "userA", "4", "X", ""],
+            [self.issuer, "userB", "0", " ", "2"],
+            [self.issuer, "userC", "1"]])
+        accessMap = access_list.parseAccessList(self.filePath)
+        self.assertEqual(accessMap, {
+            (self.issuer, "userA"): {"project1": 4},
+            (self.issuer, "userB"): {"project1": 0, "project3": 2},
+            (self.issuer, "userC"): {"project1": 1}})
+
+    def testInvalidLevel(self):
+        self._write([
+            ["issuer", "username", "project1"],
+            [self.issuer, "userA", "5"]])
+        with self.assertRaises(exceptions.InvalidAccessListException):
+            access_list.parseAccessList(self.filePath)
+        userAccessMap = access_list.UserAccessMap(self.filePath)
+        with self.assertRaises(exceptions.InvalidAccessListException):
+            userAccessMap.load()
+        self.assertEqual(userAccessMap.getUserAccessMap(self.issuer, "userA"), {})
+
+    def testReload(self):
+        self._write([
+            ["issuer", "username", "project1"],
+            [self.issuer, "userA", "4"]], mtime=1000)
+        userAccessMap = access_list.UserAccessMap(
+            self.filePath, pollInterval=0).load()
+        self.assertEqual(
+            userAccessMap.getUserAccessMap(self.issuer, "userA"),
+            {"project1": 4})
+        self.assertEqual(userAccessMap.getUserAccessMap(self.issuer, "userB"), {})
+        self.assertFalse(userAccessMap.reloadIfUpdated())
+
+        self._write([
+            ["issuer", "username", "project1"],
+            [self.issuer, "userB", "3"]], mtime=2000)
+        self.assertTrue(userAccessMap.reloadIfUpdated())
+        self.assertEqual(userAccessMap.getUserAccessMap(self.issuer, "userA"), {})
+        self.assertEqual(
+            userAccessMap.getUserAccessMap(self.issuer, "userB"),
+            {"project1": 3})
+
+        # Duplicated users disable all access
+        self._write([
+            ["issuer", "username", "project1"],
+            [self.issuer, "userB", "3"],
+            [self.issuer, "userB", "4"]], mtime=3000)
+        self.assertTrue(userAccessMap.reloadIfUpdated())
+        self.assertEqual(userAccessMap.getUserAccessMap(self.issuer, "userB"), {})
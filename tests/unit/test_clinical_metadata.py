@@ -2,11 +2,20 @@
 Tests the clinical meta data models
 """
 
+import json
+import sys
+import types
 import unittest
 
+import candig.server.backend as backend
+import candig.server.datamodel as datamodel
 import candig.server.datamodel.datasets as datasets
+import candig.server.datarepo as datarepo
 import candig.server.exceptions as exceptions
+import candig.server.paging as paging
+import candig.server.response_builder as response_builder
 import candig.server.datamodel.clinical_metadata as clinMetadata
+import candig.server.datamodel.metadata_schema as metadata_schema
 
 import candig.schemas.protocol as protocol
 
@@ -786,6 +795,20 @@ class TestLabtest(unittest.TestCase):
         self.assertEqual(gaLabtest.collectionDate, validLabtest.collectionDate)
         self.assertEqual(gaLabtest.recordingDateTier, validLabtest.recordingDateTier)
 
+        # A field without a tier hides the fields projected after it
+        row = types.SimpleNamespace(
+            created="", updated="", name="test", description=None,
+            attributes=None)
+        for field in metadata_schema.CLINICAL_TABLES["Labtest"]:
+            setattr(row, field, "n/a")
+            setattr(row, metadata_schema.getTierField(field), 0)
+        row.endDateTier = None
+        labtest = clinMetadata.Labtest(dataset, "test").populateFromRow(row)
+        gaLabtest = labtest.toProtocolElement()
+        self.assertEqual(gaLabtest.startDate, "n/a")
+        self.assertEqual(gaLabtest.endDate, "")
+        self.assertEqual(gaLabtest.collectionDate, "")
+
         # Invalid input
         invalidLabtest = '{"bad:", "json"}'
         labtest = clinMetadata.Labtest(dataset, "test")
@@ -1191,3 +1214,251 @@ class TestCelltransplant(unittest.TestCase):
             exceptions.InvalidJsonException,
             celltransplant.populateFromJson,
             invalidCelltransplant)
+
+
+class TestSerializedProtocolElements(unittest.TestCase):
+    """
+    Test the cached serialization of clinical records
+    """
+    def setUp(self):
+        datamodel.serializedElementCache.clear()
+        dataset = datasets.Dataset('dataset1')
+        self.patients = []
+        for i in range(3):
+            validPatient = protocol.Patient(
+                name="test{}".format(i),
+                patientId="PATIENT_TEST_{}".format(i),
+                patientIdTier=0,
+                gender="Male",
+                genderTier=2)
+            patient = clinMetadata.Patient(dataset, "test{}".format(i))
+            patient.populateFromJson(protocol.toJson(validPatient))
+            self.patients.append(patient)
+
+    def testSerializedElements(self):
+        patient = self.patients[0]
+        for tier in range(5):
+            for mimetype in [None, "application/json"]:
+                expected = patient.toProtocolElement(tier)
+                if mimetype is None:
+                    expected = expected.SerializeToString()
+                else:
+                    expected = protocol.toJson(expected)
+                for _ in range(2):
+                    self.assertEqual(
+                        patient.toSerializedProtocolElement(tier, mimetype),
+                        expected)
+        self.assertIn(
+            '"gender"', patient.toSerializedProtocolElement(2, "application/json"))
+        self.assertNotIn(
+            '"gender"', patient.toSerializedProtocolElement(1, "application/json"))
+        stats = datamodel.serializedElementCache.getStats()
+        self.assertEqual(stats["misses"], 10)
+        self.assertEqual(stats["hits"], 12)
+
+        datamodel.serializedElementCache.setMaxSize(0)
+        try:
+            self.assertEqual(datamodel.serializedElementCache.getStats()["size"], 0)
+            patient.toSerializedProtocolElement(0)
+            self.assertEqual(datamodel.serializedElementCache.getStats()["elements"], 0)
+        finally:
+            datamodel.serializedElementCache.setMaxSize(64 * 1024 * 1024)
+
+    def testCacheDoesNotKeepRecords(self):
+        patient = self.patients[0]
+        refCount = sys.getrefcount(patient)
+        patient.toSerializedProtocolElement(0, "application/json")
+        self.assertEqual(sys.getrefcount(patient), refCount)
+        # A record loaded again under the same ID shares its entries
+        reloaded = clinMetadata.Patient(patient.getParentContainer(), "test0")
+        reloaded.populateFromJson(protocol.toJson(patient.toProtocolElement(0)))
+        reloaded.toSerializedProtocolElement(0, "application/json")
+        self.assertEqual(datamodel.serializedElementCache.getStats()["hits"], 1)
+
+    def testSplicedResponses(self):
+        for mimetype in ["application/json", "application/protobuf"]:
+            for nextPageToken in [None, "3"]:
+                builders = [
+                    response_builder.SearchResponseBuilder(
+                        protocol.SearchPatientsResponse, 10, 2 ** 32, mimetype)
+                    for _ in range(2)]
+                for patient in self.patients:
+                    builders[0].addValue(patient.toProtocolElement(2))
+                    builders[1].addValue(
+                        datamodel.CachedProtocolElement(patient, 2))
+                for builder in builders:
+                    builder.setNextPageToken(nextPageToken)
+                self.assertEqual(
+                    builders[0].getSerializedResponse(),
+                    builders[1].getSerializedResponse())
+
+    def testStreamedResponses(self):
+        for nextPageToken in [None, "3"]:
+            builder = response_builder.SearchResponseBuilder(
+                protocol.SearchPatientsResponse, 10, 2 ** 32)
+            for patient in self.patients:
+                builder.addValue(datamodel.CachedProtocolElement(patient, 2))
+            builder.addValue(self.patients[0].toProtocolElement(0))
+            builder.setNextPageToken(nextPageToken)
+            serializedResponse = builder.getSerializedResponse()
+            response = builder.getJsonResponse()
+            self.assertEqual(
+                "".join(response_builder.iterJson(response)),
+                serializedResponse)
+            # small chunks only split the output between records
+            response = {"status": {"Valid response": True}, "results": response}
+            chunks = list(response_builder.iterJson(response, chunkSize=1))
+            self.assertGreater(len(chunks), len(self.patients))
+            self.assertEqual(
+                json.loads("".join(chunks)),
+                {"status": {"Valid response": True},
+                 "results": json.loads(serializedResponse)})
+
+
+class TestTieredMetadataRecords(unittest.TestCase):
+    """
+    Test the records generated from the metadata schema
+    """
+    def setUp(self):
+        dataset = datasets.Dataset('dataset1')
+        validPatient = protocol.Patient(
+            name="test",
+            patientId="PATIENT_TEST",
+            patientIdTier=0,
+            gender="Male",
+            genderTier=2)
+        validPatient.attributes.attr['note'].values.add().string_value = 'n/a'
+        validPatient.attributes.attr['noteTier'].values.add().int32_value = 3
+        self.patient = clinMetadata.Patient(dataset, "test")
+        self.patient.populateFromJson(protocol.toJson(validPatient))
+
+    def testFields(self):
+        self.assertEqual(self.patient.getPatientId(), "PATIENT_TEST")
+        self.assertEqual(self.patient.getGenderTier(), 2)
+        self.assertEqual(self.patient.mapper("gender"), "Male")
+        self.assertRaises(
+            exceptions.BadFieldNameException, self.patient.mapper, "Gender")
+        self.assertRaises(
+            exceptions.BadFieldNameNoCloseMatchException,
+            self.patient.mapper, "zzzzzz")
+        fieldValues = self.patient.getFieldValues()
+        self.assertEqual(fieldValues["patientId"], "PATIENT_TEST")
+        self.assertEqual(fieldValues["patientIdTier"], 0)
+        self.assertFalse(hasattr(self.patient, "__dict__"))
+
+    def testTierProjection(self):
+        self.assertEqual(self.patient.toProtocolElement(1).gender, "")
+        self.assertEqual(self.patient.toProtocolElement(2).gender, "Male")
+        # attributes are shown from their own tier
+        self.assertNotIn('note', self.patient.toProtocolElement(2).attributes.attr)
+        self.assertIn('note', self.patient.toProtocolElement(3).attributes.attr)
+
+
+class TestSearchCursors(unittest.TestCase):
+    """
+    Test the paging of the clinical searches through cursors
+    """
+    def setUp(self):
+        paging.cursorRegistry.configure(maxSize=1024, timeToLive=600)
+        paging.cursorRegistry.clear()
+        dataset = datasets.Dataset('dataset1')
+        for i in range(10):
+            validPatient = protocol.Patient(
+                name="test{}".format(i),
+                patientId="PATIENT_TEST_{}".format(i),
+                gender="Male" if i % 3 else "Female")
+            patient = clinMetadata.Patient(dataset, "test{}".format(i))
+            patient.populateFromJson(protocol.toJson(validPatient))
+            dataset.addPatient(patient)
+        dataRepository = datarepo.EmptyDataRepository()
+        dataRepository.addDataset(dataset)
+        self.backend = backend.Backend(dataRepository)
+        self.datasetId = dataset.getId()
+        self.accessMap = {dataset.getLocalId(): 4}
+
+    def _searchPatients(self, request):
+        patientIds = []
+        pageTokens = []
+        while True:
+            response = json.loads(self.backend.runSearchPatients(
+                json.dumps(request), "application/json", self.accessMap))
+            patientIds.extend(
+                patient["patientId"] for patient in response["patients"])
+            pageToken = response.get("nextPageToken")
+            if not pageToken:
+                return patientIds, pageTokens
+            pageTokens.append(pageToken)
+            request["page_token"] = pageToken
+
+    def testPagedSearch(self):
+        request = {
+            "dataset_id": self.datasetId,
+            "filters": [
+                {"field": "gender", "operator": "==", "value": "Male"}]}
+        expected, _ = self._searchPatients(dict(request))
+        self.assertEqual(len(expected), 6)
+        hits = paging.cursorRegistry.getStats()["hits"]
+        patientIds, pageTokens = self._searchPatients(
+            dict(request, page_size=4))
+        self.assertEqual(patientIds, expected)
+        cursorId, offset = paging.parseCursorPageToken(pageTokens[0])
+        self.assertIsNotNone(cursorId)
+        self.assertEqual(offset, 4)
+        self.assertEqual(paging.cursorRegistry.getStats()["hits"], hits + 1)
+
+        # The pages of an evicted cursor are read from the recomputed list
+        paging.cursorRegistry.clear()
+        response = json.loads(self.backend.runSearchPatients(
+            json.dumps(dict(request, page_size=4, page_token=pageTokens[0])),
+            "application/json", self.accessMap))
+        self.assertEqual(
+            [patient["patientId"] for patient in response["patients"]],
+            expected[4:])
+
+        # Integer page tokens are still supported
+        response = json.loads(self.backend.runSearchPatients(
+            json.dumps(dict(request, page_size=4, page_token="5")),
+            "application/json", self.accessMap))
+        self.assertEqual(
+            [patient["patientId"] for patient in response["patients"]],
+            expected[5:])
+        with self.assertRaises(exceptions.BadPageTokenException):
+            self.backend.runSearchPatients(
+                json.dumps(dict(request, page_token="cursor:x")),
+                "application/json", self.accessMap)
+
+    def testPagedQuery(self):
+        request = {
+            "dataset_id": self.datasetId,
+            "logic": {"id": "A"},
+            "components": [{"id": "A", "patients": {"filters": [
+                {"field": "gender", "operator": "==", "value": "Female"}]}}],
+            "results": [{"table": "patients"}]}
+        response = json.loads(self.backend.runSearchQuery(
+            json.dumps(request), "application/json", self.accessMap))
+        expected = [patient["patientId"] for patient in response["patients"]]
+        self.assertEqual(len(expected), 4)
+        self.backend._defaultPageSize = 3
+        patientIds = []
+        while True:
+            response = json.loads(self.backend.runSearchQuery(
+                json.dumps(request), "application/json", self.accessMap))
+            patientIds.extend(
+                patient["patientId"] for patient in response["patients"])
+            if not response.get("nextPageToken"):
+                break
+            request["page_token"] = response["nextPageToken"]
+        self.assertEqual(patientIds, expected)
+
+    def testRegistry(self):
+        registry = paging.CursorRegistry(maxSize=2, timeToLive=600)
+        keys = [("search", str(i)) for i in range(3)]
+        cursorIds = [registry.register(key, [key]) for key in keys]
+        self.assertIsNone(registry.get(cursorIds[0], keys[0]))
+        self.assertEqual(registry.get(cursorIds[1], keys[1]), [keys[1]])
+        self.assertIsNone(registry.get(cursorIds[1], keys[2]))
+        registry.configure(timeToLive=-1)
+        self.assertIsNone(registry.get(cursorIds[2], keys[2]))
+        self.assertEqual(registry.getStats()["expired"], 1)
+        registry.configure(maxSize=0)
+        self.assertIsNone(registry.register(keys[0], []))
@@ -454,6 +454,63 @@ class TestCompoundIds(unittest.TestCase):
         self.assertEqual(cid.feature_set, "b")
         self.verifyParseFailure(idStr, datamodel.FeatureSetCompoundId)
 
+    def testIdFormatter(self):
+        # Vary the length of the parent IDs so that every alignment of
+        # the local part with the base64 quanta is exercised
+        localIds = ["0", "12", "123", "1234", 'quo"te', "¡unicode¿"]
+        for datasetName in ["a", "ab", "abc", "ab\"c", "ÀÁ"]:
+            dataset = datasets.Dataset(datasetName)
+            for featureSetName in ["f", "fs", "fset"]:
+                featureSet = sequence_annotations.AbstractFeatureSet(
+                    dataset, featureSetName)
+                formatter = datamodel.FeatureCompoundId.getIdFormatter(
+                    featureSet.getCompoundId())
+                for localId in localIds:
+                    cid = datamodel.FeatureCompoundId(
+                        featureSet.getCompoundId(), localId)
+                    self.assertEqual(formatter(localId), str(cid))
+                    parsed = datamodel.FeatureCompoundId.parse(
+                        formatter(localId))
+                    self.assertEqual(parsed.featureId, cid.featureId)
+                self.assertRaises(
+                    exceptions.BadIdentifierNotStringException,
+                    formatter, 1)
+
+    def testChildIdFormatter(self):
+        variantSet = self.getVariantSet()
+        parentId = variantSet.getCompoundId()
+        formatter = parentId.getChildIdFormatter(datamodel.VariantCompoundId)
+        self.assertIs(
+            parentId.getChildIdFormatter(datamodel.VariantCompoundId),
+            formatter)
+        for localIds in [("chr1", "0", "md5"), ('"', "ÀÁ", "")]:
+            cid = datamodel.VariantCompoundId(parentId, *localIds)
+            self.assertEqual(formatter(*localIds), str(cid))
+        self.assertRaises(ValueError, formatter, "chr1", "0")
+        self.assertEqual(
+            variantSet.getCallSetId("sample"),
+            str(datamodel.CallSetCompoundId(parentId, "sample")))
+
+    def testParseMemoized(self):
+        variantSet = self.getVariantSet()
+        callSetId = variantSet.getCallSetId("sample")
+        cid = datamodel.CallSetCompoundId.parse(callSetId)
+        self.assertIs(datamodel.CallSetCompoundId.parse(callSetId), cid)
+        self.assertEqual(str(cid), callSetId)
+        self.assertEqual(cid.name, "sample")
+        self.assertRaises(
+            exceptions.ObjectWithIdNotFoundException,
+            datamodel.VariantCompoundId.parse, callSetId)
+
+    def testIdFormatterBadParent(self):
+        dataset = datasets.Dataset("a")
+        self.assertRaises(
+            ValueError, datamodel.FeatureCompoundId.getIdFormatter,
+            dataset.getCompoundId())
+        self.assertRaises(
+            ValueError, datamodel.VariantSetCompoundId.getIdFormatter,
+            dataset.getCompoundId())
+
     def testContinuousSet(self):
         continuousSet = self.getContinuousSet()
         dataset = continuousSet.getParentContainer()
@@ -0,0 +1,182 @@
+"""
+Unit tests for the federation of search requests and the compression of
+the responses.
+"""
+
+import concurrent.futures
+import gzip
+import json
+import unittest
+import unittest.mock as mock
+
+import candig.server.compression as compression
+import candig.server.frontend as frontend
+import candig.server.network as network
+import candig.schemas.protocol as protocol
+
+
+class FakePeer(object):
+
+    url = "http://peer.example.com"
+
+    def __init__(self, searchFormats=("application/protobuf",)):
+        self.searchFormats = searchFormats
+
+    def isHealthy(self):
+        return True
+
+    def acceptsSearchFormat(self, mimetype):
+        return mimetype in self.searchFormats
+
+    def getUrl(self):
+        return self.url
+
+
+class FakePeerResponse(object):
+
+    def __init__(self, response):
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content = response.data
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class TestFederation(unittest.TestCase):
+    """
+    Federates the requests to a peer that is the server itself.
+    """
+    @classmethod
+    def setUpClass(cls):
+        config = {
+            "DATA_SOURCE": "simulated://",
+            "SIMULATED_BACKEND_RANDOM_SEED": 1111,
+            "SIMULATED_BACKEND_NUM_CALLS": 1,
+            "SIMULATED_BACKEND_VARIANT_DENSITY": 1.0,
+            "SIMULATED_BACKEND_NUM_VARIANT_SETS": 1,
+        }
+        frontend.reset()
+        frontend.configure(
+            baseConfig="TestConfig", extraConfig=config)
+        cls.app = frontend.app.test_client()
+        repo = frontend.app.backend.getDataRepository()
+        cls.datasetId = repo.getDatasets()[0].getId()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app = None
+
+    def setUp(self):
+        self.peerHeaders = []
+        self.peer = FakePeer()
+        patches = [
+            mock.patch.object(
+                frontend.app.peerManager, "getPeers", lambda: [self.peer]),
+            mock.patch.object(
+                frontend.app.serverStatus, "getPeers", lambda: [FakePeer()]),
+            mock.patch.object(
+                frontend.FederationResponse, "async_requests",
+                self._asyncRequests),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _asyncRequests(self, uriList, requestType, headerList):
+        futures = []
+        for uri, header in zip(uriList, headerList):
+            self.peerHeaders.append(header)
+            response = self.app.post(
+                uri.replace(FakePeer.url, ""),
+                headers={k: v for k, v in header.items() if v is not None},
+                data=json.dumps({"datasetId": self.datasetId}))
+            future = concurrent.futures.Future()
+            future.set_result(FakePeerResponse(response))
+            futures.append(future)
+        return futures
+
+    def _search(self, headers):
+        headers = dict({'Content-type': 'application/json'}, **headers)
+        return self.app.post(
+            "/variantsets/search", headers=headers,
+            data=json.dumps({"datasetId": self.datasetId}))
+
+    def testJsonResponse(self):
+        local = json.loads(self._search(
+            {'Accept': 'application/json', 'Federation': 'False'}).data)
+        response = json.loads(self._search({'Accept': 'application/json'}).data)
+        self.assertEqual(self.peerHeaders[0]['Accept'], 'application/protobuf')
+        variantSets = local['results']['variantSets']
+        self.assertEqual(
+            response['results']['variantSets'], variantSets + variantSets)
+        self.assertEqual(response['results']['total'], 2 * len(variantSets))
+        self.assertTrue(response['status']['Valid response'])
+
+    def testJsonPeer(self):
+        # Peers that don't advertise protobuf are asked for JSON
+        self.peer = FakePeer(searchFormats=())
+        local = json.loads(self._search(
+            {'Accept': 'application/json', 'Federation': 'False'}).data)
+        response = json.loads(self._search({'Accept': 'application/json'}).data)
+        self.assertEqual(self.peerHeaders[0]['Accept'], 'application/json')
+        variantSets = local['results']['variantSets']
+        self.assertEqual(
+            response['results']['variantSets'], variantSets + variantSets)
+
+    def testUnexpectedMessageType(self):
+        # A peer answering with another type of message is counted as failed
+        failures = []
+        local = json.loads(self._search(
+            {'Accept': 'application/json', 'Federation': 'False'}).data)
+        with mock.patch.object(
+                frontend, "_getProtocolClass",
+                lambda contentType: protocol.SearchCallSetsResponse), \
+                mock.patch.object(
+                    frontend.app.peerManager, "recordFailure", failures.append):
+            response = json.loads(
+                self._search({'Accept': 'application/json'}).data)
+        self.assertEqual(failures, [FakePeer.url])
+        self.assertEqual(
+            response['results']['variantSets'],
+            local['results']['variantSets'])
+        self.assertEqual(response['status']['Successful communications'], 1)
+        self.assertFalse(response['status']['Valid response'])
+
+    def testSearchFormatsAdvertised(self):
+        response = self.app.get("/info")
+        self.assertEqual(
+            response.headers[network.SEARCH_FORMATS_HEADER],
+            'application/protobuf')
+
+    def testProtobufResponse(self):
+        response = self._search({'Accept': 'application/protobuf'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            frontend._getProtocolClass(response.headers['Content-Type']),
+            protocol.SearchVariantSetsResponse)
+        searchResponse = protocol.fromProtobufString(
+            response.data, protocol.SearchVariantSetsResponse)
+        self.assertEqual(len(searchResponse.variant_sets), 2)
+
+    def testCompressedResponse(self):
+        response = self._search(
+            {'Accept': 'application/json', 'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        uncompressed = self._search({'Accept': 'application/json'})
+        self.assertEqual(gzip.decompress(response.data), uncompressed.data)
+
+
+class TestCompression(unittest.TestCase):
+
+    def testGzip(self):
+        chunks = ["{\"values\": [", "1, " * 1000, "2]}"]
+        compressor = compression.Compressor(compression.GZIP)
+        compressed = list(compressor.iterCompress(chunks))
+        self.assertEqual(gzip.decompress(b"".join(compressed)), "".join(chunks).encode())
+        data = b"x" * 10000
+        self.assertEqual(
+            gzip.decompress(compression.Compressor(compression.GZIP).compress(data)), data)
+        with self.assertRaises(ValueError):
+            compression.Compressor("br")
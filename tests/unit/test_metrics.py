@@ -0,0 +1,143 @@
+"""
+Unit tests for the runtime metrics and the /metrics endpoint.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import candig.server.frontend as frontend
+import candig.server.metrics as metrics
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = metrics.MetricsRegistry(buckets=(0.1, 1.0))
+        self.registry.describe("requests_total", metrics.COUNTER, "Requests")
+        self.registry.describe("duration_seconds", metrics.HISTOGRAM, "Duration")
+        self.registry.describe("entries", metrics.GAUGE, "Entries")
+        self.registry.describe(
+            "load_seconds", metrics.GAUGE, "Load time", aggregate=metrics.MAX)
+        self.tempDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def _record(self):
+        self.registry.increment("requests_total", labels={"endpoint": "/a"})
+        self.registry.increment("requests_total", 2, labels={"endpoint": "/a"})
+        for value in [0.05, 0.5, 5]:
+            self.registry.observe("duration_seconds", value)
+        self.registry.setGauge("entries", 3)
+        self.registry.setGauge("load_seconds", 1.5)
+
+    def testRender(self):
+        self._record()
+        lines = self.registry.render().splitlines()
+        self.assertIn("# TYPE requests_total counter", lines)
+        self.assertIn('requests_total{endpoint="/a"} 3', lines)
+        self.assertIn("entries 3", lines)
+        index = lines.index("# TYPE duration_seconds histogram")
+        self.assertEqual(lines[index + 1:index + 6], [
+            'duration_seconds_bucket{le="0.1"} 1',
+            'duration_seconds_bucket{le="1"} 2',
+            'duration_seconds_bucket{le="+Inf"} 3',
+            'duration_seconds_sum 5.55',
+            'duration_seconds_count 3'])
+
+    def testMultiprocess(self):
+        self.registry.configure(directory=self.tempDir, syncInterval=0)
+        self._record()
+        self.registry.sync()
+        snapshot = self.registry.getSnapshot()
+        # A worker that has exited, and a live worker
+        for pid, loadTime in [(2 ** 30, 2.5), (os.getppid(), 0.5)]:
+            snapshot["pid"] = pid
+            snapshot["gauges"] = [
+                ["entries", [], 3], ["load_seconds", [], loadTime]]
+            with open(os.path.join(
+                    self.tempDir, "metrics_{}.json".format(pid)), "w") as f:
+                json.dump(snapshot, f)
+        lines = self.registry.render().splitlines()
+        self.assertIn('requests_total{endpoint="/a"} 9', lines)
+        self.assertIn('duration_seconds_count 9', lines)
+        self.assertIn("entries 6", lines)
+        self.assertIn("load_seconds 1.5", lines)
+        # The snapshot of the exited worker is folded into one file
+        fileNames = os.listdir(self.tempDir)
+        self.assertNotIn("metrics_{}.json".format(2 ** 30), fileNames)
+        self.assertIn(metrics.EXITED_SNAPSHOT_FILE, fileNames)
+        lines = self.registry.render().splitlines()
+        self.assertIn('requests_total{endpoint="/a"} 9', lines)
+        self.assertIn('duration_seconds_count 9', lines)
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config = {
+            "DATA_SOURCE": "simulated://",
+            "SIMULATED_BACKEND_RANDOM_SEED": 1111,
+            "SIMULATED_BACKEND_NUM_CALLS": 1,
+            "SIMULATED_BACKEND_VARIANT_DENSITY": 1.0,
+            "SIMULATED_BACKEND_NUM_VARIANT_SETS": 1,
+            "METRICS_ENABLED": True,
+        }
+        frontend.reset()
+        frontend.configure(
+            baseConfig="TestConfig", extraConfig=config)
+        cls.app = frontend.app.test_client()
+        repo = frontend.app.backend.getDataRepository()
+        cls.datasetId = repo.getDatasets()[0].getId()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app = None
+        frontend.app.config["METRICS_ENABLED"] = False
+
+    def testMetrics(self):
+        response = self.app.post(
+            "/variantsets/search",
+            headers={'Content-type': 'application/json',
+                     'Federation': 'False'},
+            data=json.dumps({"datasetId": self.datasetId}))
+        self.assertEqual(response.status_code, 200)
+        response = self.app.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertIn(
+            'candig_http_requests_total{endpoint="/variantsets/search",'
+            'method="POST",status="200"} 1', lines)
+        self.assertIn(
+            'candig_http_request_duration_seconds_count{endpoint='
+            '"/variantsets/search",method="POST"} 1', lines)
+        self.assertIn('candig_repository_objects{table="datasets"} 2', lines)
+        self.assertIn('candig_repository_objects{table="variantSets"} 2', lines)
+        for prefix in ["candig_repository_load_seconds ",
+                       'candig_cache_hits_total{cache="fileHandle"} ']:
+            self.assertTrue(any(line.startswith(prefix) for line in lines))
+
+    def testToken(self):
+        frontend.app.config["METRICS_TOKEN"] = "secret"
+        try:
+            self.assertEqual(self.app.get("/metrics").status_code, 401)
+            self.assertEqual(self.app.get(
+                "/metrics", headers={"Authorization": "Bearer other"}
+            ).status_code, 401)
+            self.assertEqual(self.app.get(
+                "/metrics", headers={"Authorization": "Bearer secret"}
+            ).status_code, 200)
+        finally:
+            frontend.app.config["METRICS_TOKEN"] = None
+
+    def testDisabled(self):
+        frontend.app.config["METRICS_ENABLED"] = False
+        try:
+            self.assertEqual(self.app.get("/metrics").status_code, 404)
+        finally:
+            frontend.app.config["METRICS_ENABLED"] = True
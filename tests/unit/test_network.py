@@ -0,0 +1,117 @@
+"""
+Unit tests for the peer manager.
+"""
+
+import unittest
+import unittest.mock as mock
+
+import requests
+
+import candig.server.datamodel.peers as peers
+import candig.server.network as network
+
+
+class FakeRepository(object):
+
+    def __init__(self, urls):
+        self._urls = urls
+
+    def getPeers(self):
+        return [peers.Peer(url) for url in self._urls]
+
+
+class FakeResponse(object):
+
+    def __init__(self, statusCode, body=None, headers=None):
+        self.status_code = statusCode
+        self._body = body
+        self.headers = headers or {}
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("No JSON")
+        return self._body
+
+
+class TestPeerManager(unittest.TestCase):
+
+    def setUp(self):
+        self.urls = [
+            "http://peer1.example.com/", "http://peer2.example.com/",
+            "http://peer3.example.com/"]
+        self.peerManager = network.PeerManager(
+            FakeRepository(self.urls), timeout=1, probeInterval=60)
+        # The background thread is not needed by these tests
+        self.peerManager.stop()
+
+    def _get(self, url, timeout):
+        self.assertEqual(timeout, 1)
+        if url.startswith(self.urls[0]):
+            return FakeResponse(
+                200, {"results": {"protocolVersion": "1.0.0"}},
+                {network.SEARCH_FORMATS_HEADER: "application/protobuf"})
+        elif url.startswith(self.urls[1]):
+            return FakeResponse(401)
+        raise requests.exceptions.ConnectionError()
+
+    def testProbeAll(self):
+        with mock.patch("requests.get", self._get):
+            self.peerManager.probeAll()
+        peerList = self.peerManager.getPeers()
+        self.assertEqual(
+            sorted(peer.getUrl() for peer in peerList[:2]), self.urls[:2])
+        self.assertTrue(peerList[0].isHealthy())
+        self.assertTrue(peerList[1].isHealthy())
+        self.assertFalse(peerList[2].isHealthy())
+        self.assertEqual(peerList[2].getUrl(), self.urls[2])
+        health = [
+            peer.getHealth() for peer in peerList
+            if peer.getUrl() == self.urls[0]][0]
+        self.assertEqual(health.getVersion(), "1.0.0")
+        self.assertIsNotNone(health.getRtt())
+        self.assertEqual(health.getFailures(), 0)
+        searchFormats = {
+            peer.getUrl(): peer.acceptsSearchFormat("application/protobuf")
+            for peer in peerList}
+        self.assertEqual(searchFormats, dict(zip(self.urls, [True, False, False])))
+
+    def testRecordFailure(self):
+        for peer in self.peerManager.getPeers():
+            self.assertTrue(peer.isHealthy())
+            self.assertIsNone(peer.getHealth())
+        self.peerManager.recordFailure(self.urls[0])
+        peerList = self.peerManager.getPeers()
+        self.assertEqual(peerList[-1].getUrl(), self.urls[0])
+        self.assertFalse(peerList[-1].isHealthy())
+        # A successful probe brings the peer back
+        with mock.patch("requests.get", self._get):
+            self.peerManager.probe(peerList[-1])
+        self.assertTrue(self.peerManager.getPeers()[0].isHealthy())
+
+    def testProbingDisabled(self):
+        peerManager = network.PeerManager(
+            FakeRepository(self.urls), probeInterval=0)
+        peerManager.stop()
+        peerManager.recordFailure(self.urls[0])
+        self.assertTrue(all(
+            peer.isHealthy() for peer in peerManager.getPeers()))
+
+    def testInitialize(self):
+        announced = []
+
+        def post(url, headers, json, timeout):
+            announced.append((url, json["peer"]["url"], timeout))
+            raise requests.exceptions.Timeout()
+
+        repository = mock.Mock()
+        with mock.patch("requests.post", post), mock.patch(
+                "candig.server.network.getInitialPeerList",
+                return_value=self.urls[:1]):
+            peerManager = network.initialize(
+                "initial_peers.txt", repository, timeout=2,
+                probeInterval=0)
+            peerManager._thread.join(5)
+        self.assertEqual(
+            announced,
+            [("http://peer1.example.com/announce", self.urls[0], 2)])
+        self.assertEqual(repository.insertPeer.call_count, 1)
@@ -0,0 +1,92 @@
+"""
+Unit tests for the OPA client and its decision cache.
+"""
+
+import base64
+import json
+import time
+import unittest
+import unittest.mock as mock
+
+import requests
+
+import candig.server.auth.opa as opa
+
+
+def makeToken(payload):
+    encoded = base64.urlsafe_b64encode(
+        json.dumps(payload).encode()).decode().rstrip("=")
+    return "Bearer header.{}.signature".format(encoded)
+
+
+class FakeResponse(object):
+
+    def __init__(self, body, statusCode=200):
+        self.status_code = statusCode
+        self._body = body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(str(self.status_code))
+
+    def json(self):
+        return self._body
+
+
+class TestOpaClient(unittest.TestCase):
+
+    def setUp(self):
+        self.client = opa.OpaClient(
+            "http://opa.example.com/v1/data/permissions/datasets",
+            serverToken="secret", timeout=2, cacheTtl=60)
+        self.calls = []
+
+    def _post(self, url, data, timeout):
+        self.assertEqual(timeout, 2)
+        self.calls.append(json.loads(data)["input"])
+        return FakeResponse({"result": ["dataset1", "dataset2"]})
+
+    def testParseTokenPayload(self):
+        payload = {"iss": "issuer", "preferred_username": "user"}
+        self.assertEqual(opa.parseTokenPayload(makeToken(payload)), payload)
+        self.assertEqual(opa.parseTokenPayload("Bearer"), {})
+        cache = opa.TokenPayloadCache(maxSize=1)
+        self.assertEqual(cache.get(makeToken(payload)), payload)
+        self.assertEqual(cache.get(makeToken({})), {})
+
+    def testCachedDecisions(self):
+        token = makeToken({"exp": time.time() + 600})
+        with mock.patch.object(self.client._session, "post", self._post):
+            for _ in range(3):
+                self.assertEqual(
+                    self.client.getDatasets(token, "/search"),
+                    ["dataset1", "dataset2"])
+            self.client.getDatasets(token, "/count")
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.calls[0]["body"]["path"], "/search")
+        self.assertEqual(self.calls[0]["token"], token.split(" ")[1])
+        stats = self.client.getStats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["cachedDecisions"], 2)
+        self.assertGreaterEqual(stats["opaMaxLatency"], 0)
+
+    def testExpiredToken(self):
+        # decisions for an expired token are never served from the cache
+        token = makeToken({"exp": time.time() - 1})
+        with mock.patch.object(self.client._session, "post", self._post):
+            self.client.getDatasets(token, "/search")
+            self.client.getDatasets(token, "/search")
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.client.getStats()["hits"], 0)
+
+    def testFailedRequest(self):
+        def post(url, data, timeout):
+            raise requests.exceptions.ConnectionError()
+        token = makeToken({})
+        with mock.patch.object(self.client._session, "post", post):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.client.getDatasets(token, "/search")
+        stats = self.client.getStats()
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["cachedDecisions"], 0)
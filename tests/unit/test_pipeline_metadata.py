@@ -87,7 +87,7 @@ class TestSequencing(unittest.TestCase):
             rnaLibraryKitTier = 0,
             rnaSeqPlatform = "n/a",
             rnaSeqPlatformTier = 0,
-            rnaReadLength = "n/a",
+            rnaReadLength = "150",
             rnaReadLengthTier = 0,
             pcrCycles = "n/a",
             pcrCyclesTier = 0,
@@ -112,6 +112,8 @@ class TestSequencing(unittest.TestCase):
         self.assertEqual(gaSequencing.sampleId, validSequencing.sampleId)
         self.assertEqual(gaSequencing.site, validSequencing.site)
         self.assertEqual(gaSequencing.sampleIdTier, validSequencing.sampleIdTier)
+        self.assertEqual(gaSequencing.rnaReadLength, validSequencing.rnaReadLength)
+        self.assertEqual(sequencing.getRnaReadLength(), validSequencing.rnaReadLength)
 
         # Invalid input
         invalidSequencing = '{"bad:", "json"}'
@@ -4,7 +4,9 @@ Tests for the repo manager tool
 
 import os
 import glob
+import json
 import shutil
+import sqlite3
 import tempfile
 import subprocess
 import unittest
@@ -13,6 +15,9 @@ import candig.server.exceptions as exceptions
 import candig.server.datarepo as datarepo
 import candig.server.cli.repomanager as cli_repomanager
 import candig.server.datamodel as datamodel
+import candig.server.datamodel.rna_quantification as rna_quantification
+import candig.server.datamodel.sequence_annotations as sequence_annotations
+import candig.server.sqlite_backend as sqlite_backend
 import tests.paths as paths
 
 
@@ -192,6 +197,152 @@ class TestAddRnaQuantificationSet(AbstractRepoManagerTest):
         self.assertEqual(rnaQuantificationSet.getLocalId(), name)
 
 
+class TestAddRnaQuantifications(AbstractRepoManagerTest):
+
+    def setUp(self):
+        super(TestAddRnaQuantifications, self).setUp()
+        self.init()
+        self.addDataset()
+        self._tempDir = tempfile.mkdtemp(prefix="candig_repoman_test")
+        self._rnaDbPath = os.path.join(self._tempDir, "rnaseq.db")
+        self.runCommand("init-rnaquantificationset {} {}".format(
+            self._repoPath, self._rnaDbPath))
+
+    def tearDown(self):
+        super(TestAddRnaQuantifications, self).tearDown()
+        shutil.rmtree(self._tempDir)
+
+    def writeManifest(self, rows):
+        manifestPath = os.path.join(self._tempDir, "manifest.tsv")
+        with open(manifestPath, "w") as manifestFile:
+            for row in rows:
+                manifestFile.write("\t".join(row) + "\n")
+        return manifestPath
+
+    def testBulkLoad(self):
+        quantificationPath = os.path.join(
+            paths.testDataDir, "datasets/dataset1/rnaQuant/rsem_test_data.tsv")
+        manifestPath = self.writeManifest([
+            ("name", "quantificationFilePath", "patientId", "sampleId"),
+            ("rq1", quantificationPath, "patient1", "sample1"),
+            ("rq2", quantificationPath, "patient2", "sample2")])
+        self.runCommand("add-rnaquantifications {} {} rsem {} {} -p 1".format(
+            self._rnaDbPath, manifestPath, self._repoPath,
+            self._datasetName))
+        dbConn = sqlite3.connect(self._rnaDbPath)
+        self.assertEqual(
+            dbConn.execute("SELECT COUNT(*) FROM Expression").fetchone()[0], 4)
+        self.assertEqual(
+            dbConn.execute("SELECT patientId FROM RnaQuantification "
+                           "ORDER BY rowid").fetchall(),
+            [("patient1",), ("patient2",)])
+        indices = {row[0] for row in dbConn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn("name_index", indices)
+        self.assertEqual(
+            dbConn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+        dbConn.close()
+        matrix = rna_quantification.ExpressionMatrix(self._rnaDbPath)
+        self.assertEqual(matrix.getSamples(), ["rq1", "rq2"])
+
+    def testFailedLoad(self):
+        quantificationPath = os.path.join(
+            paths.testDataDir, "datasets/dataset1/rnaQuant/rsem_test_data.tsv")
+        manifestPath = self.writeManifest([
+            ("name", "quantificationFilePath", "patientId", "sampleId"),
+            ("rq1", quantificationPath, "patient1", "sample1"),
+            ("rq2", os.path.join(self._tempDir, "missing.tsv"),
+             "patient2", "sample2")])
+        with self.assertRaises(EnvironmentError):
+            self.runCommand(
+                "add-rnaquantifications {} {} rsem {} {} -p 1".format(
+                    self._rnaDbPath, manifestPath, self._repoPath,
+                    self._datasetName))
+        dbConn = sqlite3.connect(self._rnaDbPath)
+        self.assertEqual(
+            dbConn.execute("SELECT COUNT(*) FROM Expression").fetchone()[0], 0)
+        indices = {row[0] for row in dbConn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({"name_index", "expression_index"} <= indices)
+        self.assertEqual(
+            dbConn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+        dbConn.close()
+
+    def testMissingColumns(self):
+        manifestPath = self.writeManifest([
+            ("quantificationFilePath",), ("data.tsv",)])
+        with self.assertRaises(exceptions.RepoManagerException):
+            self.runCommand("add-rnaquantifications {} {} rsem {} {}".format(
+                self._rnaDbPath, manifestPath, self._repoPath,
+                self._datasetName))
+
+
+class TestIngestMetadata(AbstractRepoManagerTest):
+
+    def setUp(self):
+        super(TestIngestMetadata, self).setUp()
+        self._tempDir = tempfile.mkdtemp(prefix="candig_repoman_test")
+
+    def tearDown(self):
+        super(TestIngestMetadata, self).tearDown()
+        shutil.rmtree(self._tempDir)
+
+    def ingest(self, path, options=""):
+        self.runCommand("ingest-metadata {} {} {} {}".format(
+            self._repoPath, "ingested", path, options))
+
+    def writeRecords(self, lines):
+        path = os.path.join(self._tempDir, "records.ndjson")
+        with open(path, "w") as recordsFile:
+            for line in lines:
+                recordsFile.write(json.dumps(line) + "\n")
+        return path
+
+    def getDataset(self):
+        repo = datarepo.SqlDataRepository(self._repoPath)
+        repo.open(datarepo.MODE_READ)
+        return repo.getDatasetByName("ingested")
+
+    def testIngest(self):
+        self.ingest(os.path.join(
+            paths.testDataDir, "sample_clin_metadata.json"), "-b 7")
+        self.ingest(os.path.join(
+            paths.testDataDir, "sample_pipe_metadata.json"))
+        dataset = self.getDataset()
+        self.assertEqual(len(dataset.getPatients()), 10)
+        self.assertEqual(len(dataset.getExtractions()), 25)
+        sample = dataset.getSampleByName("PATIENT_49845_SAMPLE_58628")
+        self.assertEqual(sample.mapper("patientId"), "PATIENT_49845")
+        dataset.getSurgeryByName(
+            "PATIENT_49845_PATIENT_49845_44159_2016-06-15_SAMPLE_58628")
+
+    def testUpsert(self):
+        path = self.writeRecords([
+            {"Patient": {"patientId": "p1", "gender": "F"}},
+            {"Patient": [{"patientId": "p2"}, {"patientId": "p3"}]}])
+        self.ingest(path)
+        created = self.getDataset().getPatientByName("p1").getCreated()
+        self.ingest(self.writeRecords([
+            {"Patient": {"patientId": "p1", "gender": "M"}}]))
+        dataset = self.getDataset()
+        self.assertEqual(len(dataset.getPatients()), 3)
+        patient = dataset.getPatientByName("p1")
+        self.assertEqual(patient.mapper("gender"), "M")
+        self.assertEqual(patient.getCreated(), created)
+
+    def testInvalidRecords(self):
+        path = self.writeRecords([
+            {"Patient": {"patientId": "p1"}},
+            {"Sample": {"patientId": "p1"}},
+            {"Unknown": {"patientId": "p1"}}])
+        with self.assertRaises(exceptions.InvalidMetadataRecordException):
+            self.ingest(path)
+        self.ingest(path, "--skipInvalid")
+        dataset = self.getDataset()
+        self.assertEqual(len(dataset.getPatients()), 1)
+        self.assertEqual(len(dataset.getSamples()), 0)
+
+
 class TestRemoveRnaQuantificationSet(AbstractRepoManagerTest):
 
     def setUp(self):
@@ -299,6 +450,43 @@ class TestRemoveFeatureSet(AbstractRepoManagerTest):
             self.getFeatureSet()
 
 
+class TestIndexFeatureSet(AbstractRepoManagerTest):
+
+    def setUp(self):
+        super(TestIndexFeatureSet, self).setUp()
+        # start from fresh, writable connections
+        sqlite_backend.connectionPool.configure()
+        self.init()
+        self.addDataset()
+        self.addOntology()
+        self.addReferenceSet()
+        self._tempDir = tempfile.mkdtemp(prefix="candig_repoman_test")
+        featuresPath = os.path.join(
+            self._tempDir, os.path.basename(paths.featuresPath))
+        shutil.copy(paths.featuresPath, featuresPath)
+        self._featureSetName = paths.featureSetName
+        cmd = (
+            "add-featureset {} {} {} --referenceSetName={} "
+            "--ontologyName={}").format(
+            self._repoPath, self._datasetName, featuresPath,
+            self._referenceSetName, self._ontologyName)
+        self.runCommand(cmd)
+
+    def tearDown(self):
+        super(TestIndexFeatureSet, self).tearDown()
+        shutil.rmtree(self._tempDir)
+
+    def testIndexFeatureSet(self):
+        featureSet = self.getFeatureSet()
+        backend = sequence_annotations.Gff3DbBackend(featureSet.getDataUrl())
+        self.assertFalse(backend.hasSpatialIndex())
+        cmd = "index-featureset {} {} {}".format(
+            self._repoPath, self._datasetName, self._featureSetName)
+        self.runCommand(cmd)
+        backend = sequence_annotations.Gff3DbBackend(featureSet.getDataUrl())
+        self.assertTrue(backend.hasSpatialIndex())
+
+
 class TestAddContinuousSet(AbstractRepoManagerTest):
 
     def setUp(self):
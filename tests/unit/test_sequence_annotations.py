@@ -4,10 +4,16 @@ This is used for all tests that can be performed in isolation
 from input data.
 """
 
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
+import candig.server.datamodel as datamodel
 import candig.server.datamodel.sequence_annotations as sequence_annotations
 import candig.server.datamodel.datasets as datasets
+import tests.paths as paths
 
 
 class TestAbstractFeatureSet(unittest.TestCase):
@@ -23,3 +29,83 @@ class TestAbstractFeatureSet(unittest.TestCase):
     def testGetFeatureIdFailsWithNullInput(self):
         self.assertEqual("",
                          self._featureSet.getCompoundIdForFeatureId(None))
+
+    def testGetFeatureId(self):
+        for featureId in [1, "2", 4394780816]:
+            compoundId = datamodel.FeatureCompoundId(
+                self._featureSet.getCompoundId(), str(featureId))
+            self.assertEqual(
+                str(compoundId),
+                self._featureSet.getCompoundIdForFeatureId(featureId))
+
+
+class TestChildIds(unittest.TestCase):
+    """
+    Tests the encodings of the child_ids column.
+    """
+    def testSplitChildIds(self):
+        childIds = [4394780880, 4394780944]
+        self.assertEqual(sequence_annotations._splitChildIds(
+            json.dumps(childIds)), childIds)
+        self.assertEqual(sequence_annotations._splitChildIds(
+            sequence_annotations.serializeChildIds(childIds)),
+            [str(childId) for childId in childIds])
+        self.assertEqual(sequence_annotations._splitChildIds("[]"), [])
+        self.assertEqual(sequence_annotations._splitChildIds(""), [])
+        self.assertEqual(sequence_annotations._splitChildIds(None), [])
+
+
+class TestGff3DbSpatialIndex(unittest.TestCase):
+    """
+    Tests that range queries answered through the R*Tree index match
+    the ones answered from the FEATURE table alone.
+    """
+    def setUp(self):
+        self._tempDir = tempfile.mkdtemp()
+        plainPath = os.path.join(self._tempDir, "plain.db")
+        indexedPath = os.path.join(self._tempDir, "indexed.db")
+        shutil.copy(paths.featuresPath, plainPath)
+        shutil.copy(paths.featuresPath, indexedPath)
+        self._numFeatures = sequence_annotations.createSpatialIndex(
+            indexedPath)
+        self._plainDb = sequence_annotations.Gff3DbBackend(plainPath)
+        self._indexedDb = sequence_annotations.Gff3DbBackend(indexedPath)
+
+    def tearDown(self):
+        shutil.rmtree(self._tempDir)
+
+    def _searchFeatures(self, db, **kwargs):
+        with db as dataSource:
+            return dataSource.searchFeaturesInDb(**kwargs)
+
+    def testHasSpatialIndex(self):
+        self.assertGreater(self._numFeatures, 0)
+        self.assertFalse(self._plainDb.hasSpatialIndex())
+        self.assertTrue(self._indexedDb.hasSpatialIndex())
+
+    def testRangeQueries(self):
+        queries = [
+            dict(referenceName="chr1", start=12000, end=30000),
+            dict(referenceName="chr1", start=0, end=2 ** 31),
+            dict(referenceName="chr1", start=810059, end=810060),
+            dict(referenceName="chrX", start=156010000, end=156020000),
+            dict(referenceName="chrX", start=0, end=100),
+            dict(referenceName="chr1", start=12000, end=30000,
+                 featureTypes=["exon"]),
+            dict(referenceName="chr1", start=12000, end=30000,
+                 startIndex=2, maxResults=5),
+            dict(referenceName="chrUn", start=0, end=2 ** 31),
+            dict(start=12000, end=30000),
+        ]
+        for query in queries:
+            plainFeatures = self._searchFeatures(self._plainDb, **query)
+            indexedFeatures = self._searchFeatures(self._indexedDb, **query)
+            self.assertEqual(plainFeatures, indexedFeatures)
+
+    def testNonRangeQuery(self):
+        plainFeatures = self._searchFeatures(
+            self._plainDb, referenceName="chrY")
+        indexedFeatures = self._searchFeatures(
+            self._indexedDb, referenceName="chrY")
+        self.assertEqual(len(plainFeatures), 16)
+        self.assertEqual(plainFeatures, indexedFeatures)
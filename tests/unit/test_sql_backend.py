@@ -2,7 +2,13 @@
 Unit tests for the sql backend
 """
 
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
 import unittest
+import unittest.mock as mock
 
 import candig.server.sqlite_backend as sqlite_backend
 import tests.paths as paths
@@ -103,3 +109,102 @@ class TestSqlBackend(unittest.TestCase):
         with self._db as db:
             rowDict = db.fetchOneMethod()
         self._testRowDict(rowDict)
+
+
+class TestSqliteConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self._tempDir = tempfile.mkdtemp()
+        self._dbFile = os.path.join(self._tempDir, "test.db")
+        dbconn = sqlite3.connect(self._dbFile)
+        dbconn.execute("CREATE TABLE Test (id INTEGER, name TEXT)")
+        dbconn.execute("INSERT INTO Test VALUES (1, 'one')")
+        dbconn.commit()
+        dbconn.close()
+        self._pool = sqlite_backend.SqliteConnectionPool()
+
+    def tearDown(self):
+        self._pool.closeAll()
+        shutil.rmtree(self._tempDir)
+
+    def testConnectionReused(self):
+        first = self._pool.getConnection(self._dbFile)
+        second = self._pool.getConnection(self._dbFile)
+        self.assertIs(first, second)
+        stats = self._pool.getStats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["openConnections"], 1)
+        self.assertEqual(stats["databases"], 1)
+
+    def testConnectionPerThread(self):
+        connections = []
+
+        def getConnection():
+            connections.append(self._pool.getConnection(self._dbFile))
+
+        thread = threading.Thread(target=getConnection)
+        thread.start()
+        thread.join()
+        mainConnection = self._pool.getConnection(self._dbFile)
+        self.assertIsNot(connections[0], mainConnection)
+        # the connection of the exited thread is released
+        self.assertEqual(self._pool.getStats()["openConnections"], 1)
+
+    def testDeadThreadConnectionsClosedOnMiss(self):
+        connections = []
+
+        def getConnection():
+            connections.append(self._pool.getConnection(self._dbFile))
+
+        for _ in range(5):
+            thread = threading.Thread(target=getConnection)
+            thread.start()
+            thread.join()
+        # Each new connection closes those of the threads that exited
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+        self.assertEqual(len(self._pool._connections), 1)
+
+    def testReadOnly(self):
+        self._pool.configure(readOnly=True)
+        dbconn = self._pool.getConnection(self._dbFile)
+        row = dbconn.execute("SELECT name FROM Test").fetchone()
+        self.assertEqual(row["name"], "one")
+        with self.assertRaises(sqlite3.OperationalError):
+            dbconn.execute("INSERT INTO Test VALUES (2, 'two')")
+
+    def testImmutable(self):
+        self._pool.configure(
+            readOnly=True, immutable=True, mmapSize=1024 * 1024)
+        dbconn = self._pool.getConnection(self._dbFile)
+        mmapSize = dbconn.execute("PRAGMA mmap_size").fetchone()[0]
+        self.assertEqual(mmapSize, 1024 * 1024)
+        self.assertEqual(
+            dbconn.execute("SELECT COUNT(*) FROM Test").fetchone()[0], 1)
+
+    def testConfigureClosesConnections(self):
+        self._pool.getConnection(self._dbFile)
+        self._pool.configure(cacheSize=-1024)
+        self.assertEqual(self._pool.getStats()["openConnections"], 0)
+        dbconn = self._pool.getConnection(self._dbFile)
+        cacheSize = dbconn.execute("PRAGMA cache_size").fetchone()[0]
+        self.assertEqual(cacheSize, -1024)
+
+    def testDataSourceBorrowsOncePerOperation(self):
+        dataSource = sqlite_backend.SqliteBackedDataSource(self._dbFile)
+        with mock.patch.object(sqlite_backend, "connectionPool", self._pool):
+            for _ in range(2):
+                with dataSource:
+                    with dataSource:
+                        dataSource._dbconn.execute("SELECT * FROM Test")
+                    dataSource._dbconn.execute("SELECT * FROM Test")
+        stats = self._pool.getStats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def testMissingFile(self):
+        self._pool.configure(readOnly=True)
+        with self.assertRaises(sqlite3.OperationalError):
+            self._pool.getConnection(
+                os.path.join(self._tempDir, "missing.db"))
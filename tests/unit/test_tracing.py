@@ -0,0 +1,101 @@
+"""
+Unit tests for the tracing of the stages of the requests.
+"""
+
+import json
+import unittest
+
+import candig.server.frontend as frontend
+import candig.server.tracing as tracing
+
+
+class TestTracing(unittest.TestCase):
+
+    def testDisabled(self):
+        self.assertIsNone(tracing.getCurrentTrace())
+        with tracing.span("stage") as span:
+            self.assertIsNone(span)
+
+        @tracing.traced("stage")
+        def stage(value):
+            return value
+        self.assertEqual(stage(1), 1)
+
+    def testSpans(self):
+        @tracing.traced("recursive")
+        def recursive(depth):
+            if depth:
+                return recursive(depth - 1)
+            with tracing.span("inner", {"depth": depth}):
+                return depth
+
+        token = tracing.startTrace("/search")
+        recursive(3)
+        trace = tracing.getCurrentTrace()
+        trace.addSpan("peer", 0, 0.002)
+        self.assertIs(tracing.endTrace(token), trace)
+        self.assertIsNone(tracing.getCurrentTrace())
+
+        root, outer, inner, peer = trace.getSpans()
+        self.assertEqual(
+            [span.name for span in trace.getSpans()],
+            ["/search", "recursive", "inner", "peer"])
+        self.assertEqual(outer.parentSpanId, root.spanId)
+        self.assertEqual(inner.parentSpanId, outer.spanId)
+        self.assertEqual(peer.parentSpanId, root.spanId)
+        self.assertEqual(peer.getDuration(), 2.0)
+
+        metrics = trace.getServerTiming().split(", ")
+        self.assertEqual(
+            [metric.split(";")[0] for metric in metrics],
+            ["recursive", "inner", "peer", "total"])
+        self.assertIn("peer;dur=2.000", metrics)
+
+        spans = trace.toJson()["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(len(spans), 4)
+        self.assertNotIn("parentSpanId", spans[0])
+        self.assertEqual(spans[2]["parentSpanId"], outer.spanId)
+        self.assertEqual(
+            spans[2]["attributes"],
+            [{"key": "depth", "value": {"stringValue": "0"}}])
+        self.assertLessEqual(
+            int(spans[1]["startTimeUnixNano"]), int(spans[2]["startTimeUnixNano"]))
+
+
+class TestRequestTracing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config = {
+            "DATA_SOURCE": "simulated://",
+            "SIMULATED_BACKEND_RANDOM_SEED": 1111,
+            "SIMULATED_BACKEND_NUM_CALLS": 1,
+            "SIMULATED_BACKEND_VARIANT_DENSITY": 1.0,
+            "SIMULATED_BACKEND_NUM_VARIANT_SETS": 1,
+            "REQUEST_TRACING": True,
+        }
+        frontend.reset()
+        frontend.configure(
+            baseConfig="TestConfig", extraConfig=config)
+        cls.app = frontend.app.test_client()
+        repo = frontend.app.backend.getDataRepository()
+        cls.datasetId = repo.getDatasets()[0].getId()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app = None
+        frontend.app.config["REQUEST_TRACING"] = False
+
+    def testServerTiming(self):
+        response = self.app.post(
+            "/variantsets/search",
+            headers={'Content-type': 'application/json',
+                     'Federation': 'False'},
+            data=json.dumps({"datasetId": self.datasetId}))
+        self.assertEqual(response.status_code, 200)
+        metrics = [
+            metric.split(";")[0]
+            for metric in response.headers["Server-Timing"].split(", ")]
+        self.assertIn("search", metrics)
+        self.assertEqual(metrics[-1], "total")
+        self.assertIsNone(tracing.getCurrentTrace())
@@ -512,6 +512,54 @@ class TestFrontend(unittest.TestCase):
             "expression_levels",
             self.expressionLevelId)
 
+    def testExpressionMatrixSearch(self):
+        headers = {
+            'Content-type': 'application/json',
+            'Origin': self.exampleUrl,
+        }
+        request = {
+            "rnaQuantificationSetId": self.rnaQuantificationSetId,
+            "rnaQuantificationIds": [self.rnaQuantificationId],
+        }
+        response = self.app.post(
+            '/expressionmatrix/search', headers=headers,
+            data=json.dumps(request))
+        self.assertEqual(200, response.status_code)
+        matrices = json.loads(
+            response.get_data())["results"]["expressionMatrices"]
+        self.assertEqual(1, len(matrices))
+        matrix = matrices[0]
+        self.assertEqual(
+            [self.rnaQuantificationId], matrix["rnaQuantificationIds"])
+        self.assertIn(self.expressionLevel.getName(), matrix["names"])
+        self.assertEqual(len(matrix["names"]), len(matrix["values"]))
+        self.assertTrue(all(len(row) == 1 for row in matrix["values"]))
+
+        response = self.app.post(
+            '/expressionmatrix/search', headers=headers, data="{}")
+        self.assertEqual(400, response.status_code)
+
+    def testFeaturesSearchIncludeDescendants(self):
+        headers = {
+            'Content-type': 'application/json',
+            'Origin': self.exampleUrl,
+        }
+        request = {
+            "featureSetId": self.featureSets[0].getId(),
+            "referenceName": "chr1",
+            "start": 0,
+            "end": 10000,
+            "includeDescendants": True,
+        }
+        response = self.app.post(
+            '/features/search', headers=headers, data=json.dumps(request))
+        self.assertEqual(200, response.status_code)
+
+        request["includeDescendants"] = "yes"
+        response = self.app.post(
+            '/features/search', headers=headers, data=json.dumps(request))
+        self.assertEqual(400, response.status_code)
+
     def testRnaQuantificationsSearch(self):
         self.searchObjectTest(
             self.sendRnaQuantificationsSearch,